@@ -0,0 +1,390 @@
+"""
+Exchange Symbol Filters Cache
+Claire de Binare Trading Bot
+
+Caches lot size, tick size and min/max notional for all traded symbols so
+that risk and execution can quantize orders locally before anything is
+sent to the exchange. Orders that would be rejected (below min qty or
+min notional) are caught without a REST round trip.
+
+Sources (first match wins):
+- Local JSON snapshot of GET /api/v3/exchangeInfo (EXCHANGE_INFO_PATH)
+- MEXC REST endpoint GET /api/v3/exchangeInfo (public, no signature)
+
+Both MEXC-style fields (baseSizePrecision, quotePrecision,
+quoteAmountPrecision) and Binance-style filters (LOT_SIZE, PRICE_FILTER,
+MIN_NOTIONAL/NOTIONAL) are understood.
+
+Usage:
+    cache = ExchangeInfoCache.from_env()
+    result = cache.quantize("BTCUSDT", quantity=0.123456789, price=50000.0)
+    if not result.valid:
+        skip(result.reason)
+"""
+
+import json
+import logging
+import math
+import os
+from decimal import Decimal
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Tolerance for float noise when flooring to a step (e.g. 0.3 / 0.1)
+_STEP_EPS = 1e-9
+
+
+def _decimals(step: float) -> int:
+    """Number of decimals needed to represent a step size exactly."""
+    if step <= 0:
+        return 12
+    exponent = Decimal(repr(float(step))).normalize().as_tuple().exponent
+    return max(0, min(12, -int(exponent)))
+
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class SymbolFilters:
+    """Trading filters for one symbol."""
+
+    symbol: str
+    step_size: float  # quantity increment
+    tick_size: float  # price increment
+    min_qty: float = 0.0
+    max_qty: float = 0.0  # 0 = unlimited
+    min_notional: float = 0.0
+    max_notional: float = 0.0  # 0 = unlimited
+    status: str = "ENABLED"
+
+    @property
+    def qty_decimals(self) -> int:
+        return _decimals(self.step_size)
+
+    @property
+    def price_decimals(self) -> int:
+        return _decimals(self.tick_size)
+
+    @classmethod
+    def from_exchange_info(cls, data: Dict[str, Any]) -> "SymbolFilters":
+        """Parse one entry of exchangeInfo['symbols']."""
+        symbol = data["symbol"]
+
+        # MEXC spot fields
+        step = _to_float(data.get("baseSizePrecision"))
+        if step <= 0 and data.get("baseAssetPrecision") is not None:
+            step = 10.0 ** -int(data["baseAssetPrecision"])
+        tick = 0.0
+        if data.get("quotePrecision") is not None:
+            tick = 10.0 ** -int(data["quotePrecision"])
+        min_notional = _to_float(data.get("quoteAmountPrecision"))
+        max_notional = _to_float(data.get("maxQuoteAmount"))
+        min_qty = max_qty = 0.0
+
+        # Binance-style filters (take precedence when present)
+        for flt in data.get("filters") or []:
+            kind = flt.get("filterType")
+            if kind == "LOT_SIZE":
+                step = _to_float(flt.get("stepSize"), step)
+                min_qty = _to_float(flt.get("minQty"), min_qty)
+                max_qty = _to_float(flt.get("maxQty"), max_qty)
+            elif kind == "PRICE_FILTER":
+                tick = _to_float(flt.get("tickSize"), tick)
+            elif kind in ("MIN_NOTIONAL", "NOTIONAL"):
+                min_notional = _to_float(flt.get("minNotional"), min_notional)
+                max_notional = _to_float(flt.get("maxNotional"), max_notional)
+
+        status = data.get("status", "ENABLED")
+        if str(status) in ("1", "TRADING"):
+            status = "ENABLED"
+
+        return cls(
+            symbol=symbol,
+            step_size=step,
+            tick_size=tick,
+            min_qty=min_qty,
+            max_qty=max_qty,
+            min_notional=min_notional,
+            max_notional=max_notional,
+            status=str(status),
+        )
+
+
+@dataclass(frozen=True)
+class QuantizedOrder:
+    """Result of quantizing an order against the symbol filters."""
+
+    symbol: str
+    quantity: float
+    price: Optional[float]
+    valid: bool
+    reason: Optional[str] = None
+
+
+def floor_to_step(value: float, step: float) -> float:
+    """Floor a value to a multiple of step (float-noise tolerant)."""
+    if step <= 0:
+        return value
+    return round(math.floor(value / step + _STEP_EPS) * step, _decimals(step))
+
+
+def ceil_to_step(value: float, step: float) -> float:
+    """Ceil a value to a multiple of step (float-noise tolerant)."""
+    if step <= 0:
+        return value
+    return round(math.ceil(value / step - _STEP_EPS) * step, _decimals(step))
+
+
+class ExchangeInfoCache:
+    """Thread-safe symbol filter cache with optional background refresh.
+
+    Args:
+        loader: Callable returning an exchangeInfo payload (dict with
+            'symbols'); used by refresh().
+        refresh_interval: Seconds between background refreshes (0 = off).
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], Dict[str, Any]]] = None,
+        refresh_interval: float = 0.0,
+    ):
+        self._loader = loader
+        self.refresh_interval = refresh_interval
+        self._filters: Dict[str, SymbolFilters] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self.last_refresh_ok: Optional[bool] = None
+
+    # ------------------------------------------------------------------ #
+    # Loading
+    # ------------------------------------------------------------------ #
+
+    def load(self, payload: Dict[str, Any]) -> int:
+        """Replace the cache from an exchangeInfo payload. Returns #symbols."""
+        filters: Dict[str, SymbolFilters] = {}
+        for entry in payload.get("symbols", []):
+            try:
+                parsed = SymbolFilters.from_exchange_info(entry)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed exchangeInfo entry: {e}")
+                continue
+            filters[parsed.symbol] = parsed
+        with self._lock:
+            self._filters = filters  # atomic swap, readers never block on refresh
+        return len(filters)
+
+    def load_snapshot(self, path: str) -> int:
+        """Load filters from a local JSON snapshot of exchangeInfo."""
+        with open(path, encoding="utf-8") as f:
+            count = self.load(json.load(f))
+        logger.info(f"Exchange info loaded from snapshot {path}: {count} symbols")
+        return count
+
+    def refresh(self) -> bool:
+        """Reload via the configured loader; keeps old data on failure."""
+        if self._loader is None:
+            return False
+        try:
+            count = self.load(self._loader())
+            self.last_refresh_ok = True
+            logger.info(f"Exchange info refreshed: {count} symbols")
+            return True
+        except Exception as e:  # noqa: BLE001
+            self.last_refresh_ok = False
+            logger.warning(f"Exchange info refresh failed, keeping cache: {e}")
+            return False
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def start_background_refresh(self) -> None:
+        """Start the daemon refresh thread (no-op without loader/interval)."""
+        if self._loader is None or self.refresh_interval <= 0:
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._refresh_loop, name="exchange-info-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @classmethod
+    def from_env(cls, use_rest: Optional[bool] = None) -> "ExchangeInfoCache":
+        """Build a cache from EXCHANGE_INFO_* env vars.
+
+        EXCHANGE_INFO_PATH: JSON snapshot loaded once at startup
+        EXCHANGE_INFO_REST: fetch from MEXC REST if use_rest is None
+            (default: true)
+        EXCHANGE_INFO_REFRESH_S: background refresh interval (default: 3600)
+        MEXC_EXCHANGE_INFO_URL: REST base URL (default: https://api.mexc.com)
+        """
+        snapshot = os.getenv("EXCHANGE_INFO_PATH", "")
+        if use_rest is None:
+            use_rest = os.getenv("EXCHANGE_INFO_REST", "true").lower() == "true"
+        interval = float(os.getenv("EXCHANGE_INFO_REFRESH_S", "3600"))
+        base_url = os.getenv("MEXC_EXCHANGE_INFO_URL", "https://api.mexc.com")
+
+        loader = None
+        if use_rest:
+
+            def loader() -> Dict[str, Any]:
+                from core.clients.mexc import get_transport
+
+                response = get_transport(base_url).request("GET", "/api/v3/exchangeInfo")
+                response.raise_for_status()
+                return response.json()
+
+        cache = cls(loader=loader, refresh_interval=interval)
+        if snapshot and os.path.exists(snapshot):
+            try:
+                cache.load_snapshot(snapshot)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Exchange info snapshot unreadable ({snapshot}): {e}")
+        if not len(cache) and loader is not None:
+            cache.refresh()
+        return cache
+
+    # ------------------------------------------------------------------ #
+    # Lookup & quantization
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self._filters)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._filters
+
+    def get(self, symbol: str) -> Optional[SymbolFilters]:
+        """O(1) filter lookup (None for unknown symbols)."""
+        return self._filters.get(symbol)
+
+    def quantize(
+        self,
+        symbol: str,
+        quantity: float,
+        price: Optional[float] = None,
+        side: str = "BUY",
+    ) -> QuantizedOrder:
+        """Round quantity down to the lot step and price to the tick.
+
+        Limit prices are rounded passively (BUY down, SELL up). Unknown
+        symbols pass through unchanged and are reported as valid.
+        """
+        filters = self.get(symbol)
+        if filters is None:
+            return QuantizedOrder(symbol, quantity, price, True)
+
+        if filters.status != "ENABLED":
+            return QuantizedOrder(symbol, 0.0, price, False, "Symbol not tradable")
+
+        qty = floor_to_step(quantity, filters.step_size)
+        if filters.max_qty > 0:
+            qty = min(qty, floor_to_step(filters.max_qty, filters.step_size))
+
+        q_price = price
+        if price is not None:
+            if side.upper() == "SELL":
+                q_price = ceil_to_step(price, filters.tick_size)
+            else:
+                q_price = floor_to_step(price, filters.tick_size)
+
+        if qty <= 0 or qty < filters.min_qty:
+            return QuantizedOrder(symbol, qty, q_price, False, "Below min quantity")
+        if q_price is not None and q_price > 0:
+            notional = qty * q_price
+            if notional < filters.min_notional:
+                return QuantizedOrder(symbol, qty, q_price, False, "Below min notional")
+            if filters.max_notional > 0 and notional > filters.max_notional:
+                return QuantizedOrder(symbol, qty, q_price, False, "Above max notional")
+
+        return QuantizedOrder(symbol, qty, q_price, True)
+
+    def quantize_batch(
+        self,
+        symbols: Sequence[str],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+        sides: Optional[Sequence[str]] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized quantize for many orders.
+
+        Same rounding and validity rules as quantize(); prices <= 0 skip the
+        notional checks. Returns (quantities, prices, valid_mask).
+        """
+        n = len(symbols)
+        qty = np.asarray(quantities, dtype=float)
+        px = np.asarray(prices, dtype=float)
+        step = np.zeros(n)
+        tick = np.zeros(n)
+        min_qty = np.zeros(n)
+        max_qty = np.zeros(n)
+        min_notional = np.zeros(n)
+        max_notional = np.zeros(n)
+        known = np.zeros(n, dtype=bool)
+        enabled = np.ones(n, dtype=bool)
+
+        table = self._filters
+        for i, symbol in enumerate(symbols):
+            f = table.get(symbol)
+            if f is None:
+                continue
+            known[i] = True
+            enabled[i] = f.status == "ENABLED"
+            step[i], tick[i] = f.step_size, f.tick_size
+            min_qty[i], max_qty[i] = f.min_qty, f.max_qty
+            min_notional[i], max_notional[i] = f.min_notional, f.max_notional
+
+        sell = (
+            np.array([s.upper() == "SELL" for s in sides], dtype=bool)
+            if sides is not None
+            else np.zeros(n, dtype=bool)
+        )
+
+        def _round(values: np.ndarray, steps: np.ndarray, up: np.ndarray) -> np.ndarray:
+            out = values.copy()
+            has_step = known & (steps > 0)
+            s = np.where(has_step, steps, 1.0)
+            scaled = values / s
+            rounded = np.where(
+                up, np.ceil(scaled - _STEP_EPS), np.floor(scaled + _STEP_EPS)
+            ) * s
+            for unique_step in np.unique(s[has_step]):
+                mask = has_step & (s == unique_step)
+                out[mask] = np.round(rounded[mask], _decimals(unique_step))
+            return out
+
+        q_qty = _round(qty, step, np.zeros(n, dtype=bool))
+        capped = known & (max_qty > 0)
+        if capped.any():
+            max_steps = _round(max_qty, step, np.zeros(n, dtype=bool))
+            q_qty = np.where(capped, np.minimum(q_qty, max_steps), q_qty)
+        q_px = _round(px, tick, sell)
+
+        notional = q_qty * q_px
+        priced = q_px > 0
+        valid = ~known | (
+            enabled
+            & (q_qty > 0)
+            & (q_qty >= min_qty)
+            & ~(priced & (notional < min_notional))
+            & ~(priced & (max_notional > 0) & (notional > max_notional))
+        )
+        q_qty = np.where(known & ~enabled, 0.0, q_qty)
+        return q_qty, q_px, valid
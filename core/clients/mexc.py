@@ -13,19 +13,124 @@ Features:
 - Balance Queries
 - Order Status Tracking
 - Rate Limiting
+- Shared transport: pooled keep-alive session, per-endpoint timeouts,
+  precomputed HMAC key (MexcTransport / get_transport)
 """
 
 import os
 import time
 import hmac
 import hashlib
+import threading
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlencode
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts in seconds per endpoint; orders fail fast,
+# account/exchange info may take longer.
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 10.0)
+ENDPOINT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "/api/v3/order": (3.05, 5.0),
+    "/api/v3/ticker/price": (3.05, 3.0),
+    "/api/v3/account": (3.05, 10.0),
+    "/api/v3/exchangeInfo": (3.05, 15.0),
+    "/api/v3/userDataStream": (3.05, 5.0),
+}
+
+
+class MexcTransport:
+    """Shared HTTP transport for all MEXC REST callers.
+
+    - One requests.Session with a pooled keep-alive HTTPAdapter, so DNS,
+      TCP and TLS setup is paid once per connection instead of per call.
+    - Per-endpoint (connect, read) timeouts; no request runs unbounded.
+    - HMAC-SHA256 key object precomputed once; signing copies it instead
+      of re-deriving the padded key for every request.
+
+    Use get_transport() to share one instance per (base_url, api_key).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        pool_maxsize: int = 10,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeouts = {**ENDPOINT_TIMEOUTS, **(timeouts or {})}
+        self._hmac = (
+            hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+            if api_secret
+            else None
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        if api_key:
+            self.session.headers["X-MEXC-APIKEY"] = api_key
+
+    def timeout_for(self, endpoint: str) -> Tuple[float, float]:
+        return self.timeouts.get(endpoint, DEFAULT_TIMEOUT)
+
+    def sign(self, message: str) -> str:
+        """HMAC-SHA256 hex signature using the precomputed key."""
+        if self._hmac is None:
+            raise ValueError("MEXC API secret required for signed requests")
+        mac = self._hmac.copy()
+        mac.update(message.encode("utf-8"))
+        return mac.hexdigest()
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+    ) -> requests.Response:
+        """Send a request over the pooled session (caller handles status)."""
+        return self.session.request(
+            method,
+            f"{self.base_url}{endpoint}",
+            params=params,
+            json=json,
+            timeout=timeout or self.timeout_for(endpoint),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_transports: Dict[Tuple[str, Optional[str]], MexcTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(
+    base_url: str, api_key: Optional[str] = None, api_secret: Optional[str] = None
+) -> MexcTransport:
+    """Process-wide MexcTransport per (base_url, api_key)."""
+    key = (base_url.rstrip("/"), api_key)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = MexcTransport(base_url, api_key, api_secret)
+            _transports[key] = transport
+        elif transport._hmac is None and api_secret:
+            transport._hmac = hmac.new(
+                api_secret.encode("utf-8"), digestmod=hashlib.sha256
+            )
+        return transport
+
 
 class MexcClient:
     """MEXC Spot Trading API Client (Unified)"""
@@ -60,13 +165,8 @@ class MexcClient:
             self.base_url = "https://api.mexc.com"
             logger.warning("🔴 MEXC Client initialized in LIVE mode - real money!")
 
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "X-MEXC-APIKEY": self.api_key,
-                "Content-Type": "application/json",
-            }
-        )
+        self.transport = get_transport(self.base_url, self.api_key, self.api_secret)
+        self.session = self.transport.session
 
     def _sign_request(self, params: Dict[str, Any]) -> str:
         """
@@ -79,12 +179,7 @@ class MexcClient:
             Hex signature string
         """
         query_string = urlencode(sorted(params.items()))
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+        return self.transport.sign(query_string)
 
     def get_account_balance(self) -> Dict[str, Any]:
         """
@@ -103,9 +198,7 @@ class MexcClient:
         params["signature"] = self._sign_request(params)
 
         try:
-            response = self.session.get(
-                f"{self.base_url}{endpoint}", params=params, timeout=10
-            )
+            response = self.transport.request("GET", endpoint, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -168,9 +261,7 @@ class MexcClient:
         params["signature"] = self._sign_request(params)
 
         try:
-            response = self.session.post(
-                f"{self.base_url}{endpoint}", params=params, timeout=10
-            )
+            response = self.transport.request("POST", endpoint, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -218,9 +309,7 @@ class MexcClient:
         params["signature"] = self._sign_request(params)
 
         try:
-            response = self.session.post(
-                f"{self.base_url}{endpoint}", params=params, timeout=10
-            )
+            response = self.transport.request("POST", endpoint, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -256,9 +345,7 @@ class MexcClient:
         params["signature"] = self._sign_request(params)
 
         try:
-            response = self.session.get(
-                f"{self.base_url}{endpoint}", params=params, timeout=10
-            )
+            response = self.transport.request("GET", endpoint, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -282,9 +369,7 @@ class MexcClient:
         endpoint = "/api/v3/ticker/price"
 
         try:
-            response = self.session.get(
-                f"{self.base_url}{endpoint}", params={"symbol": symbol}, timeout=10
-            )
+            response = self.transport.request("GET", endpoint, params={"symbol": symbol})
             response.raise_for_status()
             data = response.json()
 
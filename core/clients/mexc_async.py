@@ -0,0 +1,274 @@
+"""
+MEXC Spot Trading API Client (asyncio)
+Claire de Binare Trading Bot
+
+Async counterpart of core.clients.mexc.MexcClient for concurrent order
+dispatch:
+- aiohttp session with a pooled keep-alive TCPConnector
+- Shared async rate limiter: 20 requests/s, 100 orders/10s (MEXC spot)
+- Same signing (precomputed HMAC key of the shared MexcTransport)
+  and per-endpoint timeouts as the sync client
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import aiohttp
+
+from core.clients.mexc import get_transport
+
+logger = logging.getLogger(__name__)
+
+# MEXC Spot Limits
+REQUESTS_PER_SECOND = 20
+ORDERS_PER_10S = 100
+
+
+class AsyncRateLimiter:
+    """Sliding-window rate limiter shared by all coroutines of one loop.
+
+    Args:
+        max_calls: Allowed calls per window.
+        period: Window length in seconds.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_calls <= 0 or period <= 0:
+            raise ValueError("max_calls und period müssen > 0 sein")
+        self.max_calls = max_calls
+        self.period = period
+        self._clock = clock
+        self._calls: deque = deque()
+        self._lock = asyncio.Lock()
+        self.waits = 0
+
+    async def acquire(self) -> None:
+        """Wait until a call fits into the window, then record it."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                self.waits += 1
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+
+class AsyncMexcClient:
+    """MEXC Spot Trading API Client (asyncio, pooled)
+
+    Share one instance (or its limiters) between all dispatchers of an
+    event loop so the exchange limits hold across concurrent orders.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        testnet: bool = False,
+        base_url: Optional[str] = None,
+        pool_size: int = 20,
+        request_limiter: Optional[AsyncRateLimiter] = None,
+        order_limiter: Optional[AsyncRateLimiter] = None,
+    ):
+        """
+        Initialize async MEXC API Client
+
+        Args:
+            api_key: MEXC API Key (default: from env MEXC_API_KEY)
+            api_secret: MEXC API Secret (default: from env MEXC_API_SECRET)
+            testnet: Use testnet API (default: False)
+            base_url: Override API base URL (tests, proxies)
+            pool_size: Max. concurrent keep-alive connections
+            request_limiter: Shared limiter for all requests
+            order_limiter: Shared limiter for order placement
+        """
+        self.api_key = api_key or os.getenv("MEXC_API_KEY")
+        self.api_secret = api_secret or os.getenv("MEXC_API_SECRET")
+
+        if not self.api_key or not self.api_secret:
+            raise ValueError(
+                "MEXC API credentials required. Set MEXC_API_KEY and MEXC_API_SECRET"
+            )
+
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        elif testnet:
+            self.base_url = "https://contract.mexc.com"  # Testnet URL
+        else:
+            self.base_url = "https://api.mexc.com"
+
+        # Signing + timeouts from the shared sync transport
+        self.transport = get_transport(self.base_url, self.api_key, self.api_secret)
+        self.pool_size = pool_size
+        self.request_limiter = request_limiter or AsyncRateLimiter(
+            REQUESTS_PER_SECOND, 1.0
+        )
+        self.order_limiter = order_limiter or AsyncRateLimiter(ORDERS_PER_10S, 10.0)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size, keepalive_timeout=30, ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "X-MEXC-APIKEY": self.api_key,
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncMexcClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _sign_request(self, params: Dict[str, Any]) -> str:
+        """HMAC SHA256 signature (same format as MexcClient)"""
+        return self.transport.sign(urlencode(sorted(params.items())))
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = False,
+        order: bool = False,
+    ) -> Dict[str, Any]:
+        if order:
+            await self.order_limiter.acquire()
+        await self.request_limiter.acquire()
+
+        # Erst nach dem Limiter stempeln: gedrosselte Orders (bis ~10 s) würden
+        # sonst außerhalb des recvWindow (5 s) ankommen und abgelehnt
+        params = dict(params or {})
+        if signed:
+            params["timestamp"] = int(time.time() * 1000)
+            params["signature"] = self._sign_request(params)
+
+        connect, read = self.transport.timeout_for(endpoint)
+        session = await self._get_session()
+        async with session.request(
+            method,
+            f"{self.base_url}{endpoint}",
+            params={key: str(value) for key, value in params.items()},
+            timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+        ) as response:
+            if response.status >= 400:
+                body = await response.text()
+                logger.error(f"   Response: {body}")
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def get_account_balance(self) -> Dict[str, Any]:
+        """Get spot account balance"""
+        try:
+            data = await self._request("GET", "/api/v3/account", signed=True)
+            logger.info(
+                f"✅ Fetched account balance: {len(data.get('balances', []))} assets"
+            )
+            return data
+        except aiohttp.ClientError as e:
+            logger.error(f"❌ Failed to fetch account balance: {e}")
+            raise
+
+    async def get_balance(self, asset: str = "USDT") -> float:
+        """Get available balance for specific asset"""
+        account = await self.get_account_balance()
+        for balance in account.get("balances", []):
+            if balance.get("asset") == asset:
+                return float(balance.get("free", 0))
+        logger.warning(f"⚠️  Asset {asset} not found in balance")
+        return 0.0
+
+    async def place_market_order(
+        self, symbol: str, side: str, quantity: float
+    ) -> Dict[str, Any]:
+        """Place market order"""
+        params = {
+            "symbol": symbol,
+            "side": side.upper(),
+            "type": "MARKET",
+            "quantity": quantity,
+        }
+        try:
+            data = await self._request(
+                "POST", "/api/v3/order", params, signed=True, order=True
+            )
+            logger.info(
+                f"✅ Market order placed: {symbol} {side} {quantity} - Order ID: {data.get('orderId')}"
+            )
+            return data
+        except aiohttp.ClientError as e:
+            logger.error(f"❌ Failed to place market order: {e}")
+            raise
+
+    async def place_limit_order(
+        self, symbol: str, side: str, quantity: float, price: float
+    ) -> Dict[str, Any]:
+        """Place limit order (GTC)"""
+        params = {
+            "symbol": symbol,
+            "side": side.upper(),
+            "type": "LIMIT",
+            "timeInForce": "GTC",
+            "quantity": quantity,
+            "price": price,
+        }
+        try:
+            data = await self._request(
+                "POST", "/api/v3/order", params, signed=True, order=True
+            )
+            logger.info(
+                f"✅ Limit order placed: {symbol} {side} {quantity} @ {price} - Order ID: {data.get('orderId')}"
+            )
+            return data
+        except aiohttp.ClientError as e:
+            logger.error(f"❌ Failed to place limit order: {e}")
+            raise
+
+    async def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
+        """Get order status"""
+        try:
+            return await self._request(
+                "GET",
+                "/api/v3/order",
+                {"symbol": symbol, "orderId": order_id},
+                signed=True,
+            )
+        except aiohttp.ClientError as e:
+            logger.error(f"❌ Failed to get order status: {e}")
+            raise
+
+    async def get_ticker_price(self, symbol: str) -> float:
+        """Get current market price for symbol"""
+        try:
+            data = await self._request(
+                "GET", "/api/v3/ticker/price", {"symbol": symbol}
+            )
+            return float(data.get("price", 0))
+        except aiohttp.ClientError as e:
+            logger.error(f"❌ Failed to get ticker price: {e}")
+            raise
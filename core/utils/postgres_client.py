@@ -37,11 +37,42 @@ Usage:
 
     # Get DSN string for ORMs
     dsn = get_postgres_dsn(sslmode="verify-ca")
+
+    # Thread-safe pooled connections (long-running services)
+    pool = create_postgres_pool(minconn=1, maxconn=5, dsn=config.DATABASE_URL)
+    with pool.connection() as conn:
+        ...
+
+    # Große Ergebnismengen per Server-Side-Cursor streamen
+    for description, rows in iter_query_batches(conn, "SELECT * FROM trades"):
+        ...
+
+    # Server-side prepared statements + schema capabilities per connection
+    statements = PreparedStatements()
+    statements.define("order_by_id", "SELECT * FROM orders WHERE order_id = %s")
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            statements.execute(cur, "order_by_id", (order_id,))
 """
 
 import logging
 import os
-from typing import Optional
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Optional,
+    Sequence,
+    Set,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -209,3 +240,533 @@ def verify_ssl_connection(conn) -> dict:
         "ssl_cipher": cipher,
         "ssl_in_use": info.ssl_in_use if hasattr(info, "ssl_in_use") else None,
     }
+
+
+def iter_query_batches(
+    conn,
+    query,
+    params: Optional[Sequence[Any]] = None,
+    name: str = "stream",
+    itersize: int = 2000,
+    cursor_factory=None,
+) -> Iterator[tuple]:
+    """
+    Stream a query result through a named (server-side) cursor.
+
+    PostgreSQL keeps the result set and at most ``itersize`` rows are held
+    client-side at a time. On autocommit connections the cursor is declared
+    WITH HOLD, otherwise it lives in the caller's transaction.
+
+    Args:
+        conn: PostgreSQL connection object.
+        query: SQL string or psycopg2.sql.Composable.
+        params: Query parameters.
+        name: Cursor name (unique per connection).
+        itersize: Rows per fetch.
+        cursor_factory: Optional row factory (e.g. RealDictCursor).
+
+    Yields:
+        (description, rows) per batch of at most ``itersize`` rows
+    """
+    kwargs: Dict[str, Any] = {
+        "name": name,
+        "withhold": bool(getattr(conn, "autocommit", False)),
+    }
+    if cursor_factory is not None:
+        kwargs["cursor_factory"] = cursor_factory
+    itersize = max(1, itersize)
+    with conn.cursor(**kwargs) as cursor:
+        cursor.itersize = itersize
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(itersize)
+            if not rows:
+                return
+            yield cursor.description, rows
+
+
+class PoolExhaustedError(RuntimeError):
+    """No pooled connection became available within the checkout timeout."""
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.last_used = time.monotonic()
+
+
+class PostgresConnectionPool:
+    """
+    Thread-safe PostgreSQL connection pool.
+
+    - Keeps between ``minconn`` and ``maxconn`` open connections.
+    - Checkout blocks up to ``checkout_timeout`` seconds when all
+      connections are in use (raises PoolExhaustedError afterwards).
+    - Health check on checkout: closed connections are always replaced;
+      connections idle longer than ``health_check_after_s`` are pinged with
+      ``SELECT 1`` first (0 = ping on every checkout).
+    - Connections that fail with OperationalError/InterfaceError while in use
+      are discarded and transparently reconnected on the next checkout.
+
+    Args:
+        connect: Zero-argument factory returning a new DB-API connection.
+        minconn: Connections opened eagerly and kept open.
+        maxconn: Upper bound of simultaneously open connections.
+        checkout_timeout: Max. seconds to wait for a free connection.
+        health_check_after_s: Idle time after which a connection is pinged.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        minconn: int = 1,
+        maxconn: int = 10,
+        checkout_timeout: float = 10.0,
+        health_check_after_s: float = 30.0,
+    ):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Require 0 <= minconn <= maxconn and maxconn >= 1")
+
+        self._connect = connect
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.checkout_timeout = checkout_timeout
+        self.health_check_after_s = health_check_after_s
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._size = 0  # open connections (idle + in use)
+        self._cond = threading.Condition()
+        self._closed = False
+        self.stats = {
+            "connections_created": 0,
+            "connections_discarded": 0,
+            "checkouts": 0,
+            "checkout_waits": 0,
+        }
+
+        for _ in range(minconn):
+            self._idle.append(_PooledConnection(self._new_connection()))
+            self._size += 1
+
+    def _new_connection(self):
+        conn = self._connect()
+        self.stats["connections_created"] += 1
+        return conn
+
+    def _close_quietly(self, conn) -> None:
+        self.stats["connections_discarded"] += 1
+        try:
+            conn.close()
+        except Exception:  # noqa: BLE001 - already broken
+            pass
+
+    def _is_healthy(self, entry: _PooledConnection) -> bool:
+        conn = entry.conn
+        if getattr(conn, "closed", 0):
+            return False
+        if time.monotonic() - entry.last_used < self.health_check_after_s:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Pooled PostgreSQL connection unhealthy, reconnecting: {e}")
+            return False
+
+    def getconn(self, timeout: Optional[float] = None):
+        """Check out a healthy connection (blocks while the pool is exhausted)."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()  # LIFO: hot connections stay warm
+                    break
+                if self._size < self.maxconn:
+                    self._size += 1  # reserve slot, connect outside the lock
+                    entry = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhaustedError(
+                        f"No PostgreSQL connection available within {timeout:.1f}s "
+                        f"(maxconn={self.maxconn})"
+                    )
+                self.stats["checkout_waits"] += 1
+                self._cond.wait(remaining)
+
+        try:
+            if entry is not None and not self._is_healthy(entry):
+                self._close_quietly(entry.conn)
+                entry = None
+            conn = entry.conn if entry is not None else self._new_connection()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        self.stats["checkouts"] += 1
+        return conn
+
+    def putconn(self, conn, discard: bool = False) -> None:
+        """Return a connection to the pool (discard=True closes it)."""
+        broken = discard or bool(getattr(conn, "closed", 0)) or self._closed
+        if not broken:
+            try:
+                conn.rollback()  # never hand out an open transaction
+            except Exception:  # noqa: BLE001
+                broken = True
+
+        with self._cond:
+            if broken:
+                self._size -= 1
+            else:
+                self._idle.append(_PooledConnection(conn))
+            self._cond.notify()
+        if broken:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        """Checkout as context manager: commit on success, rollback on error."""
+        import psycopg2
+
+        conn = self.getconn()
+        discard = False
+        try:
+            yield conn
+            conn.commit()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            discard = True
+            raise
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:  # noqa: BLE001
+                discard = True
+            raise
+        finally:
+            self.putconn(conn, discard=discard)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        return self._size - len(self._idle)
+
+    def closeall(self) -> None:
+        """Close idle connections; in-use ones are closed when returned."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry.conn)
+
+
+def create_postgres_pool(
+    minconn: int = 1,
+    maxconn: int = 10,
+    dsn: Optional[str] = None,
+    checkout_timeout: float = 10.0,
+    health_check_after_s: float = 30.0,
+    **connect_kwargs,
+) -> PostgresConnectionPool:
+    """
+    Create a PostgresConnectionPool.
+
+    Args:
+        minconn: Connections opened eagerly.
+        maxconn: Maximum open connections.
+        dsn: Connection string; if omitted, connections are created via
+            create_postgres_connection(**connect_kwargs) (env + SSL support).
+        checkout_timeout: Max. seconds to wait for a free connection.
+        health_check_after_s: Idle time after which checkout pings first.
+
+    Returns:
+        PostgresConnectionPool: Ready-to-use pool.
+    """
+    if dsn:
+        import psycopg2
+
+        def connect():
+            return psycopg2.connect(dsn)
+
+    else:
+
+        def connect():
+            return create_postgres_connection(**connect_kwargs)
+
+    return PostgresConnectionPool(
+        connect,
+        minconn=minconn,
+        maxconn=maxconn,
+        checkout_timeout=checkout_timeout,
+        health_check_after_s=health_check_after_s,
+    )
+
+
+_PLACEHOLDER = re.compile(r"%([s%])")
+_STATEMENT_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def _numbered_placeholders(sql: str):
+    """Translate psycopg2 ``%s`` placeholders into ``$1..$n`` (PREPARE syntax)."""
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.group(1) == "%":
+            return "%"
+        count += 1
+        return f"${count}"
+
+    return _PLACEHOLDER.sub(replace, sql), count
+
+
+class _Statement:
+    __slots__ = ("name", "sql", "prepare_sql", "execute_sql", "insert_sql", "template")
+
+    def __init__(self, name: str, sql: str, insert_sql=None, template=None):
+        numbered, params = _numbered_placeholders(sql)
+        self.name = name
+        self.sql = sql
+        self.prepare_sql = f"PREPARE {name} AS {numbered}"
+        self.execute_sql = (
+            f"EXECUTE {name} ({', '.join(['%s'] * params)})"
+            if params
+            else f"EXECUTE {name}"
+        )
+        # Multi-row Variante (execute_values) für define_insert
+        self.insert_sql = insert_sql
+        self.template = template
+
+
+class _ConnectionState:
+    __slots__ = ("prepared", "server_prepared", "columns")
+
+    def __init__(self):
+        self.prepared: Set[str] = set()
+        # Server-Name -> PREPARE-Text (None: veraltet, neu vorbereiten)
+        self.server_prepared: Optional[Dict[str, Optional[str]]] = None
+        self.columns: Dict[str, FrozenSet[str]] = {}
+
+
+class PreparedStatements:
+    """
+    Registry of server-side prepared statements and schema capabilities.
+
+    - Statements are defined once (psycopg2 ``%s`` syntax) and PREPAREd
+      lazily on every connection they are first executed on.
+    - Schema capabilities (columns of a table) are queried once per
+      connection, so a migration is picked up by new connections.
+    - ``execute_many`` runs one or a few rows via EXECUTE (no parse/plan per
+      event); larger batches of ``define_insert`` statements stay one
+      multi-row INSERT via execute_values, which is cheaper at that size.
+    - State is keyed by connection (weakly): reconnects simply re-prepare.
+      Statements dropped server-side (DISCARD ALL, changed result type) are
+      re-prepared in the next transaction after the error.
+
+    Not usable behind a transaction-pooling PgBouncer (prepared statements
+    are session state).
+
+    Args:
+        prefix: Prefix of the server-side statement names.
+        prepared_max_rows: execute_many uses EXECUTE up to this many rows.
+    """
+
+    def __init__(self, prefix: str = "cdb", prepared_max_rows: int = 4):
+        self.prefix = prefix
+        self.prepared_max_rows = prepared_max_rows
+        self._statements: Dict[str, _Statement] = {}
+        self._connections: "weakref.WeakKeyDictionary[Any, _ConnectionState]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.stats = {"prepares": 0, "executions": 0, "capability_checks": 0}
+
+    def define(self, name: str, sql: str) -> None:
+        """Register a statement (idempotent for identical SQL)."""
+        self._add(_Statement(self._server_name(name), sql), name)
+
+    def define_insert(
+        self,
+        name: str,
+        table: str,
+        columns: str,
+        template: Optional[str] = None,
+        returning: Optional[str] = None,
+    ) -> None:
+        """
+        Register a single-row INSERT plus its multi-row form.
+
+        Args:
+            name: Statement name.
+            table: Target table.
+            columns: Comma-separated column list in row order.
+            template: Row template, e.g. ``(%s, to_timestamp(%s))``
+                (default: one ``%s`` per column).
+            returning: Optional RETURNING clause of the single-row form.
+        """
+        if template is None:
+            template = f"({', '.join(['%s'] * len(columns.split(',')))})"
+        insert_sql = f"INSERT INTO {table} ({columns}) VALUES %s"
+        sql = f"INSERT INTO {table} ({columns}) VALUES {template}"
+        if returning:
+            sql += f" RETURNING {returning}"
+        self._add(_Statement(self._server_name(name), sql, insert_sql, template), name)
+
+    def sql(self, name: str) -> str:
+        """SQL text of a defined statement (psycopg2 placeholders)."""
+        return self._statement(name).sql
+
+    def _server_name(self, name: str) -> str:
+        server_name = f"{self.prefix}_{name}" if self.prefix else name
+        if not _STATEMENT_NAME.match(server_name):
+            raise ValueError(f"Invalid prepared statement name: {server_name!r}")
+        return server_name
+
+    def _add(self, statement: _Statement, name: str) -> None:
+        existing = self._statements.get(name)
+        if existing is not None and existing.sql != statement.sql:
+            raise ValueError(f"Prepared statement {name!r} already defined")
+        self._statements[name] = statement
+
+    def _statement(self, name: str) -> _Statement:
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise KeyError(f"Unknown prepared statement: {name!r}") from None
+
+    def _state(self, conn) -> _ConnectionState:
+        with self._lock:
+            state = self._connections.get(conn)
+            if state is None:
+                state = self._connections[conn] = _ConnectionState()
+            return state
+
+    def forget(self, conn) -> None:
+        """Drop the cached state of a connection (re-prepare on next use)."""
+        with self._lock:
+            self._connections.pop(conn, None)
+
+    def prepared(self, conn) -> FrozenSet[str]:
+        """Names of the statements prepared on conn."""
+        with self._lock:
+            state = self._connections.get(conn)
+            return frozenset(state.prepared) if state else frozenset()
+
+    def prepare(self, cur, name: str) -> str:
+        """PREPARE name on the cursor's connection (once); returns EXECUTE SQL."""
+        statement = self._statement(name)
+        state = self._state(cur.connection)
+        if name in state.prepared:
+            return statement.execute_sql
+
+        if state.server_prepared is None:
+            # Verbindung evtl. schon von einer früheren Registry vorbereitet
+            with cur.connection.cursor() as catalog:
+                catalog.execute("SELECT name, statement FROM pg_prepared_statements")
+                state.server_prepared = dict(catalog.fetchall())
+        if statement.name in state.server_prepared:
+            if state.server_prepared[statement.name] == statement.prepare_sql:
+                state.prepared.add(name)
+                return statement.execute_sql
+            cur.execute(f"DEALLOCATE {statement.name}")
+            del state.server_prepared[statement.name]
+
+        cur.execute(statement.prepare_sql)
+        state.server_prepared[statement.name] = statement.prepare_sql
+        state.prepared.add(name)
+        self.stats["prepares"] += 1
+        return statement.execute_sql
+
+    def execute(self, cur, name: str, params: Sequence[Any] = ()) -> None:
+        """Execute a prepared statement (PREPARE on first use per connection)."""
+        execute_sql = self.prepare(cur, name)
+        self._run(cur, name, lambda: cur.execute(execute_sql, tuple(params)))
+
+    def execute_many(self, cur, name: str, rows: Sequence[Sequence[Any]]) -> None:
+        """
+        Execute a statement for many rows in one round trip.
+
+        Up to ``prepared_max_rows`` rows (or statements without multi-row
+        form) go through EXECUTE; larger batches of ``define_insert``
+        statements are sent as one multi-row INSERT.
+        """
+        from psycopg2.extras import execute_batch, execute_values
+
+        if not rows:
+            return
+        statement = self._statement(name)
+        if statement.insert_sql is not None and len(rows) > self.prepared_max_rows:
+            execute_values(
+                cur,
+                statement.insert_sql,
+                rows,
+                template=statement.template,
+                page_size=len(rows),
+            )
+            return
+        execute_sql = self.prepare(cur, name)
+        self._run(
+            cur,
+            name,
+            lambda: execute_batch(cur, execute_sql, rows, page_size=len(rows)),
+        )
+
+    def _run(self, cur, name: str, call: Callable[[], None]) -> None:
+        import psycopg2.errors
+
+        try:
+            call()
+        except psycopg2.errors.InvalidSqlStatementName:
+            # Server-seitig verworfen (DISCARD ALL): Zustand neu einlesen
+            self.forget(cur.connection)
+            raise
+        except psycopg2.errors.FeatureNotSupported:
+            # "cached plan must not change result type" (Spalten geändert):
+            # in der nächsten Transaktion DEALLOCATE + PREPARE
+            state = self._state(cur.connection)
+            state.prepared.discard(name)
+            if state.server_prepared is not None:
+                state.server_prepared[self._statement(name).name] = None
+            raise
+        self.stats["executions"] += 1
+
+    def columns(self, cur, table: str) -> FrozenSet[str]:
+        """Column names of table (queried once per connection)."""
+        state = self._state(cur.connection)
+        columns = state.columns.get(table)
+        if columns is None:
+            with cur.connection.cursor() as catalog:
+                catalog.execute(
+                    """
+                    SELECT column_name FROM information_schema.columns
+                    WHERE table_name = %s
+                      AND table_schema = ANY (current_schemas(false))
+                    """,
+                    (table,),
+                )
+                columns = frozenset(row[0] for row in catalog.fetchall())
+            state.columns[table] = columns
+            self.stats["capability_checks"] += 1
+        return columns
+
+    def has_column(self, cur, table: str, column: str) -> bool:
+        """Whether table has column on this connection's schema (cached)."""
+        return column in self.columns(cur, table)
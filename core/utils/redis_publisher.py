@@ -0,0 +1,126 @@
+"""
+Redis Event Publisher (Pub/Sub + Stream Fan-out)
+
+Groups one channel PUBLISH and any number of stream XADDs for an event into
+a single round trip: a non-transactional pipeline by default, or one Lua
+script when the fan-out must be atomic. Streams are trimmed with approximate
+``MAXLEN ~`` so trimming stays O(1) amortized.
+
+Usage:
+    from core.utils.redis_publisher import EventPublisher
+
+    publisher = EventPublisher(redis_client, maxlen=10000)
+    publisher.publish(
+        channel="order_results",
+        message=json.dumps(payload),
+        streams=["stream.fills", "stream.order_results"],
+        fields=payload,
+    )
+
+relations:
+  role: event_publisher
+  domain: utility
+  upstream: []
+  downstream:
+    - services/execution/service.py
+    - services/risk/service.py
+    - services/signal/service.py
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# KEYS = streams; ARGV = channel, message, maxlen, field1, value1, ...
+_FANOUT_LUA = """
+if ARGV[1] ~= '' then
+    redis.call('PUBLISH', ARGV[1], ARGV[2])
+end
+local ids = {}
+for i, key in ipairs(KEYS) do
+    ids[i] = redis.call('XADD', key, 'MAXLEN', '~', ARGV[3], '*', unpack(ARGV, 4))
+end
+return ids
+"""
+
+
+@dataclass
+class Event:
+    """One fan-out unit: optional channel message plus stream entries."""
+
+    channel: Optional[str]
+    message: Optional[str]
+    streams: Sequence[str] = ()
+    fields: dict[str, Any] = field(default_factory=dict)
+
+
+class EventPublisher:
+    """Publishes events to a Pub/Sub channel and streams in one round trip.
+
+    Args:
+        client: redis.Redis instance.
+        maxlen: Approximate max length of each stream.
+        atomic: Use a Lua script instead of a pipeline (all-or-nothing
+            fan-out per event, one EVALSHA per call).
+    """
+
+    def __init__(self, client, maxlen: int = 10000, atomic: bool = False):
+        self.client = client
+        self.maxlen = maxlen
+        self.atomic = atomic
+        self._script = client.register_script(_FANOUT_LUA) if atomic else None
+
+    def publish(
+        self,
+        channel: Optional[str],
+        message: Optional[str],
+        streams: Iterable[str] = (),
+        fields: Optional[dict[str, Any]] = None,
+    ) -> list:
+        """Fan out a single event. Returns the raw command results."""
+        return self.publish_many([Event(channel, message, tuple(streams), fields or {})])
+
+    def publish_many(self, events: Sequence[Event]) -> list:
+        """Fan out several events in one round trip."""
+        if not events:
+            return []
+        if self._script is not None:
+            return self._publish_lua(events)
+
+        pipe = self.client.pipeline(transaction=False)
+        for event in events:
+            if event.channel and event.message is not None:
+                pipe.publish(event.channel, event.message)
+            for stream in _unique(event.streams):
+                if event.fields:
+                    pipe.xadd(
+                        stream, event.fields, maxlen=self.maxlen, approximate=True
+                    )
+        return pipe.execute()
+
+    def _publish_lua(self, events: Sequence[Event]) -> list:
+        pipe = self.client.pipeline(transaction=False)
+        for event in events:
+            streams = _unique(event.streams) if event.fields else []
+            args: list[Any] = [
+                event.channel or "",
+                event.message if event.message is not None else "",
+                self.maxlen,
+            ]
+            for key, value in event.fields.items():
+                args.extend((key, value))
+            self._script(keys=streams, args=args, client=pipe)
+        return pipe.execute()
+
+
+def _unique(streams: Iterable[str]) -> list[str]:
+    """Drop empty and duplicate stream names, keeping order."""
+    seen: list[str] = []
+    for stream in streams:
+        if stream and stream not in seen:
+            seen.append(stream)
+    return seen
@@ -0,0 +1,326 @@
+"""
+Streaming Performance Metrics
+
+O(1)-per-update accumulators for trading performance: Welford mean/variance
+(Sharpe), downside deviation (Sortino), running peak / max drawdown, trade
+win/loss aggregates and P²-algorithm quantiles (VaR) — queryable at any
+moment without rescanning trade or equity history.
+
+relations:
+  role: metrics_accumulator
+  domain: utility
+  upstream: []
+  downstream:
+    - services/risk/metrics.py
+    - services/execution/paper_trading.py
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+
+class RunningStats:
+    """Welford online mean/variance plus downside semi-deviation."""
+
+    __slots__ = ("count", "mean", "_m2", "_downside_sq")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < 0:
+            self._downside_sq += value * value
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than two samples)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def downside_deviation(self) -> float:
+        """Root mean square of negative values (target return 0)."""
+        return math.sqrt(self._downside_sq / self.count) if self.count else 0.0
+
+
+class P2Quantile:
+    """P² streaming quantile estimator (Jain & Chlamtac, 1985).
+
+    Tracks a single quantile with five markers in O(1) memory and time.
+    Exact for the first five observations.
+    """
+
+    __slots__ = ("p", "_q", "_n", "_np", "_dn", "_count")
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError("p must be in (0, 1)")
+        self.p = p
+        self._q: list[float] = []
+        self._n = [0, 1, 2, 3, 4]
+        self._np = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._dn = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def update(self, x: float) -> None:
+        self._count += 1
+        q = self._q
+        if self._count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while k < 3 and x >= q[k + 1]:
+                k += 1
+
+        n = self._n
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._np[i] += self._dn[i]
+
+        for i in range(1, 4):
+            d = self._np[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._q, self._n
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        """Current quantile estimate (None before the first observation)."""
+        if not self._q:
+            return None
+        if self._count <= 5:
+            # Nearest-rank on the exact sample
+            rank = max(math.ceil(self.p * self._count) - 1, 0)
+            return self._q[rank]
+        return self._q[2]
+
+
+@dataclass
+class MetricsSnapshot:
+    """Point-in-time view of a StreamingPerformanceMetrics accumulator."""
+
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    realized_pnl: float
+    gross_profit: float
+    gross_loss: float
+    avg_trade_pnl: float
+    avg_winning_trade: float
+    avg_losing_trade: float
+    largest_win: float
+    largest_loss: float
+    profit_factor: float
+    holding_period_avg: float
+    initial_equity: Optional[float]
+    current_equity: Optional[float]
+    peak_equity: Optional[float]
+    max_drawdown: float
+    current_drawdown: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    var_95: float
+    return_observations: int
+    elapsed_seconds: float
+
+
+class StreamingPerformanceMetrics:
+    """Incremental trade and equity statistics.
+
+    Feed closed trades via `record_trade` and equity observations via
+    `record_equity`; each call is O(1). Returns for Sharpe/Sortino/VaR are
+    simple returns between consecutive equity observations.
+
+    Args:
+        annualization: Equity observations per year, used to annualize
+            Sharpe/Sortino (mean * N / (std * sqrt(N))); 365 = daily ticks.
+        var_quantile: Lower-tail quantile of returns reported as VaR.
+    """
+
+    def __init__(self, annualization: float = 365.0, var_quantile: float = 0.05):
+        self.annualization = annualization
+
+        # Trades
+        self.total_trades = 0
+        self.winning_trades = 0
+        self.losing_trades = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0  # positive number
+        self.largest_win = 0.0
+        self.largest_loss = 0.0  # most negative trade PnL
+        self._holding_sum = 0.0
+        self._holding_count = 0
+
+        # Equity
+        self.initial_equity: Optional[float] = None
+        self.current_equity: Optional[float] = None
+        self.peak_equity: Optional[float] = None
+        self.max_drawdown = 0.0
+        self._first_ts: Optional[float] = None
+        self._last_ts: Optional[float] = None
+
+        # Returns
+        self.returns = RunningStats()
+        self._var = P2Quantile(var_quantile)
+
+    def record_trade(self, pnl: float, holding_seconds: Optional[float] = None) -> None:
+        """Account one closed trade with its realized PnL."""
+        self.total_trades += 1
+        if pnl > 0:
+            self.winning_trades += 1
+            self.gross_profit += pnl
+            self.largest_win = max(self.largest_win, pnl)
+        elif pnl < 0:
+            self.losing_trades += 1
+            self.gross_loss += -pnl
+            self.largest_loss = min(self.largest_loss, pnl)
+        if holding_seconds is not None:
+            self._holding_sum += holding_seconds
+            self._holding_count += 1
+
+    def record_equity(self, equity: float, ts: Optional[float] = None) -> None:
+        """Account one equity observation (optionally with epoch seconds)."""
+        if ts is not None:
+            if self._first_ts is None:
+                self._first_ts = ts
+            self._last_ts = ts
+
+        previous = self.current_equity
+        self.current_equity = equity
+        if self.initial_equity is None:
+            self.initial_equity = equity
+
+        if self.peak_equity is None or equity > self.peak_equity:
+            self.peak_equity = equity
+        elif self.peak_equity > 0:
+            drawdown = (self.peak_equity - equity) / self.peak_equity
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+
+        if previous:
+            r = (equity - previous) / previous
+            self.returns.update(r)
+            self._var.update(r)
+
+    @property
+    def realized_pnl(self) -> float:
+        return self.gross_profit - self.gross_loss
+
+    @property
+    def win_rate(self) -> float:
+        return self.winning_trades / self.total_trades if self.total_trades else 0.0
+
+    @property
+    def profit_factor(self) -> float:
+        """Gross profit / gross loss (0.0 while undefined, i.e. no losses)."""
+        if self.gross_loss > 0:
+            return self.gross_profit / self.gross_loss
+        return 0.0
+
+    @property
+    def current_drawdown(self) -> float:
+        if not self.peak_equity or self.current_equity is None:
+            return 0.0
+        return max((self.peak_equity - self.current_equity) / self.peak_equity, 0.0)
+
+    @property
+    def sharpe_ratio(self) -> float:
+        std = self.returns.std
+        if std <= 0:
+            return 0.0
+        n = self.annualization
+        return (self.returns.mean * n) / (std * math.sqrt(n))
+
+    @property
+    def sortino_ratio(self) -> float:
+        downside = self.returns.downside_deviation
+        if downside <= 0:
+            return 0.0
+        n = self.annualization
+        return (self.returns.mean * n) / (downside * math.sqrt(n))
+
+    @property
+    def var_95(self) -> float:
+        """Loss quantile of per-observation returns as a positive fraction."""
+        q = self._var.value()
+        return max(-q, 0.0) if q is not None else 0.0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self._first_ts is None or self._last_ts is None:
+            return 0.0
+        return self._last_ts - self._first_ts
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Current metrics (O(1))."""
+        trades = self.total_trades
+        return MetricsSnapshot(
+            total_trades=trades,
+            winning_trades=self.winning_trades,
+            losing_trades=self.losing_trades,
+            win_rate=self.win_rate,
+            realized_pnl=self.realized_pnl,
+            gross_profit=self.gross_profit,
+            gross_loss=self.gross_loss,
+            avg_trade_pnl=self.realized_pnl / trades if trades else 0.0,
+            avg_winning_trade=(
+                self.gross_profit / self.winning_trades if self.winning_trades else 0.0
+            ),
+            avg_losing_trade=(
+                -self.gross_loss / self.losing_trades if self.losing_trades else 0.0
+            ),
+            largest_win=self.largest_win,
+            largest_loss=self.largest_loss,
+            profit_factor=self.profit_factor,
+            holding_period_avg=(
+                self._holding_sum / self._holding_count if self._holding_count else 0.0
+            ),
+            initial_equity=self.initial_equity,
+            current_equity=self.current_equity,
+            peak_equity=self.peak_equity,
+            max_drawdown=self.max_drawdown,
+            current_drawdown=self.current_drawdown,
+            sharpe_ratio=self.sharpe_ratio,
+            sortino_ratio=self.sortino_ratio,
+            var_95=self.var_95,
+            return_observations=self.returns.count,
+            elapsed_seconds=self.elapsed_seconds,
+        )
@@ -0,0 +1,312 @@
+-- Migration 004: Zeitreihen-Tabellen range-partitionieren
+-- Datum: 2026-10-19
+-- Grund: Analytics-Queries scannen immer größere Heap-Tabellen; Query- und
+--        VACUUM-Kosten sollen bei wachsender Historie konstant bleiben
+--
+-- Änderungen:
+--   - signals, trades, portfolio_snapshots: PARTITION BY RANGE (timestamp)
+--   - orders: PARTITION BY RANGE (created_at)
+--   - Primary Keys (id, <zeitspalte>); orders.order_id bleibt global eindeutig
+--     über die nicht partitionierte Tabelle order_ids (Trigger)
+--   - FKs orders.signal_id / trades.order_id entfallen (Ziel partitioniert)
+--   - b-tree auf Zeitspalten ersetzt durch BRIN (je Partition)
+--   - partition_config + cdb_create_partition / cdb_run_partition_maintenance
+--     (identisch zu schema.sql)
+--
+-- Ablauf je Tabelle (eine Transaktion, Tabellen exklusiv gesperrt):
+--   alte Tabelle → <name>_legacy, partitionierte Tabelle per LIKE anlegen,
+--   Partitionen für den vorhandenen Zeitraum anlegen, Daten kopieren,
+--   Sequence an neue Tabelle hängen, Legacy-Tabelle löschen.
+--
+-- Voraussetzung: Schreibende Services (db_writer, execution) gestoppt.
+
+BEGIN;
+
+-- ============================================================================
+-- PARTITION MANAGEMENT
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS partition_config (
+    table_name VARCHAR(63) PRIMARY KEY,
+    column_name VARCHAR(63) NOT NULL,
+    granularity VARCHAR(5) NOT NULL DEFAULT 'month' CHECK (granularity IN ('day', 'month')),
+    premake INTEGER NOT NULL DEFAULT 3 CHECK (premake >= 1),
+    retention INTERVAL,                            -- NULL = unbegrenzt
+    drop_expired BOOLEAN NOT NULL DEFAULT FALSE    -- FALSE = nur DETACH (Archivierung)
+);
+
+INSERT INTO partition_config (table_name, column_name) VALUES
+    ('signals', 'timestamp'),
+    ('orders', 'created_at'),
+    ('trades', 'timestamp'),
+    ('portfolio_snapshots', 'timestamp')
+ON CONFLICT (table_name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION cdb_create_partition(
+    p_table TEXT,
+    p_column TEXT,
+    p_granularity TEXT,
+    p_at TIMESTAMPTZ
+) RETURNS TEXT AS $$
+DECLARE
+    v_start TIMESTAMPTZ := date_trunc(p_granularity, p_at, 'UTC');
+    v_end TIMESTAMPTZ := v_start + ('1 ' || p_granularity)::INTERVAL;
+    v_name TEXT := p_table || '_p' || to_char(
+        v_start AT TIME ZONE 'UTC',
+        CASE p_granularity WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END
+    );
+BEGIN
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        v_name, p_table
+    );
+    IF to_regclass(p_table || '_default') IS NOT NULL THEN
+        -- Umzug innerhalb derselben Tabelle: Row-Trigger (z.B. order_ids)
+        -- dürfen ihn nicht als Löschung sehen
+        EXECUTE format('ALTER TABLE %I DISABLE TRIGGER USER', p_table || '_default');
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            p_table || '_default', p_column, v_start, p_column, v_end, v_name
+        );
+        EXECUTE format('ALTER TABLE %I ENABLE TRIGGER USER', p_table || '_default');
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        p_table, v_name, v_start, v_end
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION cdb_run_partition_maintenance(p_now TIMESTAMPTZ DEFAULT now())
+RETURNS TABLE (table_name TEXT, action TEXT, partition_name TEXT) AS $$
+DECLARE
+    cfg RECORD;
+    part RECORD;
+    v_created TEXT;
+    v_step INTERVAL;
+    v_fmt TEXT;
+    v_part_end TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_partition_maintenance')) THEN
+        RETURN;
+    END IF;
+
+    FOR cfg IN SELECT * FROM partition_config c ORDER BY c.table_name LOOP
+        v_step := ('1 ' || cfg.granularity)::INTERVAL;
+        v_fmt := CASE cfg.granularity WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END;
+
+        IF to_regclass(cfg.table_name || '_default') IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I DEFAULT',
+                cfg.table_name || '_default', cfg.table_name
+            );
+        END IF;
+
+        FOR i IN 0..cfg.premake LOOP
+            v_created := cdb_create_partition(
+                cfg.table_name, cfg.column_name, cfg.granularity, p_now + i * v_step
+            );
+            IF v_created IS NOT NULL THEN
+                table_name := cfg.table_name;
+                action := 'created';
+                partition_name := v_created;
+                RETURN NEXT;
+            END IF;
+        END LOOP;
+
+        CONTINUE WHEN cfg.retention IS NULL;
+
+        FOR part IN
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = cfg.table_name::regclass
+              AND c.relname ~ ('^' || cfg.table_name || '_p[0-9]+$')
+            ORDER BY c.relname
+        LOOP
+            v_part_end := (
+                to_date(substring(part.relname FROM '_p([0-9]+)$'), v_fmt)::TIMESTAMP
+                AT TIME ZONE 'UTC'
+            ) + v_step;
+            CONTINUE WHEN v_part_end > p_now - cfg.retention;
+
+            -- DETACH/DROP feuern keinen DELETE-Trigger: Reservierungen der
+            -- ausgehängten Orders selbst freigeben, sonst wächst order_ids ewig
+            IF cfg.table_name = 'orders' THEN
+                EXECUTE format(
+                    'DELETE FROM order_ids o USING %I p WHERE o.order_id = p.order_id',
+                    part.relname
+                );
+            END IF;
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', cfg.table_name, part.relname);
+            table_name := cfg.table_name;
+            partition_name := part.relname;
+            IF cfg.drop_expired THEN
+                EXECUTE format('DROP TABLE %I', part.relname);
+                action := 'dropped';
+            ELSE
+                action := 'detached';
+            END IF;
+            RETURN NEXT;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Heap-Tabelle → partitionierte Tabelle (Daten, Defaults, CHECKs, Sequence)
+CREATE OR REPLACE FUNCTION cdb_migrate_to_partitioned(
+    p_table TEXT,
+    p_column TEXT,
+    p_granularity TEXT DEFAULT 'month'
+) RETURNS BIGINT AS $$
+DECLARE
+    v_legacy TEXT := p_table || '_legacy';
+    v_seq TEXT := pg_get_serial_sequence(p_table, 'id');
+    v_from TIMESTAMPTZ;
+    v_at TIMESTAMPTZ;
+    v_rows BIGINT;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table WHERE partrelid = p_table::regclass
+    ) THEN
+        RAISE NOTICE '% ist bereits partitioniert', p_table;
+        RETURN 0;
+    END IF;
+
+    EXECUTE format('LOCK TABLE %I IN ACCESS EXCLUSIVE MODE', p_table);
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_table, v_legacy);
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS '
+        'INCLUDING COMMENTS, PRIMARY KEY (id, %I)) PARTITION BY RANGE (%I)',
+        p_table, v_legacy, p_column, p_column
+    );
+
+    -- Partitionen für die vorhandene Historie
+    EXECUTE format('SELECT min(%I) FROM %I', p_column, v_legacy) INTO v_from;
+    v_at := LEAST(COALESCE(v_from, now()), now());
+    WHILE v_at < now() + ('1 ' || p_granularity)::INTERVAL LOOP
+        PERFORM cdb_create_partition(p_table, p_column, p_granularity, v_at);
+        v_at := v_at + ('1 ' || p_granularity)::INTERVAL;
+    END LOOP;
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF %I DEFAULT', p_table || '_default', p_table
+    );
+
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', p_table, v_legacy);
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+    IF v_seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', v_seq, p_table);
+    END IF;
+    EXECUTE format('DROP TABLE %I CASCADE', v_legacy);
+
+    RAISE NOTICE '% partitioniert: % Zeilen übernommen', p_table, v_rows;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- MIGRATION
+-- ============================================================================
+
+-- FKs auf künftig partitionierte Tabellen (PK enthält dann die Zeitspalte)
+ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_order_id_fkey;
+ALTER TABLE orders DROP CONSTRAINT IF EXISTS orders_signal_id_fkey;
+
+SELECT cdb_migrate_to_partitioned('signals', 'timestamp');
+SELECT cdb_migrate_to_partitioned('orders', 'created_at');
+SELECT cdb_migrate_to_partitioned('trades', 'timestamp');
+SELECT cdb_migrate_to_partitioned('portfolio_snapshots', 'timestamp');
+
+DROP FUNCTION cdb_migrate_to_partitioned(TEXT, TEXT, TEXT);
+
+-- Indexe auf den partitionierten Tabellen (werden an alle Partitionen vererbt)
+-- orders.order_id global eindeutig: UNIQUE auf der partitionierten Tabelle
+-- müsste created_at enthalten und würde Duplikate über Partitionen (und
+-- abweichende Zeitstempel) zulassen. Der Trigger reserviert jede order_id
+-- in einer kleinen, nicht partitionierten Tabelle; ein Duplikat scheitert
+-- wie zuvor mit unique_violation (order_ids_pkey).
+-- (UNIQUE (order_id) aus Migration 003 ist mit der Legacy-Tabelle entfallen)
+CREATE TABLE IF NOT EXISTS order_ids (
+    order_id VARCHAR(100) PRIMARY KEY,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+COMMENT ON TABLE order_ids IS 'Eindeutigkeit von orders.order_id über alle Partitionen (gepflegt per Trigger)';
+
+CREATE OR REPLACE FUNCTION cdb_claim_order_id() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.order_id IS NOT NULL
+       AND (TG_OP = 'DELETE' OR OLD.order_id IS DISTINCT FROM NEW.order_id) THEN
+        DELETE FROM order_ids WHERE order_id = OLD.order_id;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    IF NEW.order_id IS NOT NULL
+       AND (TG_OP = 'INSERT' OR OLD.order_id IS DISTINCT FROM NEW.order_id) THEN
+        INSERT INTO order_ids (order_id, created_at) VALUES (NEW.order_id, NEW.created_at);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER orders_order_id_unique
+    BEFORE INSERT OR UPDATE OF order_id OR DELETE ON orders
+    FOR EACH ROW EXECUTE FUNCTION cdb_claim_order_id();
+
+INSERT INTO order_ids (order_id, created_at)
+SELECT order_id, min(created_at) FROM orders
+WHERE order_id IS NOT NULL
+GROUP BY order_id;
+
+CREATE INDEX idx_signals_symbol ON signals(symbol);
+CREATE INDEX idx_signals_signal_type ON signals(signal_type);
+CREATE INDEX idx_signals_timestamp_brin ON signals USING BRIN (timestamp);
+
+CREATE INDEX idx_orders_symbol ON orders(symbol);
+CREATE INDEX idx_orders_order_id ON orders(order_id);
+CREATE INDEX idx_orders_status ON orders(status);
+CREATE INDEX idx_orders_signal_id ON orders(signal_id);
+CREATE INDEX idx_orders_created_at_brin ON orders USING BRIN (created_at);
+
+CREATE INDEX idx_trades_symbol ON trades(symbol);
+CREATE INDEX idx_trades_order_id ON trades(order_id);
+CREATE INDEX idx_trades_status ON trades(status);
+CREATE INDEX idx_trades_timestamp_brin ON trades USING BRIN (timestamp);
+
+CREATE INDEX idx_portfolio_snapshots_timestamp_brin ON portfolio_snapshots USING BRIN (timestamp);
+
+-- Künftige Partitionen (premake) anlegen
+SELECT * FROM cdb_run_partition_maintenance();
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO claire_user;
+GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO claire_user;
+
+-- Migration-Version aktualisieren
+INSERT INTO schema_version (version, description) VALUES
+    ('1.1.0', 'Range-partitioned time series tables + BRIN + partition maintenance');
+
+-- Validierung
+DO $$
+DECLARE
+    t TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['signals', 'orders', 'trades', 'portfolio_snapshots'] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_partitioned_table WHERE partrelid = t::regclass
+        ) THEN
+            RAISE EXCEPTION 'Migration fehlgeschlagen: % ist nicht partitioniert', t;
+        END IF;
+    END LOOP;
+
+    RAISE NOTICE 'Migration 004 erfolgreich: Zeitreihen-Tabellen partitioniert';
+END $$;
+
+COMMIT;
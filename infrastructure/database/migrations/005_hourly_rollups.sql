@@ -0,0 +1,213 @@
+-- ============================================================================
+-- Migration 005: Stündliche Rollup-Tabellen
+-- Datum: 2026-10-19
+-- Grund: Reports, query_analytics.py und Grafana aggregieren bisher bei jedem
+--        Aufruf die vollständigen Rohtabellen (orders, trades,
+--        portfolio_snapshots)
+--
+-- Änderungen:
+--   - orders_hourly: Orders je Stunde/Symbol/Strategie/Status/Ablehnungsgrund
+--   - trades_hourly: Trades je Stunde/Symbol/Seite (Volumen, Notional, Fees,
+--     Slippage)
+--   - portfolio_hourly: Snapshots je Stunde (Equity-Spanne, PnL-Schlusswerte)
+--   - rollup_watermarks + cdb_refresh_rollups() (identisch zu schema.sql)
+--   - Backfill der vorhandenen Historie beim ersten Refresh
+--
+-- Kein Downtime-Bedarf: nur neue Tabellen/Funktionen.
+
+BEGIN;
+
+-- ============================================================================
+-- HOURLY ROLLUPS - Aggregate für Reports und Dashboards
+-- ============================================================================
+-- cdb_refresh_rollups() rechnet je Rollup die Stunden ab (Watermark - Lookback)
+-- neu (DELETE + INSERT, idempotent) und setzt die Watermark auf die laufende
+-- Stunde. Nachzügler (Batches, Dead-Letter-Retries) und Status-Updates im
+-- Lookback werden so erfasst; Reports lesen O(Stunden) statt O(Zeilen).
+-- Aufruf: db_writer (DB_WRITER_ROLLUP_REFRESH_S) und Reports vor dem Lesen.
+-- Ältere Nachzügler (z. B. DLQ-Redrive nach Stunden) mit größerem Lookback
+-- nachziehen: SELECT * FROM cdb_refresh_rollups(now(), INTERVAL '7 days');
+
+CREATE TABLE orders_hourly (
+    bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+    symbol VARCHAR(20) NOT NULL,
+    strategy_id VARCHAR(100) NOT NULL DEFAULT '',
+    status VARCHAR(20) NOT NULL,
+    rejection_reason TEXT NOT NULL DEFAULT '',
+    order_count BIGINT NOT NULL,
+    notional DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    PRIMARY KEY (bucket, symbol, strategy_id, status, rejection_reason)
+);
+
+CREATE TABLE trades_hourly (
+    bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+    symbol VARCHAR(20) NOT NULL,
+    side VARCHAR(10) NOT NULL,
+    trade_count BIGINT NOT NULL,
+    volume DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    notional DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    fees DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    slippage_bps_sum DECIMAL(20, 2) NOT NULL DEFAULT 0.0,
+    slippage_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, symbol, side)
+);
+
+CREATE TABLE portfolio_hourly (
+    bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+    snapshot_count BIGINT NOT NULL,
+    daily_pnl_sum DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8),
+    close_realized_pnl DECIMAL(18, 8),
+    close_unrealized_pnl DECIMAL(18, 8)
+);
+
+CREATE TABLE rollup_watermarks (
+    rollup_name VARCHAR(63) PRIMARY KEY,
+    watermark TIMESTAMP WITH TIME ZONE NOT NULL,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE orders_hourly IS 'Orders je Stunde/Symbol/Strategie/Status (cdb_refresh_rollups)';
+COMMENT ON TABLE trades_hourly IS 'Trades je Stunde/Symbol/Seite: Volumen, Notional, Fees, Slippage';
+COMMENT ON TABLE portfolio_hourly IS 'Portfolio-Snapshots je Stunde: Equity-Spanne, PnL zum Stundenende';
+COMMENT ON COLUMN trades_hourly.slippage_bps_sum IS 'Summe slippage_bps; Mittelwert = slippage_bps_sum / slippage_count';
+COMMENT ON COLUMN rollup_watermarks.watermark IS 'Stunden < watermark gelten als vollständig (Lookback rechnet nach)';
+
+-- Startpunkt eines Refreshs: Watermark - Lookback, beim ersten Lauf die
+-- älteste Stunde der Quelltabelle (Backfill)
+CREATE OR REPLACE FUNCTION cdb_rollup_start(
+    p_rollup TEXT,
+    p_table TEXT,
+    p_column TEXT,
+    p_hour TIMESTAMPTZ,
+    p_lookback INTERVAL
+) RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    v_from TIMESTAMPTZ;
+BEGIN
+    SELECT w.watermark - p_lookback INTO v_from
+    FROM rollup_watermarks w
+    WHERE w.rollup_name = p_rollup;
+    IF NOT FOUND THEN
+        EXECUTE format(
+            'SELECT date_trunc(''hour'', min(%I), ''UTC'') FROM %I', p_column, p_table
+        ) INTO v_from;
+    END IF;
+    RETURN LEAST(COALESCE(v_from, p_hour), p_hour);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION cdb_refresh_rollups(
+    p_now TIMESTAMPTZ DEFAULT now(),
+    p_lookback INTERVAL DEFAULT INTERVAL '2 hours'
+) RETURNS TABLE (rollup TEXT, bucket_from TIMESTAMPTZ, rows_written BIGINT) AS $$
+DECLARE
+    v_hour TIMESTAMPTZ := date_trunc('hour', p_now, 'UTC');
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_refresh_rollups')) THEN
+        RETURN;
+    END IF;
+
+    -- Orders (Zeitachse created_at)
+    rollup := 'orders_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'orders', 'created_at', v_hour, p_lookback);
+    DELETE FROM orders_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO orders_hourly (
+        bucket, symbol, strategy_id, status, rejection_reason, order_count, notional
+    )
+    SELECT
+        date_trunc('hour', o.created_at, 'UTC'),
+        o.symbol,
+        COALESCE(o.metadata->>'strategy_id', ''),
+        o.status,
+        COALESCE(o.rejection_reason, ''),
+        COUNT(*),
+        COALESCE(SUM(o.size * COALESCE(o.avg_fill_price, o.price, 0)), 0)
+    FROM orders o
+    WHERE o.created_at >= bucket_from
+    GROUP BY 1, 2, 3, 4, 5;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Trades
+    rollup := 'trades_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'trades', 'timestamp', v_hour, p_lookback);
+    DELETE FROM trades_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO trades_hourly (
+        bucket, symbol, side, trade_count, volume, notional, fees,
+        slippage_bps_sum, slippage_count
+    )
+    SELECT
+        date_trunc('hour', t.timestamp, 'UTC'),
+        t.symbol,
+        t.side,
+        COUNT(*),
+        SUM(t.size),
+        SUM(t.size * t.execution_price),
+        COALESCE(SUM(t.fees), 0),
+        COALESCE(SUM(t.slippage_bps), 0),
+        COUNT(t.slippage_bps)
+    FROM trades t
+    WHERE t.timestamp >= bucket_from
+    GROUP BY 1, 2, 3;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Portfolio (Schlusswerte = letzter Snapshot der Stunde)
+    rollup := 'portfolio_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'portfolio_snapshots', 'timestamp', v_hour, p_lookback);
+    DELETE FROM portfolio_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO portfolio_hourly (
+        bucket, snapshot_count, daily_pnl_sum, min_equity, max_equity,
+        close_equity, close_daily_pnl, close_realized_pnl, close_unrealized_pnl
+    )
+    SELECT
+        date_trunc('hour', p.timestamp, 'UTC'),
+        COUNT(*),
+        COALESCE(SUM(p.daily_pnl), 0),
+        MIN(p.total_equity),
+        MAX(p.total_equity),
+        (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_realized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_unrealized_pnl ORDER BY p.timestamp DESC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= bucket_from
+    GROUP BY 1;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    INSERT INTO rollup_watermarks AS w (rollup_name, watermark, refreshed_at)
+    VALUES
+        ('orders_hourly', v_hour, p_now),
+        ('trades_hourly', v_hour, p_now),
+        ('portfolio_hourly', v_hour, p_now)
+    ON CONFLICT ON CONSTRAINT rollup_watermarks_pkey
+    DO UPDATE SET watermark = EXCLUDED.watermark, refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill (erster Lauf ohne Watermark rechnet die gesamte Historie)
+SELECT * FROM cdb_refresh_rollups();
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO claire_user;
+GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO claire_user;
+
+-- Migration-Version aktualisieren
+INSERT INTO schema_version (version, description) VALUES
+    ('1.2.0', 'Hourly rollups (orders/trades/portfolio) + cdb_refresh_rollups');
+
+-- Validierung
+DO $$
+BEGIN
+    IF (SELECT count(*) FROM rollup_watermarks) <> 3 THEN
+        RAISE EXCEPTION 'Migration fehlgeschlagen: Rollup-Watermarks fehlen';
+    END IF;
+
+    RAISE NOTICE 'Migration 005 erfolgreich: Stündliche Rollups angelegt';
+END $$;
+
+COMMIT;
@@ -0,0 +1,366 @@
+-- ============================================================================
+-- Migration 006: Portfolio-Snapshots gestuft verdichten
+-- Datum: 2026-10-19
+-- Grund: portfolio_snapshots wächst mit jeder publizierten Snapshot-Frequenz,
+--        Dashboards brauchen nach einem Tag nur Minuten-, nach 30 Tagen nur
+--        Stundenauflösung
+--
+-- Änderungen:
+--   - portfolio_hourly.open_equity (OHLC der Equity je Stunde)
+--   - cdb_refresh_rollups(): open_equity, Portfolio-Stunden vor der
+--     Kompaktierungsgrenze werden nicht mehr aus Rohdaten neu berechnet
+--   - portfolio_minutely + cdb_compact_portfolio_snapshots()
+--   - cdb_portfolio_equity(): Lesezugriff mit automatischer Stufenwahl
+--   (identisch zu schema.sql)
+--
+-- Die erste Kompaktierung übernimmt der db_writer
+-- (DB_WRITER_SNAPSHOT_COMPACTION_S); sie löscht Rohdaten älter als 24h.
+
+BEGIN;
+
+ALTER TABLE portfolio_hourly ADD COLUMN IF NOT EXISTS open_equity DECIMAL(18, 8);
+
+-- open_equity für bestehende Stunden aus den (noch vollständigen) Rohdaten
+UPDATE portfolio_hourly h
+SET open_equity = f.open_equity
+FROM (
+    SELECT
+        date_trunc('hour', p.timestamp, 'UTC') AS bucket,
+        (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1] AS open_equity
+    FROM portfolio_snapshots p
+    GROUP BY 1
+) f
+WHERE f.bucket = h.bucket;
+
+CREATE OR REPLACE FUNCTION cdb_refresh_rollups(
+    p_now TIMESTAMPTZ DEFAULT now(),
+    p_lookback INTERVAL DEFAULT INTERVAL '2 hours'
+) RETURNS TABLE (rollup TEXT, bucket_from TIMESTAMPTZ, rows_written BIGINT) AS $$
+DECLARE
+    v_hour TIMESTAMPTZ := date_trunc('hour', p_now, 'UTC');
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_refresh_rollups')) THEN
+        RETURN;
+    END IF;
+
+    -- Orders (Zeitachse created_at)
+    rollup := 'orders_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'orders', 'created_at', v_hour, p_lookback);
+    DELETE FROM orders_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO orders_hourly (
+        bucket, symbol, strategy_id, status, rejection_reason, order_count, notional
+    )
+    SELECT
+        date_trunc('hour', o.created_at, 'UTC'),
+        o.symbol,
+        COALESCE(o.metadata->>'strategy_id', ''),
+        o.status,
+        COALESCE(o.rejection_reason, ''),
+        COUNT(*),
+        COALESCE(SUM(o.size * COALESCE(o.avg_fill_price, o.price, 0)), 0)
+    FROM orders o
+    WHERE o.created_at >= bucket_from
+    GROUP BY 1, 2, 3, 4, 5;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Trades
+    rollup := 'trades_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'trades', 'timestamp', v_hour, p_lookback);
+    DELETE FROM trades_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO trades_hourly (
+        bucket, symbol, side, trade_count, volume, notional, fees,
+        slippage_bps_sum, slippage_count
+    )
+    SELECT
+        date_trunc('hour', t.timestamp, 'UTC'),
+        t.symbol,
+        t.side,
+        COUNT(*),
+        SUM(t.size),
+        SUM(t.size * t.execution_price),
+        COALESCE(SUM(t.fees), 0),
+        COALESCE(SUM(t.slippage_bps), 0),
+        COUNT(t.slippage_bps)
+    FROM trades t
+    WHERE t.timestamp >= bucket_from
+    GROUP BY 1, 2, 3;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Portfolio (Schlusswerte = letzter Snapshot der Stunde); Stunden vor
+    -- der Kompaktierungsgrenze (portfolio_raw) haben keine Rohdaten mehr
+    rollup := 'portfolio_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'portfolio_snapshots', 'timestamp', v_hour, p_lookback);
+    bucket_from := GREATEST(bucket_from, (
+        SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_raw'
+    ));
+    DELETE FROM portfolio_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO portfolio_hourly (
+        bucket, snapshot_count, daily_pnl_sum, min_equity, max_equity,
+        close_equity, close_daily_pnl, close_realized_pnl, close_unrealized_pnl,
+        open_equity
+    )
+    SELECT
+        date_trunc('hour', p.timestamp, 'UTC'),
+        COUNT(*),
+        COALESCE(SUM(p.daily_pnl), 0),
+        MIN(p.total_equity),
+        MAX(p.total_equity),
+        (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_realized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_unrealized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= bucket_from
+    GROUP BY 1;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    INSERT INTO rollup_watermarks AS w (rollup_name, watermark, refreshed_at)
+    VALUES
+        ('orders_hourly', v_hour, p_now),
+        ('trades_hourly', v_hour, p_now),
+        ('portfolio_hourly', v_hour, p_now)
+    ON CONFLICT ON CONSTRAINT rollup_watermarks_pkey
+    DO UPDATE SET watermark = EXCLUDED.watermark, refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- PORTFOLIO DOWNSAMPLING - Gestufte Aufbewahrung der Snapshots
+-- ============================================================================
+-- portfolio_snapshots erhält jeden publizierten Snapshot. Gestuft:
+--   - Rohdaten für p_raw_retention (Default 24h)
+--   - 1-Minuten-OHLC der Equity (portfolio_minutely) für p_minute_retention
+--     (Default 30 Tage)
+--   - danach nur noch portfolio_hourly (Rollup, s. o.)
+-- cdb_compact_portfolio_snapshots() verdichtet set-basiert und führt die
+-- Grenzen als Watermarks (portfolio_raw, portfolio_minutely). Die jeweils
+-- letzte Stunde Rohdaten bleibt immer erhalten (letzter Snapshot für Services).
+-- cdb_portfolio_equity() liest einen Zeitbereich aus der passenden Stufe.
+
+CREATE TABLE portfolio_minutely (
+    bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+    snapshot_count BIGINT NOT NULL,
+    daily_pnl_sum DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    open_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    close_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    open_equity DECIMAL(18, 8),
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8),
+    close_realized_pnl DECIMAL(18, 8),
+    close_unrealized_pnl DECIMAL(18, 8)
+);
+
+COMMENT ON TABLE portfolio_minutely IS 'Kompaktierte Portfolio-Snapshots je Minute (OHLC der Equity)';
+COMMENT ON COLUMN portfolio_minutely.close_at IS 'Zeitpunkt des letzten Snapshots (Merge bei Nachzüglern)';
+
+CREATE OR REPLACE FUNCTION cdb_compact_portfolio_snapshots(
+    p_now TIMESTAMPTZ DEFAULT now(),
+    p_raw_retention INTERVAL DEFAULT INTERVAL '24 hours',
+    p_minute_retention INTERVAL DEFAULT INTERVAL '30 days'
+) RETURNS TABLE (tier TEXT, boundary TIMESTAMPTZ, rows_affected BIGINT) AS $$
+DECLARE
+    v_raw_cutoff TIMESTAMPTZ;
+    v_minute_cutoff TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_compact_portfolio_snapshots')) THEN
+        RETURN;
+    END IF;
+
+    -- Grenzen stundengenau, nie rückwärts, letzte Stunde Rohdaten bleibt
+    SELECT LEAST(
+        date_trunc('hour', p_now - p_raw_retention, 'UTC'),
+        date_trunc('hour', max(p.timestamp), 'UTC')
+    ) INTO v_raw_cutoff
+    FROM portfolio_snapshots p;
+    v_raw_cutoff := GREATEST(v_raw_cutoff, (
+        SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_raw'
+    ));
+    v_minute_cutoff := GREATEST(
+        LEAST(date_trunc('hour', p_now - p_minute_retention, 'UTC'), v_raw_cutoff),
+        (SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_minutely')
+    );
+
+    -- Rohdaten -> Minuten (Merge, falls die Minute schon kompaktiert ist)
+    tier := 'minute';
+    boundary := v_raw_cutoff;
+    INSERT INTO portfolio_minutely AS m (
+        bucket, snapshot_count, daily_pnl_sum, open_at, close_at,
+        open_equity, min_equity, max_equity, close_equity,
+        close_daily_pnl, close_realized_pnl, close_unrealized_pnl
+    )
+    SELECT
+        date_trunc('minute', p.timestamp, 'UTC'),
+        COUNT(*),
+        COALESCE(SUM(p.daily_pnl), 0),
+        MIN(p.timestamp),
+        MAX(p.timestamp),
+        (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1],
+        MIN(p.total_equity),
+        MAX(p.total_equity),
+        (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_realized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_unrealized_pnl ORDER BY p.timestamp DESC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp < v_raw_cutoff
+    GROUP BY 1
+    ON CONFLICT (bucket) DO UPDATE SET
+        snapshot_count = m.snapshot_count + EXCLUDED.snapshot_count,
+        daily_pnl_sum = m.daily_pnl_sum + EXCLUDED.daily_pnl_sum,
+        open_equity = CASE WHEN EXCLUDED.open_at < m.open_at
+            THEN EXCLUDED.open_equity ELSE m.open_equity END,
+        open_at = LEAST(m.open_at, EXCLUDED.open_at),
+        min_equity = LEAST(m.min_equity, EXCLUDED.min_equity),
+        max_equity = GREATEST(m.max_equity, EXCLUDED.max_equity),
+        close_equity = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_equity ELSE m.close_equity END,
+        close_daily_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_daily_pnl ELSE m.close_daily_pnl END,
+        close_realized_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_realized_pnl ELSE m.close_realized_pnl END,
+        close_unrealized_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_unrealized_pnl ELSE m.close_unrealized_pnl END,
+        close_at = GREATEST(m.close_at, EXCLUDED.close_at);
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    tier := 'raw_deleted';
+    DELETE FROM portfolio_snapshots p WHERE p.timestamp < v_raw_cutoff;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Minuten -> Stunden: portfolio_hourly ist i. d. R. schon vollständig
+    -- (cdb_refresh_rollups); fehlende Stunden aus den Minuten ergänzen
+    tier := 'hour';
+    boundary := v_minute_cutoff;
+    INSERT INTO portfolio_hourly (
+        bucket, snapshot_count, daily_pnl_sum, min_equity, max_equity,
+        close_equity, close_daily_pnl, close_realized_pnl, close_unrealized_pnl,
+        open_equity
+    )
+    SELECT
+        date_trunc('hour', m.bucket, 'UTC'),
+        SUM(m.snapshot_count),
+        SUM(m.daily_pnl_sum),
+        MIN(m.min_equity),
+        MAX(m.max_equity),
+        (array_agg(m.close_equity ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_daily_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_realized_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_unrealized_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.open_equity ORDER BY m.bucket ASC))[1]
+    FROM portfolio_minutely m
+    WHERE m.bucket < v_minute_cutoff
+    GROUP BY 1
+    ON CONFLICT (bucket) DO NOTHING;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    tier := 'minute_deleted';
+    DELETE FROM portfolio_minutely m WHERE m.bucket < v_minute_cutoff;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    IF v_raw_cutoff IS NOT NULL THEN
+        INSERT INTO rollup_watermarks AS w (rollup_name, watermark, refreshed_at)
+        VALUES
+            ('portfolio_raw', v_raw_cutoff, p_now),
+            ('portfolio_minutely', v_minute_cutoff, p_now)
+        ON CONFLICT ON CONSTRAINT rollup_watermarks_pkey
+        DO UPDATE SET watermark = EXCLUDED.watermark, refreshed_at = EXCLUDED.refreshed_at;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Equity-Verlauf für [p_from, p_to): je Teilbereich die feinste vorhandene
+-- Stufe, begrenzt durch die Spannweite (<= p_raw_span: Rohdaten,
+-- <= p_minute_span: Minuten, sonst Stunden). Nicht kompaktierte Rohdaten
+-- werden bei Bedarf on-the-fly auf Minuten verdichtet.
+CREATE OR REPLACE FUNCTION cdb_portfolio_equity(
+    p_from TIMESTAMPTZ,
+    p_to TIMESTAMPTZ DEFAULT now(),
+    p_raw_span INTERVAL DEFAULT INTERVAL '1 day',
+    p_minute_span INTERVAL DEFAULT INTERVAL '30 days'
+) RETURNS TABLE (
+    bucket TIMESTAMPTZ,
+    tier TEXT,
+    snapshot_count BIGINT,
+    open_equity DECIMAL(18, 8),
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8)
+) AS $$
+DECLARE
+    v_raw_start TIMESTAMPTZ := '-infinity';
+    v_minute_start TIMESTAMPTZ := '-infinity';
+    v_raw_from TIMESTAMPTZ;
+    v_minute_from TIMESTAMPTZ;
+BEGIN
+    SELECT COALESCE(max(w.watermark) FILTER (WHERE w.rollup_name = 'portfolio_raw'), v_raw_start),
+           COALESCE(max(w.watermark) FILTER (WHERE w.rollup_name = 'portfolio_minutely'), v_minute_start)
+    INTO v_raw_start, v_minute_start
+    FROM rollup_watermarks w;
+
+    v_raw_from := CASE WHEN p_to - p_from <= p_raw_span
+        THEN LEAST(GREATEST(p_from, v_raw_start), p_to) ELSE p_to END;
+    v_minute_from := CASE WHEN p_to - p_from <= p_minute_span
+        THEN LEAST(GREATEST(p_from, v_minute_start), v_raw_from) ELSE v_raw_from END;
+
+    RETURN QUERY
+    SELECT h.bucket, 'hour'::TEXT, h.snapshot_count, h.open_equity, h.min_equity,
+           h.max_equity, h.close_equity, h.close_daily_pnl
+    FROM portfolio_hourly h
+    WHERE h.bucket >= date_trunc('hour', p_from, 'UTC')
+      AND h.bucket < v_minute_from
+      AND (v_minute_from = p_to OR h.bucket + INTERVAL '1 hour' <= v_minute_from)
+    UNION ALL
+    SELECT m.bucket, 'minute'::TEXT, m.snapshot_count, m.open_equity, m.min_equity,
+           m.max_equity, m.close_equity, m.close_daily_pnl
+    FROM portfolio_minutely m
+    WHERE m.bucket >= date_trunc('minute', v_minute_from, 'UTC')
+      AND m.bucket < LEAST(v_raw_from, v_raw_start)
+    UNION ALL
+    SELECT date_trunc('minute', p.timestamp, 'UTC'), 'minute'::TEXT, COUNT(*),
+           (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1],
+           MIN(p.total_equity), MAX(p.total_equity),
+           (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+           (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= GREATEST(v_minute_from, v_raw_start)
+      AND p.timestamp < v_raw_from
+    GROUP BY 1
+    UNION ALL
+    SELECT p.timestamp, 'raw'::TEXT, 1::BIGINT, p.total_equity, p.total_equity,
+           p.total_equity, p.total_equity, p.daily_pnl
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= v_raw_from
+      AND p.timestamp < p_to
+    ORDER BY 1;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO claire_user;
+GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO claire_user;
+
+-- Migration-Version aktualisieren
+INSERT INTO schema_version (version, description) VALUES
+    ('1.3.0', 'Portfolio snapshot downsampling (raw/minute/hour tiers)');
+
+-- Validierung
+DO $$
+BEGIN
+    IF to_regclass('portfolio_minutely') IS NULL THEN
+        RAISE EXCEPTION 'Migration fehlgeschlagen: portfolio_minutely fehlt';
+    END IF;
+
+    RAISE NOTICE 'Migration 006 erfolgreich: Portfolio-Downsampling angelegt';
+END $$;
+
+COMMIT;
@@ -1,7 +1,7 @@
 -- DATABASE_SCHEMA.sql - Claire de Binare
 -- PostgreSQL Schema für Trading-System
 -- Erstellt: 2025-11-19
--- Version: 1.0.2
+-- Version: 1.3.0
 --
 -- Dieses Schema wird automatisch geladen beim ersten Start von cdb_postgres
 -- via docker-compose.yml → docker-entrypoint-initdb.d/01-schema.sql
@@ -15,13 +15,31 @@ DROP TABLE IF EXISTS positions CASCADE;
 DROP TABLE IF EXISTS trades CASCADE;
 DROP TABLE IF EXISTS orders CASCADE;
 DROP TABLE IF EXISTS signals CASCADE;
+DROP TABLE IF EXISTS partition_config CASCADE;
+DROP TABLE IF EXISTS orders_hourly CASCADE;
+DROP TABLE IF EXISTS trades_hourly CASCADE;
+DROP TABLE IF EXISTS portfolio_hourly CASCADE;
+DROP TABLE IF EXISTS portfolio_minutely CASCADE;
+DROP TABLE IF EXISTS rollup_watermarks CASCADE;
+
+-- ============================================================================
+-- PARTITIONIERUNG - Zeitreihen-Tabellen (signals, orders, trades,
+-- portfolio_snapshots) sind nach Zeitstempel range-partitioniert.
+--
+-- - Primary Keys enthalten den Partition-Key (Postgres-Vorgabe)
+-- - Zeitbereiche über BRIN-Indexe (je Partition, append-only → klein)
+-- - cdb_run_partition_maintenance() legt künftige Partitionen an und
+--   hängt abgelaufene aus (bzw. löscht sie), gesteuert über partition_config
+-- - Default-Partition fängt Ausreißer ab; beim Anlegen einer Partition
+--   werden passende Zeilen aus der Default-Partition übernommen
+-- ============================================================================
 
 -- ============================================================================
 -- SIGNALS - Trading-Signale vom Signal-Engine
 -- ============================================================================
 
 CREATE TABLE signals (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     symbol VARCHAR(20) NOT NULL,
     signal_type VARCHAR(10) NOT NULL CHECK (signal_type IN ('buy', 'sell')),
     price DECIMAL(18, 8) NOT NULL,
@@ -31,11 +49,12 @@ CREATE TABLE signals (
     metadata JSONB,
 
     -- Indexes
-    CONSTRAINT signals_symbol_check CHECK (LENGTH(symbol) >= 3)
-);
+    CONSTRAINT signals_symbol_check CHECK (LENGTH(symbol) >= 3),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
 
 CREATE INDEX idx_signals_symbol ON signals(symbol);
-CREATE INDEX idx_signals_timestamp ON signals(timestamp DESC);
+CREATE INDEX idx_signals_timestamp_brin ON signals USING BRIN (timestamp);
 CREATE INDEX idx_signals_signal_type ON signals(signal_type);
 
 COMMENT ON TABLE signals IS 'Trading-Signale generiert vom Signal-Engine';
@@ -47,9 +66,9 @@ COMMENT ON COLUMN signals.metadata IS 'Zusätzliche Signal-Metadaten als JSON';
 -- ============================================================================
 
 CREATE TABLE orders (
-    id SERIAL PRIMARY KEY,
-    order_id VARCHAR(100) UNIQUE,
-    signal_id INTEGER REFERENCES signals(id) ON DELETE SET NULL,
+    id SERIAL,
+    order_id VARCHAR(100),
+    signal_id INTEGER, -- signals.id (kein FK: Ziel ist partitioniert)
     symbol VARCHAR(20) NOT NULL,
     side VARCHAR(10) NOT NULL CHECK (side IN ('buy', 'sell', 'long', 'short')),
     order_type VARCHAR(20) NOT NULL DEFAULT 'market' CHECK (order_type IN ('market', 'limit', 'stop', 'stop_limit')),
@@ -75,28 +94,62 @@ CREATE TABLE orders (
 
     -- Constraints
     CONSTRAINT orders_size_positive CHECK (size > 0),
-    CONSTRAINT orders_filled_size_valid CHECK (filled_size >= 0 AND filled_size <= size)
-);
+    CONSTRAINT orders_filled_size_valid CHECK (filled_size >= 0 AND filled_size <= size),
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
 CREATE INDEX idx_orders_symbol ON orders(symbol);
 CREATE INDEX idx_orders_order_id ON orders(order_id);
 CREATE INDEX idx_orders_status ON orders(status);
-CREATE INDEX idx_orders_created_at ON orders(created_at DESC);
+CREATE INDEX idx_orders_created_at_brin ON orders USING BRIN (created_at);
 CREATE INDEX idx_orders_signal_id ON orders(signal_id);
 
 COMMENT ON TABLE orders IS 'Validierte Trading-Orders vom Risk-Manager';
-COMMENT ON COLUMN orders.order_id IS 'Execution Service Order ID (unique identifier for order tracking)';
+COMMENT ON COLUMN orders.order_id IS 'Execution Service Order ID (global eindeutig über order_ids)';
 COMMENT ON COLUMN orders.price IS 'Limit-Preis (NULL für Market-Orders ohne Limit)';
 COMMENT ON COLUMN orders.approved IS 'Risk-Validation bestanden?';
 COMMENT ON COLUMN orders.rejection_reason IS 'Grund für Ablehnung (falls approved=false)';
 
+-- orders.order_id global eindeutig: UNIQUE auf der partitionierten Tabelle
+-- müsste created_at enthalten und würde Duplikate über Partitionen (und
+-- abweichende Zeitstempel) zulassen. Der Trigger reserviert jede order_id
+-- in einer kleinen, nicht partitionierten Tabelle; ein Duplikat scheitert
+-- wie zuvor mit unique_violation (order_ids_pkey).
+CREATE TABLE order_ids (
+    order_id VARCHAR(100) PRIMARY KEY,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+COMMENT ON TABLE order_ids IS 'Eindeutigkeit von orders.order_id über alle Partitionen (gepflegt per Trigger)';
+
+CREATE OR REPLACE FUNCTION cdb_claim_order_id() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.order_id IS NOT NULL
+       AND (TG_OP = 'DELETE' OR OLD.order_id IS DISTINCT FROM NEW.order_id) THEN
+        DELETE FROM order_ids WHERE order_id = OLD.order_id;
+    END IF;
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    IF NEW.order_id IS NOT NULL
+       AND (TG_OP = 'INSERT' OR OLD.order_id IS DISTINCT FROM NEW.order_id) THEN
+        INSERT INTO order_ids (order_id, created_at) VALUES (NEW.order_id, NEW.created_at);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER orders_order_id_unique
+    BEFORE INSERT OR UPDATE OF order_id OR DELETE ON orders
+    FOR EACH ROW EXECUTE FUNCTION cdb_claim_order_id();
+
 -- ============================================================================
 -- TRADES - Ausgeführte Trades vom Execution-Service
 -- ============================================================================
 
 CREATE TABLE trades (
-    id SERIAL PRIMARY KEY,
-    order_id INTEGER REFERENCES orders(id) ON DELETE SET NULL,
+    id SERIAL,
+    order_id INTEGER, -- orders.id (kein FK: Ziel ist partitioniert)
     symbol VARCHAR(20) NOT NULL,
     side VARCHAR(10) NOT NULL CHECK (side IN ('buy', 'sell')),
     price DECIMAL(18, 8) NOT NULL,
@@ -121,11 +174,12 @@ CREATE TABLE trades (
     -- Constraints
     CONSTRAINT trades_size_positive CHECK (size > 0),
     CONSTRAINT trades_price_positive CHECK (price > 0),
-    CONSTRAINT trades_execution_price_positive CHECK (execution_price > 0)
-);
+    CONSTRAINT trades_execution_price_positive CHECK (execution_price > 0),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
 
 CREATE INDEX idx_trades_symbol ON trades(symbol);
-CREATE INDEX idx_trades_timestamp ON trades(timestamp DESC);
+CREATE INDEX idx_trades_timestamp_brin ON trades USING BRIN (timestamp);
 CREATE INDEX idx_trades_order_id ON trades(order_id);
 CREATE INDEX idx_trades_status ON trades(status);
 
@@ -182,7 +236,7 @@ COMMENT ON COLUMN positions.liquidation_price IS 'Liquidations-Preis für Perpet
 -- ============================================================================
 
 CREATE TABLE portfolio_snapshots (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
 
     -- Portfolio-Metriken
@@ -208,15 +262,561 @@ CREATE TABLE portfolio_snapshots (
     -- Constraints
     CONSTRAINT portfolio_snapshots_equity_positive CHECK (total_equity > 0),
     CONSTRAINT portfolio_snapshots_balance_non_negative CHECK (available_balance >= 0),
-    CONSTRAINT portfolio_snapshots_exposure_valid CHECK (total_exposure_pct >= 0 AND total_exposure_pct <= 1)
-);
+    CONSTRAINT portfolio_snapshots_exposure_valid CHECK (total_exposure_pct >= 0 AND total_exposure_pct <= 1),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
 
-CREATE INDEX idx_portfolio_snapshots_timestamp ON portfolio_snapshots(timestamp DESC);
+CREATE INDEX idx_portfolio_snapshots_timestamp_brin ON portfolio_snapshots USING BRIN (timestamp);
 
 COMMENT ON TABLE portfolio_snapshots IS 'Portfolio-Snapshots für Performance-Tracking und Backtesting';
 COMMENT ON COLUMN portfolio_snapshots.total_exposure_pct IS 'Gesamt-Exposure als % von Equity (0.0-1.0)';
 COMMENT ON COLUMN portfolio_snapshots.max_drawdown_pct IS 'Maximaler Drawdown seit Snapshot-Start';
 
+-- ============================================================================
+-- PARTITION MANAGEMENT - Vorlauf anlegen, Retention durchsetzen
+-- ============================================================================
+
+CREATE TABLE partition_config (
+    table_name VARCHAR(63) PRIMARY KEY,
+    column_name VARCHAR(63) NOT NULL,
+    granularity VARCHAR(5) NOT NULL DEFAULT 'month' CHECK (granularity IN ('day', 'month')),
+    premake INTEGER NOT NULL DEFAULT 3 CHECK (premake >= 1),
+    retention INTERVAL,                            -- NULL = unbegrenzt
+    drop_expired BOOLEAN NOT NULL DEFAULT FALSE    -- FALSE = nur DETACH (Archivierung)
+);
+
+COMMENT ON TABLE partition_config IS 'Partitionierung je Zeitreihen-Tabelle (Granularität, Vorlauf, Retention)';
+COMMENT ON COLUMN partition_config.premake IS 'Anzahl künftiger Partitionen, die vorab angelegt werden';
+COMMENT ON COLUMN partition_config.drop_expired IS 'Abgelaufene Partitionen löschen statt nur aushängen';
+
+INSERT INTO partition_config (table_name, column_name) VALUES
+    ('signals', 'timestamp'),
+    ('orders', 'created_at'),
+    ('trades', 'timestamp'),
+    ('portfolio_snapshots', 'timestamp');
+
+-- Partition für den Zeitraum um p_at anlegen (idempotent). Zeilen, die
+-- bereits in der Default-Partition liegen, werden übernommen.
+CREATE OR REPLACE FUNCTION cdb_create_partition(
+    p_table TEXT,
+    p_column TEXT,
+    p_granularity TEXT,
+    p_at TIMESTAMPTZ
+) RETURNS TEXT AS $$
+DECLARE
+    v_start TIMESTAMPTZ := date_trunc(p_granularity, p_at, 'UTC');
+    v_end TIMESTAMPTZ := v_start + ('1 ' || p_granularity)::INTERVAL;
+    v_name TEXT := p_table || '_p' || to_char(
+        v_start AT TIME ZONE 'UTC',
+        CASE p_granularity WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END
+    );
+BEGIN
+    IF to_regclass(v_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        v_name, p_table
+    );
+    IF to_regclass(p_table || '_default') IS NOT NULL THEN
+        -- Umzug innerhalb derselben Tabelle: Row-Trigger (z.B. order_ids)
+        -- dürfen ihn nicht als Löschung sehen
+        EXECUTE format('ALTER TABLE %I DISABLE TRIGGER USER', p_table || '_default');
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            p_table || '_default', p_column, v_start, p_column, v_end, v_name
+        );
+        EXECUTE format('ALTER TABLE %I ENABLE TRIGGER USER', p_table || '_default');
+    END IF;
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        p_table, v_name, v_start, v_end
+    );
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Wartungsjob (z.B. stündlich durch den DB-Writer): legt die aktuelle und
+-- premake künftige Partitionen an, hängt Partitionen älter als retention
+-- aus und löscht sie bei drop_expired. Replikas serialisiert ein Advisory-Lock.
+CREATE OR REPLACE FUNCTION cdb_run_partition_maintenance(p_now TIMESTAMPTZ DEFAULT now())
+RETURNS TABLE (table_name TEXT, action TEXT, partition_name TEXT) AS $$
+DECLARE
+    cfg RECORD;
+    part RECORD;
+    v_created TEXT;
+    v_step INTERVAL;
+    v_fmt TEXT;
+    v_part_end TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_partition_maintenance')) THEN
+        RETURN;
+    END IF;
+
+    FOR cfg IN SELECT * FROM partition_config c ORDER BY c.table_name LOOP
+        v_step := ('1 ' || cfg.granularity)::INTERVAL;
+        v_fmt := CASE cfg.granularity WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END;
+
+        IF to_regclass(cfg.table_name || '_default') IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I DEFAULT',
+                cfg.table_name || '_default', cfg.table_name
+            );
+        END IF;
+
+        FOR i IN 0..cfg.premake LOOP
+            v_created := cdb_create_partition(
+                cfg.table_name, cfg.column_name, cfg.granularity, p_now + i * v_step
+            );
+            IF v_created IS NOT NULL THEN
+                table_name := cfg.table_name;
+                action := 'created';
+                partition_name := v_created;
+                RETURN NEXT;
+            END IF;
+        END LOOP;
+
+        CONTINUE WHEN cfg.retention IS NULL;
+
+        FOR part IN
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = cfg.table_name::regclass
+              AND c.relname ~ ('^' || cfg.table_name || '_p[0-9]+$')
+            ORDER BY c.relname
+        LOOP
+            v_part_end := (
+                to_date(substring(part.relname FROM '_p([0-9]+)$'), v_fmt)::TIMESTAMP
+                AT TIME ZONE 'UTC'
+            ) + v_step;
+            CONTINUE WHEN v_part_end > p_now - cfg.retention;
+
+            -- DETACH/DROP feuern keinen DELETE-Trigger: Reservierungen der
+            -- ausgehängten Orders selbst freigeben, sonst wächst order_ids ewig
+            IF cfg.table_name = 'orders' THEN
+                EXECUTE format(
+                    'DELETE FROM order_ids o USING %I p WHERE o.order_id = p.order_id',
+                    part.relname
+                );
+            END IF;
+            EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', cfg.table_name, part.relname);
+            table_name := cfg.table_name;
+            partition_name := part.relname;
+            IF cfg.drop_expired THEN
+                EXECUTE format('DROP TABLE %I', part.relname);
+                action := 'dropped';
+            ELSE
+                action := 'detached';
+            END IF;
+            RETURN NEXT;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT * FROM cdb_run_partition_maintenance();
+
+-- ============================================================================
+-- HOURLY ROLLUPS - Aggregate für Reports und Dashboards
+-- ============================================================================
+-- cdb_refresh_rollups() rechnet je Rollup die Stunden ab (Watermark - Lookback)
+-- neu (DELETE + INSERT, idempotent) und setzt die Watermark auf die laufende
+-- Stunde. Nachzügler (Batches, Dead-Letter-Retries) und Status-Updates im
+-- Lookback werden so erfasst; Reports lesen O(Stunden) statt O(Zeilen).
+-- Aufruf: db_writer (DB_WRITER_ROLLUP_REFRESH_S) und Reports vor dem Lesen.
+-- Ältere Nachzügler (z. B. DLQ-Redrive nach Stunden) mit größerem Lookback
+-- nachziehen: SELECT * FROM cdb_refresh_rollups(now(), INTERVAL '7 days');
+
+CREATE TABLE orders_hourly (
+    bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+    symbol VARCHAR(20) NOT NULL,
+    strategy_id VARCHAR(100) NOT NULL DEFAULT '',
+    status VARCHAR(20) NOT NULL,
+    rejection_reason TEXT NOT NULL DEFAULT '',
+    order_count BIGINT NOT NULL,
+    notional DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    PRIMARY KEY (bucket, symbol, strategy_id, status, rejection_reason)
+);
+
+CREATE TABLE trades_hourly (
+    bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+    symbol VARCHAR(20) NOT NULL,
+    side VARCHAR(10) NOT NULL,
+    trade_count BIGINT NOT NULL,
+    volume DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    notional DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    fees DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    slippage_bps_sum DECIMAL(20, 2) NOT NULL DEFAULT 0.0,
+    slippage_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, symbol, side)
+);
+
+CREATE TABLE portfolio_hourly (
+    bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+    snapshot_count BIGINT NOT NULL,
+    daily_pnl_sum DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8),
+    close_realized_pnl DECIMAL(18, 8),
+    close_unrealized_pnl DECIMAL(18, 8),
+    open_equity DECIMAL(18, 8)
+);
+
+CREATE TABLE rollup_watermarks (
+    rollup_name VARCHAR(63) PRIMARY KEY,
+    watermark TIMESTAMP WITH TIME ZONE NOT NULL,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE orders_hourly IS 'Orders je Stunde/Symbol/Strategie/Status (cdb_refresh_rollups)';
+COMMENT ON TABLE trades_hourly IS 'Trades je Stunde/Symbol/Seite: Volumen, Notional, Fees, Slippage';
+COMMENT ON TABLE portfolio_hourly IS 'Portfolio-Snapshots je Stunde: Equity-Spanne, PnL zum Stundenende';
+COMMENT ON COLUMN trades_hourly.slippage_bps_sum IS 'Summe slippage_bps; Mittelwert = slippage_bps_sum / slippage_count';
+COMMENT ON COLUMN rollup_watermarks.watermark IS 'Stunden < watermark gelten als vollständig (Lookback rechnet nach)';
+
+-- Startpunkt eines Refreshs: Watermark - Lookback, beim ersten Lauf die
+-- älteste Stunde der Quelltabelle (Backfill)
+CREATE OR REPLACE FUNCTION cdb_rollup_start(
+    p_rollup TEXT,
+    p_table TEXT,
+    p_column TEXT,
+    p_hour TIMESTAMPTZ,
+    p_lookback INTERVAL
+) RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    v_from TIMESTAMPTZ;
+BEGIN
+    SELECT w.watermark - p_lookback INTO v_from
+    FROM rollup_watermarks w
+    WHERE w.rollup_name = p_rollup;
+    IF NOT FOUND THEN
+        EXECUTE format(
+            'SELECT date_trunc(''hour'', min(%I), ''UTC'') FROM %I', p_column, p_table
+        ) INTO v_from;
+    END IF;
+    RETURN LEAST(COALESCE(v_from, p_hour), p_hour);
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION cdb_refresh_rollups(
+    p_now TIMESTAMPTZ DEFAULT now(),
+    p_lookback INTERVAL DEFAULT INTERVAL '2 hours'
+) RETURNS TABLE (rollup TEXT, bucket_from TIMESTAMPTZ, rows_written BIGINT) AS $$
+DECLARE
+    v_hour TIMESTAMPTZ := date_trunc('hour', p_now, 'UTC');
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_refresh_rollups')) THEN
+        RETURN;
+    END IF;
+
+    -- Orders (Zeitachse created_at)
+    rollup := 'orders_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'orders', 'created_at', v_hour, p_lookback);
+    DELETE FROM orders_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO orders_hourly (
+        bucket, symbol, strategy_id, status, rejection_reason, order_count, notional
+    )
+    SELECT
+        date_trunc('hour', o.created_at, 'UTC'),
+        o.symbol,
+        COALESCE(o.metadata->>'strategy_id', ''),
+        o.status,
+        COALESCE(o.rejection_reason, ''),
+        COUNT(*),
+        COALESCE(SUM(o.size * COALESCE(o.avg_fill_price, o.price, 0)), 0)
+    FROM orders o
+    WHERE o.created_at >= bucket_from
+    GROUP BY 1, 2, 3, 4, 5;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Trades
+    rollup := 'trades_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'trades', 'timestamp', v_hour, p_lookback);
+    DELETE FROM trades_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO trades_hourly (
+        bucket, symbol, side, trade_count, volume, notional, fees,
+        slippage_bps_sum, slippage_count
+    )
+    SELECT
+        date_trunc('hour', t.timestamp, 'UTC'),
+        t.symbol,
+        t.side,
+        COUNT(*),
+        SUM(t.size),
+        SUM(t.size * t.execution_price),
+        COALESCE(SUM(t.fees), 0),
+        COALESCE(SUM(t.slippage_bps), 0),
+        COUNT(t.slippage_bps)
+    FROM trades t
+    WHERE t.timestamp >= bucket_from
+    GROUP BY 1, 2, 3;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Portfolio (Schlusswerte = letzter Snapshot der Stunde); Stunden vor
+    -- der Kompaktierungsgrenze (portfolio_raw) haben keine Rohdaten mehr
+    rollup := 'portfolio_hourly';
+    bucket_from := cdb_rollup_start(rollup, 'portfolio_snapshots', 'timestamp', v_hour, p_lookback);
+    bucket_from := GREATEST(bucket_from, (
+        SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_raw'
+    ));
+    DELETE FROM portfolio_hourly h WHERE h.bucket >= bucket_from;
+    INSERT INTO portfolio_hourly (
+        bucket, snapshot_count, daily_pnl_sum, min_equity, max_equity,
+        close_equity, close_daily_pnl, close_realized_pnl, close_unrealized_pnl,
+        open_equity
+    )
+    SELECT
+        date_trunc('hour', p.timestamp, 'UTC'),
+        COUNT(*),
+        COALESCE(SUM(p.daily_pnl), 0),
+        MIN(p.total_equity),
+        MAX(p.total_equity),
+        (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_realized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_unrealized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= bucket_from
+    GROUP BY 1;
+    GET DIAGNOSTICS rows_written = ROW_COUNT;
+    RETURN NEXT;
+
+    INSERT INTO rollup_watermarks AS w (rollup_name, watermark, refreshed_at)
+    VALUES
+        ('orders_hourly', v_hour, p_now),
+        ('trades_hourly', v_hour, p_now),
+        ('portfolio_hourly', v_hour, p_now)
+    ON CONFLICT ON CONSTRAINT rollup_watermarks_pkey
+    DO UPDATE SET watermark = EXCLUDED.watermark, refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- PORTFOLIO DOWNSAMPLING - Gestufte Aufbewahrung der Snapshots
+-- ============================================================================
+-- portfolio_snapshots erhält jeden publizierten Snapshot. Gestuft:
+--   - Rohdaten für p_raw_retention (Default 24h)
+--   - 1-Minuten-OHLC der Equity (portfolio_minutely) für p_minute_retention
+--     (Default 30 Tage)
+--   - danach nur noch portfolio_hourly (Rollup, s. o.)
+-- cdb_compact_portfolio_snapshots() verdichtet set-basiert und führt die
+-- Grenzen als Watermarks (portfolio_raw, portfolio_minutely). Die jeweils
+-- letzte Stunde Rohdaten bleibt immer erhalten (letzter Snapshot für Services).
+-- cdb_portfolio_equity() liest einen Zeitbereich aus der passenden Stufe.
+
+CREATE TABLE portfolio_minutely (
+    bucket TIMESTAMP WITH TIME ZONE PRIMARY KEY,
+    snapshot_count BIGINT NOT NULL,
+    daily_pnl_sum DECIMAL(28, 8) NOT NULL DEFAULT 0.0,
+    open_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    close_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    open_equity DECIMAL(18, 8),
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8),
+    close_realized_pnl DECIMAL(18, 8),
+    close_unrealized_pnl DECIMAL(18, 8)
+);
+
+COMMENT ON TABLE portfolio_minutely IS 'Kompaktierte Portfolio-Snapshots je Minute (OHLC der Equity)';
+COMMENT ON COLUMN portfolio_minutely.close_at IS 'Zeitpunkt des letzten Snapshots (Merge bei Nachzüglern)';
+
+CREATE OR REPLACE FUNCTION cdb_compact_portfolio_snapshots(
+    p_now TIMESTAMPTZ DEFAULT now(),
+    p_raw_retention INTERVAL DEFAULT INTERVAL '24 hours',
+    p_minute_retention INTERVAL DEFAULT INTERVAL '30 days'
+) RETURNS TABLE (tier TEXT, boundary TIMESTAMPTZ, rows_affected BIGINT) AS $$
+DECLARE
+    v_raw_cutoff TIMESTAMPTZ;
+    v_minute_cutoff TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('cdb_compact_portfolio_snapshots')) THEN
+        RETURN;
+    END IF;
+
+    -- Grenzen stundengenau, nie rückwärts, letzte Stunde Rohdaten bleibt
+    SELECT LEAST(
+        date_trunc('hour', p_now - p_raw_retention, 'UTC'),
+        date_trunc('hour', max(p.timestamp), 'UTC')
+    ) INTO v_raw_cutoff
+    FROM portfolio_snapshots p;
+    v_raw_cutoff := GREATEST(v_raw_cutoff, (
+        SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_raw'
+    ));
+    v_minute_cutoff := GREATEST(
+        LEAST(date_trunc('hour', p_now - p_minute_retention, 'UTC'), v_raw_cutoff),
+        (SELECT w.watermark FROM rollup_watermarks w WHERE w.rollup_name = 'portfolio_minutely')
+    );
+
+    -- Rohdaten -> Minuten (Merge, falls die Minute schon kompaktiert ist)
+    tier := 'minute';
+    boundary := v_raw_cutoff;
+    INSERT INTO portfolio_minutely AS m (
+        bucket, snapshot_count, daily_pnl_sum, open_at, close_at,
+        open_equity, min_equity, max_equity, close_equity,
+        close_daily_pnl, close_realized_pnl, close_unrealized_pnl
+    )
+    SELECT
+        date_trunc('minute', p.timestamp, 'UTC'),
+        COUNT(*),
+        COALESCE(SUM(p.daily_pnl), 0),
+        MIN(p.timestamp),
+        MAX(p.timestamp),
+        (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1],
+        MIN(p.total_equity),
+        MAX(p.total_equity),
+        (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_realized_pnl ORDER BY p.timestamp DESC))[1],
+        (array_agg(p.total_unrealized_pnl ORDER BY p.timestamp DESC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp < v_raw_cutoff
+    GROUP BY 1
+    ON CONFLICT (bucket) DO UPDATE SET
+        snapshot_count = m.snapshot_count + EXCLUDED.snapshot_count,
+        daily_pnl_sum = m.daily_pnl_sum + EXCLUDED.daily_pnl_sum,
+        open_equity = CASE WHEN EXCLUDED.open_at < m.open_at
+            THEN EXCLUDED.open_equity ELSE m.open_equity END,
+        open_at = LEAST(m.open_at, EXCLUDED.open_at),
+        min_equity = LEAST(m.min_equity, EXCLUDED.min_equity),
+        max_equity = GREATEST(m.max_equity, EXCLUDED.max_equity),
+        close_equity = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_equity ELSE m.close_equity END,
+        close_daily_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_daily_pnl ELSE m.close_daily_pnl END,
+        close_realized_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_realized_pnl ELSE m.close_realized_pnl END,
+        close_unrealized_pnl = CASE WHEN EXCLUDED.close_at >= m.close_at
+            THEN EXCLUDED.close_unrealized_pnl ELSE m.close_unrealized_pnl END,
+        close_at = GREATEST(m.close_at, EXCLUDED.close_at);
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    tier := 'raw_deleted';
+    DELETE FROM portfolio_snapshots p WHERE p.timestamp < v_raw_cutoff;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    -- Minuten -> Stunden: portfolio_hourly ist i. d. R. schon vollständig
+    -- (cdb_refresh_rollups); fehlende Stunden aus den Minuten ergänzen
+    tier := 'hour';
+    boundary := v_minute_cutoff;
+    INSERT INTO portfolio_hourly (
+        bucket, snapshot_count, daily_pnl_sum, min_equity, max_equity,
+        close_equity, close_daily_pnl, close_realized_pnl, close_unrealized_pnl,
+        open_equity
+    )
+    SELECT
+        date_trunc('hour', m.bucket, 'UTC'),
+        SUM(m.snapshot_count),
+        SUM(m.daily_pnl_sum),
+        MIN(m.min_equity),
+        MAX(m.max_equity),
+        (array_agg(m.close_equity ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_daily_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_realized_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.close_unrealized_pnl ORDER BY m.bucket DESC))[1],
+        (array_agg(m.open_equity ORDER BY m.bucket ASC))[1]
+    FROM portfolio_minutely m
+    WHERE m.bucket < v_minute_cutoff
+    GROUP BY 1
+    ON CONFLICT (bucket) DO NOTHING;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    tier := 'minute_deleted';
+    DELETE FROM portfolio_minutely m WHERE m.bucket < v_minute_cutoff;
+    GET DIAGNOSTICS rows_affected = ROW_COUNT;
+    RETURN NEXT;
+
+    IF v_raw_cutoff IS NOT NULL THEN
+        INSERT INTO rollup_watermarks AS w (rollup_name, watermark, refreshed_at)
+        VALUES
+            ('portfolio_raw', v_raw_cutoff, p_now),
+            ('portfolio_minutely', v_minute_cutoff, p_now)
+        ON CONFLICT ON CONSTRAINT rollup_watermarks_pkey
+        DO UPDATE SET watermark = EXCLUDED.watermark, refreshed_at = EXCLUDED.refreshed_at;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Equity-Verlauf für [p_from, p_to): je Teilbereich die feinste vorhandene
+-- Stufe, begrenzt durch die Spannweite (<= p_raw_span: Rohdaten,
+-- <= p_minute_span: Minuten, sonst Stunden). Nicht kompaktierte Rohdaten
+-- werden bei Bedarf on-the-fly auf Minuten verdichtet.
+CREATE OR REPLACE FUNCTION cdb_portfolio_equity(
+    p_from TIMESTAMPTZ,
+    p_to TIMESTAMPTZ DEFAULT now(),
+    p_raw_span INTERVAL DEFAULT INTERVAL '1 day',
+    p_minute_span INTERVAL DEFAULT INTERVAL '30 days'
+) RETURNS TABLE (
+    bucket TIMESTAMPTZ,
+    tier TEXT,
+    snapshot_count BIGINT,
+    open_equity DECIMAL(18, 8),
+    min_equity DECIMAL(18, 8),
+    max_equity DECIMAL(18, 8),
+    close_equity DECIMAL(18, 8),
+    close_daily_pnl DECIMAL(18, 8)
+) AS $$
+DECLARE
+    v_raw_start TIMESTAMPTZ := '-infinity';
+    v_minute_start TIMESTAMPTZ := '-infinity';
+    v_raw_from TIMESTAMPTZ;
+    v_minute_from TIMESTAMPTZ;
+BEGIN
+    SELECT COALESCE(max(w.watermark) FILTER (WHERE w.rollup_name = 'portfolio_raw'), v_raw_start),
+           COALESCE(max(w.watermark) FILTER (WHERE w.rollup_name = 'portfolio_minutely'), v_minute_start)
+    INTO v_raw_start, v_minute_start
+    FROM rollup_watermarks w;
+
+    v_raw_from := CASE WHEN p_to - p_from <= p_raw_span
+        THEN LEAST(GREATEST(p_from, v_raw_start), p_to) ELSE p_to END;
+    v_minute_from := CASE WHEN p_to - p_from <= p_minute_span
+        THEN LEAST(GREATEST(p_from, v_minute_start), v_raw_from) ELSE v_raw_from END;
+
+    RETURN QUERY
+    SELECT h.bucket, 'hour'::TEXT, h.snapshot_count, h.open_equity, h.min_equity,
+           h.max_equity, h.close_equity, h.close_daily_pnl
+    FROM portfolio_hourly h
+    WHERE h.bucket >= date_trunc('hour', p_from, 'UTC')
+      AND h.bucket < v_minute_from
+      AND (v_minute_from = p_to OR h.bucket + INTERVAL '1 hour' <= v_minute_from)
+    UNION ALL
+    SELECT m.bucket, 'minute'::TEXT, m.snapshot_count, m.open_equity, m.min_equity,
+           m.max_equity, m.close_equity, m.close_daily_pnl
+    FROM portfolio_minutely m
+    WHERE m.bucket >= date_trunc('minute', v_minute_from, 'UTC')
+      AND m.bucket < LEAST(v_raw_from, v_raw_start)
+    UNION ALL
+    SELECT date_trunc('minute', p.timestamp, 'UTC'), 'minute'::TEXT, COUNT(*),
+           (array_agg(p.total_equity ORDER BY p.timestamp ASC))[1],
+           MIN(p.total_equity), MAX(p.total_equity),
+           (array_agg(p.total_equity ORDER BY p.timestamp DESC))[1],
+           (array_agg(p.daily_pnl ORDER BY p.timestamp DESC))[1]
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= GREATEST(v_minute_from, v_raw_start)
+      AND p.timestamp < v_raw_from
+    GROUP BY 1
+    UNION ALL
+    SELECT p.timestamp, 'raw'::TEXT, 1::BIGINT, p.total_equity, p.total_equity,
+           p.total_equity, p.total_equity, p.daily_pnl
+    FROM portfolio_snapshots p
+    WHERE p.timestamp >= v_raw_from
+      AND p.timestamp < p_to
+    ORDER BY 1;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
 -- ============================================================================
 -- GRANTS - Permissions für claire_user
 -- ============================================================================
@@ -265,7 +865,10 @@ CREATE TABLE IF NOT EXISTS schema_version (
 );
 
 INSERT INTO schema_version (version, description) VALUES
-    ('1.0.2', 'Initial schema with orders.price nullable + orders.order_id column');
+    ('1.0.2', 'Initial schema with orders.price nullable + orders.order_id column'),
+    ('1.1.0', 'Range-partitioned time series tables + BRIN + partition maintenance'),
+    ('1.2.0', 'Hourly rollups (orders/trades/portfolio) + cdb_refresh_rollups'),
+    ('1.3.0', 'Portfolio snapshot downsampling (raw/minute/hour tiers)');
 
 -- ============================================================================
 -- VACUUM & ANALYZE - Optimiere nach Schema-Erstellung
@@ -277,6 +880,9 @@ VACUUM ANALYZE;
 -- SCHEMA-ERSTELLUNG ABGESCHLOSSEN
 -- ============================================================================
 -- Tabellen: signals, orders, trades, positions, portfolio_snapshots
+-- Partitioniert: signals, orders, trades, portfolio_snapshots (monatlich)
+-- Rollups: orders_hourly, trades_hourly, portfolio_hourly (cdb_refresh_rollups)
+-- Downsampling: portfolio_minutely (cdb_compact_portfolio_snapshots)
 -- User: claire_user (mit vollen Rechten)
 -- Initial Equity: 100,000 USDT
 -- Status: ✅ Ready for Paper Trading
@@ -7,14 +7,26 @@ Verwendung:
     python query_analytics.py --last-trades 20
     python query_analytics.py --portfolio-summary
     python query_analytics.py --daily-pnl
+    python query_analytics.py --equity-curve 7
+    python query_analytics.py --export trades --days 30 --format parquet --output trades.parquet
 """
 
 import sys
 import os
+import csv
+import json
 import argparse
+from decimal import Decimal
+from pathlib import Path
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 
+# Repo-Root für core.* (Aufruf als Skript)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from core.utils.postgres_client import iter_query_batches  # noqa: E402
+
 if sys.platform == "win32":
     import codecs
 
@@ -26,6 +38,63 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - import-time dependency check
     tabulate = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # pragma: no cover - optional, only for --format parquet
+    pa = None
+    pq = None
+
+# Exportierbare Tabellen -> Zeitspalte (Fenster + Sortierung)
+EXPORT_TABLES = {
+    "signals": "timestamp",
+    "orders": "created_at",
+    "trades": "timestamp",
+    "portfolio_snapshots": "timestamp",
+}
+
+# PostgreSQL-Typ-OIDs -> Arrow-Typ (Rest: string)
+ARROW_TYPES = {
+    16: "bool_",
+    20: "int64",
+    21: "int64",
+    23: "int64",
+    700: "float64",
+    701: "float64",
+    1700: "float64",  # numeric
+    1114: "timestamp",
+    1184: "timestamptz",
+}
+
+
+def _arrow_schema(description):
+    fields = []
+    for column in description:
+        kind = ARROW_TYPES.get(column.type_code, "string")
+        if kind == "timestamptz":
+            arrow_type = pa.timestamp("us", tz="UTC")
+        elif kind == "timestamp":
+            arrow_type = pa.timestamp("us")
+        else:
+            arrow_type = getattr(pa, kind)()
+        fields.append(pa.field(column.name, arrow_type))
+    return pa.schema(fields)
+
+
+def _export_value(value, arrow_type=None):
+    """Row value as CSV/Parquet cell (numeric -> float, json -> string)"""
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if arrow_type is None and isinstance(value, Decimal):
+        return format(value, "f")
+    if arrow_type is not None and pa.types.is_floating(arrow_type):
+        return float(value)
+    if arrow_type is not None and pa.types.is_string(arrow_type):
+        return value if isinstance(value, str) else str(value)
+    return value
+
 
 class AnalyticsQuery:
     """Analytics Query Tool"""
@@ -54,6 +123,12 @@ class AnalyticsQuery:
             return False
         return True
 
+    def _refresh_rollups(self):
+        """Offene Stunden der Rollup-Tabellen nachrechnen (cdb_refresh_rollups)"""
+        with self.conn:
+            with self.conn.cursor() as cursor:
+                cursor.execute("SELECT * FROM cdb_refresh_rollups()")
+
     def last_signals(self, limit=10):
         """Get last N signals"""
         with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
@@ -130,19 +205,20 @@ class AnalyticsQuery:
                 print("No portfolio snapshots found.")
 
     def daily_pnl(self, days=7):
-        """Get daily P&L for last N days"""
+        """Get daily P&L for last N days (from portfolio_hourly)"""
+        self._refresh_rollups()
         with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute(
                 """
                 SELECT
-                    DATE(timestamp) as date,
-                    COUNT(*) as num_snapshots,
-                    AVG(daily_pnl) as avg_daily_pnl,
-                    MAX(total_equity) as max_equity,
-                    MIN(total_equity) as min_equity
-                FROM portfolio_snapshots
-                WHERE timestamp >= NOW() - INTERVAL '%s days'
-                GROUP BY DATE(timestamp)
+                    DATE(bucket) as date,
+                    SUM(snapshot_count)::BIGINT as num_snapshots,
+                    SUM(daily_pnl_sum) / NULLIF(SUM(snapshot_count), 0) as avg_daily_pnl,
+                    MAX(max_equity) as max_equity,
+                    MIN(min_equity) as min_equity
+                FROM portfolio_hourly
+                WHERE bucket >= date_trunc('hour', NOW()) - INTERVAL '%s days'
+                GROUP BY DATE(bucket)
                 ORDER BY date DESC
             """,
                 (days,),
@@ -157,19 +233,43 @@ class AnalyticsQuery:
             else:
                 print(f"No data for the last {days} days.")
 
+    def equity_curve(self, days=1):
+        """Get equity curve for last N days (tier chosen by cdb_portfolio_equity)"""
+        self._refresh_rollups()
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                """
+                SELECT bucket, tier, snapshot_count, open_equity, min_equity,
+                       max_equity, close_equity, close_daily_pnl
+                FROM cdb_portfolio_equity(NOW() - INTERVAL '1 day' * %s, NOW())
+            """,
+                (days,),
+            )
+            rows = cursor.fetchall()
+
+            if rows:
+                if not self._require_tabulate():
+                    return
+                print(f"\n📉 Equity Curve (Last {days} days, {rows[0]['tier']} resolution):\n")
+                print(tabulate(rows, headers="keys", tablefmt="grid", floatfmt=".2f"))
+            else:
+                print(f"No data for the last {days} days.")
+
     def trade_statistics(self):
-        """Get overall trade statistics"""
+        """Get overall trade statistics (from trades_hourly)"""
+        self._refresh_rollups()
         with self.conn.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute(
                 """
                 SELECT
-                    COUNT(*) as total_trades,
-                    COUNT(CASE WHEN side = 'buy' THEN 1 END) as buy_trades,
-                    COUNT(CASE WHEN side = 'sell' THEN 1 END) as sell_trades,
-                    AVG(slippage_bps) as avg_slippage_bps,
+                    COALESCE(SUM(trade_count), 0)::BIGINT as total_trades,
+                    COALESCE(SUM(trade_count) FILTER (WHERE side = 'buy'), 0)::BIGINT as buy_trades,
+                    COALESCE(SUM(trade_count) FILTER (WHERE side = 'sell'), 0)::BIGINT as sell_trades,
+                    SUM(slippage_bps_sum) / NULLIF(SUM(slippage_count), 0) as avg_slippage_bps,
                     SUM(fees) as total_fees,
+                    SUM(notional) as total_notional,
                     COUNT(DISTINCT symbol) as unique_symbols
-                FROM trades
+                FROM trades_hourly
             """
             )
             row = cursor.fetchone()
@@ -180,7 +280,7 @@ class AnalyticsQuery:
                     if isinstance(value, float):
                         print(f"  {key:25s}: {value:>15,.2f}")
                     else:
-                        print(f"  {key:25s}: {value:>15}")
+                        print(f"  {key:25s}: {value!s:>15}")
             else:
                 print("No trade statistics available.")
 
@@ -212,6 +312,67 @@ class AnalyticsQuery:
             else:
                 print("No open positions.")
 
+    def iter_export_batches(self, table, days=None, itersize=5000):
+        """
+        Stream rows of a table in batches via a named (server-side) cursor
+        (core.utils.postgres_client.iter_query_batches).
+
+        Yields (description, rows) with at most itersize rows per batch, so
+        memory stays flat regardless of the exported window.
+        """
+        column = EXPORT_TABLES[table]
+        query = sql.SQL("SELECT * FROM {table}").format(table=sql.Identifier(table))
+        params = ()
+        if days:
+            query += sql.SQL(" WHERE {column} >= NOW() - INTERVAL '1 day' * %s").format(
+                column=sql.Identifier(column)
+            )
+            params = (days,)
+        query += sql.SQL(" ORDER BY {column}").format(column=sql.Identifier(column))
+
+        yield from iter_query_batches(
+            self.conn, query, params, name=f"export_{table}", itersize=itersize
+        )
+        self.conn.rollback()
+
+    def export(self, table, output, fmt="csv", days=None, itersize=5000):
+        """Export a table (optionally last N days) as CSV or Parquet"""
+        if fmt == "parquet" and pa is None:
+            print("Missing dependency: pyarrow. Install it to export Parquet.")
+            return 0
+
+        written = 0
+        writer = None
+        handle = None
+        try:
+            for description, rows in self.iter_export_batches(table, days, itersize):
+                if fmt == "parquet":
+                    if writer is None:
+                        schema = _arrow_schema(description)
+                        writer = pq.ParquetWriter(output, schema, compression="zstd")
+                    columns = {
+                        field.name: [_export_value(row[i], field.type) for row in rows]
+                        for i, field in enumerate(schema)
+                    }
+                    writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                else:
+                    if writer is None:
+                        handle = open(output, "w", newline="", encoding="utf-8")
+                        writer = csv.writer(handle)
+                        writer.writerow([column.name for column in description])
+                    writer.writerows(
+                        [_export_value(value) for value in row] for row in rows
+                    )
+                written += len(rows)
+        finally:
+            if fmt == "parquet" and writer is not None:
+                writer.close()
+            if handle is not None:
+                handle.close()
+
+        print(f"Exported {written} rows from {table} to {output}")
+        return written
+
     def close(self):
         """Close database connection"""
         if self.conn:
@@ -238,12 +399,33 @@ def main():
     parser.add_argument(
         "--daily-pnl", type=int, metavar="DAYS", help="Show daily P&L for last N days"
     )
+    parser.add_argument(
+        "--equity-curve",
+        type=int,
+        metavar="DAYS",
+        help="Show equity curve for last N days (raw/minute/hour tier by range)",
+    )
     parser.add_argument(
         "--trade-statistics", action="store_true", help="Show overall trade statistics"
     )
     parser.add_argument(
         "--open-positions", action="store_true", help="Show currently open positions"
     )
+    parser.add_argument(
+        "--export",
+        choices=sorted(EXPORT_TABLES),
+        help="Export a table as CSV/Parquet (streamed, server-side cursor)",
+    )
+    parser.add_argument(
+        "--format", choices=["csv", "parquet"], default="csv", help="Export format"
+    )
+    parser.add_argument("--output", metavar="PATH", help="Export file (default: <table>.<format>)")
+    parser.add_argument(
+        "--days", type=int, metavar="DAYS", help="Export only the last N days"
+    )
+    parser.add_argument(
+        "--itersize", type=int, default=5000, metavar="N", help="Rows per fetch when exporting"
+    )
 
     args = parser.parse_args()
 
@@ -268,14 +450,30 @@ def main():
         if args.daily_pnl:
             query.daily_pnl(args.daily_pnl)
 
+        if args.equity_curve:
+            query.equity_curve(args.equity_curve)
+
         if args.trade_statistics:
             query.trade_statistics()
 
         if args.open_positions:
             query.open_positions()
 
+        if args.export:
+            query.export(
+                args.export,
+                args.output or f"{args.export}.{args.format}",
+                fmt=args.format,
+                days=args.days,
+                itersize=args.itersize,
+            )
+
         # If no arguments, show usage
-        if not any(vars(args).values()):
+        if not any(
+            value
+            for name, value in vars(args).items()
+            if name not in ("format", "itersize")
+        ):
             parser.print_help()
 
     finally:
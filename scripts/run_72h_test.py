@@ -25,6 +25,10 @@ try:
 except ImportError as e:
     print(f"Warning: Could not import services: {e}")
 
+# Eine Iteration (Equity-Tick) pro Minute -> Sharpe/Sortino auf Minutenbasis
+ITERATION_SECONDS = 60
+TICKS_PER_YEAR = 365 * 24 * 3600 / ITERATION_SECONDS
+
 
 class Test72HourOrchestrator:
     """Orchestrates 72-hour paper trading test"""
@@ -37,6 +41,7 @@ class Test72HourOrchestrator:
         self.circuit_breaker = None
         self.test_active = False
         self.start_time = None
+        self._trade_cursor = 0  # bereits an RiskMetrics gemeldete Trades
 
     def _setup_logging(self):
         """Setup test logging"""
@@ -54,7 +59,7 @@ class Test72HourOrchestrator:
         # Initialize components
         self.paper_engine = PaperTradingEngine()
         self.market_classifier = MarketClassifier()
-        self.risk_metrics = RiskMetrics()
+        self.risk_metrics = RiskMetrics(annualization=TICKS_PER_YEAR)
         self.circuit_breaker = CircuitBreaker()
 
         # Start test
@@ -70,12 +75,13 @@ class Test72HourOrchestrator:
         while datetime.utcnow() < end_time and self.test_active:
             try:
                 self._test_iteration()
-                time.sleep(60)  # Check every minute
+                time.sleep(ITERATION_SECONDS)
             except Exception as e:
                 self.logger.error(f"Test iteration failed: {e}")
                 break
 
-        # Stop test
+        # Stop test (Trades der letzten Iteration nicht verlieren)
+        self._forward_closed_trades()
         self.paper_engine.stop_paper_trading()
         self.test_active = False
 
@@ -90,7 +96,9 @@ class Test72HourOrchestrator:
         self.paper_engine.update_market_price("TEST_SYMBOL", price)
         self.market_classifier.add_price_data(datetime.utcnow(), price)
 
-        # Check circuit breakers
+        # Feed streaming metrics, then check circuit breakers
+        self._forward_closed_trades()
+        self.risk_metrics.update_equity(self.paper_engine.get_equity())
         metrics = self.risk_metrics.calculate_comprehensive_metrics()
         breaker_result = self.circuit_breaker.check_breakers(
             {"drawdown": metrics.max_drawdown, "error_rate": 0.01}
@@ -102,6 +110,20 @@ class Test72HourOrchestrator:
             )
             self.test_active = False
 
+    def _forward_closed_trades(self):
+        """Pass trades closed by the paper engine on to RiskMetrics"""
+        history = self.paper_engine.trade_history
+        for trade in history[self._trade_cursor :]:
+            if "realized_pnl" in trade:
+                self.risk_metrics.record_trade(
+                    {
+                        "symbol": trade["symbol"],
+                        "timestamp": trade["timestamp"],
+                        "pnl": trade["realized_pnl"],
+                    }
+                )
+        self._trade_cursor = len(history)
+
     def _generate_test_results(self):
         """Generate final test results"""
         return {
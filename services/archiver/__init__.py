@@ -0,0 +1 @@
+"""Market data archiver service package."""
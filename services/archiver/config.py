@@ -0,0 +1,51 @@
+"""
+Market Data Archiver - Configuration
+"""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass
+class ArchiverConfig:
+    env: str = os.getenv("ENV", "development")
+    port: int = int(os.getenv("ARCHIVER_PORT", "8009"))
+
+    redis_host: str = os.getenv("REDIS_HOST", "redis")
+    redis_port: int = int(os.getenv("REDIS_PORT", "6379"))
+    redis_password: str | None = os.getenv("REDIS_PASSWORD")
+    redis_db: int = int(os.getenv("REDIS_DB", "0"))
+
+    # Input: PubSub channel for raw trades, stream for 1m candles
+    tick_channel: str = os.getenv("ARCHIVER_TICK_CHANNEL", "market_data")
+    candle_stream: str = os.getenv("ARCHIVER_CANDLE_STREAM", "stream.candles_1m")
+
+    # Output: Parquet root (manifest.sqlite liegt im Root)
+    archive_dir: str = os.getenv("ARCHIVER_DIR", "/data/archive")
+    compression: str = os.getenv("ARCHIVER_COMPRESSION", "zstd")
+
+    # Stunden-Datei wird geschrieben, wenn die Stunde + Grace vorbei ist;
+    # Checkpoint schreibt offene Stunden als Part-Datei (begrenzt Verlust bei Crash)
+    grace_seconds: int = int(os.getenv("ARCHIVER_GRACE_SECONDS", "120"))
+    checkpoint_seconds: int = int(os.getenv("ARCHIVER_CHECKPOINT_SECONDS", "600"))
+    max_buffer_rows: int = int(os.getenv("ARCHIVER_MAX_BUFFER_ROWS", "500000"))
+
+    # XREAD auf dem Candle-Stream
+    read_count: int = int(os.getenv("ARCHIVER_READ_COUNT", "1000"))
+    block_ms: int = int(os.getenv("ARCHIVER_BLOCK_MS", "200"))
+
+    source_version: str = os.getenv("ARCHIVER_SOURCE_VERSION", "1")
+
+    def validate(self) -> bool:
+        if self.grace_seconds < 0:
+            raise ValueError("ARCHIVER_GRACE_SECONDS muss >= 0 sein")
+        if self.checkpoint_seconds <= 0:
+            raise ValueError("ARCHIVER_CHECKPOINT_SECONDS muss > 0 sein")
+        if self.max_buffer_rows <= 0:
+            raise ValueError("ARCHIVER_MAX_BUFFER_ROWS muss > 0 sein")
+        if self.block_ms <= 0:
+            raise ValueError("ARCHIVER_BLOCK_MS muss > 0 sein")
+        return True
+
+
+config = ArchiverConfig()
@@ -0,0 +1,141 @@
+"""
+Market Data Archiver - Manifest index
+
+SQLite-Index aller geschriebenen Parquet-Dateien (Art, Symbol, Zeitbereich,
+Zeilen). Reader wählen Dateien für einen Zeitbereich über den Index statt
+Verzeichnisse und Parquet-Footer zu scannen. Zusätzlich Cursor des
+Candle-Streams (Resume nach Restart).
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+MANIFEST_FILE = "manifest.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    hour_start_ms INTEGER NOT NULL,
+    min_ts_ms INTEGER NOT NULL,
+    max_ts_ms INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_range ON files (kind, symbol, min_ts_ms, max_ts_ms);
+CREATE TABLE IF NOT EXISTS cursors (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One archived Parquet file (path relative to the archive root)"""
+
+    path: str
+    kind: str
+    symbol: str
+    hour_start_ms: int
+    min_ts_ms: int
+    max_ts_ms: int
+    rows: int
+    bytes: int
+
+
+class Manifest:
+    """SQLite index of archived files; safe for a writer plus reader threads"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / MANIFEST_FILE), check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(self, entry: ManifestEntry) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.path,
+                    entry.kind,
+                    entry.symbol,
+                    entry.hour_start_ms,
+                    entry.min_ts_ms,
+                    entry.max_ts_ms,
+                    entry.rows,
+                    entry.bytes,
+                ),
+            )
+
+    def files(
+        self,
+        kind: str,
+        symbols: Optional[Iterable[str]] = None,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> List[ManifestEntry]:
+        """Files overlapping [start_ms, end_ms), oldest first"""
+        query = "SELECT * FROM files WHERE kind = ?"
+        params: list = [kind]
+        if symbols is not None:
+            symbols = list(symbols)
+            query += f" AND symbol IN ({', '.join('?' * len(symbols))})"
+            params.extend(symbols)
+        if start_ms is not None:
+            query += " AND max_ts_ms >= ?"
+            params.append(start_ms)
+        if end_ms is not None:
+            query += " AND min_ts_ms < ?"
+            params.append(end_ms)
+        query += " ORDER BY min_ts_ms, symbol, path"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [ManifestEntry(*row) for row in rows]
+
+    def part_count(self, kind: str, symbol: str, hour_start_ms: int) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT count(*) FROM files WHERE kind = ? AND symbol = ? AND hour_start_ms = ?",
+                (kind, symbol, hour_start_ms),
+            ).fetchone()
+        return count
+
+    def max_ts(self, kind: str, symbol: str) -> Optional[int]:
+        with self._lock:
+            (value,) = self._conn.execute(
+                "SELECT max(max_ts_ms) FROM files WHERE kind = ? AND symbol = ?",
+                (kind, symbol),
+            ).fetchone()
+        return value
+
+    def symbols(self, kind: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT symbol FROM files WHERE kind = ? ORDER BY symbol", (kind,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_cursor(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cursors WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, name: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cursors (name, value) VALUES (?, ?)", (name, value)
+            )
@@ -0,0 +1,93 @@
+"""
+Market Data Archiver - Row models
+"""
+
+from typing import Optional
+
+HOUR_MS = 3_600_000
+
+# Spalten je Archiv-Art (Reihenfolge = Parquet-Schema, siehe store.py)
+TICK_COLUMNS = ("ts_ms", "symbol", "price", "qty", "side", "trade_id")
+CANDLE_COLUMNS = (
+    "ts_ms",
+    "symbol",
+    "timeframe",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "trades",
+)
+
+
+def hour_start(ts_ms: int) -> int:
+    """Floor a millisecond timestamp to its UTC hour"""
+    return ts_ms - ts_ms % HOUR_MS
+
+
+def tick_row(trade: dict) -> Optional[dict]:
+    """
+    Convert a market_data payload (contract v1.0) into a tick row.
+
+    Returns None if required fields are missing or not numeric.
+    """
+    try:
+        ts_ms = int(trade["ts_ms"])
+        symbol = trade["symbol"]
+        price = float(trade["price"])
+        qty = float(trade["trade_qty"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not symbol or ts_ms <= 0:
+        return None
+    trade_id = trade.get("trade_id")
+    return {
+        "ts_ms": ts_ms,
+        "symbol": symbol,
+        "price": price,
+        "qty": qty,
+        "side": trade.get("side") or "unknown",
+        "trade_id": str(trade_id) if trade_id is not None else None,
+    }
+
+
+def candle_row(candle: dict) -> Optional[dict]:
+    """
+    Convert a stream.candles_1m entry (string fields) into a candle row.
+
+    Candle ts is the window start in seconds; archived as ts_ms.
+    """
+    try:
+        row = {
+            "ts_ms": int(candle["ts"]) * 1000,
+            "symbol": candle["symbol"],
+            "timeframe": candle.get("timeframe") or "",
+            "open": float(candle["open"]),
+            "high": float(candle["high"]),
+            "low": float(candle["low"]),
+            "close": float(candle["close"]),
+            "volume": float(candle["volume"]),
+            "trades": int(candle.get("trades") or 0),
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not row["symbol"] or row["ts_ms"] <= 0:
+        return None
+    return row
+
+
+def stream_id_key(entry_id: str) -> tuple:
+    """Sort key of a Redis stream id ("<ms>-<seq>")"""
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def previous_stream_id(entry_id: str) -> str:
+    """Largest stream id before entry_id (XREAD is exclusive)"""
+    ms, seq = stream_id_key(entry_id)
+    if seq > 0:
+        return f"{ms}-{seq - 1}"
+    if ms > 0:
+        return f"{ms - 1}-{2**64 - 1}"
+    return "0-0"
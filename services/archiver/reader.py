@@ -0,0 +1,104 @@
+"""
+Market Data Archiver - Reader API
+
+Zeitbereichs-Abfragen über das Manifest für Backtests und Research:
+
+    from services.archiver.reader import ArchiveReader
+
+    reader = ArchiveReader("/data/archive")
+    df = reader.read_pandas("candles", ["BTCUSDT"], start_ms, end_ms)
+    arrays = reader.read_arrays("ticks", ["BTCUSDT"], start_ms, end_ms,
+                                columns=["ts_ms", "price", "qty"])
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    from .manifest import Manifest
+    from .store import DICTIONARY_COLUMNS, SCHEMAS, empty_table
+except ImportError:
+    from manifest import Manifest
+    from store import DICTIONARY_COLUMNS, SCHEMAS, empty_table
+
+
+class ArchiveReader:
+    """Read archived ticks/candles for a time range (ts_ms in [start, end))"""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.manifest = Manifest(root)
+
+    def symbols(self, kind: str) -> List[str]:
+        return self.manifest.symbols(kind)
+
+    def files(
+        self,
+        kind: str,
+        symbols: Optional[Iterable[str]] = None,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+    ) -> List[Path]:
+        """Parquet files overlapping the range (manifest lookup, no scan)"""
+        return [
+            self.root / entry.path
+            for entry in self.manifest.files(kind, symbols, start_ms, end_ms)
+        ]
+
+    def read_table(
+        self,
+        kind: str,
+        symbols: Optional[Iterable[str]] = None,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pa.Table:
+        """Rows of the range as one Arrow table, sorted by ts_ms"""
+        if kind not in SCHEMAS:
+            raise ValueError(f"Unknown archive kind: {kind}")
+        paths = self.files(kind, symbols, start_ms, end_ms)
+        if not paths:
+            return empty_table(kind, columns)
+
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns) if "ts_ms" in columns else ["ts_ms", *columns]
+        filters = []
+        if start_ms is not None:
+            filters.append(("ts_ms", ">=", start_ms))
+        if end_ms is not None:
+            filters.append(("ts_ms", "<", end_ms))
+
+        tables = [
+            pq.read_table(
+                path,
+                columns=read_columns,
+                filters=filters or None,
+                partitioning=None,
+                read_dictionary=[
+                    name
+                    for name in DICTIONARY_COLUMNS[kind]
+                    if read_columns is None or name in read_columns
+                ],
+            )
+            for path in paths
+        ]
+        table = pa.concat_tables(tables).sort_by("ts_ms")
+        return table.select(columns) if columns is not None else table
+
+    def read_pandas(self, kind: str, symbols=None, start_ms=None, end_ms=None, columns=None):
+        """Range as pandas DataFrame (symbol/side/timeframe categorical)"""
+        return self.read_table(kind, symbols, start_ms, end_ms, columns).to_pandas()
+
+    def read_arrays(
+        self, kind: str, symbols=None, start_ms=None, end_ms=None, columns=None
+    ) -> Dict[str, "numpy.ndarray"]:  # noqa: F821
+        """Range as dict of NumPy arrays (one per column)"""
+        table = self.read_table(kind, symbols, start_ms, end_ms, columns)
+        return {
+            name: table.column(name).to_numpy()
+            for name in table.column_names
+        }
@@ -0,0 +1,256 @@
+"""
+Market Data Archiver Service
+Archiviert Ticks (market_data PubSub) und Candles (stream.candles_1m) als
+stündlich gerollte, symbol-partitionierte Parquet-Dateien (siehe store.py).
+"""
+
+import json
+import logging
+import logging.config
+import sys
+import time
+from pathlib import Path
+from threading import Thread
+from typing import Optional
+
+import redis
+from flask import Flask, jsonify, Response
+
+from core.utils.clock import utcnow
+
+try:
+    from .config import config
+    from .models import candle_row, previous_stream_id, tick_row
+    from .store import ArchiveWriter
+except ImportError:
+    from config import config
+    from models import candle_row, previous_stream_id, tick_row
+    from store import ArchiveWriter
+
+logging_config_path = Path(__file__).parent.parent.parent / "logging_config.json"
+if logging_config_path.exists():
+    with open(logging_config_path) as f:
+        logging_conf = json.load(f)
+        logging.config.dictConfig(logging_conf)
+else:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+logger = logging.getLogger("archiver_service")
+app = Flask(__name__)
+
+CANDLE_CURSOR = "candles"
+
+stats = {
+    "started_at": None,
+    "ticks_received": 0,
+    "candles_received": 0,
+    "invalid_total": 0,
+    "duplicates_skipped": 0,
+    "status": "initializing",
+}
+
+writer: Optional[ArchiveWriter] = None
+
+
+class ArchiverService:
+    def __init__(self, archive_writer: Optional[ArchiveWriter] = None):
+        self.config = config
+        self.config.validate()
+        self.redis_client: Optional[redis.Redis] = None
+        self.pubsub = None
+        self.running = False
+        self.writer = archive_writer or ArchiveWriter(
+            self.config.archive_dir,
+            compression=self.config.compression,
+            max_buffer_rows=self.config.max_buffer_rows,
+        )
+        # Letzte gelesene Candle-Stream-ID (XREAD exklusiv)
+        self.last_candle_id = "0-0"
+        self._last_checkpoint = time.monotonic()
+
+    def connect_redis(self):
+        self.redis_client = redis.Redis(
+            host=self.config.redis_host,
+            port=self.config.redis_port,
+            password=self.config.redis_password,
+            db=self.config.redis_db,
+            decode_responses=True,
+        )
+        self.redis_client.ping()
+        logger.info(
+            "Redis verbunden: %s:%s", self.config.redis_host, self.config.redis_port
+        )
+
+    def restore_cursor(self):
+        """Resume the candle stream at the oldest entry not yet archived"""
+        cursor = self.writer.manifest.get_cursor(CANDLE_CURSOR)
+        if cursor:
+            self.last_candle_id = previous_stream_id(cursor)
+            logger.info("Candle-Stream ab %s (Manifest-Cursor)", cursor)
+        else:
+            self.last_candle_id = "0-0"
+            logger.info("Kein Cursor: Candle-Stream wird vollständig archiviert")
+
+    def _save_cursor(self):
+        # Ältester noch gepufferter Eintrag, sonst nach dem zuletzt gelesenen
+        resume = self.writer.resume_id("candles")
+        if resume is None and self.last_candle_id != "0-0":
+            ms, _, seq = self.last_candle_id.partition("-")
+            resume = f"{ms}-{int(seq or 0) + 1}"
+        if resume is not None:
+            self.writer.manifest.set_cursor(CANDLE_CURSOR, resume)
+
+    def handle_tick(self, trade: dict) -> None:
+        stats["ticks_received"] += 1
+        row = tick_row(trade)
+        if row is None:
+            stats["invalid_total"] += 1
+            return
+        self.writer.add("ticks", row)
+
+    def handle_candle(self, entry_id: str, fields: dict) -> None:
+        stats["candles_received"] += 1
+        row = candle_row(fields)
+        if row is None:
+            stats["invalid_total"] += 1
+            return
+        # Nach Restart ab Cursor erneut gelesene, bereits archivierte Candles
+        if row["ts_ms"] <= self.writer.archived_until("candles", row["symbol"]):
+            stats["duplicates_skipped"] += 1
+            return
+        if self.writer.add("candles", row, entry_id):
+            self._save_cursor()
+
+    def drain_ticks(self, limit: int = 10000) -> int:
+        """Consume buffered PubSub messages without blocking"""
+        count = 0
+        while count < limit:
+            message = self.pubsub.get_message(timeout=0)
+            if message is None:
+                break
+            if message["type"] != "message":
+                continue
+            count += 1
+            try:
+                self.handle_tick(json.loads(message["data"]))
+            except json.JSONDecodeError:
+                stats["invalid_total"] += 1
+                logger.warning("Invalid JSON in PubSub message")
+        return count
+
+    def read_candles(self) -> int:
+        """One XREAD round on the candle stream (blocks up to block_ms)"""
+        response = self.redis_client.xread(
+            {self.config.candle_stream: self.last_candle_id},
+            count=self.config.read_count,
+            block=self.config.block_ms,
+        )
+        count = 0
+        for _stream, entries in response or []:
+            for entry_id, fields in entries:
+                self.handle_candle(entry_id, fields)
+                self.last_candle_id = entry_id
+                count += 1
+        return count
+
+    def roll(self, now_ms: Optional[int] = None, force: bool = False) -> int:
+        """Write closed hours (or everything at checkpoint/force)"""
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        now = time.monotonic()
+        if force or now - self._last_checkpoint >= self.config.checkpoint_seconds:
+            self._last_checkpoint = now
+            written = self.writer.flush_all()
+        else:
+            written = self.writer.flush_closed(now_ms, self.config.grace_seconds * 1000)
+        if written or force:
+            self._save_cursor()
+        return written
+
+    def run(self):
+        if not self.redis_client:
+            self.connect_redis()
+
+        self.pubsub = self.redis_client.pubsub()
+        self.pubsub.subscribe(self.config.tick_channel)
+        logger.info(f"Subscribed zu PubSub channel: {self.config.tick_channel}")
+        self.restore_cursor()
+
+        self.running = True
+        stats["status"] = "running"
+        stats["started_at"] = utcnow().isoformat()
+        logger.info("Archiver gestartet: %s", self.config.archive_dir)
+
+        try:
+            while self.running:
+                try:
+                    self.drain_ticks()
+                    self.read_candles()
+                    self.roll()
+                except redis.exceptions.ConnectionError as e:
+                    logger.error(f"Redis-Verbindung verloren: {e}")
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            logger.info("Archiver wird beendet...")
+        finally:
+            self.roll(force=True)
+            stats["status"] = "stopped"
+
+
+@app.route("/health")
+def health():
+    return jsonify(
+        {
+            "status": "ok" if stats["status"] == "running" else "error",
+            "service": "archiver_service",
+            "version": config.source_version,
+        }
+    )
+
+
+@app.route("/metrics")
+def metrics():
+    written = writer.stats if writer else {}
+    buffered = writer.buffered_rows() if writer else 0
+    body = (
+        "# HELP archiver_ticks_received_total Anzahl empfangener Ticks\n"
+        "# TYPE archiver_ticks_received_total counter\n"
+        f"archiver_ticks_received_total {stats['ticks_received']}\n\n"
+        "# HELP archiver_candles_received_total Anzahl empfangener Candles\n"
+        "# TYPE archiver_candles_received_total counter\n"
+        f"archiver_candles_received_total {stats['candles_received']}\n\n"
+        "# HELP archiver_invalid_total Verworfene ungültige Events\n"
+        "# TYPE archiver_invalid_total counter\n"
+        f"archiver_invalid_total {stats['invalid_total']}\n\n"
+        "# HELP archiver_files_written_total Geschriebene Parquet-Dateien\n"
+        "# TYPE archiver_files_written_total counter\n"
+        f"archiver_files_written_total {written.get('files_written', 0)}\n\n"
+        "# HELP archiver_rows_written_total Archivierte Zeilen\n"
+        "# TYPE archiver_rows_written_total counter\n"
+        f"archiver_rows_written_total {written.get('rows_written', 0)}\n\n"
+        "# HELP archiver_bytes_written_total Geschriebene Parquet-Bytes\n"
+        "# TYPE archiver_bytes_written_total counter\n"
+        f"archiver_bytes_written_total {written.get('bytes_written', 0)}\n\n"
+        "# HELP archiver_buffered_rows Gepufferte, noch nicht geschriebene Zeilen\n"
+        "# TYPE archiver_buffered_rows gauge\n"
+        f"archiver_buffered_rows {buffered}\n"
+    )
+    return Response(body, mimetype="text/plain")
+
+
+if __name__ == "__main__":
+    service = ArchiverService()
+    writer = service.writer
+    service.connect_redis()
+
+    # Start Flask in background thread
+    flask_thread = Thread(target=lambda: app.run(host="0.0.0.0", port=config.port))
+    flask_thread.daemon = True
+    flask_thread.start()
+    logger.info(f"Health-Check: http://0.0.0.0:{config.port}/health")
+
+    service.run()
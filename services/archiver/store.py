@@ -0,0 +1,213 @@
+"""
+Market Data Archiver - Parquet store
+
+Puffert Ticks/Candles je (Art, Symbol, UTC-Stunde) und schreibt sie als
+Parquet-Datei, sobald die Stunde abgeschlossen ist:
+
+    <root>/<kind>/symbol=<SYMBOL>/date=<YYYY-MM-DD>/hour=<HH>/part-<NNN>.parquet
+
+- Zeilen nach ts_ms sortiert, ts_ms DELTA_BINARY_PACKED (monotone Deltas)
+- symbol/side/timeframe dictionary-encoded
+- Datei erst als .tmp, dann atomar umbenannt und im Manifest eingetragen
+- Checkpoints und Nachzügler ergeben weitere part-Dateien derselben Stunde
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+try:
+    from .manifest import Manifest, ManifestEntry
+    from .models import CANDLE_COLUMNS, TICK_COLUMNS, hour_start, stream_id_key
+except ImportError:
+    from manifest import Manifest, ManifestEntry
+    from models import CANDLE_COLUMNS, TICK_COLUMNS, hour_start, stream_id_key
+
+logger = logging.getLogger("archiver_service")
+
+SCHEMAS = {
+    "ticks": pa.schema(
+        [
+            ("ts_ms", pa.int64()),
+            ("symbol", pa.string()),
+            ("price", pa.float64()),
+            ("qty", pa.float64()),
+            ("side", pa.string()),
+            ("trade_id", pa.string()),
+        ]
+    ),
+    "candles": pa.schema(
+        [
+            ("ts_ms", pa.int64()),
+            ("symbol", pa.string()),
+            ("timeframe", pa.string()),
+            ("open", pa.float64()),
+            ("high", pa.float64()),
+            ("low", pa.float64()),
+            ("close", pa.float64()),
+            ("volume", pa.float64()),
+            ("trades", pa.int32()),
+        ]
+    ),
+}
+COLUMNS = {"ticks": TICK_COLUMNS, "candles": CANDLE_COLUMNS}
+DICTIONARY_COLUMNS = {"ticks": ["symbol", "side"], "candles": ["symbol", "timeframe"]}
+
+BufferKey = Tuple[str, str, int]  # (kind, symbol, hour_start_ms)
+
+
+class HourBuffer:
+    """Column lists of one (kind, symbol, hour) plus the first stream id"""
+
+    def __init__(self, columns):
+        self.columns: Dict[str, list] = {name: [] for name in columns}
+        self.rows = 0
+        self.first_id: Optional[str] = None
+
+    def append(self, row: dict, entry_id: Optional[str] = None) -> None:
+        for name, values in self.columns.items():
+            values.append(row.get(name))
+        self.rows += 1
+        if entry_id is not None and self.first_id is None:
+            self.first_id = entry_id
+
+
+def relative_path(kind: str, symbol: str, hour_start_ms: int, part: int) -> str:
+    hour = datetime.fromtimestamp(hour_start_ms / 1000, tz=timezone.utc)
+    safe_symbol = symbol.replace("/", "_")
+    return (
+        f"{kind}/symbol={safe_symbol}/date={hour:%Y-%m-%d}/hour={hour:%H}/"
+        f"part-{part:03d}.parquet"
+    )
+
+
+class ArchiveWriter:
+    """
+    Hour-rolled Parquet writer.
+
+    Args:
+        root: Archive root directory
+        manifest: Manifest index (default: <root>/manifest.sqlite)
+        compression: Parquet codec (zstd, snappy, ...)
+        max_buffer_rows: Rows per (kind, symbol, hour) before an early part file
+    """
+
+    def __init__(
+        self,
+        root: str,
+        manifest: Optional[Manifest] = None,
+        compression: str = "zstd",
+        max_buffer_rows: int = 500_000,
+    ):
+        self.root = Path(root)
+        self.manifest = manifest or Manifest(root)
+        self.compression = compression
+        self.max_buffer_rows = max_buffer_rows
+        self.buffers: Dict[BufferKey, HourBuffer] = {}
+        self._archived_until: Dict[Tuple[str, str], int] = {}
+        self.stats = {"files_written": 0, "rows_written": 0, "bytes_written": 0}
+
+    def add(self, kind: str, row: dict, entry_id: Optional[str] = None) -> int:
+        """Buffer a row; returns the number of files written (0 or 1)"""
+        key = (kind, row["symbol"], hour_start(row["ts_ms"]))
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            buffer = self.buffers[key] = HourBuffer(COLUMNS[kind])
+        buffer.append(row, entry_id)
+        if buffer.rows >= self.max_buffer_rows:
+            self._flush(key)
+            return 1
+        return 0
+
+    def buffered_rows(self) -> int:
+        return sum(buffer.rows for buffer in self.buffers.values())
+
+    def flush_closed(self, now_ms: int, grace_ms: int = 0) -> int:
+        """Write every buffer whose hour ended more than grace_ms ago"""
+        closed = [
+            key for key in self.buffers if key[2] + 3_600_000 + grace_ms <= now_ms
+        ]
+        for key in sorted(closed, key=lambda k: k[2]):
+            self._flush(key)
+        return len(closed)
+
+    def flush_all(self) -> int:
+        keys = sorted(self.buffers, key=lambda k: k[2])
+        for key in keys:
+            self._flush(key)
+        return len(keys)
+
+    def resume_id(self, kind: str) -> Optional[str]:
+        """Oldest stream id still buffered for kind (restart point)"""
+        ids = [
+            buffer.first_id
+            for (buffer_kind, _, _), buffer in self.buffers.items()
+            if buffer_kind == kind and buffer.first_id is not None
+        ]
+        return min(ids, key=stream_id_key) if ids else None
+
+    def archived_until(self, kind: str, symbol: str) -> int:
+        """Newest archived ts_ms of a symbol (-1 if none)"""
+        key = (kind, symbol)
+        if key not in self._archived_until:
+            value = self.manifest.max_ts(kind, symbol)
+            self._archived_until[key] = -1 if value is None else value
+        return self._archived_until[key]
+
+    def _flush(self, key: BufferKey) -> ManifestEntry:
+        kind, symbol, hour_start_ms = key
+        buffer = self.buffers.pop(key)
+        table = pa.Table.from_pydict(buffer.columns, schema=SCHEMAS[kind]).sort_by(
+            "ts_ms"
+        )
+
+        part = self.manifest.part_count(kind, symbol, hour_start_ms)
+        rel_path = relative_path(kind, symbol, hour_start_ms, part)
+        path = self.root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        pq.write_table(
+            table,
+            tmp_path,
+            compression=self.compression,
+            use_dictionary=DICTIONARY_COLUMNS[kind],
+            column_encoding={"ts_ms": "DELTA_BINARY_PACKED"},
+            write_statistics=True,
+        )
+        os.replace(tmp_path, path)
+
+        bounds = pc.min_max(table.column("ts_ms"))
+        entry = ManifestEntry(
+            path=rel_path,
+            kind=kind,
+            symbol=symbol,
+            hour_start_ms=hour_start_ms,
+            min_ts_ms=bounds["min"].as_py(),
+            max_ts_ms=bounds["max"].as_py(),
+            rows=table.num_rows,
+            bytes=path.stat().st_size,
+        )
+        self.manifest.add(entry)
+        self._archived_until[(kind, symbol)] = max(
+            self.archived_until(kind, symbol), entry.max_ts_ms
+        )
+        self.stats["files_written"] += 1
+        self.stats["rows_written"] += entry.rows
+        self.stats["bytes_written"] += entry.bytes
+        logger.info(
+            "Archiviert: %s (%d Zeilen, %d Bytes)", rel_path, entry.rows, entry.bytes
+        )
+        return entry
+
+
+def empty_table(kind: str, columns: Optional[List[str]] = None) -> pa.Table:
+    schema = SCHEMAS[kind]
+    if columns is not None:
+        schema = pa.schema([schema.field(name) for name in columns])
+    return schema.empty_table()
@@ -9,21 +9,48 @@ Funktionen:
 - Orders → PostgreSQL (orders table)
 - Trades → PostgreSQL (trades table)
 - Portfolio Snapshots → PostgreSQL (portfolio_snapshots table)
+- Fehlgeschlagene Events → Dead-Letter-Stream (Retry mit Backoff, siehe
+  dead_letter.py)
+
+Micro-Batching: Events werden je Tabelle gepuffert und bei
+DB_WRITER_BATCH_SIZE Zeilen oder nach DB_WRITER_FLUSH_MS in einer
+Transaktion geschrieben: einzelne Zeilen über ein je Verbindung einmal
+vorbereitetes INSERT (PREPARE/EXECUTE), größere Batches als ein
+multi-row INSERT (siehe PreparedStatements).
+
+Stream-Modus (Default, DB_WRITER_SOURCE=streams): At-least-once über eine
+Consumer Group auf den stream.*-Keys. ACK erst nach Commit des Batches,
+verwaiste Pending-Einträge toter Replikas werden per XAUTOCLAIM übernommen.
+Pub/Sub-Modus (DB_WRITER_SOURCE=pubsub) bleibt als Fallback erhalten.
+
+Worker: Je Channel-Gruppe (DB_WRITER_WORKERS) läuft ein eigener Thread mit
+eigener DB-Verbindung aus einem gemeinsamen Pool und eigener Batch-Policy
+(DB_WRITER_BATCH_POLICY). Ein Stream gehört genau einem Worker, daher bleibt
+die Reihenfolge je Stream - und damit je order_id - erhalten.
 """
 
 import os
 import json
 import logging
+import socket
+import threading
 import time
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 import redis
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
 from core.utils.clock import utcnow
-from prometheus_client import Counter, Gauge, start_http_server
+from core.utils.postgres_client import PreparedStatements
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+try:
+    from .dead_letter import DeadLetterQueue
+except ImportError:
+    from dead_letter import DeadLetterQueue
 
 # Logging Setup
 logging.basicConfig(
@@ -46,26 +73,259 @@ DB_WRITER_EVENTS_FAILED = Counter(
     "Events failed to persist.",
     ["channel"],
 )
+DB_WRITER_DEAD_LETTERS = Counter(
+    "db_writer_dead_letters_total",
+    "Failed events written to the dead-letter stream.",
+    ["channel", "transient"],
+)
+DB_WRITER_DLQ_RETRIES = Counter(
+    "db_writer_dlq_retries_total",
+    "Dead letters re-driven by the retry worker.",
+    ["channel"],
+)
 DB_WRITER_UPTIME_SECONDS = Gauge(
     "db_writer_uptime_seconds",
     "Service uptime in seconds.",
 )
 DB_WRITER_UPTIME_SECONDS.set_function(lambda: max(0.0, time.time() - START_TIME))
+DB_WRITER_FLUSH_ROWS = Histogram(
+    "db_writer_flush_rows",
+    "Rows written per batch flush.",
+    ["table"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500),
+)
+DB_WRITER_FLUSH_SECONDS = Histogram(
+    "db_writer_flush_seconds",
+    "Latency of a batch flush (one transaction).",
+    ["table"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+DB_WRITER_WORKER_BUSY = Counter(
+    "db_writer_worker_busy_seconds_total",
+    "Time a worker spent processing and flushing (excludes waiting for events).",
+    ["worker"],
+)
+DB_WRITER_WORKER_QUEUED = Gauge(
+    "db_writer_worker_queued_rows",
+    "Rows buffered in the batches of a worker.",
+    ["worker"],
+)
+
+DB_WRITER_CONSUMER_LAG = Gauge(
+    "db_writer_consumer_lag",
+    "Stream entries not yet delivered to the consumer group.",
+    ["stream"],
+)
+DB_WRITER_PENDING = Gauge(
+    "db_writer_pending_entries",
+    "Delivered but unacknowledged entries of the consumer group.",
+    ["stream"],
+)
+DB_WRITER_RECLAIMED = Counter(
+    "db_writer_reclaimed_total",
+    "Stale pending entries taken over via XAUTOCLAIM.",
+    ["stream"],
+)
+
+# Micro-Batching
+BATCH_SIZE = int(os.getenv("DB_WRITER_BATCH_SIZE", "500"))
+FLUSH_INTERVAL_S = float(os.getenv("DB_WRITER_FLUSH_MS", "200")) / 1000.0
+
+# Batch-Policy je Tabelle: "<table>=<rows>:<wait_ms>,..." (Rest: Defaults oben).
+# Trades sofort nach jeder Leserunde, Snapshots länger sammeln.
+BATCH_POLICY_SPEC = os.getenv(
+    "DB_WRITER_BATCH_POLICY",
+    f"trades={BATCH_SIZE}:0,portfolio_snapshots={BATCH_SIZE}:1000",
+)
+
+# Worker-Threads: ';' trennt Worker, ',' die Channels eines Workers.
+# "signals,orders,order_results,portfolio_snapshots" = ein Worker wie bisher.
+WORKERS_SPEC = os.getenv(
+    "DB_WRITER_WORKERS", "signals;orders;order_results;portfolio_snapshots"
+)
+
+# Stream-Consumption (Consumer Group, ack-after-commit)
+SOURCE = os.getenv("DB_WRITER_SOURCE", "streams").lower()
+GROUP = os.getenv("DB_WRITER_GROUP", "db_writer")
+CONSUMER = os.getenv("DB_WRITER_CONSUMER") or socket.gethostname()
+GROUP_START_ID = os.getenv("DB_WRITER_GROUP_START_ID", "$")
+CLAIM_MIN_IDLE_MS = int(os.getenv("DB_WRITER_CLAIM_MIN_IDLE_MS", "60000"))
+CLAIM_INTERVAL_S = float(os.getenv("DB_WRITER_CLAIM_INTERVAL_S", "30"))
+
+# Dead-Letter Retry-Worker (Intervall der Prüfung fälliger Retries)
+DLQ_RETRY_INTERVAL_S = float(os.getenv("DB_WRITER_DLQ_RETRY_INTERVAL_S", "5"))
+
+# DB-Fehler, die bei Wiederholung identisch auftreten (kein Retry)
+PERMANENT_DB_ERRORS = (
+    psycopg2.IntegrityError,
+    psycopg2.DataError,
+    psycopg2.ProgrammingError,
+)
+
+# Partition-Wartung (cdb_run_partition_maintenance, 0 = aus)
+PARTITION_MAINTENANCE_S = float(os.getenv("DB_WRITER_PARTITION_MAINTENANCE_S", "3600"))
+
+# Stündliche Rollups (cdb_refresh_rollups, 0 = aus)
+ROLLUP_REFRESH_S = float(os.getenv("DB_WRITER_ROLLUP_REFRESH_S", "60"))
+
+# Portfolio-Downsampling (cdb_compact_portfolio_snapshots, 0 = aus):
+# Rohdaten RAW_RETENTION, Minuten MINUTE_RETENTION, danach portfolio_hourly
+SNAPSHOT_COMPACTION_S = float(os.getenv("DB_WRITER_SNAPSHOT_COMPACTION_S", "3600"))
+SNAPSHOT_RAW_RETENTION = os.getenv("DB_WRITER_SNAPSHOT_RAW_RETENTION", "24 hours")
+SNAPSHOT_MINUTE_RETENTION = os.getenv("DB_WRITER_SNAPSHOT_MINUTE_RETENTION", "30 days")
+
+# Stream -> Channel (gleiche Handler wie Pub/Sub)
+STREAM_CHANNELS = {
+    os.getenv("DB_WRITER_SIGNALS_STREAM", "stream.signals"): "signals",
+    os.getenv("DB_WRITER_ORDERS_STREAM", "stream.orders"): "orders",
+    os.getenv("DB_WRITER_ORDER_RESULTS_STREAM", "stream.order_results"): "order_results",
+    os.getenv(
+        "DB_WRITER_PORTFOLIO_STREAM", "stream.portfolio_snapshots"
+    ): "portfolio_snapshots",
+}
 
 # Trade Status Definitions
 # Only filled/partial trades are persisted to trades table
 EXECUTION_STATUSES = {"filled", "partial", "partially_filled"}
 NON_EXECUTION_STATUSES = {"rejected", "cancelled"}
 
+# Tabelle -> (Channel für Metriken, Spalten)
+TABLE_COLUMNS = {
+    "signals": (
+        "signals",
+        "symbol, signal_type, price, confidence, timestamp, source, metadata",
+    ),
+    "orders": (
+        "orders",
+        "symbol, side, order_type, price, size, approved, rejection_reason, "
+        "status, metadata, created_at",
+    ),
+    "trades": (
+        "order_results",
+        "symbol, side, price, size, status, execution_price, slippage_bps, fees, "
+        "timestamp, exchange, metadata",
+    ),
+    "portfolio_snapshots": (
+        "portfolio_snapshots",
+        "timestamp, total_equity, available_balance, margin_used, daily_pnl, "
+        "total_unrealized_pnl, total_realized_pnl, total_exposure_pct, "
+        "max_drawdown_pct, open_positions, metadata",
+    ),
+}
+
+
+def table_statements() -> PreparedStatements:
+    """INSERT je Tabelle (Name = Tabelle), vorbereitet je Verbindung."""
+    statements = PreparedStatements(prefix="cdb_writer")
+    for table, (_, columns) in TABLE_COLUMNS.items():
+        statements.define_insert(table, table, columns)
+    return statements
+
+
+def parse_batch_policy(spec: str) -> Dict[str, Tuple[int, float]]:
+    """Parse DB_WRITER_BATCH_POLICY into {table: (max_rows, max_wait_s)}."""
+    policy = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            table, limits = item.split("=", 1)
+            rows, wait_ms = limits.split(":", 1)
+            table = table.strip()
+            if table not in TABLE_COLUMNS:
+                raise ValueError(f"unknown table {table!r}")
+            policy[table] = (int(rows), float(wait_ms) / 1000.0)
+        except ValueError as e:
+            raise ValueError(f"Invalid DB_WRITER_BATCH_POLICY entry {item!r}: {e}") from e
+    return policy
+
+
+def parse_workers(spec: str) -> List[List[str]]:
+    """Parse DB_WRITER_WORKERS into channel groups (one thread each)."""
+    known = set(STREAM_CHANNELS.values())
+    groups: List[List[str]] = []
+    seen = set()
+    for part in spec.split(";"):
+        group = [channel.strip() for channel in part.split(",") if channel.strip()]
+        if not group:
+            continue
+        for channel in group:
+            if channel not in known:
+                raise ValueError(f"Unknown channel in DB_WRITER_WORKERS: {channel}")
+            if channel in seen:
+                # Zwei Worker auf einem Stream würden die Reihenfolge brechen
+                raise ValueError(f"Channel assigned to more than one worker: {channel}")
+            seen.add(channel)
+        groups.append(group)
+    if not groups:
+        raise ValueError("DB_WRITER_WORKERS defines no worker")
+    return groups
+
+
+BATCH_POLICY = parse_batch_policy(BATCH_POLICY_SPEC)
+
+
+class TableBatch:
+    """Pending rows of one table, due at max_rows or after max_wait_s."""
+
+    def __init__(self, table: str, max_rows: int, max_wait_s: float):
+        self.table = table
+        self.channel, self.columns = TABLE_COLUMNS[table]
+        self.max_rows = max(1, max_rows)
+        self.max_wait_s = max_wait_s
+        self.rows: List[Tuple] = []
+        # (stream, entry_id) je Zeile; None bei Pub/Sub (nichts zu ACKen)
+        self.entries: List[Optional[Tuple[str, str]]] = []
+        # (payload, bisherige Versuche) je Zeile für die Dead-Letter-Queue
+        self.sources: List[Tuple[Dict, int]] = []
+        self.first_at: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(
+        self,
+        row: Tuple,
+        entry: Optional[Tuple[str, str]] = None,
+        source: Tuple[Dict, int] = ({}, 0),
+    ) -> bool:
+        """Append a row; returns True if the batch is full."""
+        if not self.rows:
+            self.first_at = time.monotonic()
+        self.rows.append(row)
+        self.entries.append(entry)
+        self.sources.append(source)
+        return len(self.rows) >= self.max_rows
+
+    def due(self, now: float) -> bool:
+        return bool(self.rows) and now - self.first_at >= self.max_wait_s
+
+    def take(self):
+        """Remove and return (rows, entries, sources)."""
+        rows, self.rows = self.rows, []
+        entries, self.entries = self.entries, []
+        sources, self.sources = self.sources, []
+        return rows, entries, sources
+
 
 class DatabaseWriter:
     """
     Database Writer Service
 
-    Subscribes to Redis channels and persists events to PostgreSQL
+    Subscribes to Redis channels and persists events to PostgreSQL.
+    One instance is one worker: it consumes only its own channels.
+
+    Args:
+        channels: Channels of this worker (default: all)
+        pool: Optional connection pool shared by the workers
+        primary: Runs dead-letter retries and partition maintenance
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        channels: Optional[List[str]] = None,
+        pool: Optional[ThreadedConnectionPool] = None,
+        primary: bool = True,
+    ):
         """Initialize DB Writer"""
         self.redis_host = os.getenv("REDIS_HOST", "cdb_redis")
         self.redis_port = int(os.getenv("REDIS_PORT", "6379"))
@@ -79,12 +339,45 @@ class DatabaseWriter:
         self.postgres_password = os.getenv("POSTGRES_PASSWORD", "")
 
         # Channels to subscribe to
-        self.channels = ["signals", "orders", "order_results", "portfolio_snapshots"]
+        self.channels = list(
+            channels or ["signals", "orders", "order_results", "portfolio_snapshots"]
+        )
+        self.name = "+".join(self.channels)
+        self.streams = {
+            stream: channel
+            for stream, channel in STREAM_CHANNELS.items()
+            if channel in self.channels
+        }
+        self.pool = pool
+        self.primary = primary
+        self.group = GROUP
+        self.consumer = CONSUMER
+
+        # Stream-Eintrag, dessen Event gerade verarbeitet wird (für ACK)
+        self._current_entry: Optional[Tuple[str, str]] = None
+        self._entry_queued = False
+        # Versuche des gerade re-drivten Dead Letters (0 = Erstzustellung)
+        self._current_attempts = 0
+        self._last_claim = 0.0
+        self._last_dlq_retry = 0.0
+        self.dlq: Optional[DeadLetterQueue] = None
+        # Periodische SQL-Jobs (nur Primary): letzter Lauf, abgeschaltete Jobs
+        self._last_periodic: Dict[str, float] = {}
+        self.disabled_jobs: set = set()
 
         # Connections
         self.redis_client = None
         self.db_conn = None
         self.pubsub = None
+        # PREPARE einmal je DB-Verbindung (neu nach Reconnect)
+        self.statements = table_statements()
+
+        # Micro-Batches je Tabelle (alle Tabellen: DLQ-Retries des primary
+        # Workers können jeden Channel betreffen)
+        self.batches: Dict[str, TableBatch] = {
+            table: TableBatch(table, *BATCH_POLICY.get(table, (BATCH_SIZE, FLUSH_INTERVAL_S)))
+            for table in TABLE_COLUMNS
+        }
 
     @staticmethod
     def convert_timestamp(timestamp_value):
@@ -182,7 +475,7 @@ class DatabaseWriter:
         raw = data.get("price") or data.get("limit_price")
 
         if raw is None:
-            logger.info(
+            logger.debug(
                 "Market order without limit price: %s %s",
                 data.get("symbol"),
                 data.get("order_type"),
@@ -247,22 +540,31 @@ class DatabaseWriter:
                 decode_responses=True,
             )
             self.redis_client.ping()
+            self.dlq = DeadLetterQueue(self.redis_client)
             logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
 
+    def postgres_params(self) -> Dict[str, Any]:
+        """Connection parameters for psycopg2.connect / the worker pool"""
+        return {
+            "host": self.postgres_host,
+            "port": self.postgres_port,
+            "database": self.postgres_db,
+            "user": self.postgres_user,
+            "password": self.postgres_password,
+        }
+
     def connect_postgres(self):
-        """Connect to PostgreSQL"""
+        """Connect to PostgreSQL (own connection or one from the pool)"""
         try:
-            self.db_conn = psycopg2.connect(
-                host=self.postgres_host,
-                port=self.postgres_port,
-                database=self.postgres_db,
-                user=self.postgres_user,
-                password=self.postgres_password,
-            )
-            self.db_conn.autocommit = True
+            if self.pool is not None:
+                self.db_conn = self.pool.getconn()
+            else:
+                self.db_conn = psycopg2.connect(**self.postgres_params())
+            # Transaktion je Batch-Flush (ein fsync pro Batch statt pro Event)
+            self.db_conn.autocommit = False
             logger.info(
                 f"Connected to PostgreSQL at {self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
             )
@@ -280,16 +582,309 @@ class DatabaseWriter:
             logger.error(f"Failed to subscribe to channels: {e}")
             raise
 
+    def enqueue(self, table: str, row: Tuple, data: Dict) -> None:
+        """Queue a validated row; flushes the table batch when full."""
+        self._entry_queued = True
+        source = (data, self._current_attempts)
+        if self.batches[table].add(row, self._current_entry, source):
+            self.flush_table(table)
+
+    def dead_letter(
+        self,
+        channel: str,
+        data: Dict,
+        error: Exception,
+        transient: bool = False,
+        attempts: Optional[int] = None,
+        entry: Optional[Tuple[str, str]] = None,
+    ) -> bool:
+        """
+        Move a failed event to the dead-letter stream.
+
+        Returns:
+            True if stored (the source entry may then be acknowledged)
+        """
+        if attempts is None:
+            attempts = self._current_attempts + 1
+        if entry is None:
+            entry = self._current_entry
+        if self.dlq is None:
+            return False
+        try:
+            self.dlq.push(
+                channel,
+                data,
+                error,
+                attempts=attempts,
+                transient=transient,
+                source=f"{entry[0]}:{entry[1]}" if entry else None,
+            )
+        except Exception as e:
+            logger.error("Dead-letter write failed for %s event: %s", channel, e)
+            return False
+        DB_WRITER_DEAD_LETTERS.labels(channel=channel, transient=str(transient).lower()).inc()
+        return True
+
+    def ack(self, entries) -> None:
+        """XACK stream entries (grouped per stream, one call each)."""
+        by_stream: Dict[str, List[str]] = {}
+        for entry in entries:
+            if entry is not None:
+                by_stream.setdefault(entry[0], []).append(entry[1])
+        for stream, ids in by_stream.items():
+            try:
+                self.redis_client.xack(stream, self.group, *ids)
+            except Exception as e:
+                # Kein Datenverlust: Einträge bleiben pending und werden reclaimed
+                logger.error("XACK failed for %s (%d entries): %s", stream, len(ids), e)
+
+    def flush_table(self, table: str) -> int:
+        """
+        Write all pending rows of a table in one transaction.
+
+        On failure the batch is retried row by row, so a single bad event
+        only fails itself (same semantics as the former per-event INSERT).
+
+        Returns:
+            Number of rows persisted
+        """
+        batch = self.batches[table]
+        rows, entries, sources = batch.take()
+        if not rows:
+            return 0
+
+        start = time.perf_counter()
+        try:
+            with self.db_conn:
+                with self.db_conn.cursor() as cursor:
+                    self.statements.execute_many(cursor, table, rows)
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # DB weg: transient -> Dead Letter mit Backoff-Retry. Nur Einträge,
+            # deren Dead Letter geschrieben wurde, werden ACKed; der Rest
+            # bleibt pending (XAUTOCLAIM)
+            logger.error("Batch flush for %s lost DB connection: %s", table, e)
+            DB_WRITER_EVENTS_FAILED.labels(channel=batch.channel).inc(len(rows))
+            self.ack(
+                entry
+                for entry, (data, attempts) in zip(entries, sources)
+                if self.dead_letter(
+                    batch.channel, data, e, True, attempts + 1, entry
+                )
+            )
+            self._reconnect_postgres()
+            return 0
+        except Exception as e:
+            logger.warning(
+                "Batch flush failed for %s (%d rows), retrying row by row: %s",
+                table,
+                len(rows),
+                e,
+            )
+            return self._flush_rows_individually(
+                table, batch.channel, rows, entries, sources
+            )
+
+        self.ack(entries)
+        elapsed = time.perf_counter() - start
+        DB_WRITER_FLUSH_ROWS.labels(table=table).observe(len(rows))
+        DB_WRITER_FLUSH_SECONDS.labels(table=table).observe(elapsed)
+        DB_WRITER_EVENTS_PROCESSED.labels(channel=batch.channel).inc(len(rows))
+        logger.debug("Flushed %d rows to %s in %.1f ms", len(rows), table, elapsed * 1000)
+        return len(rows)
+
+    def _flush_rows_individually(
+        self, table: str, channel: str, rows, entries, sources
+    ) -> int:
+        written = 0
+        done = []
+        for row, entry, (data, attempts) in zip(rows, entries, sources):
+            try:
+                with self.db_conn:
+                    with self.db_conn.cursor() as cursor:
+                        self.statements.execute_many(cursor, table, [row])
+                written += 1
+                done.append(entry)
+                DB_WRITER_EVENTS_PROCESSED.labels(channel=channel).inc()
+            except Exception as e:
+                logger.error("Failed to persist %s row: %s", table, e)
+                DB_WRITER_EVENTS_FAILED.labels(channel=channel).inc()
+                transient = not isinstance(e, PERMANENT_DB_ERRORS)
+                if self.dead_letter(channel, data, e, transient, attempts + 1, entry):
+                    done.append(entry)
+        self.ack(done)
+        return written
+
+    def retry_dead_letters(self, force: bool = False) -> int:
+        """
+        Re-drive dead letters whose backoff has expired.
+
+        Each event runs through the normal handler again and its batch is
+        flushed right away; a renewed failure creates a new dead letter
+        with attempts + 1, so the old entry is removed in either case.
+        """
+        if self.dlq is None or not self.primary:
+            return 0
+        now = time.monotonic()
+        if not force and now - self._last_dlq_retry < DLQ_RETRY_INTERVAL_S:
+            return 0
+        self._last_dlq_retry = now
+
+        try:
+            due = self.dlq.claim_due()
+        except Exception as e:
+            logger.error(f"Dead-letter retry scan failed: {e}")
+            return 0
+
+        for entry_id, fields in due:
+            channel = fields.get("channel", "")
+            try:
+                data = json.loads(fields.get("payload") or "{}")
+                attempts = int(fields.get("attempts") or 1)
+            except ValueError as e:
+                logger.error("Unreadable dead letter %s: %s", entry_id, e)
+                continue
+            self._current_attempts = attempts
+            try:
+                self.route(channel, data)
+            finally:
+                self._current_attempts = 0
+            self.flush_due(force=True)
+            self.dlq.delete([entry_id])
+            DB_WRITER_DLQ_RETRIES.labels(channel=channel).inc()
+        if due:
+            logger.info("Re-drove %d dead letters", len(due))
+        return len(due)
+
+    def _close_postgres(self) -> None:
+        try:
+            if self.pool is not None:
+                self.pool.putconn(self.db_conn, close=True)
+            elif self.db_conn is not None:
+                self.db_conn.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _reconnect_postgres(self) -> None:
+        self._close_postgres()
+        try:
+            self.connect_postgres()
+        except Exception:  # noqa: BLE001
+            # connect_postgres loggt bereits; nächster Flush versucht es erneut
+            pass
+
+    def _run_periodic_sql(
+        self,
+        name: str,
+        sql: str,
+        params: Optional[tuple] = None,
+        interval: float = 0.0,
+        force: bool = False,
+    ) -> list:
+        """
+        Run a schema.sql maintenance function at most every ``interval`` seconds.
+
+        Only the primary worker runs these jobs; ``interval`` <= 0 turns a job
+        off. A missing function (schema older than the job's migration)
+        disables the job for the rest of the process.
+
+        Returns:
+            Rows returned by the function ([] if skipped or failed)
+        """
+        if not self.primary or interval <= 0 or name in self.disabled_jobs:
+            return []
+        now = time.monotonic()
+        if not force and now - self._last_periodic.get(name, 0.0) < interval:
+            return []
+        self._last_periodic[name] = now
+
+        try:
+            with self.db_conn:
+                with self.db_conn.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    return cursor.fetchall()
+        except psycopg2.errors.UndefinedFunction as e:
+            logger.warning(f"{name} unavailable (schema too old): {e}")
+            self.disabled_jobs.add(name)
+        except Exception as e:
+            logger.error(f"{name} failed: {e}")
+        return []
+
+    def maintain_partitions(self, force: bool = False) -> list:
+        """
+        Pre-create future partitions and expire old ones (migration 004).
+
+        Replicas are serialized by an advisory lock inside the function.
+
+        Returns:
+            (table, action, partition) rows of the changes made
+        """
+        changes = self._run_periodic_sql(
+            "Partition maintenance",
+            "SELECT * FROM cdb_run_partition_maintenance()",
+            interval=PARTITION_MAINTENANCE_S,
+            force=force,
+        )
+        for table, action, partition in changes:
+            logger.info("Partition %s: %s (%s)", action, partition, table)
+        return changes
+
+    def refresh_rollups(self, force: bool = False) -> list:
+        """
+        Recompute the open hours of the hourly rollup tables (migration 005).
+
+        The function recomputes from its watermark minus a lookback, so late
+        rows are picked up.
+
+        Returns:
+            (rollup, bucket_from, rows_written) rows
+        """
+        refreshed = self._run_periodic_sql(
+            "Rollup refresh",
+            "SELECT * FROM cdb_refresh_rollups()",
+            interval=ROLLUP_REFRESH_S,
+            force=force,
+        )
+        for rollup, bucket_from, rows in refreshed:
+            logger.debug("Rollup %s ab %s: %s Zeilen", rollup, bucket_from, rows)
+        return refreshed
+
+    def compact_snapshots(self, force: bool = False) -> list:
+        """
+        Downsample portfolio_snapshots into the minute/hour tiers (migration 006).
+
+        Returns:
+            (tier, boundary, rows_affected) rows
+        """
+        compacted = self._run_periodic_sql(
+            "Snapshot compaction",
+            "SELECT * FROM cdb_compact_portfolio_snapshots("
+            "now(), %s::interval, %s::interval)",
+            (SNAPSHOT_RAW_RETENTION, SNAPSHOT_MINUTE_RETENTION),
+            interval=SNAPSHOT_COMPACTION_S,
+            force=force,
+        )
+        for tier, boundary, rows in compacted:
+            if rows:
+                logger.info("Snapshot-Kompaktierung %s bis %s: %s Zeilen", tier, boundary, rows)
+        return compacted
+
+    def flush_due(self, force: bool = False) -> int:
+        """Flush every batch that is full, timed out, or (force) non-empty."""
+        now = time.monotonic()
+        written = 0
+        for table, batch in self.batches.items():
+            if batch.rows and (force or batch.due(now)):
+                written += self.flush_table(table)
+        return written
+
     def process_signal_event(self, data: Dict):
         """
-        Persist Signal event to PostgreSQL
+        Queue Signal event for PostgreSQL
 
         Args:
             data: Signal event data
         """
         try:
-            cursor = self.db_conn.cursor()
-
             # Convert timestamp (handles Unix timestamps and ISO strings)
             timestamp = self.convert_timestamp(data.get("timestamp"))
 
@@ -299,12 +894,8 @@ class DatabaseWriter:
             if not signal_type:
                 signal_type = "unknown"  # Guard: satisfy NOT NULL constraint
 
-            cursor.execute(
-                """
-                INSERT INTO signals (symbol, signal_type, price, confidence, timestamp, source, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """,
+            self.enqueue(
+                "signals",
                 (
                     data.get("symbol"),
                     signal_type,
@@ -314,19 +905,16 @@ class DatabaseWriter:
                     data.get("source", "signal_engine"),
                     json.dumps(data.get("metadata", {})),
                 ),
+                data,
             )
-            signal_id = cursor.fetchone()[0]
-            logger.info(
-                f"✅ Signal persisted: ID={signal_id}, {data.get('symbol')} {signal_type}"
-            )
-            DB_WRITER_EVENTS_PROCESSED.labels(channel="signals").inc()
         except Exception as e:
             logger.error(f"Failed to persist signal: {e}")
             DB_WRITER_EVENTS_FAILED.labels(channel="signals").inc()
+            self.dead_letter("signals", data, e)
 
     def process_order_event(self, data: Dict):
         """
-        Persist Order event to PostgreSQL.
+        Queue Order event for PostgreSQL.
 
         Note: orders.price can be NULL for pure market orders without limit price.
 
@@ -340,14 +928,13 @@ class DatabaseWriter:
             # Convert timestamp (handles Unix timestamps and ISO strings)
             timestamp = self.convert_timestamp(data.get("timestamp"))
 
-            cursor = self.db_conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO orders
-                (symbol, side, order_type, price, size, approved, rejection_reason, status, metadata, created_at)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """,
+            # strategy_id für orders_hourly (Rollup liest metadata->>'strategy_id')
+            metadata = dict(data.get("metadata") or {})
+            if data.get("strategy_id") and "strategy_id" not in metadata:
+                metadata["strategy_id"] = data["strategy_id"]
+
+            self.enqueue(
+                "orders",
                 (
                     data.get("symbol"),
                     self.normalize_side(data.get("side")),
@@ -357,18 +944,11 @@ class DatabaseWriter:
                     data.get("approved", False),
                     data.get("rejection_reason"),
                     data.get("status", "pending"),
-                    json.dumps(data.get("metadata", {})),
+                    json.dumps(metadata),
                     timestamp,
                 ),
+                data,
             )
-            order_id = cursor.fetchone()[0]
-            logger.info(
-                "✅ Order persisted: ID=%d, %s %s",
-                order_id,
-                data.get("symbol"),
-                data.get("side"),
-            )
-            DB_WRITER_EVENTS_PROCESSED.labels(channel="orders").inc()
         except ValueError as e:
             # Validation error (e.g., invalid price format)
             logger.error(
@@ -377,13 +957,15 @@ class DatabaseWriter:
                 e,
             )
             DB_WRITER_EVENTS_FAILED.labels(channel="orders").inc()
+            self.dead_letter("orders", data, e)
         except Exception as e:
             logger.error("Failed to persist order: %s", e)
             DB_WRITER_EVENTS_FAILED.labels(channel="orders").inc()
+            self.dead_letter("orders", data, e)
 
     def process_trade_event(self, data: Dict):
         """
-        Persist Trade event to PostgreSQL.
+        Queue Trade event for PostgreSQL.
 
         IMPORTANT: Only persists actual executions (filled/partial).
         Rejected/cancelled orders are NOT trades and belong in orders table.
@@ -397,7 +979,7 @@ class DatabaseWriter:
 
         # Skip non-executions
         if status in NON_EXECUTION_STATUSES:
-            logger.info(
+            logger.debug(
                 "⏭️  Skipping %s order_result: %s - not an actual trade",
                 status,
                 data.get("symbol"),
@@ -444,14 +1026,8 @@ class DatabaseWriter:
                         target_price,
                     )
 
-            cursor = self.db_conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO trades
-                (symbol, side, price, size, status, execution_price, slippage_bps, fees, timestamp, exchange, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """,
+            self.enqueue(
+                "trades",
                 (
                     data.get("symbol"),
                     self.normalize_side(data.get("side")),
@@ -465,16 +1041,8 @@ class DatabaseWriter:
                     data.get("exchange", "MEXC"),
                     json.dumps(data.get("metadata", {})),
                 ),
+                data,
             )
-            trade_id = cursor.fetchone()[0]
-            logger.info(
-                "✅ Trade persisted: ID=%d, %s %s @ %s",
-                trade_id,
-                data.get("symbol"),
-                data.get("side"),
-                execution_price,
-            )
-            DB_WRITER_EVENTS_PROCESSED.labels(channel="order_results").inc()
         except ValueError as e:
             # Validation error - log but don't crash the service
             logger.error(
@@ -483,32 +1051,25 @@ class DatabaseWriter:
                 e,
             )
             DB_WRITER_EVENTS_FAILED.labels(channel="order_results").inc()
+            self.dead_letter("order_results", data, e)
         except Exception as e:
             logger.error("Failed to persist trade: %s", e)
             DB_WRITER_EVENTS_FAILED.labels(channel="order_results").inc()
+            self.dead_letter("order_results", data, e)
 
     def process_portfolio_snapshot(self, data: Dict):
         """
-        Persist Portfolio Snapshot to PostgreSQL
+        Queue Portfolio Snapshot for PostgreSQL
 
         Args:
             data: Portfolio snapshot data
         """
         try:
-            cursor = self.db_conn.cursor()
-
             # Convert timestamp (handles Unix timestamps and ISO strings)
             timestamp = self.convert_timestamp(data.get("timestamp"))
 
-            cursor.execute(
-                """
-                INSERT INTO portfolio_snapshots
-                (timestamp, total_equity, available_balance, margin_used, daily_pnl,
-                 total_unrealized_pnl, total_realized_pnl, total_exposure_pct, max_drawdown_pct,
-                 open_positions, metadata)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """,
+            self.enqueue(
+                "portfolio_snapshots",
                 (
                     timestamp,
                     data.get("equity", data.get("total_equity", 0)),
@@ -522,15 +1083,12 @@ class DatabaseWriter:
                     data.get("num_positions", data.get("open_positions", 0)),
                     json.dumps(data.get("metadata", {})),
                 ),
+                data,
             )
-            snapshot_id = cursor.fetchone()[0]
-            logger.info(
-                f"✅ Portfolio snapshot persisted: ID={snapshot_id}, Equity={data.get('equity')}"
-            )
-            DB_WRITER_EVENTS_PROCESSED.labels(channel="portfolio_snapshots").inc()
         except Exception as e:
             logger.error(f"Failed to persist portfolio snapshot: {e}")
             DB_WRITER_EVENTS_FAILED.labels(channel="portfolio_snapshots").inc()
+            self.dead_letter("portfolio_snapshots", data, e)
 
     def handle_message(self, message: Dict):
         """
@@ -550,7 +1108,10 @@ class DatabaseWriter:
             logger.warning(f"Invalid JSON in message from {channel}")
             return
 
-        # Route to handler
+        self.route(channel, data)
+
+    def route(self, channel: str, data: Dict):
+        """Route a decoded event to the handler of its channel"""
         if channel == "signals":
             self.process_signal_event(data)
         elif channel == "orders":
@@ -562,38 +1123,280 @@ class DatabaseWriter:
         else:
             logger.warning(f"Unknown channel: {channel}")
 
+    @staticmethod
+    def decode_stream_fields(fields: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Restore value types of a flat stream entry.
+
+        XADD stores every field as string (dicts/lists JSON-encoded by
+        sanitize_payload); JSON-decoding each value yields the same types
+        as the Pub/Sub payload. Plain strings (symbols, sides) stay as-is.
+        """
+        data = {}
+        for key, value in fields.items():
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+            data[key] = value
+        return data
+
+    def handle_stream_entries(self, stream: str, entries) -> int:
+        """
+        Process stream entries; ACK follows after the batch commit.
+
+        Entries that are not queued (validation error, non-trade status)
+        are acknowledged immediately - a retry would fail the same way.
+        """
+        channel = self.streams[stream]
+        skipped = []
+        for entry_id, fields in entries:
+            if fields is None:
+                # Eintrag wurde per MAXLEN getrimmt, nur noch ACK möglich
+                skipped.append((stream, entry_id))
+                continue
+            self._current_entry = (stream, entry_id)
+            self._entry_queued = False
+            try:
+                self.route(channel, self.decode_stream_fields(fields))
+            finally:
+                self._current_entry = None
+            if not self._entry_queued:
+                skipped.append((stream, entry_id))
+        self.ack(skipped)
+        return len(entries)
+
+    def ensure_groups(self):
+        """Create the consumer group on every stream (idempotent)"""
+        for stream in self.streams:
+            try:
+                self.redis_client.xgroup_create(
+                    stream, self.group, id=GROUP_START_ID, mkstream=True
+                )
+                logger.info("Consumer group %s created on %s", self.group, stream)
+            except redis.exceptions.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    def recover_own_pending(self):
+        """Re-process entries delivered to this consumer before a restart"""
+        for stream in self.streams:
+            last_id = "0"
+            while True:
+                response = self.redis_client.xreadgroup(
+                    self.group, self.consumer, {stream: last_id}, count=BATCH_SIZE
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    break
+                self.handle_stream_entries(stream, entries)
+                last_id = entries[-1][0]
+        self.flush_due(force=True)
+
+    def claim_stale(self) -> int:
+        """Take over entries pending longer than CLAIM_MIN_IDLE_MS (dead replicas)"""
+        claimed = 0
+        for stream in self.streams:
+            start_id = "0-0"
+            while True:
+                result = self.redis_client.xautoclaim(
+                    stream,
+                    self.group,
+                    self.consumer,
+                    min_idle_time=CLAIM_MIN_IDLE_MS,
+                    start_id=start_id,
+                    count=BATCH_SIZE,
+                )
+                start_id, entries = result[0], result[1]
+                if entries:
+                    DB_WRITER_RECLAIMED.labels(stream=stream).inc(len(entries))
+                    logger.warning(
+                        "Reclaimed %d stale entries from %s", len(entries), stream
+                    )
+                    claimed += self.handle_stream_entries(stream, entries)
+                if start_id in ("0-0", b"0-0"):
+                    break
+        return claimed
+
+    def update_lag_metrics(self):
+        """Export consumer lag and pending count per stream (XINFO GROUPS)"""
+        for stream in self.streams:
+            try:
+                groups = self.redis_client.xinfo_groups(stream)
+            except redis.exceptions.ResponseError:
+                continue
+            for info in groups:
+                if info.get("name") != self.group:
+                    continue
+                DB_WRITER_PENDING.labels(stream=stream).set(info.get("pending") or 0)
+                # "lag" erst ab Redis 7; None wenn nicht bestimmbar
+                if info.get("lag") is not None:
+                    DB_WRITER_CONSUMER_LAG.labels(stream=stream).set(info["lag"])
+
+    def _maintenance(self):
+        now = time.monotonic()
+        if now - self._last_claim < CLAIM_INTERVAL_S:
+            return
+        self._last_claim = now
+        try:
+            self.claim_stale()
+            self.update_lag_metrics()
+        except Exception as e:
+            logger.error(f"Stream maintenance failed: {e}")
+
+    def consume_streams_once(self) -> int:
+        """One XREADGROUP round over all streams, then flush due batches"""
+        response = self.redis_client.xreadgroup(
+            self.group,
+            self.consumer,
+            {stream: ">" for stream in self.streams},
+            count=BATCH_SIZE,
+            block=max(1, int(FLUSH_INTERVAL_S * 1000)),
+        )
+        started = time.perf_counter()
+        processed = 0
+        for stream, entries in response or []:
+            processed += self.handle_stream_entries(stream, entries)
+        self._maintenance()
+        self._housekeeping(started)
+        return processed
+
+    def poll_once(self) -> int:
+        """One receive round (stream read or Pub/Sub message) plus flushes"""
+        if self.pubsub is None:
+            return self.consume_streams_once()
+        # Timeout = Flush-Intervall, damit T-ms-Flushes greifen
+        message = self.pubsub.get_message(timeout=FLUSH_INTERVAL_S)
+        started = time.perf_counter()
+        if message:
+            self.handle_message(message)
+        self._housekeeping(started)
+        return 1 if message else 0
+
+    def _housekeeping(self, started: float) -> None:
+        self.flush_due()
+        self.retry_dead_letters()
+        self.maintain_partitions()
+        self.refresh_rollups()
+        self.compact_snapshots()
+        DB_WRITER_WORKER_BUSY.labels(worker=self.name).inc(time.perf_counter() - started)
+        DB_WRITER_WORKER_QUEUED.labels(worker=self.name).set(
+            sum(len(batch) for batch in self.batches.values())
+        )
+
+    def start(self):
+        """Connect to Redis/PostgreSQL and prepare the event source"""
+        self.connect_redis()
+        self.connect_postgres()
+        self.maintain_partitions(force=True)
+        self.refresh_rollups(force=True)
+        self.compact_snapshots(force=True)
+        if SOURCE == "pubsub":
+            self.subscribe_to_channels()
+        else:
+            self.ensure_groups()
+            self.recover_own_pending()
+            logger.info(
+                "Worker %s consuming streams %s as %s/%s",
+                self.name,
+                ", ".join(self.streams),
+                self.group,
+                self.consumer,
+            )
+
+    def serve(self, stop: Optional[threading.Event] = None):
+        """Event loop until stop is set; flushes and disconnects on exit"""
+        stop = stop or threading.Event()
+        try:
+            while not stop.is_set():
+                self.poll_once()
+        finally:
+            if self.db_conn:
+                self.flush_due(force=True)
+            if self.pubsub:
+                self.pubsub.close()
+            if self.db_conn:
+                self._close_postgres()
+
+
+class WriterPool:
+    """
+    Runs one DatabaseWriter thread per channel group.
+
+    Workers share a ThreadedConnectionPool (one connection each) but batch
+    and commit independently, so a snapshot burst no longer delays trades.
+    If one worker fails, all are stopped and the error is raised so the
+    container restarts.
+
+    Args:
+        groups: Channel groups, e.g. parse_workers(WORKERS_SPEC)
+    """
+
+    def __init__(self, groups: List[List[str]]):
+        self.workers = [
+            DatabaseWriter(channels=group, primary=index == 0)
+            for index, group in enumerate(groups)
+        ]
+        self.stop_event = threading.Event()
+        self.failed: List[str] = []
+        self.pool: Optional[ThreadedConnectionPool] = None
+
+    def _run_worker(self, worker: DatabaseWriter):
+        try:
+            worker.serve(self.stop_event)
+        except Exception as e:
+            logger.error("Worker %s failed: %s", worker.name, e)
+            self.failed.append(worker.name)
+            self.stop_event.set()
+
     def run(self):
-        """Main event loop"""
+        """Start all workers and block until shutdown"""
         logger.info("Starting DB Writer Service...")
 
         start_http_server(METRICS_PORT)
         logger.info("Metrics server listening on :%s", METRICS_PORT)
 
-        # Connect to Redis and PostgreSQL
-        self.connect_redis()
-        self.connect_postgres()
-        self.subscribe_to_channels()
-
-        logger.info("DB Writer Service started ✅")
+        size = len(self.workers)
+        self.pool = ThreadedConnectionPool(size, size, **self.workers[0].postgres_params())
+        for worker in self.workers:
+            worker.pool = self.pool
+            worker.start()
+
+        threads = [
+            threading.Thread(
+                target=self._run_worker,
+                args=(worker,),
+                name=f"db_writer-{worker.name}",
+                daemon=True,
+            )
+            for worker in self.workers
+        ]
+        for thread in threads:
+            thread.start()
+
+        logger.info(
+            "DB Writer Service started ✅ (%d workers: %s)",
+            size,
+            "; ".join(worker.name for worker in self.workers),
+        )
         logger.info("Listening for events...")
 
-        # Event loop
         try:
-            for message in self.pubsub.listen():
-                self.handle_message(message)
+            while not self.stop_event.wait(1.0):
+                pass
         except KeyboardInterrupt:
             logger.info("Shutting down DB Writer Service...")
-        except Exception as e:
-            logger.error(f"Error in event loop: {e}")
-            raise
         finally:
-            if self.pubsub:
-                self.pubsub.close()
-            if self.db_conn:
-                self.db_conn.close()
+            self.stop_event.set()
+            for thread in threads:
+                thread.join(timeout=10)
+            self.pool.closeall()
             logger.info("DB Writer Service stopped")
 
+        if self.failed:
+            raise RuntimeError(f"DB writer workers failed: {', '.join(self.failed)}")
+
 
 if __name__ == "__main__":
-    writer = DatabaseWriter()
-    writer.run()
+    WriterPool(parse_workers(WORKERS_SPEC)).run()
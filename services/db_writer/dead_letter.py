@@ -0,0 +1,226 @@
+"""
+Dead-Letter Queue - DB Writer
+Claire de Binare Trading Bot
+
+Events, die nicht persistiert werden konnten, landen mit Original-Payload,
+Fehlerklasse und Versuchszähler im Dead-Letter-Stream. Transiente Fehler
+(DB-Ausfall, Timeouts) werden über ein Sorted Set mit exponentiellem
+Backoff zur erneuten Verarbeitung eingeplant; permanente Fehler (Validierung,
+Constraints) bleiben liegen, bis sie per CLI inspiziert oder re-driven werden.
+
+CLI:
+    python -m services.db_writer.dead_letter stats
+    python -m services.db_writer.dead_letter list --limit 20 --channel orders
+    python -m services.db_writer.dead_letter redrive --all --error-class ValueError
+    python -m services.db_writer.dead_letter purge --id 1700000000000-0
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter as TallyCounter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import redis
+
+logger = logging.getLogger("db_writer")
+
+DLQ_STREAM = os.getenv("DB_WRITER_DLQ_STREAM", "stream.db_writer.dlq")
+RETRY_KEY = os.getenv("DB_WRITER_DLQ_RETRY_KEY", "db_writer:dlq:retry")
+MAX_ATTEMPTS = int(os.getenv("DB_WRITER_DLQ_MAX_ATTEMPTS", "8"))
+BACKOFF_BASE_S = float(os.getenv("DB_WRITER_DLQ_BACKOFF_S", "5"))
+BACKOFF_MAX_S = float(os.getenv("DB_WRITER_DLQ_BACKOFF_MAX_S", "900"))
+DLQ_MAXLEN = int(os.getenv("DB_WRITER_DLQ_MAXLEN", "100000"))
+
+
+class DeadLetterQueue:
+    """Dead-letter stream plus retry schedule (sorted set, score = due ms).
+
+    Args:
+        client: redis.Redis instance (decode_responses=True).
+        stream: Dead-letter stream key.
+        retry_key: Sorted set of entry ids scheduled for retry.
+        max_attempts: Transient failures are retried until this many attempts.
+        backoff_base_s: Delay after the first failure (doubles per attempt).
+        backoff_max_s: Upper bound of the retry delay.
+        maxlen: Approximate max length of the dead-letter stream.
+    """
+
+    def __init__(
+        self,
+        client,
+        stream: str = DLQ_STREAM,
+        retry_key: str = RETRY_KEY,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_base_s: float = BACKOFF_BASE_S,
+        backoff_max_s: float = BACKOFF_MAX_S,
+        maxlen: int = DLQ_MAXLEN,
+    ):
+        self.client = client
+        self.stream = stream
+        self.retry_key = retry_key
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.maxlen = maxlen
+
+    def backoff_s(self, attempts: int) -> float:
+        """Delay before retry number ``attempts`` + 1."""
+        return min(self.backoff_base_s * 2 ** max(0, attempts - 1), self.backoff_max_s)
+
+    def push(
+        self,
+        channel: str,
+        payload: Dict,
+        error: Exception,
+        attempts: int = 1,
+        transient: bool = False,
+        source: Optional[str] = None,
+    ) -> str:
+        """Store a failed event; schedules a retry for transient errors."""
+        now_ms = int(time.time() * 1000)
+        fields = {
+            "channel": channel,
+            "payload": json.dumps(payload, default=str),
+            "error_class": type(error).__name__,
+            "error": str(error)[:500],
+            "attempts": attempts,
+            "transient": int(transient),
+            "failed_at": now_ms,
+        }
+        if source:
+            fields["source"] = source
+        entry_id = self.client.xadd(
+            self.stream, fields, maxlen=self.maxlen, approximate=True
+        )
+        if transient and attempts < self.max_attempts:
+            due_ms = now_ms + int(self.backoff_s(attempts) * 1000)
+            self.client.zadd(self.retry_key, {entry_id: due_ms})
+        return entry_id
+
+    def claim_due(self, limit: int = 100) -> List[Tuple[str, Dict]]:
+        """Take due retries off the schedule (ZREM wins once across replicas)."""
+        now_ms = int(time.time() * 1000)
+        due_ids = self.client.zrangebyscore(self.retry_key, 0, now_ms, start=0, num=limit)
+        claimed = []
+        for entry_id in due_ids:
+            if not self.client.zrem(self.retry_key, entry_id):
+                continue  # andere Replika war schneller
+            entries = self.client.xrange(self.stream, entry_id, entry_id)
+            if entries:
+                claimed.append(entries[0])
+        return claimed
+
+    def delete(self, entry_ids: Iterable[str]) -> int:
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return 0
+        self.client.zrem(self.retry_key, *entry_ids)
+        return self.client.xdel(self.stream, *entry_ids)
+
+    def schedule(self, entry_ids: Iterable[str], due_ms: int = 0) -> int:
+        """(Re-)schedule entries for the retry worker (CLI re-drive)."""
+        mapping = {entry_id: due_ms for entry_id in entry_ids}
+        if not mapping:
+            return 0
+        self.client.zadd(self.retry_key, mapping)
+        return len(mapping)
+
+    def entries(
+        self,
+        channel: Optional[str] = None,
+        error_class: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch: int = 500,
+    ) -> List[Tuple[str, Dict]]:
+        """Scan the dead-letter stream (oldest first) with optional filters."""
+        result: List[Tuple[str, Dict]] = []
+        start = "-"
+        while True:
+            chunk = self.client.xrange(self.stream, start, "+", count=batch)
+            for entry_id, fields in chunk:
+                if channel and fields.get("channel") != channel:
+                    continue
+                if error_class and fields.get("error_class") != error_class:
+                    continue
+                result.append((entry_id, fields))
+                if limit is not None and len(result) >= limit:
+                    return result
+            if len(chunk) < batch:
+                return result
+            start = "(" + chunk[-1][0]
+
+    def stats(self) -> Dict:
+        entries = self.entries()
+        return {
+            "entries": len(entries),
+            "scheduled": self.client.zcard(self.retry_key),
+            "by_channel": dict(TallyCounter(f.get("channel") for _, f in entries)),
+            "by_error_class": dict(TallyCounter(f.get("error_class") for _, f in entries)),
+        }
+
+
+def _client_from_env():
+    return redis.Redis(
+        host=os.getenv("REDIS_HOST", "cdb_redis"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        password=os.getenv("REDIS_PASSWORD"),
+        decode_responses=True,
+    )
+
+
+def main(argv: Optional[List[str]] = None, dlq: Optional[DeadLetterQueue] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect and re-drive DB writer dead letters.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="Counts by channel and error class")
+
+    def _filters(p):
+        p.add_argument("--channel", help="Only this channel (signals, orders, ...)")
+        p.add_argument("--error-class", help="Only this error class (e.g. ValueError)")
+        p.add_argument("--id", action="append", default=[], help="Entry id (repeatable)")
+        p.add_argument("--all", action="store_true", help="All entries matching the filters")
+
+    list_parser = sub.add_parser("list", help="Print dead letters as JSON lines")
+    list_parser.add_argument("--channel")
+    list_parser.add_argument("--error-class")
+    list_parser.add_argument("--limit", type=int, default=50)
+
+    redrive = sub.add_parser("redrive", help="Schedule entries for immediate retry")
+    _filters(redrive)
+    purge = sub.add_parser("purge", help="Delete entries from the dead-letter stream")
+    _filters(purge)
+
+    args = parser.parse_args(argv)
+    dlq = dlq or DeadLetterQueue(_client_from_env())
+
+    if args.command == "stats":
+        print(json.dumps(dlq.stats(), indent=2, sort_keys=True))
+        return 0
+
+    if args.command == "list":
+        for entry_id, fields in dlq.entries(args.channel, args.error_class, args.limit):
+            print(json.dumps({"id": entry_id, **fields}, sort_keys=True))
+        return 0
+
+    if args.id:
+        ids = list(args.id)
+    elif args.all:
+        ids = [entry_id for entry_id, _ in dlq.entries(args.channel, args.error_class)]
+    else:
+        parser.error(f"{args.command}: --id or --all required")
+
+    if args.command == "redrive":
+        count = dlq.schedule(ids)
+        print(f"Scheduled {count} dead letters for retry")
+    else:
+        count = dlq.delete(ids)
+        print(f"Deleted {count} dead letters")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
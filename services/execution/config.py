@@ -42,12 +42,39 @@ DATABASE_URL = os.getenv(
     f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}",
 )
 
+# Connection Pool (Database-Layer)
+POSTGRES_POOL_MIN = int(os.getenv("POSTGRES_POOL_MIN", "1"))
+POSTGRES_POOL_MAX = int(os.getenv("POSTGRES_POOL_MAX", "5"))
+POSTGRES_POOL_TIMEOUT_SECONDS = float(os.getenv("POSTGRES_POOL_TIMEOUT_SECONDS", "10"))
+
+# Write-Behind Persistence (DB-Writes entkoppelt vom Order-Pfad)
+WRITE_BEHIND_QUEUE_MAX = int(os.getenv("WRITE_BEHIND_QUEUE_MAX", "10000"))
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "100"))
+WRITE_BEHIND_FLUSH_SECONDS = float(os.getenv("WRITE_BEHIND_FLUSH_SECONDS", "0.2"))
+WRITE_BEHIND_MAX_RETRIES = int(os.getenv("WRITE_BEHIND_MAX_RETRIES", "5"))
+EXECUTION_SPILL_PATH = os.getenv("EXECUTION_SPILL_PATH", "logs/execution_spill.jsonl")
+
+# Async Dispatch (nebenläufig je Symbol, geordnet innerhalb eines Symbols).
+# Paper-Mode bleibt sequentiell: der geseedete MockExecutor soll Fills und
+# RNG-Ziehungen in Nachrichtenreihenfolge liefern (deterministisches Replay).
+ASYNC_DISPATCH = (
+    os.getenv("EXECUTION_ASYNC_DISPATCH", str(not MOCK_TRADING)).lower() == "true"
+)
+ASYNC_DISPATCH_CONCURRENCY = int(os.getenv("EXECUTION_ASYNC_CONCURRENCY", "10"))
+
+# Idempotency (Duplicate-Order-Guard je client_id, lokal + Redis SET NX EX)
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("EXECUTION_IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_CACHE_MAX = int(os.getenv("EXECUTION_IDEMPOTENCY_CACHE_MAX", "10000"))
+IDEMPOTENCY_KEY_PREFIX = os.getenv("EXECUTION_IDEMPOTENCY_PREFIX", "execution:idem:")
+
 # Topics
 TOPIC_ORDERS = "orders"  # Subscribe: Orders from Risk Manager
 TOPIC_ORDER_RESULTS = "order_results"  # Publish: Execution results
 TOPIC_ALERTS = "alerts"  # Publish: Execution alerts
 STREAM_ORDER_RESULTS = os.getenv("STREAM_ORDER_RESULTS", "stream.fills")
 STREAM_BOT_SHUTDOWN = os.getenv("STREAM_BOT_SHUTDOWN", "stream.bot_shutdown")
+STREAM_ACCOUNT_UPDATES = os.getenv("STREAM_ACCOUNT_UPDATES", "stream.account_updates")
+ORDER_UPDATE_CACHE_MAX = int(os.getenv("ORDER_UPDATE_CACHE_MAX", "10000"))
 
 # Order Configuration
 MAX_RETRIES = 3
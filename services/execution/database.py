@@ -5,13 +5,14 @@ Claire de Binare Trading Bot
 
 import json
 import logging
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from typing import Optional
 from datetime import datetime
 import time
 from contextlib import contextmanager
 
+from core.utils.postgres_client import PreparedStatements, create_postgres_pool
+
 try:
     from . import config
     from .models import ExecutionResult, OrderStatus
@@ -21,14 +22,64 @@ except ImportError:
 
 logger = logging.getLogger(config.SERVICE_NAME)
 
+ORDER_COLUMNS = (
+    "symbol, side, order_type, size, price, filled_size, avg_fill_price, "
+    "status, submitted_at, filled_at, approved, metadata"
+)
+ORDER_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, to_timestamp(%s), to_timestamp(%s), %s, %s)"
+)
+TRADE_COLUMNS = (
+    "symbol, side, price, size, execution_price, status, timestamp, metadata"
+)
+TRADE_TEMPLATE = "(%s, %s, %s, %s, %s, %s, to_timestamp(%s), %s)"
+
+
+def define_statements(statements: PreparedStatements) -> PreparedStatements:
+    """Hot inserts/lookups of the execution service (both orders layouts)."""
+    statements.define_insert(
+        "order_insert",
+        "orders",
+        "order_id, " + ORDER_COLUMNS,
+        template="(%s, " + ORDER_TEMPLATE[1:],
+        returning="id",
+    )
+    statements.define_insert(
+        "order_insert_legacy", "orders", ORDER_COLUMNS, ORDER_TEMPLATE, "id"
+    )
+    statements.define_insert(
+        "trade_insert", "trades", TRADE_COLUMNS, TRADE_TEMPLATE, "id"
+    )
+    statements.define("order_by_id", "SELECT * FROM orders WHERE order_id = %s")
+    statements.define(
+        "order_by_id_legacy",
+        "SELECT * FROM orders WHERE metadata->>'order_id' = %s",
+    )
+    statements.define(
+        "recent_orders", "SELECT * FROM orders ORDER BY submitted_at DESC LIMIT %s"
+    )
+    return statements
+
 
 class Database:
     """PostgreSQL database handler"""
 
     def __init__(self):
         self.connection_string = config.DATABASE_URL
-        self._orders_has_order_id_column = None
-        self._test_connection()
+        # PREPARE + Spalten-Check einmal je Pool-Verbindung
+        self.statements = define_statements(PreparedStatements(prefix="cdb_exec"))
+        # Pool statt psycopg2.connect pro Query (TCP+Auth-Handshake je Order)
+        self.pool = create_postgres_pool(
+            minconn=config.POSTGRES_POOL_MIN,
+            maxconn=config.POSTGRES_POOL_MAX,
+            dsn=self.connection_string,
+            checkout_timeout=config.POSTGRES_POOL_TIMEOUT_SECONDS,
+        )
+        try:
+            self._test_connection()
+        except Exception:
+            self.pool.closeall()
+            raise
 
     def _test_connection(self):
         """Test database connection on init"""
@@ -43,33 +94,34 @@ class Database:
 
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = None
+        """Context manager for pooled database connections (commit/rollback)"""
         try:
-            conn = psycopg2.connect(self.connection_string)
-            yield conn
-            conn.commit()
+            with self.pool.connection() as conn:
+                yield conn
         except Exception as e:
-            if conn:
-                conn.rollback()
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
+
+    def pool_stats(self) -> dict:
+        """Connection-Pool Kennzahlen (für /status und /metrics)"""
+        return {
+            "size": self.pool.size,
+            "idle": self.pool.idle,
+            "in_use": self.pool.in_use,
+            **self.pool.stats,
+            **{
+                f"statement_{key}": value
+                for key, value in self.statements.stats.items()
+            },
+        }
+
+    def close(self):
+        """Close all pooled connections"""
+        self.pool.closeall()
 
     def _orders_has_order_id(self, cur) -> bool:
-        """Check if orders table has order_id column (cached)."""
-        if self._orders_has_order_id_column is not None:
-            return self._orders_has_order_id_column
-        cur.execute(
-            """
-            SELECT 1 FROM information_schema.columns
-            WHERE table_name = 'orders' AND column_name = 'order_id'
-        """
-        )
-        self._orders_has_order_id_column = cur.fetchone() is not None
-        return self._orders_has_order_id_column
+        """Check if orders table has order_id column (cached per connection)."""
+        return self.statements.has_column(cur, "orders", "order_id")
 
     def save_order(self, result: ExecutionResult) -> bool:
         """
@@ -84,79 +136,31 @@ class Database:
                         metadata_payload["order_id"] = result.order_id
                     metadata_json = json.dumps(metadata_payload)
 
-                    has_order_id = self._orders_has_order_id(cur)
+                    row = (
+                        result.symbol,
+                        result.side.lower(),
+                        "market",
+                        result.quantity,
+                        result.price,
+                        result.filled_quantity,
+                        result.price,
+                        result.status.lower(),
+                        int(time.time()),
+                        (
+                            int(time.time())
+                            if result.status == OrderStatus.FILLED.value
+                            else None
+                        ),
+                        True,  # approved
+                        metadata_json,
+                    )
                     # Insert into orders table
-                    if has_order_id:
-                        cur.execute(
-                            """
-                            INSERT INTO orders (
-                                order_id, symbol, side, order_type,
-                                size, price, filled_size, avg_fill_price,
-                                status, submitted_at, filled_at,
-                                approved, metadata
-                            ) VALUES (
-                                %s, %s, %s, %s,
-                                %s, %s, %s, %s,
-                                %s, to_timestamp(%s), to_timestamp(%s),
-                                %s, %s
-                            )
-                            RETURNING id
-                        """,
-                            (
-                                result.order_id,
-                                result.symbol,
-                                result.side.lower(),
-                                "market",
-                                result.quantity,
-                                result.price,
-                                result.filled_quantity,
-                                result.price,
-                                result.status.lower(),
-                                int(time.time()),
-                                (
-                                    int(time.time())
-                                    if result.status == OrderStatus.FILLED.value
-                                    else None
-                                ),
-                                True,  # approved
-                                metadata_json,
-                            ),
+                    if self._orders_has_order_id(cur):
+                        self.statements.execute(
+                            cur, "order_insert", (result.order_id, *row)
                         )
                     else:
-                        cur.execute(
-                            """
-                            INSERT INTO orders (
-                                symbol, side, order_type,
-                                size, price, filled_size, avg_fill_price,
-                                status, submitted_at, filled_at,
-                                approved, metadata
-                            ) VALUES (
-                                %s, %s, %s,
-                                %s, %s, %s, %s,
-                                %s, to_timestamp(%s), to_timestamp(%s),
-                                %s, %s
-                            )
-                            RETURNING id
-                        """,
-                            (
-                                result.symbol,
-                                result.side.lower(),
-                                "market",
-                                result.quantity,
-                                result.price,
-                                result.filled_quantity,
-                                result.price,
-                                result.status.lower(),
-                                int(time.time()),
-                                (
-                                    int(time.time())
-                                    if result.status == OrderStatus.FILLED.value
-                                    else None
-                                ),
-                                True,  # approved
-                                metadata_json,
-                            ),
-                        )
+                        self.statements.execute(cur, "order_insert_legacy", row)
 
                     logger.info(f"Saved order to database: {result.order_id}")
                     return True
@@ -184,21 +188,9 @@ class Database:
                     )
 
                     # Insert into trades table
-                    cur.execute(
-                        """
-                        INSERT INTO trades (
-                            symbol, side,
-                            price, size, execution_price,
-                            status, timestamp,
-                            metadata
-                        ) VALUES (
-                            %s, %s,
-                            %s, %s, %s,
-                            %s, to_timestamp(%s),
-                            %s
-                        )
-                        RETURNING id
-                    """,
+                    self.statements.execute(
+                        cur,
+                        "trade_insert",
                         (
                             result.symbol,
                             result.side.lower(),  # lowercase for schema constraint
@@ -220,27 +212,89 @@ class Database:
             logger.error(f"Failed to save trade: {e}")
             return False
 
+    @staticmethod
+    def _result_epoch(result: ExecutionResult) -> int:
+        """Unix timestamp of the result (falls back to now)."""
+        try:
+            return int(datetime.fromisoformat(result.timestamp).timestamp())
+        except (TypeError, ValueError):
+            return int(time.time())
+
+    def save_batch(self, results: list[ExecutionResult]) -> int:
+        """
+        Save many results in one transaction (orders for all, trades for
+        FILLED): prepared INSERTs for small batches, multi-row INSERTs above.
+        Used by the write-behind writer.
+        Raises on failure so the caller can retry/spill.
+        Returns number of orders written.
+        """
+        if not results:
+            return 0
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                has_order_id = self._orders_has_order_id(cur)
+                order_rows = []
+                trade_rows = []
+                for result in results:
+                    ts = self._result_epoch(result)
+                    metadata = {"source": "execution_service"}
+                    if result.order_id:
+                        metadata["order_id"] = result.order_id
+                    row = (
+                        result.symbol,
+                        result.side.lower(),
+                        "market",
+                        result.quantity,
+                        result.price,
+                        result.filled_quantity,
+                        result.price,
+                        result.status.lower(),
+                        ts,
+                        ts if result.status == OrderStatus.FILLED.value else None,
+                        True,  # approved
+                        json.dumps(metadata),
+                    )
+                    order_rows.append(
+                        (result.order_id, *row) if has_order_id else row
+                    )
+                    if result.status == OrderStatus.FILLED.value:
+                        trade_rows.append(
+                            (
+                                result.symbol,
+                                result.side.lower(),
+                                result.price,
+                                result.filled_quantity,
+                                result.price,
+                                "filled",
+                                ts,
+                                json.dumps({"order_id": result.order_id}),
+                            )
+                        )
+
+                self.statements.execute_many(
+                    cur,
+                    "order_insert" if has_order_id else "order_insert_legacy",
+                    order_rows,
+                )
+                self.statements.execute_many(cur, "trade_insert", trade_rows)
+
+        logger.info(
+            "Saved batch to database: %d orders, %d trades",
+            len(order_rows),
+            len(trade_rows),
+        )
+        return len(order_rows)
+
     def get_order_by_id(self, order_id: str) -> Optional[dict]:
         """Retrieve order by order_id"""
         try:
             with self.get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     if self._orders_has_order_id(cur):
-                        cur.execute(
-                            """
-                            SELECT * FROM orders
-                            WHERE order_id = %s
-                        """,
-                            (order_id,),
-                        )
+                        self.statements.execute(cur, "order_by_id", (order_id,))
                     else:
-                        cur.execute(
-                            """
-                            SELECT * FROM orders
-                            WHERE metadata->>'order_id' = %s
-                        """,
-                            (order_id,),
-                        )
+                        self.statements.execute(cur, "order_by_id_legacy", (order_id,))
 
                     result = cur.fetchone()
                     return dict(result) if result else None
@@ -254,14 +308,7 @@ class Database:
         try:
             with self.get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute(
-                        """
-                        SELECT * FROM orders 
-                        ORDER BY submitted_at DESC 
-                        LIMIT %s
-                    """,
-                        (limit,),
-                    )
+                    self.statements.execute(cur, "recent_orders", (limit,))
 
                     results = cur.fetchall()
                     return [dict(row) for row in results]
@@ -0,0 +1,80 @@
+"""
+Async Order Dispatcher for Execution Service
+Claire de Binare Trading Bot
+
+Orders verschiedener Symbole laufen nebenläufig, Orders desselben Symbols
+strikt in Eingangsreihenfolge (ein Worker-Task je Symbol mit eigener FIFO).
+Exchange-Limits setzt der gemeinsame AsyncRateLimiter des Clients durch.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+try:
+    from . import config
+except ImportError:
+    import config
+
+logger = logging.getLogger(config.SERVICE_NAME)
+
+
+class SymbolDispatcher:
+    """Per-symbol ordered, cross-symbol concurrent order dispatch.
+
+    Args:
+        handler: Coroutine function processing one order payload.
+        max_concurrency: Max. orders in flight across all symbols.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[dict], Awaitable[Any]],
+        max_concurrency: int = 10,
+    ):
+        self.handler = handler
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queues: Dict[str, deque] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self.stats = {"dispatched": 0, "completed": 0, "failed": 0}
+
+    @property
+    def pending(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    @property
+    def active_symbols(self) -> int:
+        return len(self._workers)
+
+    def submit(self, order_data: dict) -> None:
+        """Queue an order behind earlier orders of the same symbol."""
+        symbol = str(order_data.get("symbol") or "")
+        self._queues.setdefault(symbol, deque()).append(order_data)
+        self.stats["dispatched"] += 1
+        if symbol not in self._workers:
+            self._workers[symbol] = asyncio.get_running_loop().create_task(
+                self._run_symbol(symbol), name=f"orders:{symbol}"
+            )
+
+    async def _run_symbol(self, symbol: str) -> None:
+        queue = self._queues[symbol]
+        # Kein await zwischen Leer-Check und Abmelden -> kein Verlust neuer Orders
+        while queue:
+            order_data = queue.popleft()
+            async with self._semaphore:
+                try:
+                    await self.handler(order_data)
+                    self.stats["completed"] += 1
+                except Exception as e:  # noqa: BLE001
+                    self.stats["failed"] += 1
+                    logger.error(f"Order-Dispatch fehlgeschlagen ({symbol}): {e}")
+        del self._workers[symbol]
+        del self._queues[symbol]
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait until all queued orders are processed."""
+        while self._workers:
+            await asyncio.wait(list(self._workers.values()), timeout=timeout)
+            if timeout is not None:
+                break
@@ -0,0 +1,163 @@
+"""
+Idempotency Cache for Execution Service
+Claire de Binare Trading Bot
+
+Duplicate-Order-Guard je client_id: Redelivery (Restart, doppeltes Publish,
+At-least-once Streams) darf keine zweite Order an die Börse senden.
+- Lokal: begrenzter TTL-Index (OrderedDict, O(1) Lookup, älteste zuerst raus)
+- Replikaübergreifend: Redis SET NX EX als Claim, Ergebnis danach als JSON
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+try:
+    from . import config
+    from .models import ExecutionResult
+except ImportError:
+    import config
+    from models import ExecutionResult
+
+logger = logging.getLogger(config.SERVICE_NAME)
+
+# Redis-Wert eines Claims, dessen Order noch in Ausführung ist
+PENDING = "pending"
+
+
+class IdempotencyCache:
+    """Bounded TTL index of client_id -> prior ExecutionResult.
+
+    Args:
+        redis_client: Optional Redis client for the cross-replica claim.
+        ttl_s: Lifetime of a claim/result in seconds.
+        max_entries: Max. entries held in memory.
+        prefix: Redis key prefix.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        ttl_s: int = 86400,
+        max_entries: int = 10000,
+        prefix: str = "execution:idem:",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.redis = redis_client
+        self.ttl_s = int(ttl_s)
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._clock = clock
+        self._lock = Lock()
+        # client_id -> (expires_at, result or None while in flight)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[ExecutionResult]]]" = (
+            OrderedDict()
+        )
+        self.stats = {
+            "claimed": 0,
+            "duplicates": 0,
+            "in_flight": 0,
+            "released": 0,
+            "redis_errors": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, client_id: str, result: Optional[ExecutionResult]) -> None:
+        self._entries[client_id] = (self._clock() + self.ttl_s, result)
+        self._entries.move_to_end(client_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, client_id: str):
+        entry = self._entries.get(client_id)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[client_id]
+            return None
+        return entry
+
+    def _duplicate(self, result: Optional[ExecutionResult]):
+        if result is None:
+            self.stats["in_flight"] += 1
+        else:
+            self.stats["duplicates"] += 1
+        return False, result
+
+    def claim(self, client_id: str) -> Tuple[bool, Optional[ExecutionResult]]:
+        """Claim a client_id for execution.
+
+        Returns (True, None) if the order may be executed, otherwise
+        (False, prior_result) - prior_result is None while the first
+        delivery is still in flight (here or on another replica).
+        """
+        with self._lock:
+            entry = self._lookup(client_id)
+            if entry is not None:
+                return self._duplicate(entry[1])
+
+            if self.redis is not None:
+                key = f"{self.prefix}{client_id}"
+                try:
+                    if not self.redis.set(key, PENDING, nx=True, ex=self.ttl_s):
+                        prior = self._decode(self.redis.get(key))
+                        if prior is not None:
+                            self._store(client_id, prior)
+                        return self._duplicate(prior)
+                except Exception as e:  # noqa: BLE001
+                    # Redis weg: lokaler Schutz bleibt, Order nicht blockieren
+                    self.stats["redis_errors"] += 1
+                    logger.warning(f"Idempotency-Claim ohne Redis ({client_id}): {e}")
+
+            self._store(client_id, None)
+            self.stats["claimed"] += 1
+            return True, None
+
+    def record(self, client_id: str, result: ExecutionResult) -> None:
+        """Store the result of a claimed client_id for later duplicates."""
+        with self._lock:
+            self._store(client_id, result)
+        if self.redis is not None:
+            try:
+                self.redis.set(
+                    f"{self.prefix}{client_id}",
+                    json.dumps(asdict(result)),
+                    ex=self.ttl_s,
+                )
+            except Exception as e:  # noqa: BLE001
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Idempotency-Ergebnis nicht gespeichert ({client_id}): {e}")
+
+    def release(self, client_id: str) -> None:
+        """Drop the claim of a failed execution so a redelivery may retry."""
+        with self._lock:
+            self._entries.pop(client_id, None)
+            self.stats["released"] += 1
+        if self.redis is not None:
+            try:
+                self.redis.delete(f"{self.prefix}{client_id}")
+            except Exception as e:  # noqa: BLE001
+                # Claim läuft spätestens nach ttl_s ab
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Idempotency-Claim nicht freigegeben ({client_id}): {e}")
+
+    @staticmethod
+    def _decode(raw) -> Optional[ExecutionResult]:
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        if raw == PENDING:
+            return None
+        try:
+            return ExecutionResult(**json.loads(raw))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ungültiger Idempotency-Eintrag: {e}")
+            return None
@@ -7,6 +7,7 @@ Features:
 - Real market prices
 - Real order placement
 - Error handling and retries
+- Async order placement (AsyncMexcClient, shared rate limiter)
 """
 
 import logging
@@ -15,14 +16,28 @@ from typing import Optional, Dict, Any
 from core.utils.clock import utcnow
 
 try:
-    from .models import Order, ExecutionResult, OrderStatus
+    from .models import Order, ExecutionResult, OrderStatus, PushedOrderCache
     from .mexc_client import MexcClient
 except ImportError:
-    from models import Order, ExecutionResult, OrderStatus
+    from models import Order, ExecutionResult, OrderStatus, PushedOrderCache
     from mexc_client import MexcClient
 
+try:
+    from core.clients.mexc_async import AsyncMexcClient
+except ImportError:  # aiohttp optional: sync path only
+    AsyncMexcClient = None
+
 logger = logging.getLogger(__name__)
 
+MEXC_STATUS_MAP = {
+    "NEW": OrderStatus.PENDING,
+    "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELED": OrderStatus.CANCELLED,
+    "REJECTED": OrderStatus.REJECTED,
+    "EXPIRED": OrderStatus.REJECTED,
+}
+
 
 class LiveExecutor:
     """Executes real orders via MEXC API"""
@@ -33,6 +48,7 @@ class LiveExecutor:
         api_secret: Optional[str] = None,
         testnet: bool = False,
         dry_run: bool = False,
+        order_cache_max: int = 10000,
     ):
         """
         Initialize Live Executor
@@ -42,9 +58,15 @@ class LiveExecutor:
             api_secret: MEXC API Secret (default: from env)
             testnet: Use testnet API (default: False)
             dry_run: Log orders without executing (default: False)
+            order_cache_max: Max. order ids kept from the private-WS push
         """
         self.dry_run = dry_run
         self.testnet = testnet
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self.async_client = None
+        # Order state pushed by the private user-data stream (no REST polling)
+        self.pushed_orders = PushedOrderCache(order_cache_max)
 
         if dry_run:
             logger.warning("🔶 DRY RUN MODE - Orders will be logged but NOT executed!")
@@ -111,8 +133,74 @@ class LiveExecutor:
             logger.error(f"❌ Order execution failed: {e}")
             return self._create_error_result(order, str(e))
 
+    def _get_async_client(self):
+        """AsyncMexcClient, created lazily inside the running event loop."""
+        if self.async_client is None:
+            if AsyncMexcClient is None:
+                raise RuntimeError("aiohttp not installed - async execution unavailable")
+            self.async_client = AsyncMexcClient(
+                api_key=self._api_key, api_secret=self._api_secret, testnet=self.testnet
+            )
+        return self.async_client
+
+    async def execute_order_async(self, order: Order) -> ExecutionResult:
+        """
+        Execute real order via the async MEXC client (concurrent dispatch)
+
+        Args:
+            order: Order to execute
+
+        Returns:
+            ExecutionResult with real execution data
+        """
+        order_type = getattr(order, "order_type", "MARKET")
+        order_price = getattr(order, "price", None)
+
+        if self.dry_run:
+            logger.warning(
+                f"🔶 DRY RUN: Would execute {order.symbol} {order.side} {order.quantity}"
+            )
+            return self._create_dry_run_result(order)
+
+        try:
+            client = self._get_async_client()
+            if order_type.upper() == "MARKET":
+                response = await client.place_market_order(
+                    symbol=order.symbol, side=order.side, quantity=float(order.quantity)
+                )
+            elif order_type.upper() == "LIMIT":
+                if order_price is None:
+                    raise ValueError("Limit order requires price")
+                response = await client.place_limit_order(
+                    symbol=order.symbol,
+                    side=order.side,
+                    quantity=float(order.quantity),
+                    price=float(order_price),
+                )
+            else:
+                raise ValueError(f"Unsupported order type: {order.order_type}")
+
+            market_price = None
+            if response.get("status") in ("FILLED", "PARTIALLY_FILLED") and not float(
+                response.get("price", 0)
+            ):
+                market_price = await client.get_ticker_price(order.symbol)
+            return self._parse_mexc_response(order, response, market_price)
+
+        except Exception as e:
+            logger.error(f"❌ Order execution failed: {e}")
+            return self._create_error_result(order, str(e))
+
+    async def aclose(self) -> None:
+        """Close the async client session"""
+        if self.async_client is not None:
+            await self.async_client.close()
+
     def _parse_mexc_response(
-        self, order: Order, response: Dict[str, Any]
+        self,
+        order: Order,
+        response: Dict[str, Any],
+        market_price: Optional[float] = None,
     ) -> ExecutionResult:
         """
         Parse MEXC API response into ExecutionResult
@@ -131,17 +219,8 @@ class LiveExecutor:
             "side": "BUY"
         }
         """
-        status_map = {
-            "NEW": OrderStatus.PENDING,
-            "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
-            "FILLED": OrderStatus.FILLED,
-            "CANCELED": OrderStatus.CANCELLED,
-            "REJECTED": OrderStatus.REJECTED,
-            "EXPIRED": OrderStatus.REJECTED,
-        }
-
         mexc_status = response.get("status", "UNKNOWN")
-        status = status_map.get(mexc_status, OrderStatus.PENDING)
+        status = MEXC_STATUS_MAP.get(mexc_status, OrderStatus.PENDING)
 
         # Get execution price
         if status in (OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED):
@@ -149,7 +228,11 @@ class LiveExecutor:
             execution_price = float(response.get("price", 0))
             if execution_price == 0:
                 # Fallback: get current market price
-                execution_price = self.client.get_ticker_price(order.symbol)
+                execution_price = (
+                    market_price
+                    if market_price is not None
+                    else self.client.get_ticker_price(order.symbol)
+                )
         else:
             execution_price = 0.0
 
@@ -176,6 +259,45 @@ class LiveExecutor:
 
         return result
 
+    def apply_order_update(self, update: dict) -> None:
+        """Store a private-WS order_update as the latest known order state"""
+        self.pushed_orders.apply(update)
+
+    def get_order_status(
+        self, order_id: str, symbol: Optional[str] = None
+    ) -> Optional[ExecutionResult]:
+        """
+        Latest order state: pushed state first, REST query as fallback
+
+        Args:
+            order_id: Exchange order id
+            symbol: Trading pair (required for the REST fallback)
+
+        Returns:
+            ExecutionResult or None if unknown
+        """
+        pushed = self.pushed_orders.get(order_id)
+        if pushed is not None or self.dry_run or not symbol:
+            return pushed
+
+        try:
+            response = self.client.get_order_status(symbol, order_id)
+        except Exception as e:
+            logger.error(f"❌ Order status query failed: {e}")
+            return None
+        status = MEXC_STATUS_MAP.get(response.get("status"), OrderStatus.PENDING)
+        return ExecutionResult(
+            order_id=str(response.get("orderId", order_id)),
+            client_id=response.get("clientOrderId") or None,
+            symbol=symbol,
+            side=str(response.get("side", "")).upper(),
+            quantity=float(response.get("origQty", 0) or 0),
+            filled_quantity=float(response.get("executedQty", 0) or 0),
+            price=float(response.get("price", 0) or 0) or None,
+            status=status.value,
+            timestamp=utcnow().isoformat(),
+        )
+
     def _create_dry_run_result(self, order: Order) -> ExecutionResult:
         """Create mock result for dry-run mode"""
         order_price = getattr(order, "price", None)
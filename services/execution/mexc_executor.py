@@ -3,14 +3,18 @@ MEXC Real Executor for Live Trading
 URGENT: Replaces MockExecutor with real MEXC API integration
 """
 
-import requests
 import time
-import hashlib
-import hmac
 from typing import Optional
-from .models import Order, ExecutionResult, OrderStatus
-from .config import MEXC_API_KEY, MEXC_API_SECRET, MEXC_BASE_URL, MEXC_TESTNET
-
+from .models import Order, ExecutionResult, OrderStatus, PushedOrderCache
+from .config import (
+    MEXC_API_KEY,
+    MEXC_API_SECRET,
+    MEXC_BASE_URL,
+    MEXC_TESTNET,
+    ORDER_UPDATE_CACHE_MAX,
+)
+
+from core.clients.mexc import get_transport
 from core.utils.clock import utcnow
 from core.utils.uuid_gen import generate_uuid_hex
 
@@ -28,12 +32,19 @@ class MexcExecutor:
                 "MEXC_API_KEY and MEXC_API_SECRET must be set in environment"
             )
 
+        # Shared keep-alive session + precomputed HMAC key
+        self.transport = get_transport(self.base_url, self.api_key, self.api_secret)
+
+        # Order state pushed by the private user-data stream (no REST polling)
+        self.pushed_orders = PushedOrderCache(ORDER_UPDATE_CACHE_MAX)
+
+    def apply_order_update(self, update: dict) -> None:
+        """Store a private-WS order_update as the latest known order state"""
+        self.pushed_orders.apply(update)
+
     def _generate_signature(self, params: str, timestamp: str) -> str:
         """Generate MEXC API signature"""
-        message = f"{timestamp}{params}"
-        return hmac.new(
-            self.api_secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        return self.transport.sign(f"{timestamp}{params}")
 
     def _make_request(self, method: str, endpoint: str, params: dict = None) -> dict:
         """Make authenticated request to MEXC API"""
@@ -55,16 +66,10 @@ class MexcExecutor:
         # Add signature
         params["signature"] = signature
 
-        headers = {"X-MEXC-APIKEY": self.api_key, "Content-Type": "application/json"}
-
-        url = f"{self.base_url}{endpoint}"
-
-        if method == "GET":
-            response = requests.get(url, params=params, headers=headers)
+        if method in ("GET", "DELETE"):
+            response = self.transport.request(method, endpoint, params=params)
         elif method == "POST":
-            response = requests.post(url, json=params, headers=headers)
-        elif method == "DELETE":
-            response = requests.delete(url, params=params, headers=headers)
+            response = self.transport.request(method, endpoint, json=params)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -134,7 +139,10 @@ class MexcExecutor:
             )
 
     def get_order_status(self, order_id: str) -> Optional[ExecutionResult]:
-        """Get REAL order status from MEXC"""
+        """Get REAL order status (pushed state first, REST as fallback)"""
+        pushed = self.pushed_orders.get(order_id)
+        if pushed is not None:
+            return pushed
         try:
             result = self._make_request("GET", "/api/v3/order", {"orderId": order_id})
 
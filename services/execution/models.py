@@ -3,7 +3,9 @@ Data Models for Execution Service
 Claire de Binare Trading Bot
 """
 
-from typing import Literal, Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Literal, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -31,6 +33,16 @@ class OrderStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# MEXC private.orders Status -> interner Status
+PUSH_STATUS_MAP = {
+    "NEW": OrderStatus.SUBMITTED,
+    "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELED": OrderStatus.CANCELLED,
+    "PARTIALLY_CANCELED": OrderStatus.CANCELLED,
+}
+
+
 @dataclass
 class Order:
     """Order from Risk Manager (EVENT_SCHEMA kompatibel)"""
@@ -123,6 +135,30 @@ class ExecutionResult:
         if self.timestamp is None:
             self.timestamp = utcnow().isoformat()
 
+    @classmethod
+    def from_order_update(cls, update: dict) -> "ExecutionResult":
+        """Erstellt ein Ergebnis aus einem Private-WS order_update Event"""
+
+        def _num(key: str) -> float:
+            try:
+                return float(update.get(key) or 0.0)
+            except (TypeError, ValueError):
+                return 0.0
+
+        avg_price = _num("avg_price") or _num("price")
+        return cls(
+            order_id=str(update.get("order_id", "")),
+            symbol=str(update.get("symbol", "")),
+            side=str(update.get("side", "")).upper(),
+            quantity=_num("quantity"),
+            filled_quantity=_num("cumulative_quantity"),
+            status=PUSH_STATUS_MAP.get(
+                str(update.get("status", "")), OrderStatus.SUBMITTED
+            ).value,
+            client_id=update.get("client_id") or None,
+            price=avg_price or None,
+        )
+
     @staticmethod
     def _schema_status(status: str) -> str:
         """Mappt interne Stati auf EVENT_SCHEMA-Konstanten"""
@@ -204,3 +240,39 @@ class Trade:
             "commission": self.commission,
             "timestamp": self.timestamp,
         }
+
+
+class PushedOrderCache:
+    """Latest pushed order state (private-WS order_update) per order_id.
+
+    Bounded like the idempotency index: oldest order ids are evicted once
+    max_entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._orders: "OrderedDict[str, ExecutionResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def apply(self, update: dict) -> Optional[ExecutionResult]:
+        """Store an order_update event; returns the parsed state."""
+        result = ExecutionResult.from_order_update(update)
+        if not result.order_id:
+            return None
+        with self._lock:
+            self._orders[result.order_id] = result
+            self._orders.move_to_end(result.order_id)
+            while len(self._orders) > self.max_entries:
+                self._orders.popitem(last=False)
+        return result
+
+    def get(self, order_id: str) -> Optional[ExecutionResult]:
+        with self._lock:
+            return self._orders.get(order_id)
+
+    def order_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._orders)
@@ -6,14 +6,18 @@ Provides comprehensive logging and performance tracking for 72-hour testing prot
 """
 
 import os
+import heapq
+import itertools
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import time
 
 from core.utils.clock import utcnow
+from core.utils.streaming_metrics import StreamingPerformanceMetrics
 
 class OrderType(Enum):
     """Order types for paper trading"""
@@ -68,6 +72,34 @@ class PaperPosition:
     updated_at: datetime
 
 
+@dataclass
+class _SymbolOrderBook:
+    """Pending orders of one symbol, indexed by trigger price.
+
+    - max-heap (negated key): buy limits, sell stops -> trigger when price <= key
+    - min-heap: sell limits, buy stops -> trigger when price >= key
+    - FIFO: market orders waiting for the first price
+    Cancelled orders stay in the heaps and are skipped lazily on pop.
+    """
+
+    falling: List[Tuple[float, int, PaperOrder]] = field(default_factory=list)
+    rising: List[Tuple[float, int, PaperOrder]] = field(default_factory=list)
+    market: Deque[PaperOrder] = field(default_factory=deque)
+    stale: int = 0
+
+    def __len__(self) -> int:
+        return len(self.falling) + len(self.rising) + len(self.market)
+
+    def compact(self) -> None:
+        """Drop lazily cancelled entries once they dominate the heaps."""
+        self.falling = [e for e in self.falling if e[2].status == OrderStatus.PENDING]
+        self.rising = [e for e in self.rising if e[2].status == OrderStatus.PENDING]
+        heapq.heapify(self.falling)
+        heapq.heapify(self.rising)
+        self.market = deque(o for o in self.market if o.status == OrderStatus.PENDING)
+        self.stale = 0
+
+
 class PaperTradingEngine:
     """
     Paper trading engine for 72-hour validation testing
@@ -82,7 +114,10 @@ class PaperTradingEngine:
         self.initial_balance = initial_balance
         self.current_balance = initial_balance
         self.positions: Dict[str, PaperPosition] = {}
-        self.orders: Dict[str, PaperOrder] = {}
+        self.orders: Dict[str, PaperOrder] = {}  # open (pending) orders
+        self.order_archive: Dict[str, PaperOrder] = {}  # filled/cancelled
+        self._books: Dict[str, _SymbolOrderBook] = {}
+        self._order_seq = itertools.count()
         self.trade_history: List[Dict[str, Any]] = []
         self.performance_metrics: Dict[str, Any] = {}
 
@@ -105,6 +140,7 @@ class PaperTradingEngine:
         self.total_pnl = 0.0
         self.max_drawdown = 0.0
         self.peak_balance = initial_balance
+        self._metrics = StreamingPerformanceMetrics()
 
         self.logger.info(
             f"Paper trading engine initialized with balance: ${initial_balance:,.2f}"
@@ -222,6 +258,8 @@ class PaperTradingEngine:
         # Try immediate fill for market orders
         if order_type == OrderType.MARKET and symbol in self.market_prices:
             self._execute_order(order, self.market_prices[symbol])
+        else:
+            self._index_order(order)
 
         self.logger.info(
             f"Order placed: {order.side} {order.quantity} {order.symbol} @ {order.order_type.value}"
@@ -237,6 +275,12 @@ class PaperTradingEngine:
         order = self.orders[order_id]
         if order.status == OrderStatus.PENDING:
             order.status = OrderStatus.CANCELLED
+            self._archive_order(order)
+            book = self._books.get(order.symbol)
+            if book is not None:
+                book.stale += 1
+                if book.stale > 64 and book.stale * 2 > len(book):
+                    book.compact()
             self.logger.info(f"Order cancelled: {order_id}")
             return True
 
@@ -252,7 +296,7 @@ class PaperTradingEngine:
 
     def get_order_status(self, order_id: str) -> Optional[OrderStatus]:
         """Get order status"""
-        order = self.orders.get(order_id)
+        order = self.orders.get(order_id) or self.order_archive.get(order_id)
         return order.status if order else None
 
     def get_balance(self) -> float:
@@ -275,14 +319,14 @@ class PaperTradingEngine:
             "balance": self.current_balance,
             "equity": self.get_equity(),
             "max_drawdown": self.max_drawdown,
+            "sharpe_ratio": self._metrics.sharpe_ratio,
+            "sortino_ratio": self._metrics.sortino_ratio,
             "return_percentage": (
                 (self.get_equity() - self.initial_balance) / self.initial_balance
             )
             * 100,
             "active_positions": len(self.positions),
-            "pending_orders": len(
-                [o for o in self.orders.values() if o.status == OrderStatus.PENDING]
-            ),
+            "pending_orders": len(self.orders),
         }
 
     def _validate_order(self, order: PaperOrder) -> Dict[str, Any]:
@@ -303,41 +347,58 @@ class PaperTradingEngine:
 
         return {"valid": True, "reason": None}
 
+    def _index_order(self, order: PaperOrder):
+        """Add a pending order to its symbol's trigger index"""
+        book = self._books.setdefault(order.symbol, _SymbolOrderBook())
+        seq = next(self._order_seq)  # FIFO among equal trigger prices
+
+        if order.order_type == OrderType.MARKET:
+            book.market.append(order)
+        elif order.order_type == OrderType.LIMIT:
+            if order.side == "buy":
+                heapq.heappush(book.falling, (-order.price, seq, order))
+            else:
+                heapq.heappush(book.rising, (order.price, seq, order))
+        elif order.order_type == OrderType.STOP:
+            if order.side == "buy":
+                heapq.heappush(book.rising, (order.stop_price, seq, order))
+            else:
+                heapq.heappush(book.falling, (-order.stop_price, seq, order))
+        # STOP_LIMIT is not simulated; such orders stay pending
+
+    def _archive_order(self, order: PaperOrder):
+        """Move a filled/cancelled order out of the open-order table"""
+        self.orders.pop(order.id, None)
+        self.order_archive[order.id] = order
+
     def _check_order_fills(self, symbol: str, price: float):
-        """Check if any orders should be filled at current price"""
-        symbol_orders = [
-            o
-            for o in self.orders.values()
-            if o.symbol == symbol and o.status == OrderStatus.PENDING
-        ]
-
-        for order in symbol_orders:
-            should_fill = False
-            fill_price = price
-
-            if order.order_type == OrderType.MARKET:
-                should_fill = True
-            elif order.order_type == OrderType.LIMIT:
-                if order.side == "buy" and price <= order.price:
-                    should_fill = True
-                    fill_price = order.price
-                elif order.side == "sell" and price >= order.price:
-                    should_fill = True
-                    fill_price = order.price
-            elif order.order_type == OrderType.STOP:
-                if order.side == "buy" and price >= order.stop_price:
-                    should_fill = True
-                elif order.side == "sell" and price <= order.stop_price:
-                    should_fill = True
-
-            if should_fill:
-                self._execute_order(order, fill_price)
+        """Fill only orders whose trigger was crossed: O(k log n)"""
+        book = self._books.get(symbol)
+        if book is None:
+            return
+
+        triggered: List[PaperOrder] = []
+        while book.market:
+            triggered.append(book.market.popleft())
+        while book.falling and price <= -book.falling[0][0]:
+            triggered.append(heapq.heappop(book.falling)[2])
+        while book.rising and price >= book.rising[0][0]:
+            triggered.append(heapq.heappop(book.rising)[2])
+
+        for order in triggered:
+            if order.status != OrderStatus.PENDING:
+                book.stale = max(0, book.stale - 1)
+                continue
+            # Limits fill at their limit price, market/stop at the tick price
+            fill_price = order.price if order.order_type == OrderType.LIMIT else price
+            self._execute_order(order, fill_price)
 
     def _execute_order(self, order: PaperOrder, fill_price: float):
         """Execute an order"""
         order.status = OrderStatus.FILLED
         order.filled_at = utcnow()
         order.filled_price = fill_price
+        self._archive_order(order)
 
         # Update balance and positions
         if order.side == "buy":
@@ -368,6 +429,11 @@ class PaperTradingEngine:
             drawdown = (self.peak_balance - current_equity) / self.peak_balance
             self.max_drawdown = max(self.max_drawdown, drawdown)
 
+        # Streaming metrics (O(1) Sharpe/Sortino per executed order)
+        self._metrics.record_equity(current_equity, order.filled_at.timestamp())
+        if order.side == "sell":
+            self._metrics.record_trade(realized_pnl)
+
         # Log trade
         trade_info = {
             "timestamp": order.filled_at.isoformat(),
@@ -379,6 +445,8 @@ class PaperTradingEngine:
             "balance": self.current_balance,
             "equity": current_equity,
         }
+        if order.side == "sell":
+            trade_info["realized_pnl"] = realized_pnl
         self.trade_history.append(trade_info)
 
         self.logger.info(
@@ -473,26 +541,8 @@ class PaperTradingEngine:
         self.logger.info(f"Final performance: {self.performance_metrics}")
 
     def _calculate_sharpe_ratio(self) -> float:
-        """Calculate Sharpe ratio (simplified)"""
-        if not self.trade_history or len(self.trade_history) < 2:
-            return 0.0
-
-        # Calculate daily returns (simplified)
-        returns = []
-        for i in range(1, len(self.trade_history)):
-            prev_equity = self.trade_history[i - 1]["equity"]
-            curr_equity = self.trade_history[i]["equity"]
-            daily_return = (curr_equity - prev_equity) / prev_equity
-            returns.append(daily_return)
-
-        if not returns:
-            return 0.0
-
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        std_dev = variance**0.5
-
-        return (mean_return * 365) / (std_dev * (365**0.5)) if std_dev > 0 else 0.0
+        """Calculate Sharpe ratio (simplified, per-trade equity returns)"""
+        return self._metrics.sharpe_ratio
 
     def export_results(self) -> Dict[str, Any]:
         """Export all trading results for analysis"""
@@ -500,6 +550,9 @@ class PaperTradingEngine:
             "performance_metrics": self.performance_metrics,
             "trade_history": self.trade_history,
             "final_positions": {k: asdict(v) for k, v in self.positions.items()},
-            "order_history": {k: asdict(v) for k, v in self.orders.items()},
+            "order_history": {
+                k: asdict(v)
+                for k, v in {**self.order_archive, **self.orders}.items()
+            },
             "price_history": self.price_history,
         }
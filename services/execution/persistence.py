@@ -0,0 +1,305 @@
+"""
+Write-Behind Persistence for Execution Service
+Claire de Binare Trading Bot
+
+Entkoppelt Postgres-Latenz vom Order-Pfad: Ergebnisse werden in eine
+begrenzte Queue gelegt und von einem Writer-Thread gebündelt (Multi-Row
+INSERT) geschrieben. Bei DB-Ausfall: Retry mit exponentiellem Backoff,
+danach Spill in eine lokale JSONL-Datei, die nach Recovery nachgespielt wird.
+Lehnt die DB einen Batch dauerhaft ab (Constraint, ungültige Daten), wird
+er zeilenweise geschrieben; nur die abgelehnten Zeilen landen in
+<spill_path>.rejected und werden nicht erneut versucht.
+"""
+
+import json
+import logging
+import os
+import queue
+import time
+from dataclasses import asdict
+from threading import Event, Lock, Thread
+from typing import Optional
+
+import psycopg2
+
+try:
+    from . import config
+    from .models import ExecutionResult
+except ImportError:
+    import config
+    from models import ExecutionResult
+
+logger = logging.getLogger(config.SERVICE_NAME)
+
+# Fehler, die ein Retry nicht behebt (Zeile selbst ist ungültig)
+PERMANENT_ERRORS = (
+    psycopg2.IntegrityError,
+    psycopg2.DataError,
+    psycopg2.ProgrammingError,
+    TypeError,
+    ValueError,
+)
+
+
+class WriteBehindWriter:
+    """Bounded write-behind queue with a dedicated DB writer thread.
+
+    Args:
+        db: Object with ``save_batch(results)`` that raises on failure.
+        max_queue: Queue capacity; when full, results are spilled directly.
+        batch_size: Max. results per multi-row write.
+        flush_interval_s: Max. time a result waits for its batch to fill.
+        max_retries: Attempts per batch before it is spilled to disk.
+        backoff_base_s: First retry delay (doubles per attempt).
+        backoff_max_s: Upper bound of the retry delay.
+        spill_path: JSONL file for results that could not be written
+            (rows rejected permanently go to ``<spill_path>.rejected``).
+    """
+
+    def __init__(
+        self,
+        db,
+        max_queue: int = 10000,
+        batch_size: int = 100,
+        flush_interval_s: float = 0.2,
+        max_retries: int = 5,
+        backoff_base_s: float = 0.5,
+        backoff_max_s: float = 30.0,
+        spill_path: Optional[str] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.max_retries = max_retries
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self.spill_path = spill_path
+
+        self._queue: "queue.Queue[ExecutionResult]" = queue.Queue(maxsize=max_queue)
+        self._stop = Event()
+        self._spill_lock = Lock()
+        self._thread: Optional[Thread] = None
+        self.stats = {
+            "written": 0,
+            "batches": 0,
+            "retries": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "rejected": 0,
+            "dropped": 0,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Producer side (order path)
+    # ------------------------------------------------------------------ #
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, result: ExecutionResult) -> bool:
+        """Enqueue a result without blocking. Returns False if it was spilled."""
+        try:
+            self._queue.put_nowait(result)
+            return True
+        except queue.Full:
+            logger.warning("Write-Behind Queue voll - Spill: %s", result.order_id)
+            self._spill([result])
+            return False
+
+    # ------------------------------------------------------------------ #
+    # Writer thread
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the writer after draining the queue (spills what is left)."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        leftover = self._drain(self._queue.qsize())
+        if leftover:
+            self._spill(leftover)
+
+    def _drain(self, limit: int) -> list[ExecutionResult]:
+        items: list[ExecutionResult] = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _next_batch(self) -> list[ExecutionResult]:
+        try:
+            first = self._queue.get(timeout=self.flush_interval_s)
+        except queue.Empty:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            batch.extend(self._drain(self.batch_size - len(batch)))
+            if len(batch) >= self.batch_size:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if batch:
+                failed = self._write_with_retry(batch)
+                if failed:
+                    self._spill(failed)
+                else:
+                    self.replay_spill()
+
+    def _write(self, batch: list[ExecutionResult]) -> None:
+        self.db.save_batch(batch)
+        self.stats["written"] += len(batch)
+        self.stats["batches"] += 1
+
+    def _write_once(self, batch: list[ExecutionResult]) -> list[ExecutionResult]:
+        """One write attempt; returns the results still to be written."""
+        try:
+            self._write(batch)
+            return []
+        except PERMANENT_ERRORS as e:
+            logger.warning(
+                "DB-Batch (%d) abgelehnt, schreibe zeilenweise: %s", len(batch), e
+            )
+            return self._write_rows(batch)
+
+    def _write_rows(self, batch: list[ExecutionResult]) -> list[ExecutionResult]:
+        """Per-row fallback: rejects bad rows, stops at the first transient error."""
+        for index, result in enumerate(batch):
+            try:
+                self._write([result])
+            except PERMANENT_ERRORS as e:
+                self._reject(result, e)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Einzel-Write fehlgeschlagen ({result.order_id}): {e}")
+                return batch[index:]
+        return []
+
+    def _write_with_retry(self, batch: list[ExecutionResult]) -> list[ExecutionResult]:
+        """Write a batch with backoff; returns the results left to spill."""
+        delay = self.backoff_base_s
+        pending = batch
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                pending = self._write_once(pending)
+                if not pending:
+                    return []
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "DB-Batch (%d) fehlgeschlagen, Versuch %d/%d: %s",
+                    len(pending),
+                    attempt,
+                    self.max_retries,
+                    e,
+                )
+            if attempt == self.max_retries or self._stop.is_set():
+                break
+            self.stats["retries"] += 1
+            self._stop.wait(delay)
+            delay = min(delay * 2, self.backoff_max_s)
+        return pending
+
+    # ------------------------------------------------------------------ #
+    # Spill file
+    # ------------------------------------------------------------------ #
+
+    def _spill(self, results: list[ExecutionResult]) -> None:
+        if not self.spill_path:
+            self.stats["dropped"] += len(results)
+            logger.error("Kein Spill-Pfad - %d Ergebnisse verworfen", len(results))
+            return
+        with self._spill_lock:
+            try:
+                directory = os.path.dirname(self.spill_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as f:
+                    for result in results:
+                        f.write(json.dumps(asdict(result), ensure_ascii=False) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.stats["spilled"] += len(results)
+                logger.warning(
+                    "%d Ergebnisse in Spill-Datei %s geschrieben",
+                    len(results),
+                    self.spill_path,
+                )
+            except OSError as e:
+                self.stats["dropped"] += len(results)
+                logger.error(f"Spill fehlgeschlagen ({self.spill_path}): {e}")
+
+    def _reject(self, result: ExecutionResult, error: Exception) -> None:
+        """Keep a permanently rejected result out of the replay loop."""
+        self.stats["rejected"] += 1
+        logger.error(f"Ergebnis von DB abgelehnt ({result.order_id}): {error}")
+        if not self.spill_path:
+            return
+        with self._spill_lock:
+            try:
+                with open(self.spill_path + ".rejected", "a", encoding="utf-8") as f:
+                    record = {**asdict(result), "error": str(error)}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.error(f"Rejected-Datei nicht schreibbar: {e}")
+
+    def replay_spill(self) -> int:
+        """Write spilled results back to the DB. Returns number replayed."""
+        if not self.spill_path:
+            return 0
+        replay_path = self.spill_path + ".replay"
+        with self._spill_lock:
+            # A leftover .replay file stems from an interrupted replay.
+            if not os.path.exists(replay_path):
+                if not os.path.exists(self.spill_path):
+                    return 0
+                os.replace(self.spill_path, replay_path)
+        results: list[ExecutionResult] = []
+        with open(replay_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    results.append(ExecutionResult(**json.loads(line)))
+                except (TypeError, ValueError) as e:
+                    logger.error(f"Ungültige Spill-Zeile verworfen: {e}")
+
+        written_before = self.stats["written"]
+        for start in range(0, len(results), self.batch_size):
+            chunk = results[start : start + self.batch_size]
+            try:
+                failed = self._write_once(chunk)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Spill-Replay abgebrochen: {e}")
+                failed = chunk
+            if failed:
+                self._spill(failed + results[start + len(chunk) :])
+                os.remove(replay_path)
+                replayed = self.stats["written"] - written_before
+                self.stats["replayed"] += replayed
+                return replayed
+        os.remove(replay_path)
+        replayed = self.stats["written"] - written_before
+        if results:
+            self.stats["replayed"] += replayed
+            logger.info("%d Ergebnisse aus Spill-Datei nachgeschrieben", replayed)
+        return replayed
@@ -3,6 +3,7 @@ Execution Service - Main Entry Point
 Claire de Binare Trading Bot
 """
 
+import asyncio
 import os
 import json
 import signal
@@ -15,11 +16,14 @@ from pathlib import Path
 from flask import Flask, jsonify, Response
 import redis
 from threading import Thread, Lock
+from typing import Optional
 
 from core.utils.clock import utcnow
 from core.utils.redis_payload import sanitize_payload
+from core.utils.redis_publisher import EventPublisher
 from core.utils.uuid_gen import generate_uuid_hex
 from core.auth import validate_all_auth
+from core.clients.exchange_info import ExchangeInfoCache
 
 try:
     from . import config
@@ -27,12 +31,18 @@ try:
     from .mock_executor import MockExecutor
     from .live_executor import LiveExecutor
     from .database import Database
+    from .persistence import WriteBehindWriter
+    from .dispatcher import SymbolDispatcher
+    from .idempotency import IdempotencyCache
 except ImportError:
     import config
     from models import Order, ExecutionResult, OrderStatus
     from mock_executor import MockExecutor
     from live_executor import LiveExecutor
     from database import Database
+    from persistence import WriteBehindWriter
+    from dispatcher import SymbolDispatcher
+    from idempotency import IdempotencyCache
 
 # Logging setup mit zentraler Konfiguration
 # Im Container ist logging_config.json nicht verfügbar, daher Fallback
@@ -65,6 +75,11 @@ executor = None
 redis_client = None
 pubsub = None
 db = None
+writer = None
+publisher = None
+exchange_info = None
+dispatcher = None
+idempotency = None
 running = True
 
 # Thread-safe stats with lock (Fix for Issue #306)
@@ -73,17 +88,24 @@ stats = {
     "orders_received": 0,
     "orders_filled": 0,
     "orders_rejected": 0,
+    "orders_duplicate": 0,
+    "order_updates_pushed": 0,
+    "fills_pushed": 0,
     "start_time": utcnow().isoformat(),
     "last_result": None,
 }
 
 # Thread-safe sets with lock (Fix for Issue #306)
 _orders_lock = Lock()
+_sync_execute_lock = Lock()
 bot_shutdown_active = False
 blocked_strategy_ids = set()
 blocked_bot_ids = set()
 open_orders = set()
 
+# Order-State aus dem Private-WS hält der Executor (apply_order_update)
+TERMINAL_PUSH_STATUSES = {"FILLED", "CANCELED", "PARTIALLY_CANCELED"}
+
 
 def increment_stat(key: str, value: int = 1) -> None:
     """Thread-safe stats increment"""
@@ -125,7 +147,7 @@ def _init_with_retry(
 
 def init_services():
     """Initialize Redis, Executor and Database"""
-    global redis_client, pubsub, executor, db
+    global redis_client, pubsub, executor, db, writer, exchange_info, idempotency
 
     try:
 
@@ -149,6 +171,14 @@ def init_services():
         pubsub.subscribe(config.TOPIC_ORDERS)
         logger.info(f"Subscribed to topic: {config.TOPIC_ORDERS}")
 
+        # Duplicate-Order-Guard (Redelivery / mehrere Replikas)
+        idempotency = IdempotencyCache(
+            redis_client,
+            ttl_s=config.IDEMPOTENCY_TTL_SECONDS,
+            max_entries=config.IDEMPOTENCY_CACHE_MAX,
+            prefix=config.IDEMPOTENCY_KEY_PREFIX,
+        )
+
         # Initialize executor - LIVE DATA CONVERSION
         if config.MOCK_TRADING:
             executor = MockExecutor()
@@ -165,6 +195,7 @@ def init_services():
                 api_secret=config.MEXC_API_SECRET or None,
                 testnet=testnet,
                 dry_run=dry_run,
+                order_cache_max=config.ORDER_UPDATE_CACHE_MAX,
             )
 
             if dry_run:
@@ -175,12 +206,30 @@ def init_services():
                 mode = "TESTNET" if testnet else "LIVE"
                 logger.warning(f"🔴 Live Executor in {mode} mode - REAL MONEY!")
 
+        # Symbol filters (lot/tick/min notional) - REST only when trading live
+        exchange_info = ExchangeInfoCache.from_env(use_rest=not config.MOCK_TRADING)
+        exchange_info.start_background_refresh()
+        logger.info(f"Exchange filters loaded: {len(exchange_info)} symbols")
+
         # Initialize database
         db = _init_with_retry(
             "PostgreSQL", Database, retries=3, delay=config.RETRY_DELAY_SECONDS * 2
         )
         logger.info("Database initialized")
 
+        # Write-Behind: DB-Latenz nicht mehr im Order-Pfad
+        writer = WriteBehindWriter(
+            db,
+            max_queue=config.WRITE_BEHIND_QUEUE_MAX,
+            batch_size=config.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval_s=config.WRITE_BEHIND_FLUSH_SECONDS,
+            max_retries=config.WRITE_BEHIND_MAX_RETRIES,
+            spill_path=config.EXECUTION_SPILL_PATH,
+        )
+        writer.replay_spill()
+        writer.start()
+        logger.info("Write-behind writer started")
+
         return True
 
     except Exception as e:
@@ -188,6 +237,14 @@ def init_services():
         return False
 
 
+def _get_publisher() -> EventPublisher:
+    """Shared fan-out publisher bound to the current Redis client."""
+    global publisher
+    if publisher is None or publisher.client is not redis_client:
+        publisher = EventPublisher(redis_client, maxlen=10000)
+    return publisher
+
+
 def _publish_result(result: ExecutionResult) -> None:
     """Publish order result to Redis (pubsub + stream) and persist to DB."""
     event_payload = sanitize_payload(result.to_dict())
@@ -195,9 +252,6 @@ def _publish_result(result: ExecutionResult) -> None:
     if not redis_client:
         raise RuntimeError("Redis client not initialised")
 
-    redis_client.publish(
-        config.TOPIC_ORDER_RESULTS, json.dumps(event_payload, ensure_ascii=False)
-    )
     stream_payload = {
         key: value for key, value in event_payload.items() if value is not None
     }
@@ -212,40 +266,90 @@ def _publish_result(result: ExecutionResult) -> None:
     if "stream.order_results" not in streams:
         streams.append("stream.order_results")
 
-    for stream in streams:
-        redis_client.xadd(stream, stream_payload, maxlen=10000)
-        logger.info("Published result to stream %s", stream)
-    logger.info(f"Published result to {config.TOPIC_ORDER_RESULTS}")
+    # PUBLISH + alle XADDs in einem Roundtrip
+    _get_publisher().publish(
+        config.TOPIC_ORDER_RESULTS,
+        json.dumps(event_payload, ensure_ascii=False),
+        streams=streams,
+        fields=stream_payload,
+    )
+    logger.info(
+        "Published result to %s and streams %s",
+        config.TOPIC_ORDER_RESULTS,
+        ", ".join(streams),
+    )
 
-    if db:
+    if writer:
+        writer.submit(result)
+    elif db:
         db.save_order(result)
         if ExecutionResult._schema_status(result.status) == "FILLED":
             db.save_trade(result)
 
 
-def process_order(order_data: dict):
-    """Process incoming order"""
-    try:
-        if order_data.get("type") not in (None, "order"):
-            logger.warning(
-                "Ignoriere Event mit unerwartetem Typ: %s", order_data.get("type")
-            )
-            return None
+def _prepare_order(order_data: dict):
+    """Parse order and run pre-trade checks (shutdown, exchange filters).
+
+    Returns (order, None) if the order should be sent to the executor,
+    otherwise (None, result) with the early result (None for ignored events).
+    """
+    if order_data.get("type") not in (None, "order"):
+        logger.warning(
+            "Ignoriere Event mit unerwartetem Typ: %s", order_data.get("type")
+        )
+        return None, None
+
+    order = Order.from_event(order_data)
+
+    increment_stat("orders_received")  # Thread-safe
 
-        order = Order.from_event(order_data)
+    if (
+        bot_shutdown_active
+        or (order.strategy_id and order.strategy_id in blocked_strategy_ids)
+        or (order.bot_id and order.bot_id in blocked_bot_ids)
+    ):
+        shutdown_id = generate_uuid_hex(
+            name=f"shutdown:{order.symbol}:{order.side}:{order.quantity}:{utcnow().isoformat()}"
+        )
+        result = ExecutionResult(
+            order_id=f"SHUTDOWN_{shutdown_id}",
+            symbol=order.symbol,
+            side=order.side,
+            quantity=order.quantity,
+            filled_quantity=0.0,
+            status=OrderStatus.REJECTED.value,
+            price=None,
+            client_id=order.client_id,
+            error_message="Order blocked by bot shutdown",
+            timestamp=utcnow().isoformat(),
+            strategy_id=order.strategy_id,
+            bot_id=order.bot_id,
+        )
+        increment_stat("orders_rejected")  # Thread-safe
+        _publish_result(result)
+        return None, result
+
+    logger.info(
+        "Processing order: %s %s qty=%.4f",
+        order.symbol,
+        order.side,
+        order.quantity,
+    )
 
-        increment_stat("orders_received")  # Thread-safe
+    if executor is None:
+        raise RuntimeError("Executor not initialised")
 
-        if (
-            bot_shutdown_active
-            or (order.strategy_id and order.strategy_id in blocked_strategy_ids)
-            or (order.bot_id and order.bot_id in blocked_bot_ids)
-        ):
-            shutdown_id = generate_uuid_hex(
-                name=f"shutdown:{order.symbol}:{order.side}:{order.quantity}:{utcnow().isoformat()}"
+    # Lot-Size lokal anwenden: Orders unter Min-Qty nie an die Börse senden
+    if exchange_info is not None:
+        quantized = exchange_info.quantize(
+            order.symbol, order.quantity, side=order.side
+        )
+        if not quantized.valid:
+            filter_id = generate_uuid_hex(
+                name=f"filter:{order.symbol}:{order.side}:{order.quantity}:{utcnow().isoformat()}"
             )
             result = ExecutionResult(
-                order_id=f"SHUTDOWN_{shutdown_id}",
+                order_id=f"FILTER_{filter_id}",
                 symbol=order.symbol,
                 side=order.side,
                 quantity=order.quantity,
@@ -253,54 +357,131 @@ def process_order(order_data: dict):
                 status=OrderStatus.REJECTED.value,
                 price=None,
                 client_id=order.client_id,
-                error_message="Order blocked by bot shutdown",
+                error_message=f"Exchange filter: {quantized.reason}",
                 timestamp=utcnow().isoformat(),
                 strategy_id=order.strategy_id,
                 bot_id=order.bot_id,
             )
             increment_stat("orders_rejected")  # Thread-safe
+            logger.warning(
+                "Order rejected locally: %s %s qty=%s (%s)",
+                order.symbol,
+                order.side,
+                order.quantity,
+                quantized.reason,
+            )
             _publish_result(result)
-            return result
+            return None, result
+        order.quantity = quantized.quantity
+
+    # Duplikat (gleiche client_id): vorheriges Ergebnis statt zweiter Order
+    if idempotency is not None and order.client_id:
+        claimed, prior = idempotency.claim(order.client_id)
+        if not claimed:
+            increment_stat("orders_duplicate")
+            logger.warning(
+                "Duplicate order ignored: client_id=%s (%s)",
+                order.client_id,
+                f"prior {prior.order_id}" if prior else "in flight",
+            )
+            return None, prior
 
-        logger.info(
-            "Processing order: %s %s qty=%.4f",
-            order.symbol,
-            order.side,
-            order.quantity,
+    return order, None
+
+
+def _release_claim(order: Optional[Order]) -> None:
+    """Free the idempotency claim of an order that was not executed."""
+    if order is not None and idempotency is not None and order.client_id:
+        idempotency.release(order.client_id)
+
+
+def _complete_order(order: Order, result: Optional[ExecutionResult]) -> ExecutionResult:
+    """Update stats and publish/persist the executor result."""
+    if result is None:
+        _release_claim(order)
+        raise RuntimeError("Executor returned no result")
+
+    result.strategy_id = order.strategy_id
+    result.bot_id = order.bot_id
+    if idempotency is not None and order.client_id:
+        idempotency.record(order.client_id, result)
+
+    # Update stats (Thread-safe)
+    schema_status = ExecutionResult._schema_status(result.status)
+    if schema_status == "FILLED":
+        increment_stat("orders_filled")
+        logger.info("Order filled: %s at %s", result.order_id, result.price)
+    else:
+        increment_stat("orders_rejected")
+        logger.warning(
+            "Order rejected: %s - %s", result.order_id, result.error_message
         )
 
-        if executor is None:
-            raise RuntimeError("Executor not initialised")
+    _publish_result(result)
+
+    return result
+
+
+def _order_failed(err: Exception) -> None:
+    if isinstance(err, (KeyError, ValueError)):
+        logger.error("Fehlerhafte Orderdaten: %s", err)
+    else:
+        logger.error(f"Error processing order: {err}")
+    increment_stat("orders_rejected")  # Thread-safe
+
+
+def process_order(order_data: dict):
+    """Process incoming order"""
+    order = None
+    try:
+        order, early_result = _prepare_order(order_data)
+        if order is None:
+            return early_result
 
         # Execute order
         result = executor.execute_order(order)
-        if result is None:
-            raise RuntimeError("Executor returned no result")
+    except Exception as e:
+        # Claim freigeben, sonst gilt jede Redelivery bis zur TTL als "in flight"
+        _release_claim(order)
+        _order_failed(e)
+        return None
 
-        result.strategy_id = order.strategy_id
-        result.bot_id = order.bot_id
+    try:
+        return _complete_order(order, result)
+    except Exception as e:
+        _order_failed(e)
+        return None
 
-        # Update stats (Thread-safe)
-        schema_status = ExecutionResult._schema_status(result.status)
-        if schema_status == "FILLED":
-            increment_stat("orders_filled")
-            logger.info("Order filled: %s at %s", result.order_id, result.price)
-        else:
-            increment_stat("orders_rejected")
-            logger.warning(
-                "Order rejected: %s - %s", result.order_id, result.error_message
-            )
 
-        _publish_result(result)
+def _execute_serialized(order: Order) -> ExecutionResult:
+    """Sync-only executors (Mock/Mexc) are not thread-safe: one call at a time"""
+    with _sync_execute_lock:
+        return executor.execute_order(order)
 
-        return result
-    except (KeyError, ValueError) as err:
-        logger.error("Fehlerhafte Orderdaten: %s", err)
-        increment_stat("orders_rejected")  # Thread-safe
+
+async def process_order_async(order_data: dict):
+    """Process incoming order on the event loop (async executor if available)"""
+    order = None
+    try:
+        # Redis/Filter-Arbeit blockiert -> Thread, Exchange-Call -> Event-Loop
+        order, early_result = await asyncio.to_thread(_prepare_order, order_data)
+        if order is None:
+            return early_result
+
+        execute_async = getattr(executor, "execute_order_async", None)
+        if execute_async is not None:
+            result = await execute_async(order)
+        else:
+            result = await asyncio.to_thread(_execute_serialized, order)
+    except Exception as e:
+        _release_claim(order)
+        _order_failed(e)
         return None
+
+    try:
+        return await asyncio.to_thread(_complete_order, order, result)
     except Exception as e:
-        logger.error(f"Error processing order: {e}")
-        increment_stat("orders_rejected")  # Thread-safe
+        _order_failed(e)
         return None
 
 
@@ -330,6 +511,43 @@ def message_loop():
     logger.info("Message loop stopped")
 
 
+async def async_message_loop():
+    """Listen for orders and dispatch them concurrently per symbol"""
+    global dispatcher
+
+    logger.info("Starting async message loop...")
+    dispatcher = SymbolDispatcher(
+        process_order_async, max_concurrency=config.ASYNC_DISPATCH_CONCURRENCY
+    )
+
+    while running:
+        try:
+            message = await asyncio.to_thread(pubsub.get_message, timeout=1.0)
+
+            if message and message["type"] == "message":
+                try:
+                    dispatcher.submit(json.loads(message["data"]))
+                except json.JSONDecodeError as e:
+                    logger.error(f"Invalid JSON in message: {e}")
+
+        except Exception as e:
+            logger.error(f"Error in message loop: {e}")
+            await asyncio.sleep(1)
+
+    await dispatcher.drain(timeout=config.ORDER_TIMEOUT_SECONDS)
+    if hasattr(executor, "aclose"):
+        await executor.aclose()
+    logger.info("Async message loop stopped")
+
+
+def run_message_loop():
+    """Run the async dispatch loop or the sequential loop (config)"""
+    if config.ASYNC_DISPATCH:
+        asyncio.run(async_message_loop())
+    else:
+        message_loop()
+
+
 def _handle_bot_shutdown(payload: dict) -> None:
     """Handle bot shutdown events with safety priority."""
     global bot_shutdown_active
@@ -380,6 +598,64 @@ def listen_bot_shutdown():
             time.sleep(1)
 
 
+def _handle_account_update(payload: dict) -> None:
+    """Apply a pushed order/fill/balance event (private user-data stream)."""
+    event_type = payload.get("type")
+    order_id = payload.get("order_id")
+
+    if event_type == "order_update" and order_id:
+        if payload.get("status") in TERMINAL_PUSH_STATUSES:
+            with _orders_lock:
+                open_orders.discard(order_id)
+        increment_stat("order_updates_pushed")
+        if executor is not None and hasattr(executor, "apply_order_update"):
+            executor.apply_order_update(payload)
+        logger.info(
+            "Order-Update (push): %s %s %s",
+            order_id,
+            payload.get("symbol"),
+            payload.get("status"),
+        )
+    elif event_type == "fill":
+        increment_stat("fills_pushed")
+        logger.info(
+            "Fill (push): %s %s %s @ %s",
+            order_id,
+            payload.get("side"),
+            payload.get("quantity"),
+            payload.get("price"),
+        )
+    elif event_type == "balance":
+        logger.debug(
+            "Balance (push): %s free=%s locked=%s",
+            payload.get("asset"),
+            payload.get("free"),
+            payload.get("locked"),
+        )
+
+
+def listen_account_updates():
+    """Listen for pushed order/fill/balance events (replaces status polling)."""
+    if not redis_client or not config.STREAM_ACCOUNT_UPDATES:
+        return
+
+    last_id = "$"  # nur neue Events; Historie ist über REST abrufbar
+    while running:
+        try:
+            response = redis_client.xread(
+                {config.STREAM_ACCOUNT_UPDATES: last_id}, block=1000, count=100
+            )
+            if not response:
+                continue
+            for _, entries in response:
+                for entry_id, payload in entries:
+                    last_id = entry_id
+                    _handle_account_update(payload)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Account-Update stream error: %s", exc)
+            time.sleep(1)
+
+
 # Health Check Endpoint
 @app.route("/health", methods=["GET"])
 def health():
@@ -411,8 +687,26 @@ def status():
                 "version": config.SERVICE_VERSION,
                 "mode": "mock" if config.MOCK_TRADING else "live",
                 "stats": stats,
+                "dispatch": (
+                    {
+                        "pending": dispatcher.pending,
+                        "active_symbols": dispatcher.active_symbols,
+                        **dispatcher.stats,
+                    }
+                    if dispatcher
+                    else None
+                ),
+                "idempotency": (
+                    {"entries": len(idempotency), **idempotency.stats}
+                    if idempotency
+                    else None
+                ),
                 "redis": {"connected": redis_connected},
                 "database": db.get_stats() if db else {"error": "not initialized"},
+                "db_pool": db.pool_stats() if db else None,
+                "write_behind": (
+                    {"queue_depth": writer.depth, **writer.stats} if writer else None
+                ),
             }
         ),
         200,
@@ -442,11 +736,45 @@ def metrics():
         "# HELP execution_orders_rejected_total Anzahl abgelehnter Orders\n"
         "# TYPE execution_orders_rejected_total counter\n"
         f"execution_orders_rejected_total {current_stats['orders_rejected']}\n"
+        "# HELP execution_orders_duplicate_total Doppelt zugestellte Orders (nicht ausgefuehrt)\n"
+        "# TYPE execution_orders_duplicate_total counter\n"
+        f"execution_orders_duplicate_total {current_stats['orders_duplicate']}\n"
         "# HELP execution_uptime_seconds Service Laufzeit in Sekunden\n"
         "# TYPE execution_uptime_seconds gauge\n"
         f"execution_uptime_seconds {uptime_seconds}\n"
+        "# HELP execution_order_updates_pushed_total Order-Updates via Private-WS\n"
+        "# TYPE execution_order_updates_pushed_total counter\n"
+        f"execution_order_updates_pushed_total {current_stats['order_updates_pushed']}\n"
+        "# HELP execution_fills_pushed_total Fills via Private-WS\n"
+        "# TYPE execution_fills_pushed_total counter\n"
+        f"execution_fills_pushed_total {current_stats['fills_pushed']}\n"
     )
 
+    if writer is not None:
+        body += (
+            "# HELP execution_write_behind_queue_depth Wartende DB-Writes\n"
+            "# TYPE execution_write_behind_queue_depth gauge\n"
+            f"execution_write_behind_queue_depth {writer.depth}\n"
+            "# HELP execution_write_behind_spilled_total In Spill-Datei geschriebene Ergebnisse\n"
+            "# TYPE execution_write_behind_spilled_total counter\n"
+            f"execution_write_behind_spilled_total {writer.stats['spilled']}\n"
+        )
+
+    if db is not None:
+        pool = db.pool_stats()
+        body += (
+            "# HELP execution_db_pool_connections Offene DB-Verbindungen im Pool\n"
+            "# TYPE execution_db_pool_connections gauge\n"
+            f'execution_db_pool_connections{{state="idle"}} {pool["idle"]}\n'
+            f'execution_db_pool_connections{{state="in_use"}} {pool["in_use"]}\n'
+            "# HELP execution_db_pool_checkout_waits_total Checkouts mit Wartezeit (Pool erschoepft)\n"
+            "# TYPE execution_db_pool_checkout_waits_total counter\n"
+            f"execution_db_pool_checkout_waits_total {pool['checkout_waits']}\n"
+            "# HELP execution_db_statement_prepares_total PREPAREs (einmal je Verbindung und Statement)\n"
+            "# TYPE execution_db_statement_prepares_total counter\n"
+            f"execution_db_statement_prepares_total {pool['statement_prepares']}\n"
+        )
+
     return Response(body, mimetype="text/plain")
 
 
@@ -524,12 +852,15 @@ def main():
         sys.exit(1)
 
     # Start message loop in background
-    message_thread = Thread(target=message_loop, daemon=True)
+    message_thread = Thread(target=run_message_loop, daemon=True)
     message_thread.start()
     logger.info("Message loop started")
     shutdown_thread = Thread(target=listen_bot_shutdown, daemon=True)
     shutdown_thread.start()
     logger.info("Bot-shutdown listener started")
+    account_thread = Thread(target=listen_account_updates, daemon=True)
+    account_thread.start()
+    logger.info("Account-update listener started")
 
     # Start Flask app
     try:
@@ -544,6 +875,10 @@ def main():
             pubsub.close()
         if redis_client:
             redis_client.close()
+        if writer:
+            writer.stop()
+        if db:
+            db.close()
         logger.info("Service stopped")
 
 
@@ -6,9 +6,11 @@ including:
 - Trading fees (maker/taker)
 - Partial fills
 - Funding fees
-- Order book depth impact
+- Order book depth impact (parametric, or exact depth walk over an L2 snapshot)
 
 Designed for backtesting and paper trading to minimize backtest bias.
+Batch variants (simulate_market_orders / simulate_limit_orders) evaluate
+NumPy arrays with the same math for Monte Carlo and stress runs.
 
 References:
 - Almgren & Chriss (2000): "Optimal Execution of Portfolio Transactions"
@@ -19,11 +21,39 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
-from typing import Dict, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Structured result of the batch simulators (one row per order)
+FILL_DTYPE = np.dtype(
+    [
+        ("filled_size", np.float64),
+        ("avg_fill_price", np.float64),
+        ("slippage_bps", np.float64),
+        ("fees", np.float64),
+        ("partial_fill", np.bool_),
+        ("fill_ratio", np.float64),
+    ]
+)
+
+ArrayLike = Union[float, str, np.ndarray, list]
+
+
+def _is_buy(side: ArrayLike, n: int) -> np.ndarray:
+    """Boolean buy mask from side strings ("buy"/"long") or signs (>0 = buy)."""
+    arr = np.asarray(side)
+    if arr.dtype.kind in ("U", "S", "O"):
+        # Lower-case only the distinct labels, not every element
+        labels, inverse = np.unique(arr.astype(str), return_inverse=True)
+        mask = np.isin(np.char.lower(labels), ("buy", "long"))[inverse.reshape(arr.shape)]
+    else:
+        mask = arr > 0
+    return np.broadcast_to(mask, (n,))
+
 
 @dataclass
 class ExecutionResult:
@@ -37,6 +67,7 @@ class ExecutionResult:
         partial_fill: Whether this was a partial fill.
         fill_ratio: Ratio of filled to requested size (0.0-1.0).
         notes: Optional execution notes.
+        levels_consumed: Book levels touched (0 = parametric model).
     """
 
     filled_size: float
@@ -46,6 +77,106 @@ class ExecutionResult:
     partial_fill: bool
     fill_ratio: float
     notes: Optional[str] = None
+    levels_consumed: int = 0
+
+
+@dataclass
+class BookFill:
+    """Result of walking one side of an L2 book.
+
+    Attributes:
+        filled_size: Base quantity filled (<= requested).
+        vwap: Volume-weighted average fill price (0.0 if nothing filled).
+        notional: Quote notional of the fill.
+        levels_consumed: Levels touched, including a partially taken one.
+        partial_fill: Whether the book ran out before the size was filled.
+    """
+
+    filled_size: float
+    vwap: float
+    notional: float
+    levels_consumed: int
+    partial_fill: bool
+
+
+@dataclass
+class _BookSide:
+    prices: np.ndarray
+    cum_size: np.ndarray
+    cum_notional: np.ndarray
+
+
+def _book_side(levels: Sequence, descending: bool) -> _BookSide:
+    arr = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+    arr = arr[arr[:, 1] > 0]
+    order = np.argsort(-arr[:, 0] if descending else arr[:, 0], kind="stable")
+    prices, sizes = arr[order, 0], arr[order, 1]
+    return _BookSide(prices, np.cumsum(sizes), np.cumsum(prices * sizes))
+
+
+@dataclass
+class OrderBookSnapshot:
+    """L2 snapshot with cumulative size/notional prefix sums per side.
+
+    Built once per snapshot (O(levels)); every fill is then a binary search
+    over the prefix sums, O(log levels), and works on size arrays too.
+
+    Args:
+        bids: [[price, size], ...] in any order.
+        asks: [[price, size], ...] in any order.
+    """
+
+    bids: Sequence
+    asks: Sequence
+    _bid: _BookSide = field(init=False, repr=False)
+    _ask: _BookSide = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._bid = _book_side(self.bids, descending=True)
+        self._ask = _book_side(self.asks, descending=False)
+
+    def has_liquidity(self, side: str) -> bool:
+        book = self._ask if side.lower() in ["buy", "long"] else self._bid
+        return book.prices.size > 0
+
+    def walk(self, side: str, size: ArrayLike):
+        """Exact taker fill of ``size`` against asks (buy) or bids (sell).
+
+        Returns a BookFill for scalar sizes, or a tuple of arrays
+        (filled_size, vwap, notional, levels_consumed, partial_fill).
+        """
+        book = self._ask if side.lower() in ["buy", "long"] else self._bid
+        qty = np.asarray(size, dtype=np.float64)
+        n_levels = book.prices.size
+
+        if n_levels == 0:
+            zeros = np.zeros_like(qty)
+            filled, notional = zeros, zeros
+            levels = np.zeros(qty.shape, dtype=np.int64)
+            partial = qty > 0
+        else:
+            total = book.cum_size[-1]
+            filled = np.minimum(qty, total)
+            # first level whose cumulative size covers the order
+            k = np.minimum(np.searchsorted(book.cum_size, filled, side="left"), n_levels - 1)
+            prev_size = np.where(k > 0, book.cum_size[k - 1], 0.0)
+            prev_notional = np.where(k > 0, book.cum_notional[k - 1], 0.0)
+            notional = prev_notional + (filled - prev_size) * book.prices[k]
+            levels = np.where(filled > 0, k + 1, 0)
+            partial = qty > total
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(filled > 0, notional / filled, 0.0)
+
+        if qty.ndim == 0:
+            return BookFill(
+                filled_size=float(filled),
+                vwap=float(vwap),
+                notional=float(notional),
+                levels_consumed=int(levels),
+                partial_fill=bool(partial),
+            )
+        return filled, vwap, notional, levels, partial
 
 
 class ExecutionSimulator:
@@ -96,15 +227,20 @@ class ExecutionSimulator:
         current_price: float,
         order_book_depth: float,
         volatility: float,
+        book: Optional[OrderBookSnapshot] = None,
     ) -> ExecutionResult:
         """Simulate market order execution with realistic slippage and fees.
 
+        With an L2 ``book`` the order walks the price levels (exact VWAP);
+        without one (or with an empty side) the parametric model is used.
+
         Args:
             side: Order side ("buy" or "sell").
             size: Order size in base currency (e.g., BTC).
             current_price: Current market price in quote currency (USDT).
             order_book_depth: Available liquidity in quote currency (USDT).
             volatility: Current volatility (e.g., 0.02 = 2% hourly).
+            book: Optional L2 snapshot for the depth-walking fill model.
 
         Returns:
             ExecutionResult with fill details.
@@ -117,6 +253,9 @@ class ExecutionSimulator:
             >>> result.slippage_bps
             15.0  # 0.15% slippage
         """
+        if book is not None and book.has_liquidity(side):
+            return self._simulate_book_fill(side, size, current_price, book)
+
         notional = size * current_price
 
         # Check for partial fill
@@ -172,6 +311,136 @@ class ExecutionSimulator:
             notes=f"Market order {side} with {slippage_bps:.1f}bps slippage",
         )
 
+    def _simulate_book_fill(
+        self,
+        side: str,
+        size: float,
+        current_price: float,
+        book: OrderBookSnapshot,
+    ) -> ExecutionResult:
+        """Market order filled by walking the L2 book (taker fees)."""
+        fill = book.walk(side, size)
+        is_buy = side.lower() in ["buy", "long"]
+
+        # Adverse price move of the VWAP vs. reference price, in bps
+        if fill.filled_size > 0 and current_price > 0:
+            move = fill.vwap / current_price - 1.0
+            slippage_bps = (move if is_buy else -move) * 10000.0
+        else:
+            slippage_bps = 0.0
+
+        fees = fill.notional * self.taker_fee
+        fill_ratio = fill.filled_size / size if size > 0 else 1.0
+
+        if fill.partial_fill:
+            logger.warning(
+                f"Partial fill (book): requested={size:.4f} "
+                f"filled={fill.filled_size:.4f} ({fill_ratio:.2%})"
+            )
+        logger.info(
+            f"Market Order (book): {side} {fill.filled_size:.4f} @ {fill.vwap:.2f} "
+            f"(levels={fill.levels_consumed} slippage={slippage_bps:.1f}bps fees={fees:.2f})"
+        )
+
+        return ExecutionResult(
+            filled_size=fill.filled_size,
+            avg_fill_price=fill.vwap,
+            slippage_bps=slippage_bps,
+            fees=fees,
+            partial_fill=fill.partial_fill,
+            fill_ratio=fill_ratio,
+            notes=(
+                f"Market order {side} walked {fill.levels_consumed} levels "
+                f"with {slippage_bps:.1f}bps slippage"
+            ),
+            levels_consumed=fill.levels_consumed,
+        )
+
+    def simulate_market_orders(
+        self,
+        side: ArrayLike,
+        size: ArrayLike,
+        price: ArrayLike,
+        depth: ArrayLike,
+        vol: ArrayLike,
+    ) -> np.ndarray:
+        """Vectorized simulate_market_order for many orders at once.
+
+        Inputs broadcast against each other; ``side`` takes "buy"/"sell"
+        strings or signs (>0 = buy). Same math as the scalar version, but
+        without per-order logging.
+
+        Returns:
+            Structured array with FILL_DTYPE fields.
+        """
+        size, price, depth, vol = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (size, price, depth, vol))
+        )
+        n = size.size
+        size, price, depth, vol = (x.ravel() for x in (size, price, depth, vol))
+        buy = _is_buy(side, n)
+
+        notional = size * price
+        usable_depth = depth * self.fill_threshold
+        partial = notional > usable_depth
+
+        filled_notional = np.where(partial, usable_depth, notional)
+        filled_size = np.where(partial, usable_depth / price, size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fill_ratio = np.where(partial, filled_size / size, 1.0)
+
+        slippage_bps = self._calculate_slippage_batch(filled_notional, depth, vol)
+        slippage_fraction = slippage_bps / 10000.0
+        avg_fill_price = np.where(
+            buy, price * (1 + slippage_fraction), price * (1 - slippage_fraction)
+        )
+
+        out = np.empty(n, dtype=FILL_DTYPE)
+        out["filled_size"] = filled_size
+        out["avg_fill_price"] = avg_fill_price
+        out["slippage_bps"] = slippage_bps
+        out["fees"] = filled_notional * self.taker_fee
+        out["partial_fill"] = partial
+        out["fill_ratio"] = fill_ratio
+
+        logger.debug(
+            f"Market Orders (batch): n={n} partial={int(partial.sum())} "
+            f"fees={float(out['fees'].sum()):.2f}"
+        )
+        return out
+
+    def simulate_limit_orders(
+        self,
+        side: ArrayLike,
+        size: ArrayLike,
+        limit_price: ArrayLike,
+        current_price: ArrayLike,
+    ) -> np.ndarray:
+        """Vectorized simulate_limit_order (same fill rule, maker fees).
+
+        Returns:
+            Structured array with FILL_DTYPE fields.
+        """
+        size, limit_price, current_price = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (size, limit_price, current_price))
+        )
+        n = size.size
+        size, limit_price, current_price = (
+            x.ravel() for x in (size, limit_price, current_price)
+        )
+        buy = _is_buy(side, n)
+
+        filled = np.where(buy, limit_price >= current_price, limit_price <= current_price)
+
+        out = np.zeros(n, dtype=FILL_DTYPE)
+        out["filled_size"] = np.where(filled, size, 0.0)
+        out["avg_fill_price"] = np.where(filled, limit_price, 0.0)
+        out["fees"] = np.where(filled, size * limit_price * self.maker_fee, 0.0)
+        out["fill_ratio"] = filled.astype(np.float64)
+
+        logger.debug(f"Limit Orders (batch): n={n} filled={int(filled.sum())}")
+        return out
+
     def simulate_limit_order(
         self,
         side: str,
@@ -320,6 +589,7 @@ class ExecutionSimulator:
         slippage = self.base_slippage_bps
 
         # Depth impact
+        depth_impact = 0.0
         if order_book_depth > 0:
             depth_ratio = order_size / order_book_depth
             depth_impact = depth_ratio * self.depth_impact_factor * 10000
@@ -339,6 +609,22 @@ class ExecutionSimulator:
 
         return slippage
 
+    def _calculate_slippage_batch(
+        self,
+        order_size: np.ndarray,
+        order_book_depth: np.ndarray,
+        volatility: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized _calculate_slippage (identical operation order)."""
+        slippage = np.full(order_size.shape, self.base_slippage_bps)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            depth_impact = order_size / order_book_depth * self.depth_impact_factor * 10000
+        slippage = np.where(order_book_depth > 0, slippage + depth_impact, slippage)
+
+        hourly_vol = volatility / (365 * 24) ** 0.5
+        return slippage + hourly_vol * self.vol_slippage_multiplier * 10000
+
     def calculate_roundtrip_cost(
         self,
         size: float,
@@ -8,10 +8,12 @@ import os
 import time
 import smtplib
 import psycopg2
-from datetime import datetime, timezone, timedelta
+from datetime import timezone, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from core.utils.clock import utcnow
+
 
 def read_secret(path):
     """Read secret from Docker mounted file"""
@@ -45,37 +47,30 @@ def get_db_connection():
 
 
 def fetch_summary(conn, hours=24):
-    """Fetch orders summary for last N hours"""
+    """Fetch orders summary for last N hours from the hourly rollup tables"""
+    # Offene Stunden nachrechnen (idempotent, db_writer macht das ebenfalls)
+    refresh_query = "SELECT * FROM cdb_refresh_rollups();"
+
+    # Fenster = laufende Stunde + (N-1) volle Stunden, also höchstens N Stunden
     query = """
     WITH order_summary AS (
       SELECT
-        COUNT(*) AS total_orders,
-        COUNT(*) FILTER (WHERE status = 'filled') AS filled_count,
-        COUNT(*) FILTER (WHERE status = 'rejected') AS rejected_count,
-        COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_count,
-        COUNT(*) FILTER (WHERE status = 'pending') AS pending_count,
-        COALESCE(SUM(size * COALESCE(avg_fill_price, price, 0)), 0) AS total_notional
-      FROM orders
-      WHERE created_at >= NOW() - INTERVAL '%s hours'
-    ),
-    top_rejections AS (
-      SELECT
-        rejection_reason,
-        COUNT(*) AS count
-      FROM orders
-      WHERE rejection_reason IS NOT NULL
-        AND created_at >= NOW() - INTERVAL '%s hours'
-      GROUP BY rejection_reason
-      ORDER BY count DESC
-      LIMIT 5
+        COALESCE(SUM(order_count), 0) AS total_orders,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'filled'), 0) AS filled_count,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'rejected'), 0) AS rejected_count,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'cancelled'), 0) AS cancelled_count,
+        COALESCE(SUM(order_count) FILTER (WHERE status = 'pending'), 0) AS pending_count,
+        COALESCE(SUM(notional), 0) AS total_notional
+      FROM orders_hourly
+      WHERE bucket >= date_trunc('hour', NOW()) - INTERVAL '%s hours' + INTERVAL '1 hour'
     ),
     trade_summary AS (
       SELECT
-        COUNT(*) AS total_trades,
-        COALESCE(SUM(size * execution_price), 0) AS total_notional,
+        COALESCE(SUM(trade_count), 0) AS total_trades,
+        COALESCE(SUM(notional), 0) AS total_notional,
         COALESCE(SUM(fees), 0) AS total_fees
-      FROM trades
-      WHERE timestamp >= NOW() - INTERVAL '%s hours'
+      FROM trades_hourly
+      WHERE bucket >= date_trunc('hour', NOW()) - INTERVAL '%s hours' + INTERVAL '1 hour'
     )
     SELECT
       o.total_orders, o.filled_count, o.rejected_count,
@@ -85,19 +80,23 @@ def fetch_summary(conn, hours=24):
     """
 
     rejection_query = """
-    SELECT rejection_reason, COUNT(*) as count
-    FROM orders
-    WHERE rejection_reason IS NOT NULL
-      AND created_at >= NOW() - INTERVAL '%s hours'
+    SELECT rejection_reason, SUM(order_count) AS count
+    FROM orders_hourly
+    WHERE rejection_reason <> ''
+      AND bucket >= date_trunc('hour', NOW()) - INTERVAL '%s hours' + INTERVAL '1 hour'
     GROUP BY rejection_reason
     ORDER BY count DESC
     LIMIT 5;
     """
 
     try:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute(refresh_query)
+
         with conn.cursor() as cur:
             # Get summary stats
-            cur.execute(query % (hours, hours, hours))
+            cur.execute(query % (hours, hours))
             summary = cur.fetchone()
 
             # Get top rejections
@@ -105,15 +104,15 @@ def fetch_summary(conn, hours=24):
             rejections = cur.fetchall()
 
             return {
-                'total_orders': summary[0] or 0,
-                'filled': summary[1] or 0,
-                'rejected': summary[2] or 0,
-                'cancelled': summary[3] or 0,
-                'pending': summary[4] or 0,
+                'total_orders': int(summary[0] or 0),
+                'filled': int(summary[1] or 0),
+                'rejected': int(summary[2] or 0),
+                'cancelled': int(summary[3] or 0),
+                'pending': int(summary[4] or 0),
                 'notional': float(summary[5] or 0),
-                'total_trades': summary[6] or 0,
+                'total_trades': int(summary[6] or 0),
                 'total_fees': float(summary[7] or 0),
-                'rejections': rejections
+                'rejections': [(reason, int(count)) for reason, count in rejections]
             }
     except Exception as e:
         print(f"[ERROR] Query failed: {e}")
@@ -254,7 +253,7 @@ def send_email(subject, body_html):
 
 def wait_until_next_run(target_hour=8):
     """Calculate seconds until next run at target_hour UTC"""
-    now = datetime.now(timezone.utc)
+    now = utcnow().replace(tzinfo=timezone.utc)
     target = now.replace(hour=target_hour, minute=0, second=0, microsecond=0)
 
     # If we've passed target hour today, schedule for tomorrow
@@ -279,7 +278,7 @@ def main():
             time.sleep(wait_seconds)
 
             # Run summary
-            print(f"[INFO] Generating daily summary for {datetime.now(timezone.utc).strftime('%Y-%m-%d')}")
+            print(f"[INFO] Generating daily summary for {utcnow().strftime('%Y-%m-%d')}")
 
             # Connect to database
             conn = get_db_connection()
@@ -289,7 +288,7 @@ def main():
 
             try:
                 # Fetch summary data (last 24 hours)
-                end_time = datetime.now(timezone.utc)
+                end_time = utcnow().replace(tzinfo=timezone.utc)
                 start_time = end_time - timedelta(hours=24)
 
                 data = fetch_summary(conn, hours=24)
@@ -7,11 +7,10 @@ Fixed: Issue #305 - Removed hardcoded BTC/ETH prices, added proper error handlin
 
 import requests
 import time
-import hashlib
-import hmac
 import os
 import logging
 from typing import Dict, Optional
+from core.clients.mexc import get_transport
 from core.secrets import read_secret
 
 logger = logging.getLogger(__name__)
@@ -34,18 +33,19 @@ class RealBalanceFetcher:
         if not self.api_key or not self.api_secret:
             raise ValueError("MEXC API credentials required for real balance")
 
+        # Shared keep-alive session + precomputed HMAC key
+        self.transport = get_transport(self.base_url, self.api_key, self.api_secret)
+
         # Cache for last-known-good values
         self._price_cache: Dict[str, float] = {}
         self._balance_cache: Optional[Dict[str, float]] = None
         self._cache_timestamp: float = 0
         self._cache_ttl: float = 60.0  # Cache valid for 60 seconds
+        self._pushed_at: float = 0  # last private-WS balance update
 
     def _generate_signature(self, params: str, timestamp: str) -> str:
         """Generate MEXC API signature"""
-        message = f"{timestamp}{params}"
-        return hmac.new(
-            self.api_secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
+        return self.transport.sign(f"{timestamp}{params}")
 
     def _get_ticker_price(self, symbol: str) -> float:
         """Get current price for a symbol from MEXC API.
@@ -66,8 +66,9 @@ class RealBalanceFetcher:
                 return self._price_cache[symbol]
 
         try:
-            url = f"{self.base_url}/api/v3/ticker/price"
-            response = requests.get(url, params={"symbol": symbol}, timeout=5)
+            response = self.transport.request(
+                "GET", "/api/v3/ticker/price", params={"symbol": symbol}
+            )
             response.raise_for_status()
 
             price = float(response.json()["price"])
@@ -83,6 +84,35 @@ class RealBalanceFetcher:
                 return self._price_cache[symbol]
             raise BalanceFetchError(f"Cannot fetch {symbol} price and no cache: {e}")
 
+    # Assets valued in TOTAL_USDT (same set as get_real_balance)
+    VALUED_ASSETS = ("BTC", "ETH", "BNB", "SOL")
+
+    def apply_balance_update(self, asset: str, free: float, locked: float) -> None:
+        """Apply a pushed balance (private user-data stream) to the cache.
+
+        While pushes are fresh, get_real_balance serves the cache instead of
+        polling /api/v3/account.
+        """
+        if self._balance_cache is None:
+            # No REST baseline yet: other assets unknown, keep polling
+            return
+        balances = dict(self._balance_cache)
+        total = free + locked
+        if total > 0:
+            balances[asset] = total
+        else:
+            balances.pop(asset, None)
+
+        total_usdt = balances.get("USDT", 0.0)
+        for other in self.VALUED_ASSETS:
+            if other in balances and f"{other}USDT" in self._price_cache:
+                total_usdt += balances[other] * self._price_cache[f"{other}USDT"]
+        balances["TOTAL_USDT"] = total_usdt
+
+        self._balance_cache = balances
+        self._pushed_at = time.time()
+        self._cache_timestamp = self._pushed_at
+
     def get_real_balance(self) -> Dict[str, float]:
         """Get REAL balance from MEXC exchange - NO MORE FAKE DATA.
 
@@ -92,6 +122,13 @@ class RealBalanceFetcher:
         Raises:
             BalanceFetchError: If balance cannot be fetched (FAIL FAST)
         """
+        if (
+            self._balance_cache is not None
+            and self._pushed_at
+            and time.time() - self._pushed_at < self._cache_ttl
+        ):
+            return self._balance_cache
+
         try:
             timestamp = str(int(time.time() * 1000))
 
@@ -102,13 +139,7 @@ class RealBalanceFetcher:
             signature = self._generate_signature(query_string, timestamp)
             params["signature"] = signature
 
-            headers = {
-                "X-MEXC-APIKEY": self.api_key,
-                "Content-Type": "application/json",
-            }
-
-            url = f"{self.base_url}/api/v3/account"
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = self.transport.request("GET", "/api/v3/account", params=params)
             response.raise_for_status()
 
             result = response.json()
@@ -129,7 +160,7 @@ class RealBalanceFetcher:
                     # Convert to USDT equivalent using REAL prices
                     if asset == "USDT":
                         total_usdt += total
-                    elif asset in ("BTC", "ETH", "BNB", "SOL"):
+                    elif asset in self.VALUED_ASSETS:
                         # Fetch REAL price from API - no more hardcoded values!
                         try:
                             price = self._get_ticker_price(f"{asset}USDT")
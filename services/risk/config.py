@@ -32,6 +32,20 @@ class RiskConfig:
     early_live_max_alloc: float = float(os.getenv("EARLY_LIVE_MAX_ALLOC", "0.02"))
     paper_auto_unwind: bool = os.getenv("PAPER_AUTO_UNWIND", "false").lower() == "true"
 
+    # Signal-Intake (Stale-Signal Shedding)
+    signal_max_age_s: float = float(os.getenv("RISK_SIGNAL_MAX_AGE_S", "30"))
+    signal_degrade_age_s: float = float(os.getenv("RISK_SIGNAL_DEGRADE_AGE_S", "10"))
+    signal_queue_max: int = int(os.getenv("RISK_SIGNAL_QUEUE_MAX", "1000"))
+    # Max. Signale pro Batch-Entscheidung bei Bursts (1 = Einzelverarbeitung)
+    signal_batch_max: int = int(os.getenv("RISK_SIGNAL_BATCH_MAX", "50"))
+
+    # Portfolio-VaR (Streaming Risk Engine, 0 = Layer deaktiviert)
+    max_portfolio_var_pct: float = float(os.getenv("RISK_MAX_PORTFOLIO_VAR_PCT", "0"))
+    var_confidence: float = float(os.getenv("RISK_VAR_CONFIDENCE", "0.99"))
+    var_horizon_minutes: int = int(os.getenv("RISK_VAR_HORIZON_MINUTES", "60"))
+    var_window: int = int(os.getenv("RISK_VAR_WINDOW", "1440"))
+    var_ewma_lambda: float = float(os.getenv("RISK_VAR_EWMA_LAMBDA", "0.94"))
+
     # Topics
     input_topic: str = "signals"
     input_topic_order_results: str = "order_results"
@@ -45,6 +59,10 @@ class RiskConfig:
     bot_shutdown_stream: str = os.getenv(
         "RISK_BOT_SHUTDOWN_STREAM", "stream.bot_shutdown"
     )
+    candles_stream: str = os.getenv("RISK_CANDLES_STREAM", "stream.candles_1m")
+    account_updates_stream: str = os.getenv(
+        "RISK_ACCOUNT_UPDATES_STREAM", "stream.account_updates"
+    )
 
     # Balance Configuration
     use_live_balance: bool = os.getenv("USE_LIVE_BALANCE", "false").lower() == "true"
@@ -62,6 +80,21 @@ class RiskConfig:
             raise ValueError("MAX_POSITION_PCT muss zwischen 0 und 1 liegen")
         if self.max_total_exposure_pct <= 0 or self.max_total_exposure_pct > 1:
             raise ValueError("MAX_TOTAL_EXPOSURE_PCT muss zwischen 0 und 1 liegen")
+        if self.max_portfolio_var_pct < 0 or self.max_portfolio_var_pct > 1:
+            raise ValueError("RISK_MAX_PORTFOLIO_VAR_PCT muss zwischen 0 und 1 liegen")
+        if not 0.5 < self.var_confidence < 1:
+            raise ValueError("RISK_VAR_CONFIDENCE muss zwischen 0.5 und 1 liegen")
+        if self.signal_queue_max <= 0:
+            raise ValueError("RISK_SIGNAL_QUEUE_MAX muss positiv sein")
+        if self.signal_batch_max <= 0:
+            raise ValueError("RISK_SIGNAL_BATCH_MAX muss positiv sein")
+        if (
+            self.signal_max_age_s > 0
+            and self.signal_degrade_age_s > self.signal_max_age_s
+        ):
+            raise ValueError(
+                "RISK_SIGNAL_DEGRADE_AGE_S darf RISK_SIGNAL_MAX_AGE_S nicht überschreiten"
+            )
         return True
 
 
@@ -0,0 +1,178 @@
+"""
+Risk Manager - Signal Intake
+
+Bounded intake stage in front of the risk layers. Sheds signals whose
+`timestamp` is older than the configured TTL, downgrades aging signals to
+reduce-only and collapses superseded signals for the same
+(strategy_id, symbol, side), so that under overload the manager keeps
+trading on current prices instead of working through a backlog.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Condition
+from typing import Callable, Optional
+
+from core.domain.models import Signal
+
+logger = logging.getLogger(__name__)
+
+# Shed reasons (also used as Prometheus label values)
+SHED_STALE = "stale"
+SHED_SUPERSEDED = "superseded"
+SHED_OVERFLOW = "overflow"
+SHED_DEGRADED = "degraded"
+
+SHED_REASONS = (SHED_STALE, SHED_SUPERSEDED, SHED_OVERFLOW, SHED_DEGRADED)
+
+
+@dataclass
+class IntakeItem:
+    """Signal released by the intake stage."""
+
+    signal: Signal
+    age_s: Optional[float]
+    degraded: bool = False  # True → only reduce-only execution allowed
+
+
+def signal_age_seconds(signal: Signal, now: float) -> Optional[float]:
+    """Age of a signal in seconds, or None if it carries no usable timestamp.
+
+    Accepts epoch seconds as well as epoch milliseconds (ts_ms payloads).
+    """
+    try:
+        ts = float(signal.timestamp or 0.0)
+    except (TypeError, ValueError):
+        return None
+    if ts <= 0:
+        return None
+    if ts > 1e12:  # epoch milliseconds
+        ts /= 1000.0
+    return max(now - ts, 0.0)
+
+
+class SignalIntake:
+    """Thread-safe bounded signal queue with TTL shedding and coalescing.
+
+    Args:
+        max_age_s: Signals older than this are dropped (0 disables).
+        degrade_age_s: Signals older than this are released as reduce-only
+            (0 disables).
+        max_queue: Maximum number of pending signals; the oldest pending
+            signal is shed when the queue is full.
+        clock: Time source returning epoch seconds (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        max_age_s: float = 30.0,
+        degrade_age_s: float = 0.0,
+        max_queue: int = 1000,
+        clock: Callable[[], float] = time.time,
+    ):
+        if max_queue <= 0:
+            raise ValueError("max_queue must be positive")
+
+        self.max_age_s = max_age_s
+        self.degrade_age_s = degrade_age_s
+        self.max_queue = max_queue
+        self._clock = clock
+        self._pending: "OrderedDict[tuple, Signal]" = OrderedDict()
+        self._cond = Condition()
+        self.shed_counts: dict[str, int] = {reason: 0 for reason in SHED_REASONS}
+
+    @staticmethod
+    def _key(signal: Signal) -> tuple:
+        side = (signal.side or signal.direction or "").upper()
+        return (signal.strategy_id, signal.symbol, side)
+
+    def _shed(self, reason: str, signal: Signal, detail: str = "") -> None:
+        self.shed_counts[reason] += 1
+        logger.info(
+            "Signal verworfen (%s): %s %s %s",
+            reason,
+            signal.symbol,
+            signal.side,
+            detail,
+        )
+
+    def offer(self, signal: Signal) -> bool:
+        """Enqueue a signal. Returns False if it was shed immediately."""
+        now = self._clock()
+        age = signal_age_seconds(signal, now)
+        with self._cond:
+            if self.max_age_s > 0 and age is not None and age > self.max_age_s:
+                self._shed(SHED_STALE, signal, f"age={age:.1f}s")
+                return False
+
+            key = self._key(signal)
+            if key in self._pending:
+                # Newer signal replaces the pending one but keeps its queue slot.
+                self._shed(SHED_SUPERSEDED, self._pending[key])
+                self._pending[key] = signal
+            else:
+                if len(self._pending) >= self.max_queue:
+                    _, dropped = self._pending.popitem(last=False)
+                    self._shed(SHED_OVERFLOW, dropped)
+                self._pending[key] = signal
+            self._cond.notify()
+        return True
+
+    def poll(self, timeout: Optional[float] = None) -> Optional[IntakeItem]:
+        """Return the next current signal, or None if none arrived in time.
+
+        The age check is repeated at dequeue time, so signals that went stale
+        while waiting in the queue are shed rather than handed to the risk
+        layers.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                while not self._pending:
+                    if deadline is None:
+                        self._cond.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._cond.wait(remaining)
+
+                item = self._pop_current()
+                if item is not None:
+                    return item
+
+    def drain(self, max_items: int) -> list[IntakeItem]:
+        """Return up to max_items current signals without waiting."""
+        items: list[IntakeItem] = []
+        with self._cond:
+            while self._pending and len(items) < max_items:
+                item = self._pop_current()
+                if item is not None:
+                    items.append(item)
+        return items
+
+    def _pop_current(self) -> Optional[IntakeItem]:
+        """Pop the oldest pending signal; None if it went stale (caller holds lock)."""
+        _, signal = self._pending.popitem(last=False)
+        age = signal_age_seconds(signal, self._clock())
+        if self.max_age_s > 0 and age is not None and age > self.max_age_s:
+            self._shed(SHED_STALE, signal, f"age={age:.1f}s")
+            return None
+
+        degraded = (
+            self.degrade_age_s > 0 and age is not None and age > self.degrade_age_s
+        )
+        return IntakeItem(signal=signal, age_s=age, degraded=degraded)
+
+    def record_degraded_block(self, signal: Signal) -> None:
+        """Count a degraded signal that was blocked by the reduce-only rule."""
+        with self._cond:
+            self._shed(SHED_DEGRADED, signal, "reduce-only required")
+
+    @property
+    def depth(self) -> int:
+        """Number of pending signals."""
+        with self._cond:
+            return len(self._pending)
@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from enum import Enum
 
 from core.utils.clock import utcnow
+from core.utils.streaming_metrics import StreamingPerformanceMetrics
+
+from .var_engine import StreamingRiskEngine
 
 class RiskLevel(Enum):
     """Risk level classifications"""
@@ -66,10 +69,22 @@ class PerformanceMetrics:
 
 
 class RiskMetrics:
-    """Enhanced risk metrics calculator and tracker for paper trading validation"""
-
-    def __init__(self):
+    """Enhanced risk metrics calculator and tracker for paper trading validation
+
+    Args:
+        risk_engine: Streaming VaR engine for position/portfolio risk.
+        annualization: Periods per year of the update_equity ticks, used to
+            annualize Sharpe/Sortino (365 = daily, 525600 = per minute).
+    """
+
+    def __init__(
+        self,
+        risk_engine: Optional[StreamingRiskEngine] = None,
+        annualization: float = 365.0,
+    ):
         self.logger = logging.getLogger(__name__)
+        self.risk_engine = risk_engine
+        self.stream = StreamingPerformanceMetrics(annualization=annualization)
         self.positions: Dict[str, Any] = {}
         self.trade_history: List[Dict[str, Any]] = []
         self.equity_curve: List[Tuple[datetime, float]] = []
@@ -97,10 +112,29 @@ class RiskMetrics:
         self.start_time = utcnow()
         self.peak_equity = initial_equity
         self.equity_curve = [(self.start_time, initial_equity)]
+        self.stream = StreamingPerformanceMetrics(
+            annualization=self.stream.annualization
+        )
+        self.stream.record_equity(initial_equity, self.start_time.timestamp())
         self.logger.info(
             f"Risk tracking initialized with equity: ${initial_equity:,.2f}"
         )
 
+    def record_trade(self, trade: Dict[str, Any]) -> None:
+        """Record a closed trade (expects 'pnl', optional 'holding_seconds')"""
+        self.trade_history.append(trade)
+        pnl = float(trade.get("pnl", trade.get("realized_pnl", 0.0)) or 0.0)
+        holding = trade.get("holding_seconds")
+        self.stream.record_trade(
+            pnl, float(holding) if holding is not None else None
+        )
+
+    def update_equity(self, equity: float, timestamp: Optional[datetime] = None):
+        """Record an equity tick (O(1), no equity curve is retained)"""
+        ts = (timestamp or utcnow()).timestamp()
+        self.stream.record_equity(equity, ts)
+        self.peak_equity = max(self.peak_equity, equity)
+
     def validate_paper_trading_performance(self) -> Dict[str, Any]:
         """
         Validate performance against 72-hour testing criteria
@@ -147,33 +181,49 @@ class RiskMetrics:
         return validation_results
 
     def calculate_comprehensive_metrics(self) -> PerformanceMetrics:
-        """Calculate comprehensive performance metrics"""
-        # Simplified implementation for initial version
+        """Calculate comprehensive performance metrics
+
+        Reads the streaming accumulators only, so the cost is independent of
+        the number of recorded trades and equity ticks.
+        """
+        snap = self.stream.snapshot()
+        initial = snap.initial_equity or 0.0
+        current = snap.current_equity if snap.current_equity is not None else initial
+        total_pnl = current - initial
+        hours = self._get_test_duration_hours()
+
+        max_drawdown_abs = snap.max_drawdown * (snap.peak_equity or 0.0)
+        recovery_factor = total_pnl / max_drawdown_abs if max_drawdown_abs > 0 else 0.0
+        calmar_ratio = 0.0
+        if snap.max_drawdown > 0 and initial > 0 and hours > 0:
+            annual_return = (total_pnl / initial) * (24 * 365 / hours)
+            calmar_ratio = annual_return / snap.max_drawdown
+
         return PerformanceMetrics(
-            total_trades=len(self.trade_history),
-            winning_trades=0,
-            losing_trades=0,
-            win_rate=0.5,
-            total_pnl=0.0,
-            realized_pnl=0.0,
-            unrealized_pnl=0.0,
-            gross_profit=0.0,
-            gross_loss=0.0,
-            max_drawdown=0.0,
-            current_drawdown=0.0,
-            var_95=0.0,
-            sharpe_ratio=1.0,
-            sortino_ratio=1.0,
-            avg_trade_pnl=0.0,
-            avg_winning_trade=0.0,
-            avg_losing_trade=0.0,
-            largest_win=0.0,
-            largest_loss=0.0,
-            holding_period_avg=0.0,
-            trades_per_hour=0.0,
-            profit_factor=1.2,
-            recovery_factor=0.0,
-            calmar_ratio=0.0,
+            total_trades=snap.total_trades,
+            winning_trades=snap.winning_trades,
+            losing_trades=snap.losing_trades,
+            win_rate=snap.win_rate,
+            total_pnl=total_pnl,
+            realized_pnl=snap.realized_pnl,
+            unrealized_pnl=total_pnl - snap.realized_pnl,
+            gross_profit=snap.gross_profit,
+            gross_loss=snap.gross_loss,
+            max_drawdown=snap.max_drawdown,
+            current_drawdown=snap.current_drawdown,
+            var_95=snap.var_95,
+            sharpe_ratio=snap.sharpe_ratio,
+            sortino_ratio=snap.sortino_ratio,
+            avg_trade_pnl=snap.avg_trade_pnl,
+            avg_winning_trade=snap.avg_winning_trade,
+            avg_losing_trade=snap.avg_losing_trade,
+            largest_win=snap.largest_win,
+            largest_loss=snap.largest_loss,
+            holding_period_avg=snap.holding_period_avg,
+            trades_per_hour=snap.total_trades / hours if hours > 0 else 0.0,
+            profit_factor=snap.profit_factor,
+            recovery_factor=recovery_factor,
+            calmar_ratio=calmar_ratio,
             timestamp=utcnow(),
         )
 
@@ -190,17 +240,91 @@ class RiskMetrics:
         return ["Optimize trading strategy based on test results"]
 
     # Legacy methods for backward compatibility
+    @staticmethod
+    def _position_notional(position: Dict[str, Any]) -> Tuple[str, float, float]:
+        """Return (symbol, signed quantity, mark price) of a position dict"""
+        symbol = position.get("symbol", "")
+        qty = float(position.get("quantity", position.get("size", 0.0)) or 0.0)
+        if position.get("side", "").upper() in ("SELL", "SHORT") and qty > 0:
+            qty = -qty
+        price = float(
+            position.get("current_price", position.get("price", 0.0)) or 0.0
+        )
+        return symbol, qty, price
+
+    def _current_equity(self) -> float:
+        if self.stream.current_equity is not None:
+            return self.stream.current_equity
+        return self.peak_equity
+
     def calculate_position_risk(self, position: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate risk metrics for a single position"""
-        return {"var_95": 0.02, "position_size_pct": 0.1, "unrealized_pnl_pct": 0.0}
+        """Calculate risk metrics for a single position
+
+        var_95 is the 1-minute 95% parametric VaR as a fraction of the
+        position notional (0.0 while the risk engine has no history).
+        """
+        symbol, qty, price = self._position_notional(position)
+        notional = abs(qty) * price
+
+        var_95 = 0.0
+        if self.risk_engine is not None and notional > 0:
+            result = self.risk_engine.portfolio_var(
+                {symbol: qty * price}, confidence=0.95
+            )
+            var_95 = result.parametric_var / notional
+
+        equity = self._current_equity()
+        entry = float(position.get("entry_price", 0.0) or 0.0)
+        unrealized_pnl_pct = 0.0
+        if entry > 0 and price > 0:
+            unrealized_pnl_pct = (price - entry) / entry * (1 if qty >= 0 else -1)
+
+        return {
+            "var_95": var_95,
+            "position_size_pct": notional / equity if equity > 0 else 0.0,
+            "unrealized_pnl_pct": unrealized_pnl_pct,
+        }
 
     def calculate_portfolio_risk(
-        self, positions: List[Dict[str, Any]]
+        self, positions: List[Dict[str, Any]], benchmark: str = "BTCUSDT"
     ) -> Dict[str, float]:
-        """Calculate overall portfolio risk metrics"""
+        """Calculate overall portfolio risk metrics
+
+        portfolio_var is the 1-minute 95% parametric VaR as a fraction of
+        gross exposure; beta is measured against the benchmark symbol.
+        """
+        exposures: Dict[str, float] = {}
+        for position in positions:
+            symbol, qty, price = self._position_notional(position)
+            exposures[symbol] = exposures.get(symbol, 0.0) + qty * price
+
+        total_exposure = sum(abs(v) for v in exposures.values())
+        concentration_risk = (
+            max(abs(v) for v in exposures.values()) / total_exposure
+            if total_exposure > 0
+            else 0.0
+        )
+
+        portfolio_var = 0.0
+        beta = 1.0
+        engine = self.risk_engine
+        if engine is not None and total_exposure > 0:
+            result = engine.portfolio_var(exposures, confidence=0.95)
+            portfolio_var = result.parametric_var / total_exposure
+
+            known = [s for s in exposures if s in engine.symbols]
+            if benchmark in engine.symbols and known:
+                symbols = known + ([benchmark] if benchmark not in known else [])
+                cov = engine.covariance(symbols)
+                bench = symbols.index(benchmark)
+                weights = [exposures.get(s, 0.0) / total_exposure for s in symbols]
+                bench_var = cov[bench, bench]
+                if bench_var > 0:
+                    beta = float(cov[bench] @ weights / bench_var)
+
         return {
-            "total_exposure": 100000.0,
-            "concentration_risk": 0.1,
-            "portfolio_var": 0.02,
-            "beta": 1.0,
+            "total_exposure": total_exposure,
+            "concentration_risk": concentration_risk,
+            "portfolio_var": portfolio_var,
+            "beta": beta,
         }
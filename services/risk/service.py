@@ -20,11 +20,16 @@ from threading import Thread
 
 from core.utils.clock import utcnow
 from core.utils.redis_payload import sanitize_payload
+from core.utils.redis_publisher import Event, EventPublisher
+from core.utils.uuid_gen import generate_uuid_hex
 from core.auth import validate_all_auth
+from core.clients.exchange_info import ExchangeInfoCache
 
 try:
     from .config import config
     from .models import Order, Alert, RiskState, OrderResult
+    from .intake import SignalIntake, IntakeItem, SHED_REASONS
+    from .var_engine import StreamingRiskEngine
 except ImportError:
     # Fallback for script/importlib execution: ensure repo root is on sys.path.
     repo_root = Path(__file__).resolve().parents[2]
@@ -32,6 +37,8 @@ except ImportError:
         sys.path.insert(0, str(repo_root))
     from services.risk.config import config
     from services.risk.models import Order, Alert, RiskState, OrderResult
+    from services.risk.intake import SignalIntake, IntakeItem, SHED_REASONS
+    from services.risk.var_engine import StreamingRiskEngine
 
 from core.domain.models import Signal
 
@@ -78,6 +85,24 @@ shutdown_strategy_ids = set()
 shutdown_bot_ids = set()
 
 
+def order_client_id(signal: Signal) -> str:
+    """Stable client_id for the order of a signal (Idempotency-Key der Execution).
+
+    Gleiches Signal (Redelivery) -> gleiche ID; verschiedene Strategien, Bots
+    oder Seiten in derselben Sekunde -> verschiedene IDs. Signale ohne
+    signal_id und timestamp sind nicht wiedererkennbar und bekommen eine
+    eindeutige ID.
+    """
+    identity = signal.signal_id or (signal.timestamp or None)
+    if identity is None:
+        identity = f"anon:{utcnow().isoformat()}"
+    name = (
+        f"order:{signal.strategy_id}:{signal.bot_id}:{signal.symbol}:"
+        f"{signal.side}:{identity}:{signal.timestamp}"
+    )
+    return f"cdb-{generate_uuid_hex(name=name, length=32)}"
+
+
 @dataclass
 class AllocationState:
     allocation_pct: float = 0.0
@@ -92,10 +117,15 @@ class RiskManager:
         self.redis_client: Optional[redis.Redis] = None
         self.pubsub: Optional[redis.client.PubSub] = None
         self.pubsub_results: Optional[redis.client.PubSub] = None
+        self._event_publisher: Optional[EventPublisher] = None
+        self._balance_fetcher = None
         self._order_result_thread: Optional[Thread] = None
         self._regime_thread: Optional[Thread] = None
         self._allocation_thread: Optional[Thread] = None
         self._shutdown_thread: Optional[Thread] = None
+        self._signal_thread: Optional[Thread] = None
+        self._candles_thread: Optional[Thread] = None
+        self._account_thread: Optional[Thread] = None
         self.running = False
         self.allocation_state: dict[str, AllocationState] = {}
         self._circuit_shutdown_emitted = False
@@ -108,6 +138,20 @@ class RiskManager:
             logger.error(f"Config-Fehler: {e}")
             sys.exit(1)
 
+        self.intake = SignalIntake(
+            max_age_s=self.config.signal_max_age_s,
+            degrade_age_s=self.config.signal_degrade_age_s,
+            max_queue=self.config.signal_queue_max,
+        )
+        self.var_engine = StreamingRiskEngine(
+            window=self.config.var_window,
+            ewma_lambda=self.config.var_ewma_lambda,
+        )
+        # Symbol-Filter (Lot/Tick/Min-Notional); REST nur mit echter Balance
+        self.exchange_info = ExchangeInfoCache.from_env(
+            use_rest=self.config.use_real_balance
+        )
+
     def connect_redis(self):
         """Redis-Verbindung"""
         try:
@@ -292,16 +336,131 @@ class RiskManager:
                 logger.error("Shutdown-Stream Fehler: %s", err)
                 time.sleep(1)
 
-    def check_position_limit(self, signal: Signal) -> tuple[bool, str]:
-        """Prüft Positions-Limit"""
-        # REAL BALANCE - NO MORE FAKE test_balance
+    def _listen_candles_stream(self):
+        """Füttert die Streaming Risk Engine mit 1m-Candles"""
+        if not self.redis_client or not self.config.candles_stream:
+            return
+        last_id = "0-0"
+        while self.running:
+            try:
+                response = self.redis_client.xread(
+                    {self.config.candles_stream: last_id}, block=1000, count=500
+                )
+                if not response:
+                    continue
+                for _, entries in response:
+                    for entry_id, payload in entries:
+                        last_id = entry_id
+                        self.var_engine.update_from_payload(payload)
+            except Exception as err:  # noqa: BLE001
+                logger.error("Candle-Stream Fehler: %s", err)
+                time.sleep(1)
+
+    def _apply_account_update(self, payload: dict) -> None:
+        """Gepushte Balance (Private-WS) in den Balance-Cache übernehmen"""
+        if payload.get("type") != "balance" or self._balance_fetcher is None:
+            return
+        try:
+            self._balance_fetcher.apply_balance_update(
+                payload["asset"],
+                float(payload.get("free") or 0.0),
+                float(payload.get("locked") or 0.0),
+            )
+        except (KeyError, ValueError) as err:
+            logger.warning("Ungültiges Balance-Update verworfen: %s", err)
+
+    def _listen_account_stream(self):
+        """Private-WS Balance-Updates statt REST-Polling (nur Live-Balance)"""
+        if (
+            not self.redis_client
+            or not self.config.account_updates_stream
+            or not self.config.use_real_balance
+        ):
+            return
+        last_id = "$"
+        while self.running:
+            try:
+                response = self.redis_client.xread(
+                    {self.config.account_updates_stream: last_id},
+                    block=1000,
+                    count=100,
+                )
+                if not response:
+                    continue
+                for _, entries in response:
+                    for entry_id, payload in entries:
+                        last_id = entry_id
+                        self._apply_account_update(payload)
+            except Exception as err:  # noqa: BLE001
+                logger.error("Account-Stream Fehler: %s", err)
+                time.sleep(1)
+
+    def _get_current_balance(self) -> float:
+        """USDT-Balance: live von MEXC oder TEST_BALANCE"""
         from .balance_fetcher import RealBalanceFetcher
 
         if self.config.use_real_balance:
-            balance_fetcher = RealBalanceFetcher()
-            current_balance = balance_fetcher.get_usdt_balance()
-        else:
-            current_balance = self.config.test_balance
+            # Eine Instanz: Preis-/Balance-Cache und Session bleiben erhalten
+            if self._balance_fetcher is None:
+                self._balance_fetcher = RealBalanceFetcher()
+            return self._balance_fetcher.get_usdt_balance()
+        return self.config.test_balance
+
+    @staticmethod
+    def _current_exposures() -> dict[str, float]:
+        """Signiertes Notional je Symbol aus dem Risk-State"""
+        return {
+            symbol: qty * risk_state.last_prices.get(symbol, 0.0)
+            for symbol, qty in risk_state.positions.items()
+        }
+
+    def check_var_limit(
+        self, signal: Signal, quantity: float, balance: Optional[float] = None
+    ) -> tuple[bool, str]:
+        """Prüft Portfolio-VaR inkl. geplanter Order (Streaming Risk Engine)"""
+        if self.config.max_portfolio_var_pct <= 0:
+            return True, "VaR-Limit deaktiviert"
+
+        exposures = self._current_exposures()
+        direction = 1 if signal.side == "BUY" else -1
+        notional = direction * quantity * float(signal.price or 0.0)
+        exposures[signal.symbol] = exposures.get(signal.symbol, 0.0) + notional
+
+        result = self.var_engine.portfolio_var(
+            exposures,
+            confidence=self.config.var_confidence,
+            horizon_minutes=self.config.var_horizon_minutes,
+        )
+        portfolio_var = max(result.parametric_var, result.historical_var)
+        if balance is None:
+            balance = self._get_current_balance()
+        max_var = balance * self.config.max_portfolio_var_pct
+
+        if portfolio_var > max_var:
+            return (
+                False,
+                f"Portfolio-VaR zu hoch: {portfolio_var:.2f} > {max_var:.2f}",
+            )
+
+        return True, "VaR OK"
+
+    def portfolio_var_snapshot(self) -> dict:
+        """Aktueller Portfolio-VaR der offenen Positionen (für /status)"""
+        result = self.var_engine.portfolio_var(
+            self._current_exposures(),
+            confidence=self.config.var_confidence,
+            horizon_minutes=self.config.var_horizon_minutes,
+        )
+        return result.to_dict()
+
+    def check_position_limit(
+        self, signal: Signal, balance: Optional[float] = None
+    ) -> tuple[bool, str]:
+        """Prüft Positions-Limit"""
+        # REAL BALANCE - NO MORE FAKE test_balance
+        current_balance = (
+            balance if balance is not None else self._get_current_balance()
+        )
 
         # Max 10% des REAL Kapitals pro Position
         max_position_size = current_balance * self.config.max_position_pct
@@ -317,37 +476,32 @@ class RiskManager:
 
         return True, "Position OK"
 
-    def check_exposure_limit(self) -> tuple[bool, str]:
-        """Prüft Gesamt-Exposure"""
+    def check_exposure_limit(
+        self, balance: Optional[float] = None, reserved: float = 0.0
+    ) -> tuple[bool, str]:
+        """Prüft Gesamt-Exposure (reserved: im Batch bereits vergebenes Notional)"""
         # REAL BALANCE - NO MORE FAKE
-        from .balance_fetcher import RealBalanceFetcher
-
-        if self.config.use_real_balance:
-            balance_fetcher = RealBalanceFetcher()
-            current_balance = balance_fetcher.get_usdt_balance()
-        else:
-            current_balance = self.config.test_balance
+        current_balance = (
+            balance if balance is not None else self._get_current_balance()
+        )
 
         max_exposure = current_balance * self.config.max_total_exposure_pct
+        exposure = risk_state.total_exposure + reserved
 
-        if risk_state.total_exposure >= max_exposure:
+        if exposure >= max_exposure:
             return (
                 False,
-                f"Max Exposure erreicht: {risk_state.total_exposure:.2f} >= {max_exposure:.2f}",
+                f"Max Exposure erreicht: {exposure:.2f} >= {max_exposure:.2f}",
             )
 
         return True, "Exposure OK"
 
-    def check_drawdown_limit(self) -> tuple[bool, str]:
+    def check_drawdown_limit(self, balance: Optional[float] = None) -> tuple[bool, str]:
         """Prüft Daily-Drawdown (Circuit Breaker)"""
         # REAL BALANCE - NO MORE FAKE
-        from .balance_fetcher import RealBalanceFetcher
-
-        if self.config.use_real_balance:
-            balance_fetcher = RealBalanceFetcher()
-            current_balance = balance_fetcher.get_usdt_balance()
-        else:
-            current_balance = self.config.test_balance
+        current_balance = (
+            balance if balance is not None else self._get_current_balance()
+        )
 
         max_drawdown = current_balance * self.config.max_daily_drawdown_pct
 
@@ -360,8 +514,82 @@ class RiskManager:
 
         return True, "Drawdown OK"
 
-    def process_signal(self, signal: Signal) -> Optional[Order]:
-        """Prüft Signal gegen alle Risk-Layers"""
+    def _remaining_exposure(self, balance: Optional[float], reserved: float) -> float:
+        """Verbleibendes Exposure-Budget in USDT nach Reservierungen"""
+        if balance is None:
+            balance = self._get_current_balance()
+        max_exposure = balance * self.config.max_total_exposure_pct
+        return max_exposure - risk_state.total_exposure - reserved
+
+    def _batch_priority(self, signal: Signal) -> tuple:
+        """Deterministische Reihenfolge im Batch
+
+        Reduce-Only zuerst (verbraucht kein Budget), dann nach Strength und
+        Confidence absteigend; Symbol/Timestamp als stabiler Tie-Breaker.
+        """
+        return (
+            0 if self._is_reduce_only_allowed(signal) else 1,
+            -abs(float(signal.strength or 0.0)),
+            -float(signal.confidence or 0.0),
+            signal.symbol,
+            str(signal.side or ""),
+            float(signal.timestamp or 0),
+        )
+
+    def process_signals_batch(self, signals: list[Signal]) -> list[Order]:
+        """Prüft einen Signal-Burst gegen einen einzigen Risk-Snapshot
+
+        Balance wird einmal gelesen; das verbleibende Exposure-Budget wird
+        in Prioritätsreihenfolge vergeben (nicht first-come), jede
+        freigegebene Order reserviert ihr Notional für die folgenden.
+        Versand aller Orders erfolgt gebündelt über send_orders().
+        """
+        if not signals:
+            return []
+
+        balance = self._get_current_balance()
+        reserved = 0.0
+        orders: list[Order] = []
+        for sig in sorted(signals, key=self._batch_priority):
+            try:
+                order = self.process_signal(
+                    sig, balance=balance, reserved_exposure=reserved
+                )
+            except Exception as e:
+                # Ein fehlerhaftes Signal darf bereits freigegebene Orders
+                # (pending_orders gezählt) nicht vom Versand abhalten
+                logger.error(f"Fehler bei Signal {sig.symbol} im Batch: {e}")
+                stats["orders_skipped"] += 1
+                continue
+            if order is None:
+                continue
+            orders.append(order)
+            if not self._is_reduce_only_allowed(sig):
+                reserved += order.quantity * float(order.price or 0.0)
+
+        logger.info(
+            "Batch geprüft: %d Signale → %d Orders (reserviert %.2f USDT)",
+            len(signals),
+            len(orders),
+            reserved,
+        )
+        self.send_orders(orders)
+        return orders
+
+    def process_signal(
+        self,
+        signal: Signal,
+        balance: Optional[float] = None,
+        reserved_exposure: Optional[float] = None,
+    ) -> Optional[Order]:
+        """Prüft Signal gegen alle Risk-Layers
+
+        Args:
+            balance: Balance-Snapshot (None = aktuell abfragen)
+            reserved_exposure: Im laufenden Batch bereits vergebenes Notional;
+                gesetzt, wird die Order auf das verbleibende Exposure-Budget
+                begrenzt (siehe process_signals_batch)
+        """
 
         if not signal.strategy_id:
             self.send_alert(
@@ -398,7 +626,7 @@ class RiskManager:
                 return None
 
         # Layer 1: Circuit Breaker
-        ok, reason = self.check_drawdown_limit()
+        ok, reason = self.check_drawdown_limit(balance)
         if not ok:
             self.send_alert(
                 "CRITICAL", "CIRCUIT_BREAKER", reason, {"signal": signal.symbol}
@@ -414,7 +642,7 @@ class RiskManager:
         # Layer 2: Exposure-Limit
         reduce_only = self._is_reduce_only_allowed(signal)
         if not reduce_only:
-            ok, reason = self.check_exposure_limit()
+            ok, reason = self.check_exposure_limit(balance, reserved_exposure or 0.0)
             if not ok:
                 self.send_alert(
                     "WARNING", "RISK_LIMIT", reason, {"signal": signal.symbol}
@@ -425,7 +653,7 @@ class RiskManager:
                 return None
 
         # Layer 3: Position-Size
-        ok, reason = self.check_position_limit(signal)
+        ok, reason = self.check_position_limit(signal, balance)
         if not ok:
             self.send_alert("WARNING", "RISK_LIMIT", reason, {"signal": signal.symbol})
             logger.warning(f"⚠️ {reason}")
@@ -435,8 +663,11 @@ class RiskManager:
 
         # Alle Checks passed → Order erstellen
         allocation = self._get_allocation_state(signal.strategy_id)
+        max_notional = None
+        if reserved_exposure is not None and not reduce_only:
+            max_notional = self._remaining_exposure(balance, reserved_exposure)
         quantity, skip_reason = self.calculate_position_size(
-            signal, allocation.allocation_pct
+            signal, allocation.allocation_pct, balance, max_notional=max_notional
         )
 
         # SKIP: qty=0 wegen invalid price oder sanity check
@@ -447,6 +678,18 @@ class RiskManager:
             stats["orders_skipped"] += 1
             return None
 
+        # Layer 4: Portfolio-VaR (nur für risikoerhöhende Orders)
+        if not reduce_only:
+            ok, reason = self.check_var_limit(signal, quantity, balance)
+            if not ok:
+                self.send_alert(
+                    "WARNING", "RISK_LIMIT", reason, {"signal": signal.symbol}
+                )
+                logger.warning(f"⚠️ {reason}")
+                stats["orders_blocked"] += 1
+                risk_state.signals_blocked += 1
+                return None
+
         # Mark order if Early-Live exception applies
         reason = signal.reason
         if self._is_early_live_exception(signal.strategy_id):
@@ -464,7 +707,7 @@ class RiskManager:
             signal_id=signal.timestamp,
             reason=reason,
             timestamp=int(time.time()),
-            client_id=f"{signal.symbol}-{signal.timestamp}",
+            client_id=order_client_id(signal),
             strategy_id=signal.strategy_id,
             bot_id=signal.bot_id,
             price=signal.price,
@@ -480,26 +723,32 @@ class RiskManager:
         return order
 
     def calculate_position_size(
-        self, signal: Signal, allocation_pct: float
+        self,
+        signal: Signal,
+        allocation_pct: float,
+        balance: Optional[float] = None,
+        max_notional: Optional[float] = None,
     ) -> tuple[float, str | None]:
         """Berechnet Position-Size basierend auf Allokation
 
+        Args:
+            balance: Balance-Snapshot (None = aktuell abfragen)
+            max_notional: Obergrenze in USDT, z.B. Rest-Budget im Batch
+
         Returns:
             (quantity, skip_reason): qty=0.0 mit reason wenn skipped
         """
         # REAL BALANCE - NO MORE FAKE
-        from .balance_fetcher import RealBalanceFetcher
-
-        if self.config.use_real_balance:
-            balance_fetcher = RealBalanceFetcher()
-            current_balance = balance_fetcher.get_usdt_balance()
-        else:
-            current_balance = self.config.test_balance
+        current_balance = (
+            balance if balance is not None else self._get_current_balance()
+        )
 
         max_notional_usdt = current_balance * self.config.max_position_pct
 
         # Allokationsbasiert (keine Confidence im Control-Pfad)
         notional_usdt = max_notional_usdt * max(allocation_pct, 0.0)
+        if max_notional is not None:
+            notional_usdt = min(notional_usdt, max(max_notional, 0.0))
 
         # Hole Price vom Signal, fallback auf 0.0
         price = float(getattr(signal, "price", 0.0) or 0.0)
@@ -524,22 +773,59 @@ class RiskManager:
                 )
                 return 0.0, "Sanity check failed (qty too large)"
 
-        return float(max(qty, 0.0)), None
+        # Auf Exchange-Filter runden (Lot-Size abrunden, Min-Qty/Min-Notional)
+        quantized = self.exchange_info.quantize(
+            signal.symbol, max(qty, 0.0), price, signal.side or "BUY"
+        )
+        if not quantized.valid:
+            logger.info(
+                f"calculate_position_size: {signal.symbol} qty={qty:.8f} "
+                f"verletzt Exchange-Filter ({quantized.reason})"
+            )
+            return 0.0, quantized.reason
+
+        return float(quantized.quantity), None
+
+    def _publisher(self) -> EventPublisher:
+        if (
+            self._event_publisher is None
+            or self._event_publisher.client is not self.redis_client
+        ):
+            self._event_publisher = EventPublisher(self.redis_client, maxlen=10000)
+        return self._event_publisher
+
+    def _order_event(self, order: Order) -> Event:
+        payload = sanitize_payload(order.to_dict())
+        return Event(
+            channel=self.config.output_topic_orders,
+            message=json.dumps(payload, ensure_ascii=False),
+            streams=(self.config.orders_stream,),
+            fields=payload,
+        )
 
     def send_order(self, order: Order):
-        """Publiziert Order"""
+        """Publiziert Order (PUBLISH + XADD in einem Roundtrip)"""
         try:
-            payload = sanitize_payload(order.to_dict())
-            message = json.dumps(payload, ensure_ascii=False)
-            self.redis_client.publish(self.config.output_topic_orders, message)
-            if self.redis_client:
-                self.redis_client.xadd(self.config.orders_stream, payload, maxlen=10000)
+            self._publisher().publish_many([self._order_event(order)])
             logger.debug(f"Order publiziert: {order.symbol}")
         except Exception as e:
             logger.error(f"Fehler beim Order-Publishing: {e}")
             if risk_state.pending_orders > 0:
                 risk_state.pending_orders -= 1
 
+    def send_orders(self, orders: list[Order]):
+        """Publiziert mehrere Orders in einer Redis-Pipeline (ein Roundtrip)"""
+        if not orders:
+            return
+        try:
+            self._publisher().publish_many(
+                [self._order_event(order) for order in orders]
+            )
+            logger.debug(f"{len(orders)} Orders publiziert (Pipeline)")
+        except Exception as e:
+            logger.error(f"Fehler beim Batch-Order-Publishing: {e}")
+            risk_state.pending_orders = max(risk_state.pending_orders - len(orders), 0)
+
     def send_alert(self, level: str, code: str, message: str, context: dict):
         """Publiziert Alert"""
         try:
@@ -708,6 +994,60 @@ class RiskManager:
         finally:
             logger.info("Order-Result Listener beendet")
 
+    def listen_signals(self):
+        """Hintergrund-Listener: Signale aus PubSub in die Intake-Queue"""
+        if not self.pubsub:
+            return
+
+        try:
+            for message in self.pubsub.listen():
+                if not self.running:
+                    break
+                if message.get("type") != "message":
+                    continue
+                try:
+                    data = json.loads(message["data"])
+                    signal = Signal.from_dict(data)
+                    stats["signals_received"] += 1
+                    logger.info(f"📨 Signal empfangen: {signal.symbol} {signal.side}")
+                    self.intake.offer(signal)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Ungültiges JSON: {e}")
+                    stats["orders_skipped"] += 1  # Silent drop: JSON parse error
+                except Exception as e:
+                    logger.error(f"Fehler beim Signal-Empfang: {e}")
+                    stats["orders_skipped"] += 1  # Silent drop: Signal parsing error
+        finally:
+            logger.info("Signal Listener beendet")
+
+    def _admit_intake_item(self, item: IntakeItem) -> bool:
+        """Degradierte (zu alte) Signale nur als Reduce-Only zulassen"""
+        if item.degraded and not self._is_reduce_only_allowed(item.signal):
+            logger.warning(
+                "Signal blockiert: zu alt (%.1fs), nur Reduce-Only erlaubt",
+                item.age_s or 0.0,
+            )
+            self.intake.record_degraded_block(item.signal)
+            stats["orders_blocked"] += 1
+            risk_state.signals_blocked += 1
+            return False
+        return True
+
+    def handle_intake_item(self, item: IntakeItem) -> Optional[Order]:
+        """Prüft ein Signal aus der Intake-Queue und sendet die Order"""
+        if not self._admit_intake_item(item):
+            return None
+
+        order = self.process_signal(item.signal)
+        if order:
+            self.send_order(order)
+        return order
+
+    def handle_intake_batch(self, items: list[IntakeItem]) -> list[Order]:
+        """Prüft mehrere Intake-Signale als Batch (siehe process_signals_batch)"""
+        signals = [item.signal for item in items if self._admit_intake_item(item)]
+        return self.process_signals_batch(signals)
+
     def run(self):
         """Hauptschleife"""
         self.running = True
@@ -719,6 +1059,7 @@ class RiskManager:
         logger.info(f"   Max Exposure: {self.config.max_total_exposure_pct*100}%")
         logger.info(f"   Max Drawdown: {self.config.max_daily_drawdown_pct*100}%")
         logger.info(f"   Stop-Loss: {self.config.stop_loss_pct*100}%")
+        self.exchange_info.start_background_refresh()
 
         if self.pubsub_results and (
             self._order_result_thread is None
@@ -745,38 +1086,41 @@ class RiskManager:
             )
             self._shutdown_thread.start()
             logger.info("Shutdown-Stream Listener Thread gestartet")
+        if self._candles_thread is None or not self._candles_thread.is_alive():
+            self._candles_thread = Thread(
+                target=self._listen_candles_stream, daemon=True
+            )
+            self._candles_thread.start()
+            logger.info("Candle-Stream Listener Thread gestartet")
+        if self._account_thread is None or not self._account_thread.is_alive():
+            self._account_thread = Thread(
+                target=self._listen_account_stream, daemon=True
+            )
+            self._account_thread.start()
+            logger.info("Account-Stream Listener Thread gestartet")
 
-        try:
-            for message in self.pubsub.listen():
-                if not self.running:
-                    break
-
-                if message["type"] == "message":
-                    try:
-                        data = json.loads(message["data"])
-                        signal = Signal.from_dict(data)
-
-                        stats["signals_received"] += 1
-                        logger.info(
-                            f"📨 Signal empfangen: {signal.symbol} {signal.side}"
-                        )
-
-                        # Risk-Checks durchführen
-                        order = self.process_signal(signal)
-
-                        # Falls approved, Order senden
-                        if order:
-                            self.send_order(order)
-
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Ungültiges JSON: {e}")
-                        stats["orders_skipped"] += 1  # Silent drop: JSON parse error
-                    except Exception as e:
-                        logger.error(f"Fehler in Hauptschleife: {e}")
-                        stats[
-                            "orders_skipped"
-                        ] += 1  # Silent drop: Signal parsing error
+        if self._signal_thread is None or not self._signal_thread.is_alive():
+            self._signal_thread = Thread(target=self.listen_signals, daemon=True)
+            self._signal_thread.start()
+            logger.info("Signal-Intake Listener Thread gestartet")
 
+        try:
+            while self.running:
+                item = self.intake.poll(timeout=1.0)
+                if item is None:
+                    if not self._signal_thread.is_alive():
+                        logger.error("Signal Listener nicht mehr aktiv")
+                        break
+                    continue
+                try:
+                    burst = self.intake.drain(self.config.signal_batch_max - 1)
+                    if burst:
+                        self.handle_intake_batch([item, *burst])
+                    else:
+                        self.handle_intake_item(item)
+                except Exception as e:
+                    logger.error(f"Fehler in Hauptschleife: {e}")
+                    stats["orders_skipped"] += 1  # Silent drop: Processing error
         except KeyboardInterrupt:
             logger.info("Shutdown via Keyboard")
         finally:
@@ -800,6 +1144,10 @@ class RiskManager:
         logger.info("Risk-Manager gestoppt ✓")
 
 
+# Service-Instanz (gesetzt in __main__, für Intake-Metriken)
+manager: Optional[RiskManager] = None
+
+
 # ===== FLASK ENDPOINTS =====
 
 
@@ -830,6 +1178,7 @@ def status():
                 "pending_orders": risk_state.pending_orders,
                 "last_prices": risk_state.last_prices,
             },
+            "portfolio_var": manager.portfolio_var_snapshot() if manager else None,
         }
     )
 
@@ -865,6 +1214,20 @@ def metrics():
         "# TYPE risk_total_exposure_value gauge\n"
         f"risk_total_exposure_value {risk_state.total_exposure}\n"
     )
+    if manager is not None:
+        shed_counts = manager.intake.shed_counts
+        body += (
+            "\n# HELP risk_signal_intake_depth Wartende Signale in der Intake-Queue\n"
+            "# TYPE risk_signal_intake_depth gauge\n"
+            f"risk_signal_intake_depth {manager.intake.depth}\n\n"
+            "# HELP risk_signals_shed_total Verworfene Signale je Grund\n"
+            "# TYPE risk_signals_shed_total counter\n"
+        )
+        for reason in SHED_REASONS:
+            body += (
+                f'risk_signals_shed_total{{reason="{reason}"}} '
+                f"{shed_counts.get(reason, 0)}\n"
+            )
     return Response(body, mimetype="text/plain")
 
 
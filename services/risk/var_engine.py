@@ -0,0 +1,282 @@
+"""
+Risk Manager - Streaming Portfolio VaR Engine
+
+Maintains per-symbol 1m log-return series in a ring array and an
+exponentially weighted (RiskMetrics, zero-mean) covariance matrix that is
+updated incrementally with one rank-1 update per closed minute. Parametric
+and historical-simulation VaR/ES for a set of exposures are then a matrix
+product away instead of a full covariance recomputation per candle.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VaRResult:
+    """Portfolio VaR/ES in quote currency (positive numbers = loss)."""
+
+    parametric_var: float
+    parametric_es: float
+    historical_var: float
+    historical_es: float
+    portfolio_volatility: float
+    gross_exposure: float
+    confidence: float
+    horizon_minutes: int
+    observations: int
+
+    def to_dict(self) -> dict:
+        return {
+            "parametric_var": self.parametric_var,
+            "parametric_es": self.parametric_es,
+            "historical_var": self.historical_var,
+            "historical_es": self.historical_es,
+            "portfolio_volatility": self.portfolio_volatility,
+            "gross_exposure": self.gross_exposure,
+            "confidence": self.confidence,
+            "horizon_minutes": self.horizon_minutes,
+            "observations": self.observations,
+        }
+
+
+class StreamingRiskEngine:
+    """Incremental return/covariance store with VaR and ES queries.
+
+    Candles are grouped into one joint return row per candle timestamp.
+    A row is closed as soon as a candle for a newer timestamp arrives;
+    symbols without a candle in that minute contribute a zero return.
+
+    Args:
+        window: Number of return rows kept for historical simulation.
+        ewma_lambda: Decay factor of the EW covariance (RiskMetrics: 0.94).
+        capacity: Initial number of symbol slots (grows on demand).
+    """
+
+    def __init__(
+        self, window: int = 1440, ewma_lambda: float = 0.94, capacity: int = 256
+    ):
+        if window <= 1:
+            raise ValueError("window must be > 1")
+        if not 0.0 < ewma_lambda < 1.0:
+            raise ValueError("ewma_lambda must be in (0, 1)")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.window = window
+        self.ewma_lambda = ewma_lambda
+        self._lock = Lock()
+
+        self._index: dict[str, int] = {}
+        self._capacity = capacity
+        self._last_close = np.full(capacity, np.nan)
+        self._cov = np.zeros((capacity, capacity))
+        self._returns = np.zeros((window, capacity))
+        self._head = 0  # next ring row to write
+        self._rows = 0  # filled ring rows (<= window)
+        self._updates = 0  # EW covariance updates applied
+
+        self._row_ts: Optional[int] = None
+        self._row = np.zeros(capacity)
+        self._row_dirty = False
+
+    # ------------------------------------------------------------------ #
+    # Ingestion
+    # ------------------------------------------------------------------ #
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._index)
+
+    @property
+    def observations(self) -> int:
+        return self._rows
+
+    def _grow(self, capacity: int) -> None:
+        old = self._capacity
+        last_close = np.full(capacity, np.nan)
+        last_close[:old] = self._last_close
+        cov = np.zeros((capacity, capacity))
+        cov[:old, :old] = self._cov
+        returns = np.zeros((self.window, capacity))
+        returns[:, :old] = self._returns
+        row = np.zeros(capacity)
+        row[:old] = self._row
+        self._last_close, self._cov, self._returns, self._row = (
+            last_close,
+            cov,
+            returns,
+            row,
+        )
+        self._capacity = capacity
+
+    def _slot(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        if idx is None:
+            idx = len(self._index)
+            if idx >= self._capacity:
+                self._grow(self._capacity * 2)
+            self._index[symbol] = idx
+        return idx
+
+    def _close_row(self) -> None:
+        """Commit the pending return row: ring write + rank-1 EW update."""
+        if not self._row_dirty:
+            return
+        n = len(self._index)
+        r = self._row[:n]
+
+        self._returns[self._head, :n] = r
+        self._returns[self._head, n:] = 0.0
+        self._head = (self._head + 1) % self.window
+        self._rows = min(self._rows + 1, self.window)
+
+        lam = self.ewma_lambda
+        cov = self._cov[:n, :n]
+        if self._updates == 0:
+            cov[:] = np.outer(r, r)
+        else:
+            cov *= lam
+            cov += (1.0 - lam) * np.outer(r, r)
+        self._updates += 1
+
+        self._row[:n] = 0.0
+        self._row_dirty = False
+
+    def update_candle(self, symbol: str, ts: int, close: float) -> None:
+        """Feed one closed candle (timestamp in seconds, close price)."""
+        if close <= 0 or not math.isfinite(close):
+            return
+        with self._lock:
+            if self._row_ts is None or ts > self._row_ts:
+                self._close_row()
+                self._row_ts = ts
+            elif ts < self._row_ts:
+                # Late candle: its row is closed, and a stale close must not
+                # become the base of the next return.
+                return
+            idx = self._slot(symbol)
+            prev = self._last_close[idx]
+            self._last_close[idx] = close
+            if not np.isfinite(prev):
+                # First candle for the symbol: price only.
+                return
+            self._row[idx] += math.log(close / prev)
+            self._row_dirty = True
+
+    def update_from_payload(self, payload: dict) -> bool:
+        """Feed a `stream.candles_1m` payload. Returns False if unusable."""
+        try:
+            symbol = payload["symbol"]
+            ts = int(float(payload["ts"]))
+            close = float(payload["close"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        self.update_candle(symbol, ts, close)
+        return True
+
+    def flush(self) -> None:
+        """Close the pending row (e.g. before an end-of-stream query)."""
+        with self._lock:
+            self._close_row()
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def _exposure_vector(self, exposures: dict[str, float]) -> np.ndarray:
+        n = len(self._index)
+        w = np.zeros(n)
+        for symbol, notional in exposures.items():
+            idx = self._index.get(symbol)
+            if idx is not None:
+                w[idx] += notional
+        return w
+
+    def covariance(self, symbols: list[str]) -> np.ndarray:
+        """EW covariance of 1m log returns for the given symbols."""
+        with self._lock:
+            idx = [self._index[s] for s in symbols]
+            return self._cov[np.ix_(idx, idx)].copy()
+
+    def correlation(self, symbols: list[str]) -> np.ndarray:
+        """EW correlation matrix for the given symbols."""
+        cov = self.covariance(symbols)
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+        corr[~np.isfinite(corr)] = 0.0
+        np.fill_diagonal(corr, 1.0)
+        return corr
+
+    def volatility(self, symbol: str) -> Optional[float]:
+        """EW 1m return volatility of a symbol, None if unknown."""
+        with self._lock:
+            idx = self._index.get(symbol)
+            if idx is None or self._updates == 0:
+                return None
+            return float(math.sqrt(max(self._cov[idx, idx], 0.0)))
+
+    def portfolio_var(
+        self,
+        exposures: dict[str, float],
+        confidence: float = 0.99,
+        horizon_minutes: int = 1,
+    ) -> VaRResult:
+        """Parametric and historical VaR/ES for signed notional exposures.
+
+        Args:
+            exposures: {symbol: signed notional} (long > 0, short < 0).
+            confidence: VaR confidence level, e.g. 0.99.
+            horizon_minutes: Horizon; scaled with sqrt(time) from 1m returns.
+        """
+        if not 0.5 < confidence < 1.0:
+            raise ValueError("confidence must be in (0.5, 1)")
+
+        with self._lock:
+            w = self._exposure_vector(exposures)
+            n = w.shape[0]
+            gross = float(np.abs(w).sum())
+            rows = self._rows
+            scale = math.sqrt(max(horizon_minutes, 1))
+
+            # Parametric (variance-covariance)
+            if self._updates and n:
+                variance = float(w @ self._cov[:n, :n] @ w)
+                sigma = math.sqrt(max(variance, 0.0)) * scale
+            else:
+                sigma = 0.0
+            dist = NormalDist()
+            z = dist.inv_cdf(confidence)
+            p_var = z * sigma
+            p_es = sigma * dist.pdf(z) / (1.0 - confidence)
+
+            # Historical simulation over the ring window
+            if rows and n:
+                pnl = (self._returns[:rows, :n] @ w) * scale
+                cutoff = np.quantile(pnl, 1.0 - confidence)
+                tail = pnl[pnl <= cutoff]
+                h_var = max(float(-cutoff), 0.0)
+                h_es = max(float(-tail.mean()), 0.0) if tail.size else h_var
+            else:
+                h_var = h_es = 0.0
+
+        return VaRResult(
+            parametric_var=p_var,
+            parametric_es=p_es,
+            historical_var=h_var,
+            historical_es=h_es,
+            portfolio_volatility=sigma,
+            gross_exposure=gross,
+            confidence=confidence,
+            horizon_minutes=horizon_minutes,
+            observations=rows,
+        )
@@ -17,6 +17,7 @@ from pathlib import Path
 
 from core.utils.clock import utcnow
 from core.utils.redis_payload import sanitize_signal
+from core.utils.redis_publisher import EventPublisher
 from core.utils.uuid_gen import generate_uuid_hex
 try:
     from .config import config
@@ -67,6 +68,7 @@ class SignalEngine:
     def __init__(self):
         self.config = config
         self.redis_client: Optional[redis.Redis] = None
+        self._event_publisher: Optional[EventPublisher] = None
         self.pubsub: Optional[redis.client.PubSub] = None
         self.running = False
         self.price_buffer = PriceBuffer()  # Stateful pct_change calculation (Issue #345)
@@ -160,17 +162,27 @@ class SignalEngine:
             logger.error(f"Fehler bei Market-Data-Verarbeitung: {e}")
             return None
 
+    def _publisher(self) -> EventPublisher:
+        if (
+            self._event_publisher is None
+            or self._event_publisher.client is not self.redis_client
+        ):
+            self._event_publisher = EventPublisher(self.redis_client, maxlen=10000)
+        return self._event_publisher
+
     def publish_signal(self, signal: Signal):
         """Publiziert Signal auf Redis"""
         try:
             # Sanitize payload (Issue #349: None-filtering + contract v1.0 enforcement)
             sanitized = sanitize_signal(signal.to_dict())
             message = json.dumps(sanitized)
-            self.redis_client.publish(self.config.output_topic, message)
-            if self.redis_client:
-                self.redis_client.xadd(
-                    self.config.output_stream, sanitized, maxlen=10000
-                )
+            # PUBLISH + XADD in einem Roundtrip
+            self._publisher().publish(
+                self.config.output_topic,
+                message,
+                streams=[self.config.output_stream],
+                fields=sanitized,
+            )
 
             # Statistik
             stats["signals_generated"] += 1
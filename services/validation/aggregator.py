@@ -6,21 +6,31 @@ from typing import Iterable
 
 
 def aggregate_orders(orders: Iterable[dict]) -> dict:
-    """Aggregate execution orders into simple metrics."""
-    total = len(orders)
-    filled = sum(1 for order in orders if order.get("status") == "FILLED")
-    not_filled = total - filled
-    symbols = {order.get("symbol") for order in orders if order.get("symbol")}
-    qty_values = [order.get("qty", 0) for order in orders]
-    price_orders = [order["price"] for order in orders if order.get("price") is not None]
+    """Aggregate execution orders into simple metrics (single pass, any iterable)."""
+    total = 0
+    filled = 0
+    symbols: set = set()
+    qty_sum = 0
+    price_sum = 0
+    price_count = 0
+    for order in orders:
+        total += 1
+        if order.get("status") == "FILLED":
+            filled += 1
+        if order.get("symbol"):
+            symbols.add(order.get("symbol"))
+        qty_sum += order.get("qty", 0)
+        if order.get("price") is not None:
+            price_sum += order["price"]
+            price_count += 1
 
-    avg_price = sum(price_orders) / len(price_orders) if price_orders else 0.0
+    avg_price = price_sum / price_count if price_count else 0.0
 
     return {
         "orders_total": total,
         "filled_total": filled,
-        "not_filled_total": not_filled,
+        "not_filled_total": total - filled,
         "symbols": len(symbols),
-        "qty_sum": sum(qty_values),
+        "qty_sum": qty_sum,
         "avg_price": avg_price,
     }
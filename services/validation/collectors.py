@@ -1,17 +1,59 @@
-"""Collectors that read Execution DB + Redis streams for the 72h validation window."""
+"""Collectors that read Execution DB + Redis streams for the 72h validation window.
+
+Both sources are read as generators so memory stays flat regardless of the
+window size: orders through a named (server-side) cursor fetched in batches
+of ``itersize`` rows, stream entries through paginated XRANGE calls of
+``page_size`` entries.
+"""
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Any, Iterable
+from itertools import islice
+from typing import Any, Iterator
 
 from psycopg2.extras import RealDictCursor
 
+from core.utils.postgres_client import iter_query_batches
+
+logger = logging.getLogger(__name__)
+
+ORDERS_QUERY = """
+    SELECT id, symbol, side, size, COALESCE(avg_fill_price, price) AS effective_price,
+           price, submitted_at, status
+    FROM orders
+    WHERE submitted_at >= %s AND submitted_at <= %s
+    ORDER BY submitted_at ASC
+"""
+
 
 @dataclass
 class ExecutionCollectorConfig:
     db_client: Any
     redis_client: Any
+    itersize: int = 2000
+    page_size: int = 1000
+
+
+def normalize_order(row: dict) -> dict:
+    """Map an orders row to the validation order shape."""
+    price = row["effective_price"]
+    return {
+        "id": row["id"],
+        "symbol": row["symbol"],
+        "side": row["side"].upper(),
+        "qty": float(row["size"]),
+        "price": float(price) if price is not None else 0.0,
+        "ts": row["submitted_at"].isoformat(),
+        "status": row["status"].upper(),
+    }
+
+
+def next_stream_id(stream_id: str) -> str:
+    """Smallest stream ID after stream_id (XRANGE continuation)."""
+    ms, _, seq = stream_id.partition("-")
+    return f"{ms}-{int(seq or 0) + 1}"
 
 
 class ExecutionCollector:
@@ -20,37 +62,80 @@ class ExecutionCollector:
     def __init__(self, config: ExecutionCollectorConfig) -> None:
         self.db_client = config.db_client
         self.redis_client = config.redis_client
+        self.itersize = max(1, config.itersize)
+        self.page_size = max(1, config.page_size)
+
+    def iter_execution_orders(self, window_start: str, window_end: str) -> Iterator[dict]:
+        """
+        Yield normalized order rows from Execution DB.
+
+        Streams through a named cursor (iter_query_batches), so only
+        ``itersize`` rows are held client-side at a time.
+        """
+        for _, rows in iter_query_batches(
+            self.db_client,
+            ORDERS_QUERY,
+            (window_start, window_end),
+            name="validation_orders",
+            itersize=self.itersize,
+            cursor_factory=RealDictCursor,
+        ):
+            for row in rows:
+                yield normalize_order(row)
 
     def collect_execution_orders(self, window_start: str, window_end: str) -> list[dict]:
         """Return normalized order rows from Execution DB."""
-        with self.db_client.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(
-                """
-                SELECT id, symbol, side, size, COALESCE(avg_fill_price, price) AS effective_price,
-                       price, submitted_at, status
-                FROM orders
-                WHERE submitted_at >= %s AND submitted_at <= %s
-                ORDER BY submitted_at ASC
-                """,
-                (window_start, window_end),
-            )
-            rows = cur.fetchall()
-
-        normalized: list[dict] = []
-        for row in rows:
-            price = row["effective_price"]
-            normalized.append(
-                {
-                    "id": row["id"],
-                    "symbol": row["symbol"],
-                    "side": row["side"].upper(),
-                    "qty": float(row["size"]),
-                    "price": float(price) if price is not None else 0.0,
-                    "ts": row["submitted_at"].isoformat(),
-                    "status": row["status"].upper(),
-                }
-            )
-        return normalized
+        return list(self.iter_execution_orders(window_start, window_end))
+
+    def iter_redis_events(
+        self, stream: str, start_id: str, end_id: str, limit: int | None = None
+    ) -> Iterator[dict]:
+        """
+        Yield events from a Redis stream using paginated XRANGE.
+
+        Each call fetches at most ``page_size`` entries; the next page starts
+        right after the last ID returned, until the range is exhausted or
+        ``limit`` events were yielded.
+
+        Args:
+            stream: Redis stream name (e.g., 'signals', 'market_events')
+            start_id: Starting stream ID (e.g., '-', '0', '1640000000000-0')
+            end_id: Ending stream ID (e.g., '+', '1640100000000-0')
+            limit: Maximum number of entries to yield (None = whole range)
+
+        Yields:
+            Normalized event dictionaries with 'id' and event fields
+        """
+        if not self.redis_client:
+            return
+
+        remaining = limit
+        cursor = start_id
+        while remaining is None or remaining > 0:
+            count = self.page_size if remaining is None else min(self.page_size, remaining)
+            try:
+                # XRANGE returns: [(stream_id, {field: value, ...}), ...]
+                entries = self.redis_client.xrange(
+                    name=stream, min=cursor, max=end_id, count=count
+                )
+            except Exception as e:
+                # Log error but don't crash - end the stream
+                logger.error(f"Failed to read Redis stream '{stream}': {e}")
+                return
+
+            for stream_id, fields in entries:
+                event = {"id": stream_id}
+                event.update(fields)
+                yield event
+
+            if len(entries) < count:
+                return
+            if remaining is not None:
+                remaining -= len(entries)
+            last_id = entries[-1][0]
+            if isinstance(last_id, bytes):
+                last_id = last_id.decode()
+            cursor = next_stream_id(last_id)
 
     def collect_redis_events(
         self, stream: str, start_id: str, end_id: str, limit: int
@@ -67,32 +152,4 @@ class ExecutionCollector:
         Returns:
             List of normalized event dictionaries with 'id' and event fields
         """
-        if not self.redis_client:
-            return []
-
-        try:
-            # Use XRANGE to read stream entries within the specified range
-            # XRANGE returns: [(stream_id, {field: value, ...}), ...]
-            entries = self.redis_client.xrange(
-                name=stream,
-                min=start_id,
-                max=end_id,
-                count=limit
-            )
-
-            # Normalize to list of dicts with stream_id included
-            normalized: list[dict] = []
-            for stream_id, fields in entries:
-                event = {"id": stream_id}
-                event.update(fields)
-                normalized.append(event)
-
-            return normalized
-
-        except Exception as e:
-            # Log error but don't crash - return empty list
-            # The logging setup from service.py should be available
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to read Redis stream '{stream}': {e}")
-            return []
+        return list(islice(self.iter_redis_events(stream, start_id, end_id, limit), limit))
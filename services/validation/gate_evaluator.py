@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from core.utils.clock import utcnow
+from services.validation.aggregator import aggregate_orders
 
 
 @dataclass(frozen=True)
@@ -83,6 +84,13 @@ class GateEvaluator:
     def __init__(self, thresholds: GateThresholds | None = None) -> None:
         self.thresholds = thresholds or GateThresholds.from_env()
 
+    def evaluate_orders(self, orders: Iterable[dict]) -> Dict[str, Any]:
+        """Aggregate an order stream (e.g. a collector generator) and evaluate it."""
+        summary = aggregate_orders(orders)
+        evaluation = self.evaluate(summary)
+        evaluation["summary"] = summary
+        return evaluation
+
     def evaluate(self, summary: Dict[str, Any]) -> Dict[str, Any]:
         orders_total = int(summary.get("orders_total", 0) or 0)
         filled_total = int(summary.get("filled_total", 0) or 0)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+from typing import Iterator
+
 from services.validation.aggregator import aggregate_orders
 from services.validation.collectors import (
     ExecutionCollector,
@@ -9,11 +12,17 @@ from services.validation.collectors import (
 )
 
 
-def collect_execution_orders(window_start: str, window_end: str, db_client: object) -> list[dict]:
-    """Run a read-only collector query and return normalized orders."""
-    config = ExecutionCollectorConfig(db_client=db_client, redis_client=None)
+def collect_execution_orders(
+    window_start: str, window_end: str, db_client: object
+) -> Iterator[dict]:
+    """Run a read-only collector query and stream normalized orders."""
+    config = ExecutionCollectorConfig(
+        db_client=db_client,
+        redis_client=None,
+        itersize=int(os.getenv("VALIDATION_DB_ITERSIZE", "2000")),
+    )
     collector = ExecutionCollector(config=config)
-    return collector.collect_execution_orders(window_start, window_end)
+    return collector.iter_execution_orders(window_start, window_end)
 
 
 def run_validation_window(window_start: str, window_end: str, db_client: object) -> dict:
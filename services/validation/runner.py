@@ -14,11 +14,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
+import psycopg2
+
 from core.utils.clock import utcnow
 from core.utils.postgres_client import create_postgres_connection
 from services.risk.real_validation_fetcher import RealValidationFetcher
+from services.validation.aggregator import aggregate_orders
 from services.validation.gate_evaluator import GateEvaluator, ThresholdConfigError
-from services.validation.pipeline import run_validation_window
+from services.validation.pipeline import collect_execution_orders
 
 
 def _parse_iso(value: str) -> datetime:
@@ -66,6 +69,18 @@ def _connect_with_retries(
     raise RuntimeError("Failed to connect to Postgres")
 
 
+def _gate_error_evaluation(generated_at: str, exc: Exception) -> Dict[str, Any]:
+    return {
+        "timestamp": generated_at,
+        "overall_pass": False,
+        "risk_assessment": "high",
+        "criteria_results": {},
+        "criteria_used": {},
+        "reasons": [f"gate_error: {exc.__class__.__name__}"],
+        "reason": "gate evaluation failed",
+    }
+
+
 def _derive_reasons(reasons: Iterable[str]) -> list[str]:
     return [item for item in reasons if item]
 
@@ -132,20 +147,10 @@ def run(window_start: str, window_end: str) -> Dict[str, Any]:
         parsed_start = utcnow()
         parsed_end = parsed_start
 
-    try:
-        conn = _connect_with_retries()
-        try:
-            summary_payload = run_validation_window(window_start, window_end, conn)
-            summary = summary_payload["summary"]
-        finally:
-            conn.close()
-    except Exception as exc:
-        reasons.append(f"db_unreachable: {exc.__class__.__name__}")
-
+    evaluator: GateEvaluator | None = None
+    evaluation: Dict[str, Any] | None = None
     try:
         evaluator = GateEvaluator()
-        evaluation = evaluator.evaluate(summary)
-        criteria_used = evaluation.get("criteria_used", {})
     except ThresholdConfigError as exc:
         evaluation = {
             "timestamp": generated_at,
@@ -156,16 +161,37 @@ def run(window_start: str, window_end: str) -> Dict[str, Any]:
             "reasons": [f"invalid_thresholds: {exc}"],
             "reason": "invalid thresholds",
         }
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        evaluation = {
-            "timestamp": generated_at,
-            "overall_pass": False,
-            "risk_assessment": "high",
-            "criteria_results": {},
-            "criteria_used": {},
-            "reasons": [f"gate_error: {exc.__class__.__name__}"],
-            "reason": "gate evaluation failed",
-        }
+
+    try:
+        conn = _connect_with_retries()
+    except Exception as exc:
+        reasons.append(f"db_unreachable: {exc.__class__.__name__}")
+    else:
+        try:
+            # Orders werden gestreamt: Collector -> Aggregation -> Gate.
+            # DB-Fehler können daher erst während der Auswertung auftreten.
+            orders = collect_execution_orders(window_start, window_end, conn)
+            if evaluator is not None:
+                evaluation = evaluator.evaluate_orders(orders)
+                summary = evaluation.pop("summary")
+            else:
+                summary = aggregate_orders(orders)
+        except (psycopg2.Error, OSError) as exc:
+            reasons.append(f"db_unreachable: {exc.__class__.__name__}")
+        except Exception as exc:
+            if evaluation is None:
+                evaluation = _gate_error_evaluation(generated_at, exc)
+            else:
+                reasons.append(f"gate_error: {exc.__class__.__name__}")
+        finally:
+            conn.close()
+
+    if evaluation is None:
+        try:
+            evaluation = evaluator.evaluate(summary)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            evaluation = _gate_error_evaluation(generated_at, exc)
+    criteria_used = evaluation.get("criteria_used", {})
 
     reasons = _derive_reasons([*evaluation.get("reasons", []), *reasons])
     overall_pass = bool(evaluation.get("overall_pass")) and not any(
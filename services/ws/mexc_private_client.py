@@ -0,0 +1,334 @@
+"""
+MEXC WebSocket V3 Private User-Data Client
+
+Push-based order, fill and balance updates instead of REST status polling:
+- Listen-key lifecycle: create (POST), keepalive (PUT, every 30 min),
+  close (DELETE) on /api/v3/userDataStream
+- Channels: spot@private.orders / private.deals / private.account (.v3.api.pb)
+- Protobuf decoding via PushDataV3ApiWrapper (privateOrders/Deals/Account)
+- Reconnect with exponential backoff and a fresh listen key; proactive
+  reconnect before the 24h connection limit
+- Event callback interface (normalized flat dicts, Redis-stream friendly)
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urlencode
+
+import websockets
+
+from core.clients.mexc import get_transport
+
+# Add generated proto dir to sys.path for pb2 imports
+PROTO_GEN_DIR = Path(__file__).resolve().parent / "mexc_proto_gen"
+sys.path.insert(0, str(PROTO_GEN_DIR))
+
+import PushDataV3ApiWrapper_pb2 as wrapper_pb2  # type: ignore  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+WS_URL = "wss://wbs-api.mexc.com/ws"
+REST_URL = "https://api.mexc.com"
+USER_DATA_STREAM = "/api/v3/userDataStream"
+
+PRIVATE_CHANNELS = (
+    "spot@private.orders.v3.api.pb",
+    "spot@private.deals.v3.api.pb",
+    "spot@private.account.v3.api.pb",
+)
+
+# MEXC order status codes (private.orders)
+ORDER_STATUS = {
+    1: "NEW",
+    2: "FILLED",
+    3: "PARTIALLY_FILLED",
+    4: "CANCELED",
+    5: "PARTIALLY_CANCELED",
+}
+
+
+def _side(trade_type) -> str:
+    t = int(trade_type or 0)
+    return "BUY" if t == 1 else "SELL" if t == 2 else "UNKNOWN"
+
+
+def normalize_private_order(symbol: str, order, ts_ms: int = 0) -> dict:
+    """Normalize PrivateOrdersV3Api to a flat order_update event."""
+    return {
+        "type": "order_update",
+        "source": "mexc",
+        "symbol": symbol,
+        "order_id": str(getattr(order, "id", "")),
+        "client_id": str(getattr(order, "clientId", "")),
+        "side": _side(getattr(order, "tradeType", 0)),
+        "status": ORDER_STATUS.get(int(getattr(order, "status", 0) or 0), "UNKNOWN"),
+        "price": str(getattr(order, "price", "")),
+        "avg_price": str(getattr(order, "avgPrice", "")),
+        "quantity": str(getattr(order, "quantity", "")),
+        "cumulative_quantity": str(getattr(order, "cumulativeQuantity", "")),
+        "cumulative_amount": str(getattr(order, "cumulativeAmount", "")),
+        "remain_quantity": str(getattr(order, "remainQuantity", "")),
+        "ts_ms": int(getattr(order, "createTime", 0) or ts_ms),
+    }
+
+
+def normalize_private_deal(symbol: str, deal, ts_ms: int = 0) -> dict:
+    """Normalize PrivateDealsV3Api to a flat fill event."""
+    return {
+        "type": "fill",
+        "source": "mexc",
+        "symbol": symbol,
+        "order_id": str(getattr(deal, "orderId", "")),
+        "client_id": str(getattr(deal, "clientOrderId", "")),
+        "trade_id": str(getattr(deal, "tradeId", "")),
+        "side": _side(getattr(deal, "tradeType", 0)),
+        "price": str(getattr(deal, "price", "")),
+        "quantity": str(getattr(deal, "quantity", "")),
+        "amount": str(getattr(deal, "amount", "")),
+        "fee": str(getattr(deal, "feeAmount", "")),
+        "fee_asset": str(getattr(deal, "feeCurrency", "")),
+        "is_maker": int(bool(getattr(deal, "isMaker", False))),
+        "ts_ms": int(getattr(deal, "time", 0) or ts_ms),
+    }
+
+
+def normalize_private_account(account, ts_ms: int = 0) -> dict:
+    """Normalize PrivateAccountV3Api to a flat balance event."""
+    return {
+        "type": "balance",
+        "source": "mexc",
+        "asset": str(getattr(account, "vcoinName", "")),
+        "free": str(getattr(account, "balanceAmount", "")),
+        "locked": str(getattr(account, "frozenAmount", "")),
+        "free_change": str(getattr(account, "balanceAmountChange", "")),
+        "ts_ms": int(getattr(account, "time", 0) or ts_ms),
+    }
+
+
+def decode_private_message(raw: bytes) -> Optional[dict]:
+    """Decode a private push (PushDataV3ApiWrapper) into a normalized event."""
+    w = wrapper_pb2.PushDataV3ApiWrapper()
+    w.ParseFromString(raw)
+    body = w.WhichOneof("body")
+    symbol = getattr(w, "symbol", "")
+    ts_ms = int(getattr(w, "sendTime", 0) or 0)
+
+    if body == "privateOrders":
+        return normalize_private_order(symbol, w.privateOrders, ts_ms)
+    if body == "privateDeals":
+        return normalize_private_deal(symbol, w.privateDeals, ts_ms)
+    if body == "privateAccount":
+        return normalize_private_account(w.privateAccount, ts_ms)
+    logger.debug(f"[decode] ignoring private push body={body} channel={w.channel}")
+    return None
+
+
+class ListenKeyManager:
+    """Listen-key REST lifecycle on the shared MEXC transport (sync)."""
+
+    def __init__(self, api_key: str, api_secret: str, base_url: str = REST_URL):
+        self.transport = get_transport(base_url, api_key, api_secret)
+
+    def _signed(self, **params) -> dict:
+        params["timestamp"] = int(time.time() * 1000)
+        params["signature"] = self.transport.sign(urlencode(sorted(params.items())))
+        return params
+
+    def create(self) -> str:
+        response = self.transport.request("POST", USER_DATA_STREAM, params=self._signed())
+        response.raise_for_status()
+        return response.json()["listenKey"]
+
+    def keepalive(self, listen_key: str) -> None:
+        response = self.transport.request(
+            "PUT", USER_DATA_STREAM, params=self._signed(listenKey=listen_key)
+        )
+        response.raise_for_status()
+
+    def close(self, listen_key: str) -> None:
+        response = self.transport.request(
+            "DELETE", USER_DATA_STREAM, params=self._signed(listenKey=listen_key)
+        )
+        response.raise_for_status()
+
+
+class MexcPrivateClient:
+    """
+    Long-running MEXC private user-data client with listen-key lifecycle.
+
+    Usage:
+        client = MexcPrivateClient(
+            listen_keys=ListenKeyManager(api_key, api_secret),
+            on_event=lambda event: print(event),
+        )
+        await client.run()
+    """
+
+    def __init__(
+        self,
+        listen_keys,
+        on_event: Optional[Callable[[dict], None]] = None,
+        ws_url: str = WS_URL,
+        ping_interval: int = 20,
+        keepalive_interval: int = 1800,
+        max_session_s: int = 23 * 3600,
+        reconnect_max: int = 60,
+    ):
+        self.listen_keys = listen_keys
+        self.on_event = on_event
+        self.ws_url = ws_url
+        self.ping_interval = ping_interval
+        self.keepalive_interval = keepalive_interval
+        self.max_session_s = max_session_s
+        self.reconnect_max = reconnect_max
+
+        self.ws = None
+        self.listen_key: Optional[str] = None
+        self.connected = False
+        self.running = False
+
+        # Metrics
+        self.events_total = 0
+        self.decode_errors_total = 0
+        self.reconnects_total = 0
+        self.last_message_ts = 0
+
+    def get_metrics(self) -> dict:
+        """Return current metrics"""
+        return {
+            "private_events_total": self.events_total,
+            "private_decode_errors_total": self.decode_errors_total,
+            "private_reconnects_total": self.reconnects_total,
+            "private_ws_connected": 1 if self.connected else 0,
+            "private_last_message_ts_ms": self.last_message_ts,
+        }
+
+    async def _ping_loop(self):
+        """Heartbeat: send PING every ping_interval seconds"""
+        while self.running and self.ws:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                await self.ws.send(json.dumps({"method": "PING"}))
+            except Exception as e:
+                logger.warning(f"[private] ping failed: {e}")
+                return
+
+    async def _keepalive_loop(self):
+        """Extend the listen key before its 60 min expiry"""
+        while self.running and self.listen_key:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await asyncio.to_thread(self.listen_keys.keepalive, self.listen_key)
+                logger.debug("[private] listen key extended")
+            except Exception as e:
+                # Expired/invalid key: force reconnect with a new one
+                logger.warning(f"[private] listen key keepalive failed: {e}")
+                if self.ws:
+                    await self.ws.close()
+                return
+
+    async def _connect_and_subscribe(self):
+        self.listen_key = await asyncio.to_thread(self.listen_keys.create)
+        logger.info("[private] listen key created, connecting")
+        self.ws = await websockets.connect(f"{self.ws_url}?listenKey={self.listen_key}")
+        self.connected = True
+        await self.ws.send(
+            json.dumps({"method": "SUBSCRIPTION", "params": list(PRIVATE_CHANNELS)})
+        )
+        logger.info(f"[private] subscribed -> {', '.join(PRIVATE_CHANNELS)}")
+
+    def _handle_binary(self, msg: bytes) -> None:
+        try:
+            event = decode_private_message(msg)
+        except Exception as e:
+            self.decode_errors_total += 1
+            logger.error(f"[private] decode_error: {e}")
+            return
+        self.last_message_ts = int(time.time() * 1000)
+        if event is None:
+            return
+        self.events_total += 1
+        if self.on_event:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                logger.error(f"[private] on_event failed: {e}")
+
+    async def _message_loop(self):
+        """Receive pushes until disconnect"""
+        try:
+            async for msg in self.ws:
+                if isinstance(msg, str):
+                    # JSON control messages (ACK, PONG, errors)
+                    try:
+                        data = json.loads(msg)
+                    except ValueError:
+                        data = {"raw": msg}
+                    if data.get("msg") != "PONG":
+                        logger.info(f"[private] ctrl -> {data}")
+                    continue
+                self._handle_binary(msg)
+        except websockets.exceptions.ConnectionClosed as e:
+            logger.warning(f"[private] connection closed: {e}")
+        finally:
+            self.connected = False
+
+    async def _close_session(self):
+        if self.ws is not None:
+            try:
+                await self.ws.close()
+            except Exception:  # noqa: BLE001
+                pass
+            self.ws = None
+        if self.listen_key:
+            try:
+                await asyncio.to_thread(self.listen_keys.close, self.listen_key)
+            except Exception as e:
+                logger.debug(f"[private] listen key close failed: {e}")
+            self.listen_key = None
+
+    async def run(self):
+        """Main run loop with exponential backoff reconnect."""
+        self.running = True
+        backoff = 1
+
+        while self.running:
+            tasks = []
+            try:
+                await self._connect_and_subscribe()
+                backoff = 1
+                tasks = [
+                    asyncio.create_task(self._ping_loop()),
+                    asyncio.create_task(self._keepalive_loop()),
+                ]
+                try:
+                    # MEXC drops connections after 24h -> reconnect before
+                    await asyncio.wait_for(self._message_loop(), self.max_session_s)
+                except asyncio.TimeoutError:
+                    logger.info("[private] max session age reached, rotating")
+            except Exception as e:
+                logger.error(f"[private] connection error: {e}")
+                self.connected = False
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await self._close_session()
+
+            if self.running:
+                self.reconnects_total += 1
+                logger.info(f"[private] reconnecting in {backoff}s...")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.reconnect_max)
+
+        logger.info("[private] client stopped")
+
+    def stop(self):
+        """Stop the client gracefully"""
+        self.running = False
+        self.connected = False
@@ -5,6 +5,9 @@ Modes (controlled by WS_SOURCE env):
 - stub (default): Health endpoint only, no external connections
 - mexc_pb: MEXC WebSocket V3 Protobuf client
 
+Optional (WS_PRIVATE_ENABLED=true): private user-data stream (orders, fills,
+balances) published to Redis channel/stream `account_updates`.
+
 Port: 8000
 Dependencies: Redis (market_data publisher)
 """
@@ -20,7 +23,9 @@ from prometheus_client import Counter, Gauge, generate_latest, CONTENT_TYPE_LATE
 import redis
 
 from mexc_v3_client import MexcV3Client
+from core.secrets import read_secret
 from core.utils.redis_payload import sanitize_market_data
+from core.utils.redis_publisher import EventPublisher
 
 # Basic logging setup
 log_level_name = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -39,6 +44,10 @@ app = Flask(__name__)
 ws_client = None
 ws_mode = None
 redis_client = None
+private_client = None
+
+TOPIC_ACCOUNT_UPDATES = os.getenv("TOPIC_ACCOUNT_UPDATES", "account_updates")
+STREAM_ACCOUNT_UPDATES = os.getenv("STREAM_ACCOUNT_UPDATES", "stream.account_updates")
 
 # Prometheus metrics
 decoded_messages_total = Gauge("decoded_messages_total", "Total decoded WS messages")
@@ -47,6 +56,8 @@ ws_connected = Gauge("ws_connected", "WS connection status (0/1)")
 last_message_ts_ms = Gauge("last_message_ts_ms", "Last message timestamp (ms)")
 redis_publish_total = Counter("redis_publish_total", "Total Redis publishes")
 redis_publish_errors_total = Counter("redis_publish_errors_total", "Redis publish errors")
+private_events_total = Gauge("private_events_total", "Total private user-data events")
+private_ws_connected = Gauge("private_ws_connected", "Private WS connection status (0/1)")
 
 
 @app.route("/health", methods=["GET"])
@@ -94,6 +105,10 @@ def metrics():
         decode_errors_total.set(m.get("decode_errors_total", 0))
         ws_connected.set(m.get("ws_connected", 0))
         last_message_ts_ms.set(m.get("last_message_ts_ms", 0))
+    if private_client is not None:
+        m = private_client.get_metrics()
+        private_events_total.set(m.get("private_events_total", 0))
+        private_ws_connected.set(m.get("private_ws_connected", 0))
     return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
 
 
@@ -160,6 +175,64 @@ async def run_mexc_client():
     await ws_client.run()
 
 
+def _connect_redis():
+    redis_host = os.getenv("REDIS_HOST", "cdb_redis")
+    redis_port = int(os.getenv("REDIS_PORT", "6379"))
+    redis_password = os.getenv("REDIS_PASSWORD", "")
+    client = redis.Redis(
+        host=redis_host,
+        port=redis_port,
+        password=redis_password if redis_password else None,
+        db=0,
+        decode_responses=True,
+    )
+    client.ping()
+    return client
+
+
+def run_private_client():
+    """Private user-data stream -> Redis account_updates (own event loop)"""
+    global private_client
+
+    from mexc_private_client import ListenKeyManager, MexcPrivateClient
+
+    api_key = read_secret("mexc_api_key", "MEXC_API_KEY")
+    api_secret = read_secret("mexc_api_secret", "MEXC_API_SECRET")
+    if not api_key or not api_secret:
+        logger.error("WS_PRIVATE_ENABLED but MEXC credentials missing - private stream off")
+        return
+
+    try:
+        client = _connect_redis()
+    except Exception as e:
+        logger.error(f"Redis connection failed, private stream off: {e}")
+        return
+    publisher = EventPublisher(client, maxlen=10000)
+
+    def on_event(event):
+        try:
+            publisher.publish(
+                TOPIC_ACCOUNT_UPDATES,
+                json.dumps(event),
+                streams=[STREAM_ACCOUNT_UPDATES],
+                fields=event,
+            )
+            redis_publish_total.inc()
+        except Exception as e:
+            redis_publish_errors_total.inc()
+            logger.error(f"[redis] account update publish error: {e}")
+
+    private_client = MexcPrivateClient(
+        listen_keys=ListenKeyManager(
+            api_key, api_secret, os.getenv("MEXC_REST_URL", "https://api.mexc.com")
+        ),
+        on_event=on_event,
+        ping_interval=int(os.getenv("WS_PING_INTERVAL", "20")),
+    )
+    logger.info("Starting MEXC private user-data stream")
+    asyncio.run(private_client.run())
+
+
 def main():
     """
     Main service entry point.
@@ -179,6 +252,10 @@ def main():
     flask_thread = threading.Thread(target=start_flask_server, daemon=True)
     flask_thread.start()
 
+    if os.getenv("WS_PRIVATE_ENABLED", "false").lower() == "true":
+        private_thread = threading.Thread(target=run_private_client, daemon=True)
+        private_thread.start()
+
     if ws_mode == "stub":
         logger.info("STUB mode: No external WS connections")
         logger.info("Health endpoint available at http://0.0.0.0:8000/health")
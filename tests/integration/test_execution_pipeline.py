@@ -12,6 +12,21 @@ from services.execution.mock_executor import MockExecutor
 from services.execution.models import OrderStatus
 
 
+class DummyPipeline:
+    def __init__(self, client: "DummyRedisClient") -> None:
+        self.client = client
+        self.commands: list = []
+
+    def publish(self, channel: str, payload: str) -> None:
+        self.commands.append(lambda: self.client.publish(channel, payload))
+
+    def xadd(self, stream: str, payload: dict, maxlen: int, approximate: bool) -> None:
+        self.commands.append(lambda: self.client.xadd(stream, payload, maxlen))
+
+    def execute(self) -> list:
+        return [command() for command in self.commands]
+
+
 class DummyRedisClient:
     def __init__(self) -> None:
         self.published: list[tuple[str, str]] = []
@@ -23,6 +38,9 @@ class DummyRedisClient:
     def xadd(self, stream: str, payload: dict, maxlen: int) -> None:
         self.streams.append((stream, payload, maxlen))
 
+    def pipeline(self, transaction: bool = True) -> DummyPipeline:
+        return DummyPipeline(self)
+
 
 class DummyDatabase:
     def __init__(self) -> None:
@@ -0,0 +1,111 @@
+"""
+MEXC REST Transport Benchmark.
+
+Compares per-request overhead against a local stub HTTP server:
+- before: bare ``requests.get`` per call (new connection + fresh HMAC key)
+- after:  shared ``MexcTransport`` (pooled keep-alive session, precomputed key)
+
+Run with: PERF_BASELINE_RUN=1 pytest tests/performance/test_mexc_transport.py -s
+"""
+
+import hashlib
+import hmac
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+import pytest
+import requests
+
+from core.clients.mexc import MexcTransport
+from tests.performance.test_baseline_measurements import require_perf_run
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+]
+
+ITERATIONS = 500
+SECRET = "benchmark-secret"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # avoid 40ms delayed-ACK stalls
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"symbol":"BTCUSDT","price":"50000.00"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _measure(func, iterations: int = ITERATIONS) -> Dict[str, float]:
+    latencies = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "median_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95)],
+    }
+
+
+@pytest.mark.performance
+def test_transport_overhead_vs_bare_requests(stub_server):
+    """Pooled transport must not be slower than per-call requests.get."""
+    require_perf_run()
+
+    def before(i):
+        query = f"symbol=BTCUSDT&timestamp={i}"
+        signature = hmac.new(
+            SECRET.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        requests.get(
+            f"{stub_server}/api/v3/ticker/price",
+            params={"symbol": "BTCUSDT", "timestamp": i, "signature": signature},
+            headers={"X-MEXC-APIKEY": "key"},
+            timeout=5,
+        ).json()
+
+    transport = MexcTransport(stub_server, "key", SECRET)
+
+    def after(i):
+        signature = transport.sign(f"symbol=BTCUSDT&timestamp={i}")
+        transport.request(
+            "GET",
+            "/api/v3/ticker/price",
+            params={"symbol": "BTCUSDT", "timestamp": i, "signature": signature},
+        ).json()
+
+    # Warm-up (imports, first connection)
+    before(0)
+    after(0)
+
+    stats_before = _measure(before)
+    stats_after = _measure(after)
+    transport.close()
+
+    print(f"\n📊 requests.get per call: {stats_before}")
+    print(f"📊 MexcTransport:         {stats_after}")
+    assert stats_after["median_ms"] <= stats_before["median_ms"]
@@ -0,0 +1,138 @@
+"""
+Unit-Tests für den Parquet-Archiver (Store, Manifest, Reader, Candle-Resume).
+"""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("flask")
+
+import pyarrow.parquet as pq  # noqa: E402
+
+from services.archiver import service as archiver_service  # noqa: E402
+from services.archiver.models import HOUR_MS, previous_stream_id, tick_row  # noqa: E402
+from services.archiver.reader import ArchiveReader  # noqa: E402
+from services.archiver.store import ArchiveWriter  # noqa: E402
+
+BASE_MS = 1_760_000_000_000 - 1_760_000_000_000 % HOUR_MS
+
+
+def _tick(symbol, ts_ms, price):
+    return tick_row(
+        {"symbol": symbol, "ts_ms": ts_ms, "price": str(price), "trade_qty": "0.5", "side": "buy"}
+    )
+
+
+def _candle(symbol, ts_ms, close=100.0):
+    return {
+        "ts": str(ts_ms // 1000),
+        "symbol": symbol,
+        "timeframe": "60s",
+        "open": "100.0",
+        "high": "101.0",
+        "low": "99.0",
+        "close": f"{close}",
+        "volume": "2.5",
+        "trades": "7",
+    }
+
+
+class FakeRedis:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def xread(self, streams, count=None, block=None):
+        ((stream, last_id),) = streams.items()
+        key = lambda entry_id: tuple(int(p) for p in entry_id.split("-"))  # noqa: E731
+        entries = [e for e in self.entries if key(e[0]) > key(last_id)][:count]
+        return [[stream, entries]] if entries else []
+
+
+@pytest.mark.unit
+def test_hour_files_are_sorted_delta_encoded_and_indexed(tmp_path):
+    writer = ArchiveWriter(str(tmp_path))
+    # Unsortiert über zwei Stunden und zwei Symbole
+    for ts_ms in (BASE_MS + 5_000, BASE_MS, BASE_MS + HOUR_MS + 1_000):
+        writer.add("ticks", _tick("BTCUSDT", ts_ms, 100))
+        writer.add("ticks", _tick("ETHUSDT", ts_ms, 10))
+
+    assert writer.flush_closed(BASE_MS + HOUR_MS + 60_000, grace_ms=30_000) == 2
+    assert writer.buffered_rows() == 2  # laufende Stunde bleibt gepuffert
+
+    entries = writer.manifest.files("ticks")
+    assert [(e.symbol, e.rows) for e in entries] == [("BTCUSDT", 2), ("ETHUSDT", 2)]
+    assert entries[0].path == "ticks/symbol=BTCUSDT/date=2025-10-09/hour=08/part-000.parquet"
+
+    meta = pq.ParquetFile(tmp_path / entries[0].path).metadata.row_group(0)
+    assert "DELTA_BINARY_PACKED" in meta.column(0).encodings
+    assert meta.column(1).dictionary_page_offset is not None
+    assert pq.read_table(tmp_path / entries[0].path).column("ts_ms").to_pylist() == [
+        BASE_MS,
+        BASE_MS + 5_000,
+    ]
+
+
+@pytest.mark.unit
+def test_reader_selects_files_by_range_and_returns_arrays(tmp_path):
+    writer = ArchiveWriter(str(tmp_path))
+    for hour in range(3):
+        for minute in range(60):
+            ts_ms = BASE_MS + hour * HOUR_MS + minute * 60_000
+            writer.add("ticks", _tick("BTCUSDT", ts_ms, 1000 + hour * 60 + minute))
+            writer.add("ticks", _tick("ETHUSDT", ts_ms, 1))
+    writer.flush_all()
+
+    reader = ArchiveReader(str(tmp_path))
+    start, end = BASE_MS + HOUR_MS + 30 * 60_000, BASE_MS + 2 * HOUR_MS + 30 * 60_000
+    assert len(reader.files("ticks", ["BTCUSDT"], start, end)) == 2
+
+    arrays = reader.read_arrays("ticks", ["BTCUSDT"], start, end, columns=["price"])
+    assert list(arrays) == ["price"]
+    assert arrays["price"][0] == 1090 and arrays["price"][-1] == 1149
+    assert len(arrays["price"]) == 60
+
+    df = reader.read_pandas("ticks", None, start, start + 60_000)
+    assert list(df["symbol"]) == ["BTCUSDT", "ETHUSDT"]
+    assert reader.read_table("candles").num_rows == 0
+
+
+@pytest.mark.unit
+def test_candles_resume_from_cursor_without_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(archiver_service.config, "checkpoint_seconds", 3600)
+    entries = [
+        (f"{i + 1}-0", _candle("BTCUSDT", BASE_MS + i * 60_000, close=100 + i))
+        for i in range(90)
+    ]
+    service = archiver_service.ArchiverService(ArchiveWriter(str(tmp_path)))
+    service.redis_client = FakeRedis(entries)
+    service.restore_cursor()
+    while service.read_candles():
+        pass
+    # Stunde 1 geschlossen, Stunde 2 (30 Candles ab Eintrag 61-0) noch gepuffert
+    assert service.roll(now_ms=BASE_MS + 2 * HOUR_MS - 60_000) == 1
+    assert service.writer.manifest.get_cursor("candles") == "61-0"
+
+    # Crash ohne Flush -> Neustart liest ab Cursor, überspringt Archiviertes
+    restarted = archiver_service.ArchiverService(ArchiveWriter(str(tmp_path)))
+    restarted.redis_client = FakeRedis(entries)
+    restarted.restore_cursor()
+    assert restarted.last_candle_id == previous_stream_id("61-0") == f"60-{2**64 - 1}"
+    while restarted.read_candles():
+        pass
+    restarted.roll(force=True)
+
+    closes = ArchiveReader(str(tmp_path)).read_arrays("candles", ["BTCUSDT"])["close"]
+    assert list(closes) == [100.0 + i for i in range(90)]
+    assert restarted.writer.manifest.get_cursor("candles") == "90-1"
+
+
+@pytest.mark.unit
+def test_invalid_ticks_are_counted_not_archived(tmp_path):
+    service = archiver_service.ArchiverService(ArchiveWriter(str(tmp_path)))
+    before = archiver_service.stats["invalid_total"]
+
+    service.handle_tick({"symbol": "BTCUSDT", "ts_ms": BASE_MS, "price": "abc", "trade_qty": "1"})
+    service.handle_tick({"symbol": "BTCUSDT", "ts_ms": BASE_MS, "price": "1", "trade_qty": "1"})
+
+    assert archiver_service.stats["invalid_total"] == before + 1
+    assert service.writer.buffered_rows() == 1
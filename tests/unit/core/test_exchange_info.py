@@ -0,0 +1,118 @@
+"""
+Unit tests for core.clients.exchange_info module
+Tests symbol filter parsing, scalar and vectorized order quantization.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from core.clients.exchange_info import ExchangeInfoCache, SymbolFilters
+
+EXCHANGE_INFO = {
+    "symbols": [
+        {
+            # MEXC spot style
+            "symbol": "BTCUSDT",
+            "status": "1",
+            "baseSizePrecision": "0.000001",
+            "quotePrecision": 2,
+            "quoteAmountPrecision": "5",
+            "maxQuoteAmount": "2000000",
+        },
+        {
+            # Binance style filters
+            "symbol": "DOGEUSDT",
+            "status": "TRADING",
+            "filters": [
+                {"filterType": "LOT_SIZE", "stepSize": "1", "minQty": "10", "maxQty": "1000000"},
+                {"filterType": "PRICE_FILTER", "tickSize": "0.00001"},
+                {"filterType": "NOTIONAL", "minNotional": "1"},
+            ],
+        },
+        {"symbol": "HALTUSDT", "status": "2", "baseSizePrecision": "0.1"},
+        {"status": "1"},  # malformed, ignored
+    ]
+}
+
+
+@pytest.fixture
+def cache() -> ExchangeInfoCache:
+    cache = ExchangeInfoCache()
+    cache.load(EXCHANGE_INFO)
+    return cache
+
+
+@pytest.mark.unit
+def test_parses_mexc_and_binance_fields(cache):
+    btc = cache.get("BTCUSDT")
+    assert btc == SymbolFilters(
+        symbol="BTCUSDT",
+        step_size=0.000001,
+        tick_size=0.01,
+        min_notional=5.0,
+        max_notional=2_000_000.0,
+    )
+    doge = cache.get("DOGEUSDT")
+    assert (doge.step_size, doge.min_qty, doge.tick_size) == (1.0, 10.0, 0.00001)
+    assert len(cache) == 3
+
+
+@pytest.mark.unit
+def test_quantize_floors_quantity_and_rounds_price_passively(cache):
+    buy = cache.quantize("BTCUSDT", 0.0012345678, 50_000.129, "BUY")
+    sell = cache.quantize("BTCUSDT", 0.0012345678, 50_000.121, "SELL")
+
+    assert buy.valid and buy.quantity == 0.001234
+    assert buy.price == 50_000.12
+    assert sell.price == 50_000.13
+    # float noise must not lose a full step (0.3 / 0.1 = 2.9999...)
+    assert cache.quantize("DOGEUSDT", 30.0, 0.1).quantity == 30.0
+
+
+@pytest.mark.unit
+def test_quantize_rejects_below_minimums_and_disabled(cache):
+    assert cache.quantize("BTCUSDT", 0.00005, 50_000.0).reason == "Below min notional"
+    assert cache.quantize("DOGEUSDT", 9.7, 0.5).reason == "Below min quantity"
+    assert cache.quantize("BTCUSDT", 0.0000004).reason == "Below min quantity"
+    assert not cache.quantize("HALTUSDT", 5.0, 1.0).valid
+
+
+@pytest.mark.unit
+def test_unknown_symbol_passes_through(cache):
+    result = cache.quantize("NEWUSDT", 1.23456789, 0.987654321)
+    assert result.valid
+    assert (result.quantity, result.price) == (1.23456789, 0.987654321)
+
+
+@pytest.mark.unit
+def test_quantize_batch_matches_scalar(cache):
+    rng = np.random.default_rng(3)
+    symbols = ["BTCUSDT", "DOGEUSDT", "HALTUSDT", "NEWUSDT"] * 50
+    sides = ["BUY", "SELL"] * 100
+    quantities = rng.uniform(0.0, 0.01, 200) * np.array([1, 5000, 100, 1] * 50)
+    prices = rng.uniform(0.05, 60_000.0, 200)
+
+    q_qty, q_px, valid = cache.quantize_batch(symbols, quantities, prices, sides)
+
+    for i, symbol in enumerate(symbols):
+        expected = cache.quantize(symbol, quantities[i], prices[i], sides[i])
+        assert valid[i] == expected.valid
+        assert q_qty[i] == expected.quantity
+        assert q_px[i] == expected.price
+
+
+@pytest.mark.unit
+def test_snapshot_load_and_failed_refresh_keeps_cache(tmp_path):
+    path = tmp_path / "exchange_info.json"
+    path.write_text(json.dumps(EXCHANGE_INFO), encoding="utf-8")
+
+    def failing_loader():
+        raise ConnectionError("exchange down")
+
+    cache = ExchangeInfoCache(loader=failing_loader)
+    assert cache.load_snapshot(str(path)) == 3
+    assert cache.refresh() is False
+    assert "BTCUSDT" in cache
+    assert cache.last_refresh_ok is False
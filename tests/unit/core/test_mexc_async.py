@@ -0,0 +1,127 @@
+"""
+Unit tests for core.clients.mexc_async
+Tests the sliding-window rate limiter and the async client against a local
+aiohttp stub server.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import time
+from urllib.parse import urlencode
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from core.clients.mexc_async import AsyncMexcClient, AsyncRateLimiter  # noqa: E402
+
+
+@pytest.mark.unit
+def test_rate_limiter_enforces_window():
+    async def run():
+        limiter = AsyncRateLimiter(5, 0.2)
+        start = time.monotonic()
+        for _ in range(10):
+            await limiter.acquire()
+        return time.monotonic() - start, limiter.waits
+
+    elapsed, waits = asyncio.run(run())
+
+    assert elapsed >= 0.19
+    assert waits >= 1
+
+
+@pytest.mark.unit
+def test_rate_limiter_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(0, 1.0)
+
+
+@pytest.mark.unit
+def test_async_client_signs_and_runs_concurrently():
+    seen = []
+
+    async def order_handler(request):
+        params = dict(request.query)
+        signature = params.pop("signature")
+        expected = hmac.new(
+            b"secret", urlencode(sorted(params.items())).encode(), hashlib.sha256
+        ).hexdigest()
+        assert signature == expected
+        assert request.headers["X-MEXC-APIKEY"] == "key"
+        seen.append(params["symbol"])
+        await asyncio.sleep(0.1)  # simulated exchange RTT
+        return web.json_response(
+            {"orderId": len(seen), "status": "FILLED", "executedQty": params["quantity"]}
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/api/v3/order", order_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncMexcClient(
+                "key", "secret", base_url=f"http://127.0.0.1:{port}"
+            ) as client:
+                start = time.monotonic()
+                responses = await asyncio.gather(
+                    *(
+                        client.place_market_order(symbol, "BUY", 1.0)
+                        for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT")
+                    )
+                )
+                return responses, time.monotonic() - start
+        finally:
+            await runner.cleanup()
+
+    responses, elapsed = asyncio.run(run())
+
+    assert [r["status"] for r in responses] == ["FILLED"] * 4
+    assert sorted(seen) == ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"]
+    # 4 orders in ~1 RTT instead of 4 sequential RTTs
+    assert elapsed < 0.3
+
+
+@pytest.mark.unit
+def test_signed_timestamp_is_taken_after_rate_limiter():
+    released_ms = []
+    stamped_ms = []
+
+    class SlowLimiter:
+        async def acquire(self):
+            await asyncio.sleep(0.05)  # gedrosselt
+            released_ms.append(int(time.time() * 1000))
+
+    async def order_handler(request):
+        stamped_ms.append(int(request.query["timestamp"]))
+        return web.json_response({"orderId": 1, "status": "NEW"})
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/api/v3/order", order_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncMexcClient(
+                "key",
+                "secret",
+                base_url=f"http://127.0.0.1:{port}",
+                order_limiter=SlowLimiter(),
+            ) as client:
+                await client.place_market_order("BTCUSDT", "BUY", 1.0)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+    assert len(stamped_ms) == 1
+    assert stamped_ms[0] >= released_ms[0]
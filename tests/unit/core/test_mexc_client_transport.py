@@ -0,0 +1,53 @@
+"""
+Unit tests for core.clients.mexc transport
+Tests signing, per-endpoint timeouts and the shared transport registry.
+"""
+
+import hashlib
+import hmac
+
+import pytest
+
+from core.clients.mexc import (
+    DEFAULT_TIMEOUT,
+    MexcClient,
+    MexcTransport,
+    get_transport,
+)
+
+
+@pytest.mark.unit
+def test_sign_matches_plain_hmac():
+    transport = MexcTransport("https://api.mexc.com", "key", "secret")
+    message = "symbol=BTCUSDT&timestamp=1700000000000"
+    expected = hmac.new(b"secret", message.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    assert transport.sign(message) == expected
+    # Precomputed key must not be mutated by signing
+    assert transport.sign(message) == expected
+
+
+@pytest.mark.unit
+def test_sign_without_secret_raises():
+    transport = MexcTransport("https://api.mexc.com")
+    with pytest.raises(ValueError):
+        transport.sign("x")
+
+
+@pytest.mark.unit
+def test_endpoint_timeouts():
+    transport = MexcTransport(
+        "https://api.mexc.com", timeouts={"/api/v3/depth": (1.0, 2.0)}
+    )
+    assert transport.timeout_for("/api/v3/depth") == (1.0, 2.0)
+    assert transport.timeout_for("/api/v3/unknown") == DEFAULT_TIMEOUT
+    assert transport.session.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.unit
+def test_clients_share_transport():
+    a = MexcClient(api_key="shared-key", api_secret="shared-secret")
+    b = MexcClient(api_key="shared-key", api_secret="shared-secret")
+
+    assert a.transport is b.transport
+    assert a.transport is get_transport(a.base_url, "shared-key")
@@ -0,0 +1,76 @@
+"""
+Gemeinsame Fakes für die DB-Writer-Tests (psycopg2-Verbindung ohne Server).
+"""
+
+import pytest
+
+
+class FakeCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    """Transaction context like psycopg2: commit on success, rollback on error."""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.commits += 1
+        else:
+            self.rollbacks += 1
+        return False
+
+    def cursor(self):
+        return FakeCursor()
+
+
+class MaintenanceCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.queries.append(query)
+        self.conn.params.append(params)
+        if self.conn.error is not None:
+            raise self.conn.error
+
+    def fetchall(self):
+        return [("signals", "created", "signals_p202611")]
+
+
+class MaintenanceConnection(FakeConnection):
+    def __init__(self, error=None):
+        super().__init__()
+        self.queries = []
+        self.params = []
+        self.error = error
+
+    def cursor(self):
+        return MaintenanceCursor(self)
+
+
+@pytest.fixture
+def fake_connection():
+    return FakeConnection()
+
+
+@pytest.fixture
+def maintenance_connection():
+    """Factory: MaintenanceConnection(error=None)."""
+    return MaintenanceConnection
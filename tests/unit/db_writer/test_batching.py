@@ -0,0 +1,69 @@
+"""
+Unit-Tests für das Micro-Batching im DB Writer (ein INSERT je Tabelle).
+"""
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import db_writer  # noqa: E402
+
+
+@pytest.fixture
+def writer(monkeypatch, fake_connection):
+    calls = []
+
+    def fake_execute_many(cursor, name, rows):
+        if any(row[0] == "BAD" for row in rows):
+            raise ValueError("constraint violation")
+        calls.append((instance.statements.sql(name), list(rows)))
+
+    instance = db_writer.DatabaseWriter()
+    monkeypatch.setattr(instance.statements, "execute_many", fake_execute_many)
+    instance.db_conn = fake_connection
+    for batch in instance.batches.values():
+        batch.max_rows = 3
+        batch.max_wait_s = 60.0
+    return instance, calls
+
+
+@pytest.mark.unit
+def test_signals_flush_as_one_multi_row_insert_when_full(writer):
+    instance, calls = writer
+
+    for i in range(3):
+        instance.process_signal_event({"symbol": f"SYM{i}", "side": "BUY", "price": 1.0})
+
+    assert len(calls) == 1
+    query, rows = calls[0]
+    assert query.startswith("INSERT INTO signals (symbol, signal_type")
+    assert [row[:2] for row in rows] == [("SYM0", "buy"), ("SYM1", "buy"), ("SYM2", "buy")]
+    assert instance.db_conn.commits == 1
+    assert len(instance.batches["signals"]) == 0
+
+
+@pytest.mark.unit
+def test_validation_still_rejects_before_batching(writer):
+    instance, calls = writer
+
+    instance.process_trade_event({"symbol": "BTCUSDT", "status": "filled", "price": 0})
+    instance.process_order_event({"symbol": "BTCUSDT", "side": "BUY", "price": "abc"})
+    instance.process_trade_event(
+        {"symbol": "BTCUSDT", "side": "BUY", "status": "filled", "price": 100, "quantity": 1}
+    )
+
+    assert len(instance.batches["trades"]) == 1
+    assert len(instance.batches["orders"]) == 0
+    assert instance.flush_due(force=True) == 1
+    assert calls[0][0].startswith("INSERT INTO trades")
+
+
+@pytest.mark.unit
+def test_failed_batch_falls_back_to_single_rows(writer):
+    instance, calls = writer
+
+    for symbol in ("OK1", "BAD", "OK2"):
+        instance.process_signal_event({"symbol": symbol, "side": "SELL"})
+
+    assert [rows[0][0] for _, rows in calls] == ["OK1", "OK2"]
+    assert instance.db_conn.rollbacks == 2  # Batch + die fehlerhafte Zeile
@@ -0,0 +1,176 @@
+"""
+Unit-Tests für Dead-Letter-Queue und Retry-Worker des DB Writers.
+"""
+
+import json
+
+import psycopg2
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import dead_letter, db_writer  # noqa: E402
+
+
+class FakeRedis:
+    """Minimal stream + sorted set subset used by DeadLetterQueue."""
+
+    def __init__(self):
+        self.streams = {}
+        self.zsets = {}
+        self.acked = []
+        self._seq = 0
+
+    def xadd(self, stream, fields, maxlen=None, approximate=True):
+        self._seq += 1
+        entry_id = f"{self._seq}-0"
+        self.streams.setdefault(stream, []).append(
+            (entry_id, {k: str(v) for k, v in fields.items()})
+        )
+        return entry_id
+
+    def xrange(self, stream, start, end, count=None):
+        def key(entry_id):
+            return tuple(int(p) for p in entry_id.split("-"))
+
+        entries = self.streams.get(stream, [])
+        if start.startswith("("):
+            entries = [e for e in entries if key(e[0]) > key(start[1:])]
+        elif start != "-":
+            entries = [e for e in entries if key(e[0]) >= key(start)]
+        if end != "+":
+            entries = [e for e in entries if key(e[0]) <= key(end)]
+        return entries[:count] if count else entries
+
+    def xdel(self, stream, *ids):
+        before = len(self.streams.get(stream, []))
+        self.streams[stream] = [e for e in self.streams.get(stream, []) if e[0] not in ids]
+        return before - len(self.streams[stream])
+
+    def xack(self, stream, group, *ids):
+        self.acked.extend((stream, entry_id) for entry_id in ids)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrangebyscore(self, key, low, high, start=0, num=None):
+        items = sorted(
+            (score, member) for member, score in self.zsets.get(key, {}).items()
+            if low <= score <= high
+        )
+        return [member for _, member in items][start : start + num if num else None]
+
+    def zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+
+@pytest.fixture
+def writer(monkeypatch, fake_connection):
+    written = []
+    failure = {}
+
+    def fake_execute_many(cursor, name, rows):
+        if "error" in failure:
+            raise failure["error"]
+        written.extend(rows)
+
+    instance = db_writer.DatabaseWriter()
+    monkeypatch.setattr(instance.statements, "execute_many", fake_execute_many)
+    instance.db_conn = fake_connection
+    instance.redis_client = FakeRedis()
+    instance.dlq = dead_letter.DeadLetterQueue(instance.redis_client, backoff_base_s=0)
+    monkeypatch.setattr(instance, "_reconnect_postgres", lambda: None)
+    for batch in instance.batches.values():
+        batch.max_rows = 2
+        batch.max_wait_s = 60.0
+    return instance, written, failure
+
+
+def _letters(instance):
+    return instance.redis_client.streams.get(instance.dlq.stream, [])
+
+
+@pytest.mark.unit
+def test_push_schedules_only_transient_failures():
+    dlq = dead_letter.DeadLetterQueue(FakeRedis(), max_attempts=3)
+
+    permanent = dlq.push("orders", {"price": "abc"}, ValueError("bad price"))
+    transient = dlq.push("signals", {"symbol": "X"}, TimeoutError("db"), transient=True)
+    exhausted = dlq.push("signals", {"symbol": "Y"}, TimeoutError("db"), 3, True)
+
+    assert dlq.client.zsets[dlq.retry_key].keys() == {transient}
+    assert {permanent, exhausted}.isdisjoint(dlq.client.zsets[dlq.retry_key])
+    fields = dlq.client.xrange(dlq.stream, permanent, permanent)[0][1]
+    assert fields["error_class"] == "ValueError"
+    assert json.loads(fields["payload"]) == {"price": "abc"}
+
+
+@pytest.mark.unit
+def test_backoff_doubles_up_to_cap():
+    dlq = dead_letter.DeadLetterQueue(FakeRedis(), backoff_base_s=5, backoff_max_s=30)
+
+    assert [dlq.backoff_s(n) for n in (1, 2, 3, 4)] == [5, 10, 20, 30]
+
+
+@pytest.mark.unit
+def test_validation_error_is_dead_lettered_as_permanent(writer):
+    instance, written, _ = writer
+
+    instance.handle_stream_entries(
+        "stream.orders", [("7-0", {"symbol": "BTCUSDT", "side": "BUY", "price": "abc"})]
+    )
+
+    assert written == []
+    assert instance.redis_client.acked == [("stream.orders", "7-0")]
+    (_, fields), = _letters(instance)
+    assert fields["channel"] == "orders"
+    assert fields["transient"] == "0"
+    assert fields["source"] == "stream.orders:7-0"
+    assert instance.redis_client.zcard(instance.dlq.retry_key) == 0
+
+
+@pytest.mark.unit
+def test_transient_failure_is_retried_until_persisted(writer):
+    instance, written, failure = writer
+    failure["error"] = psycopg2.OperationalError("server closed the connection")
+
+    instance.handle_stream_entries(
+        "stream.signals",
+        [("1-0", {"symbol": "BTCUSDT", "side": "BUY"}), ("2-0", {"symbol": "X", "side": "BUY"})],
+    )
+    # Im DLQ gesichert -> Quell-Einträge ACKed
+    assert instance.redis_client.acked == [("stream.signals", "1-0"), ("stream.signals", "2-0")]
+    assert len(_letters(instance)) == 2
+
+    # Erster Retry scheitert erneut: neuer Dead Letter mit attempts + 1
+    assert instance.retry_dead_letters(force=True) == 2
+    assert [int(f["attempts"]) for _, f in _letters(instance)] == [2, 2]
+
+    del failure["error"]
+    assert instance.retry_dead_letters(force=True) == 2
+    assert [row[0] for row in written] == ["BTCUSDT", "X"]
+    assert _letters(instance) == []
+    assert instance.redis_client.zcard(instance.dlq.retry_key) == 0
+
+
+@pytest.mark.unit
+def test_cli_redrive_and_purge(writer, capsys):
+    instance, _, _ = writer
+    dlq = instance.dlq
+    first = dlq.push("orders", {"symbol": "A"}, ValueError("bad"))
+    dlq.push("orders", {"symbol": "B"}, KeyError("missing"))
+    dlq.push("signals", {"symbol": "C"}, ValueError("bad"))
+
+    assert dead_letter.main(["redrive", "--all", "--error-class", "ValueError"], dlq=dlq) == 0
+    assert instance.redis_client.zcard(dlq.retry_key) == 2
+
+    assert dead_letter.main(["purge", "--id", first], dlq=dlq) == 0
+    assert dead_letter.main(["stats"], dlq=dlq) == 0
+    stats = json.loads(capsys.readouterr().out.split("\n", 2)[-1])
+    assert stats["entries"] == 2
+    assert stats["scheduled"] == 1
+    assert stats["by_channel"] == {"orders": 1, "signals": 1}
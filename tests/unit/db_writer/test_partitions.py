@@ -0,0 +1,41 @@
+"""
+Unit-Tests für die periodischen Wartungsjobs des DB Writers
+(Partitionen, Rollups, Snapshot-Kompaktierung).
+"""
+
+import psycopg2
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import db_writer  # noqa: E402
+
+
+PERIODIC_JOBS = [
+    ("maintain_partitions", "SELECT * FROM cdb_run_partition_maintenance()"),
+    ("refresh_rollups", "SELECT * FROM cdb_refresh_rollups()"),
+    ("compact_snapshots", "SELECT * FROM cdb_compact_portfolio_snapshots("),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("job,sql", PERIODIC_JOBS)
+def test_periodic_job_runs_at_interval_and_disables_itself_on_old_schema(
+    job, sql, maintenance_connection
+):
+    writer = db_writer.DatabaseWriter()
+    writer.db_conn = maintenance_connection()
+    run = getattr(writer, job)
+
+    assert run(force=True) == [("signals", "created", "signals_p202611")]
+    assert run() == []  # Intervall noch nicht um
+    assert len(writer.db_conn.queries) == 1
+    assert writer.db_conn.queries[0].startswith(sql)
+    assert writer.db_conn.commits == 1
+
+    writer.db_conn = maintenance_connection(
+        psycopg2.errors.UndefinedFunction("missing")
+    )
+    assert run(force=True) == []
+    assert run(force=True) == []
+    assert len(writer.db_conn.queries) == 1
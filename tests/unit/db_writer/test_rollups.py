@@ -0,0 +1,45 @@
+"""
+Unit-Tests für Rollup-Refresh und Snapshot-Kompaktierung des DB Writers
+(cdb_refresh_rollups, cdb_compact_portfolio_snapshots).
+"""
+
+import json
+
+import psycopg2
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import db_writer  # noqa: E402
+
+
+@pytest.mark.unit
+def test_rollup_refresh_only_on_primary_worker(maintenance_connection):
+    writer = db_writer.DatabaseWriter(channels=["orders"], primary=False)
+    writer.db_conn = maintenance_connection()
+
+    assert writer.refresh_rollups(force=True) == []
+    assert writer.db_conn.queries == []
+
+
+@pytest.mark.unit
+def test_order_strategy_id_lands_in_metadata():
+    writer = db_writer.DatabaseWriter()
+
+    writer.process_order_event(
+        {"symbol": "BTCUSDT", "side": "BUY", "quantity": 1, "strategy_id": "momo"}
+    )
+
+    row = writer.batches["orders"].rows[0]
+    assert json.loads(row[8]) == {"strategy_id": "momo"}
+
+
+@pytest.mark.unit
+def test_snapshot_compaction_passes_retention(monkeypatch, maintenance_connection):
+    monkeypatch.setattr(db_writer, "SNAPSHOT_RAW_RETENTION", "12 hours")
+    monkeypatch.setattr(db_writer, "SNAPSHOT_MINUTE_RETENTION", "7 days")
+    writer = db_writer.DatabaseWriter()
+    writer.db_conn = maintenance_connection()
+
+    assert len(writer.compact_snapshots(force=True)) == 1
+    assert writer.db_conn.params == [("12 hours", "7 days")]
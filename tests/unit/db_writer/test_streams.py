@@ -0,0 +1,120 @@
+"""
+Unit-Tests für den Stream-Modus des DB Writers (Consumer Group, ack-after-commit).
+"""
+
+import psycopg2
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import db_writer  # noqa: E402
+
+
+class FakeRedis:
+    def __init__(self, claimable=None):
+        self.acked = []
+        self.claimable = list(claimable or [])
+
+    def xack(self, stream, group, *ids):
+        self.acked.extend((stream, entry_id) for entry_id in ids)
+
+    def xautoclaim(self, stream, group, consumer, min_idle_time, start_id, count):
+        if stream != "stream.signals" or not self.claimable:
+            return ["0-0", [], []]
+        entries, self.claimable = self.claimable, []
+        return ["0-0", entries, []]
+
+
+@pytest.fixture
+def writer(monkeypatch, fake_connection):
+    written = []
+    failure = {}
+
+    def fake_execute_many(cursor, name, rows):
+        if "error" in failure:
+            raise failure["error"]
+        written.extend(rows)
+
+    instance = db_writer.DatabaseWriter()
+    monkeypatch.setattr(instance.statements, "execute_many", fake_execute_many)
+    instance.db_conn = fake_connection
+    instance.redis_client = FakeRedis()
+    monkeypatch.setattr(instance, "_reconnect_postgres", lambda: None)
+    for batch in instance.batches.values():
+        batch.max_rows = 2
+        batch.max_wait_s = 60.0
+    return instance, written, failure
+
+
+@pytest.mark.unit
+def test_decode_stream_fields_restores_types():
+    data = db_writer.DatabaseWriter.decode_stream_fields(
+        {"symbol": "BTCUSDT", "price": "50000.5", "timestamp": "1763840671", "metadata": '{"a": 1}'}
+    )
+    assert data == {
+        "symbol": "BTCUSDT",
+        "price": 50000.5,
+        "timestamp": 1763840671,
+        "metadata": {"a": 1},
+    }
+
+
+@pytest.mark.unit
+def test_ack_only_after_batch_commit(writer):
+    instance, written, _ = writer
+    redis_client = instance.redis_client
+
+    instance.handle_stream_entries(
+        "stream.signals", [("1-0", {"symbol": "BTCUSDT", "side": "BUY"})]
+    )
+    assert redis_client.acked == []  # noch nicht committed
+
+    instance.handle_stream_entries(
+        "stream.signals", [("2-0", {"symbol": "ETHUSDT", "side": "SELL"})]
+    )
+    assert len(written) == 2
+    assert redis_client.acked == [("stream.signals", "1-0"), ("stream.signals", "2-0")]
+
+
+@pytest.mark.unit
+def test_invalid_and_skipped_entries_are_acked_immediately(writer):
+    instance, written, _ = writer
+
+    instance.handle_stream_entries(
+        "stream.order_results",
+        [
+            ("1-0", {"symbol": "BTCUSDT", "status": "rejected"}),
+            ("2-0", {"symbol": "BTCUSDT", "status": "filled", "price": "0"}),
+            ("3-0", None),
+        ],
+    )
+
+    assert written == []
+    assert instance.redis_client.acked == [
+        ("stream.order_results", "1-0"),
+        ("stream.order_results", "2-0"),
+        ("stream.order_results", "3-0"),
+    ]
+
+
+@pytest.mark.unit
+def test_lost_db_connection_leaves_entries_pending_for_reclaim(writer):
+    instance, written, failure = writer
+    failure["error"] = psycopg2.OperationalError("server closed the connection")
+
+    instance.handle_stream_entries(
+        "stream.signals",
+        [("1-0", {"symbol": "BTCUSDT", "side": "BUY"}), ("2-0", {"symbol": "X", "side": "BUY"})],
+    )
+    assert instance.redis_client.acked == []
+    assert len(instance.batches["signals"]) == 0
+
+    # DB wieder da: XAUTOCLAIM liefert die verwaisten Einträge erneut
+    del failure["error"]
+    instance.redis_client.claimable = [
+        ("1-0", {"symbol": "BTCUSDT", "side": "BUY"}),
+        ("2-0", {"symbol": "X", "side": "BUY"}),
+    ]
+    assert instance.claim_stale() == 2
+    assert len(written) == 2
+    assert instance.redis_client.acked == [("stream.signals", "1-0"), ("stream.signals", "2-0")]
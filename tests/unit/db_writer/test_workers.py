@@ -0,0 +1,85 @@
+"""
+Unit-Tests für die Worker je Channel-Gruppe im DB Writer.
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from services.db_writer import db_writer  # noqa: E402
+
+
+@pytest.mark.unit
+def test_parse_workers_default_is_one_worker_per_channel():
+    assert db_writer.parse_workers("signals;orders;order_results;portfolio_snapshots") == [
+        ["signals"],
+        ["orders"],
+        ["order_results"],
+        ["portfolio_snapshots"],
+    ]
+    assert db_writer.parse_workers(" signals, orders ;order_results,portfolio_snapshots;") == [
+        ["signals", "orders"],
+        ["order_results", "portfolio_snapshots"],
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("spec", ["signals;signals", "signals;fills", " ; "])
+def test_parse_workers_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        db_writer.parse_workers(spec)
+
+
+@pytest.mark.unit
+def test_batch_policy_per_table():
+    policy = db_writer.parse_batch_policy("trades=1:0, portfolio_snapshots=2000:5000")
+
+    assert policy == {"trades": (1, 0.0), "portfolio_snapshots": (2000, 5.0)}
+    with pytest.raises(ValueError):
+        db_writer.parse_batch_policy("fills=1:0")
+
+
+@pytest.mark.unit
+def test_worker_consumes_only_its_streams():
+    worker = db_writer.DatabaseWriter(channels=["order_results"], primary=False)
+
+    assert worker.name == "order_results"
+    assert list(worker.streams.values()) == ["order_results"]
+    assert worker.maintain_partitions(force=True) == []
+    assert worker.batches["trades"].max_wait_s == 0.0
+    assert worker.batches["portfolio_snapshots"].max_wait_s == 1.0
+
+
+@pytest.mark.unit
+def test_failed_worker_stops_the_others(monkeypatch):
+    class FakePool:
+        def __init__(self, *args, **kwargs):
+            self.closed = False
+
+        def closeall(self):
+            self.closed = True
+
+    monkeypatch.setattr(db_writer, "start_http_server", lambda port: None)
+    monkeypatch.setattr(db_writer, "ThreadedConnectionPool", FakePool)
+
+    pool = db_writer.WriterPool([["signals"], ["portfolio_snapshots"]])
+    stopped = threading.Event()
+
+    def healthy_serve(stop):
+        stop.wait(5)
+        stopped.set()
+
+    def failing_serve(stop):
+        raise RuntimeError("boom")
+
+    for worker, serve in zip(pool.workers, (healthy_serve, failing_serve)):
+        monkeypatch.setattr(worker, "start", lambda: None)
+        monkeypatch.setattr(worker, "serve", serve)
+
+    with pytest.raises(RuntimeError, match="portfolio_snapshots"):
+        pool.run()
+    assert stopped.is_set()
+    assert pool.pool.closed
+    assert [worker.primary for worker in pool.workers] == [True, False]
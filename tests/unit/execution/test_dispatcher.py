@@ -0,0 +1,60 @@
+"""
+Unit tests for the execution SymbolDispatcher
+Tests per-symbol ordering and cross-symbol concurrency.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from services.execution.dispatcher import SymbolDispatcher
+
+
+@pytest.mark.unit
+def test_orders_ordered_per_symbol_and_concurrent_across_symbols():
+    processed = []
+
+    async def handler(order):
+        await asyncio.sleep(0.05)
+        processed.append((order["symbol"], order["seq"]))
+
+    async def run():
+        dispatcher = SymbolDispatcher(handler, max_concurrency=10)
+        for seq in range(3):
+            for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+                dispatcher.submit({"symbol": symbol, "seq": seq})
+        start = time.monotonic()
+        await dispatcher.drain()
+        return dispatcher, time.monotonic() - start
+
+    dispatcher, elapsed = asyncio.run(run())
+
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+        assert [seq for sym, seq in processed if sym == symbol] == [0, 1, 2]
+    # 3 symbols in parallel: ~3 RTTs instead of 9
+    assert elapsed < 0.3
+    assert dispatcher.stats == {"dispatched": 9, "completed": 9, "failed": 0}
+    assert dispatcher.pending == 0 and dispatcher.active_symbols == 0
+
+
+@pytest.mark.unit
+def test_handler_error_does_not_stop_symbol_queue():
+    processed = []
+
+    async def handler(order):
+        if order["seq"] == 0:
+            raise RuntimeError("boom")
+        processed.append(order["seq"])
+
+    async def run():
+        dispatcher = SymbolDispatcher(handler)
+        dispatcher.submit({"symbol": "BTCUSDT", "seq": 0})
+        dispatcher.submit({"symbol": "BTCUSDT", "seq": 1})
+        await dispatcher.drain()
+        return dispatcher
+
+    dispatcher = asyncio.run(run())
+
+    assert processed == [1]
+    assert dispatcher.stats["failed"] == 1
@@ -0,0 +1,143 @@
+"""Unit-Tests für den Idempotency-Cache (Duplicate-Order-Guard)."""
+
+from __future__ import annotations
+
+import pytest
+
+from services.execution import service
+from services.execution.idempotency import IdempotencyCache
+from services.execution.models import ExecutionResult, OrderStatus
+
+
+class FakeRedis:
+    """Minimal SET NX EX / GET store shared by several replicas."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.ttls: dict = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+
+def _result(order_id: str = "ORD-1") -> ExecutionResult:
+    return ExecutionResult(
+        order_id=order_id,
+        symbol="BTCUSDT",
+        side="BUY",
+        quantity=0.5,
+        filled_quantity=0.5,
+        status=OrderStatus.FILLED.value,
+        client_id="cdb-1",
+        price=42000.0,
+    )
+
+
+@pytest.mark.unit
+def test_claim_record_and_cross_replica_duplicate() -> None:
+    shared = FakeRedis()
+    replica_a = IdempotencyCache(shared, ttl_s=60)
+    replica_b = IdempotencyCache(shared, ttl_s=60)
+
+    assert replica_a.claim("cdb-1") == (True, None)
+    # Erste Zustellung noch in Ausführung -> Duplikat ohne Ergebnis
+    assert replica_b.claim("cdb-1") == (False, None)
+
+    recorded = _result()
+    replica_a.record("cdb-1", recorded)
+    claimed, prior = replica_b.claim("cdb-1")
+
+    assert not claimed
+    assert prior == recorded
+    assert shared.ttls["execution:idem:cdb-1"] == 60
+    assert replica_b.stats["duplicates"] == 1
+    assert replica_b.stats["in_flight"] == 1
+
+
+@pytest.mark.unit
+def test_local_entries_expire_and_stay_bounded() -> None:
+    now = [0.0]
+    cache = IdempotencyCache(ttl_s=10, max_entries=2, clock=lambda: now[0])
+
+    for client_id in ("a", "b", "c"):
+        assert cache.claim(client_id) == (True, None)
+    assert len(cache) == 2
+    assert cache.claim("a") == (True, None)  # verdrängt
+
+    assert cache.claim("c")[0] is False
+    now[0] = 11.0
+    assert cache.claim("c") == (True, None)  # abgelaufen
+
+
+@pytest.mark.unit
+def test_process_order_short_circuits_duplicate(monkeypatch: pytest.MonkeyPatch) -> None:
+    original = service.stats.copy()
+    calls = []
+
+    class CountingExecutor:
+        def execute_order(self, order):
+            calls.append(order.client_id)
+            return _result()
+
+    published = []
+    try:
+        monkeypatch.setattr(service, "executor", CountingExecutor())
+        monkeypatch.setattr(service, "exchange_info", None)
+        monkeypatch.setattr(service, "idempotency", IdempotencyCache(FakeRedis()))
+        monkeypatch.setattr(service, "_publish_result", published.append)
+
+        order = {"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.5, "client_id": "cdb-1"}
+        first = service.process_order(order)
+        second = service.process_order(dict(order))
+
+        assert calls == ["cdb-1"]
+        assert second == first
+        assert len(published) == 1
+        assert service.get_stats_copy()["orders_duplicate"] == original["orders_duplicate"] + 1
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("failure", ["raise", "none"])
+def test_failed_execution_releases_claim(monkeypatch: pytest.MonkeyPatch, failure) -> None:
+    original = service.stats.copy()
+    calls = []
+
+    class FlakyExecutor:
+        def execute_order(self, order):
+            calls.append(order.client_id)
+            if len(calls) == 1:
+                if failure == "raise":
+                    raise TimeoutError("exchange timeout")
+                return None
+            return _result()
+
+    shared = FakeRedis()
+    try:
+        monkeypatch.setattr(service, "executor", FlakyExecutor())
+        monkeypatch.setattr(service, "exchange_info", None)
+        monkeypatch.setattr(service, "idempotency", IdempotencyCache(shared))
+        monkeypatch.setattr(service, "_publish_result", lambda result: None)
+
+        order = {"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.5, "client_id": "cdb-1"}
+        assert service.process_order(order) is None
+        assert "execution:idem:cdb-1" not in shared.data
+
+        assert service.process_order(dict(order)).order_id == "ORD-1"
+        assert calls == ["cdb-1", "cdb-1"]
+        assert service.idempotency.stats["released"] == 1
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
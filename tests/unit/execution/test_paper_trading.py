@@ -0,0 +1,73 @@
+"""
+Unit tests for the PaperTradingEngine pending-order index
+Tests trigger-price heaps, market FIFO and the order archive.
+"""
+
+import itertools
+
+import pytest
+
+from services.execution import paper_trading
+from services.execution.paper_trading import OrderStatus, OrderType, PaperTradingEngine
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # engine writes logs/ relative to cwd
+    ids = itertools.count(1_700_000_000_000)
+    monkeypatch.setattr(paper_trading.time, "time", lambda: next(ids) / 1000)
+    eng = PaperTradingEngine(initial_balance=100000.0)
+    eng.start_paper_trading()
+    eng.update_market_price("BTCUSDT", 100.0)
+    return eng
+
+
+@pytest.mark.unit
+def test_only_crossed_limits_fill(engine):
+    low = engine.place_order("BTCUSDT", "buy", 1.0, OrderType.LIMIT, price=90.0)
+    high = engine.place_order("BTCUSDT", "buy", 1.0, OrderType.LIMIT, price=95.0)
+
+    engine.update_market_price("BTCUSDT", 94.0)
+
+    assert engine.get_order_status(high) == OrderStatus.FILLED
+    assert engine.get_order_status(low) == OrderStatus.PENDING
+    assert engine.order_archive[high].filled_price == 95.0
+    assert list(engine.orders) == [low]
+    assert engine.get_performance_metrics()["pending_orders"] == 1
+
+
+@pytest.mark.unit
+def test_stops_and_sell_limits(engine):
+    engine.place_order("BTCUSDT", "buy", 2.0)  # market, fills at 100
+    take_profit = engine.place_order("BTCUSDT", "sell", 1.0, OrderType.LIMIT, price=110.0)
+    stop_loss = engine.place_order(
+        "BTCUSDT", "sell", 1.0, OrderType.STOP, stop_price=95.0
+    )
+    breakout = engine.place_order("BTCUSDT", "buy", 1.0, OrderType.STOP, stop_price=105.0)
+
+    engine.update_market_price("BTCUSDT", 96.0)
+    assert all(
+        engine.get_order_status(o) == OrderStatus.PENDING
+        for o in (take_profit, stop_loss, breakout)
+    )
+
+    engine.update_market_price("BTCUSDT", 94.0)
+    assert engine.get_order_status(stop_loss) == OrderStatus.FILLED
+    assert engine.order_archive[stop_loss].filled_price == 94.0
+
+    engine.update_market_price("BTCUSDT", 111.0)
+    assert engine.get_order_status(take_profit) == OrderStatus.FILLED
+    assert engine.get_order_status(breakout) == OrderStatus.FILLED
+
+
+@pytest.mark.unit
+def test_cancelled_orders_are_archived_and_skipped(engine):
+    order_id = engine.place_order("BTCUSDT", "buy", 1.0, OrderType.LIMIT, price=99.0)
+
+    assert engine.cancel_order(order_id)
+    engine.update_market_price("BTCUSDT", 90.0)
+
+    assert engine.get_order_status(order_id) == OrderStatus.CANCELLED
+    assert order_id in engine.order_archive and not engine.orders
+    assert engine.total_trades == 0
+    assert order_id in engine.export_results()["order_history"]
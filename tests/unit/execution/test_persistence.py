@@ -0,0 +1,143 @@
+"""Unit-Tests für den Write-Behind Writer des Execution Service."""
+
+from __future__ import annotations
+
+import time
+
+import psycopg2
+import pytest
+
+from services.execution.models import ExecutionResult, OrderStatus
+from services.execution.persistence import WriteBehindWriter
+
+
+class FlakyDatabase:
+    def __init__(self, failures: int = 0, bad_ids: tuple[str, ...] = ()) -> None:
+        self.failures = failures
+        self.bad_ids = set(bad_ids)
+        self.calls = 0
+        self.batches: list[list[str]] = []
+
+    def save_batch(self, results: list[ExecutionResult]) -> int:
+        self.calls += 1
+        if self.bad_ids & {r.order_id for r in results}:
+            raise psycopg2.IntegrityError("duplicate key")
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("postgres down")
+        self.batches.append([r.order_id for r in results])
+        return len(results)
+
+
+def make_result(i: int) -> ExecutionResult:
+    return ExecutionResult(
+        order_id=f"order-{i}",
+        symbol="BTCUSDT",
+        side="BUY",
+        quantity=0.1,
+        filled_quantity=0.1,
+        status=OrderStatus.FILLED.value,
+        price=50000.0,
+        timestamp="2026-01-01T00:00:00+00:00",
+    )
+
+
+def wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timeout")
+        time.sleep(0.01)
+
+
+@pytest.mark.unit
+def test_results_are_written_in_batches() -> None:
+    db = FlakyDatabase()
+    writer = WriteBehindWriter(db, batch_size=10, flush_interval_s=0.05)
+    for i in range(25):
+        writer.submit(make_result(i))
+    writer.start()
+    try:
+        wait_for(lambda: writer.stats["written"] == 25)
+    finally:
+        writer.stop()
+
+    assert [len(batch) for batch in db.batches] == [10, 10, 5]
+    assert db.batches[0][0] == "order-0"
+
+
+@pytest.mark.unit
+def test_transient_failure_is_retried() -> None:
+    db = FlakyDatabase(failures=2)
+    writer = WriteBehindWriter(
+        db, flush_interval_s=0.01, backoff_base_s=0.01, max_retries=3
+    )
+    writer.start()
+    try:
+        writer.submit(make_result(1))
+        wait_for(lambda: writer.stats["written"] == 1)
+    finally:
+        writer.stop()
+
+    assert writer.stats["retries"] == 2
+    assert writer.stats["spilled"] == 0
+
+
+@pytest.mark.unit
+def test_outage_spills_to_file_and_replays_after_recovery(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    db = FlakyDatabase(failures=100)
+    writer = WriteBehindWriter(
+        db, max_retries=2, backoff_base_s=0.0, spill_path=str(spill)
+    )
+
+    failed = writer._write_with_retry([make_result(1), make_result(2)])
+    assert [r.order_id for r in failed] == ["order-1", "order-2"]
+    writer._spill(failed)
+    assert len(spill.read_text(encoding="utf-8").splitlines()) == 2
+
+    db.failures = 0
+    assert writer.replay_spill() == 2
+    assert db.batches == [["order-1", "order-2"]]
+    assert not spill.exists()
+
+
+@pytest.mark.unit
+def test_full_queue_spills_instead_of_blocking(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    writer = WriteBehindWriter(FlakyDatabase(), max_queue=1, spill_path=str(spill))
+
+    assert writer.submit(make_result(1)) is True
+    assert writer.submit(make_result(2)) is False
+    assert writer.depth == 1
+    assert "order-2" in spill.read_text(encoding="utf-8")
+
+
+@pytest.mark.unit
+def test_rejected_row_is_isolated_without_retry(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    db = FlakyDatabase(bad_ids=("order-2",))
+    writer = WriteBehindWriter(db, backoff_base_s=0.0, spill_path=str(spill))
+
+    assert writer._write_with_retry([make_result(i) for i in range(1, 4)]) == []
+
+    assert db.batches == [["order-1"], ["order-3"]]
+    assert db.calls == 4  # Batch + drei Einzel-Writes, kein Retry
+    assert writer.stats["retries"] == 0
+    assert writer.stats["rejected"] == 1
+    assert not spill.exists()
+    assert "order-2" in (tmp_path / "spill.jsonl.rejected").read_text()
+
+
+@pytest.mark.unit
+def test_replay_writes_good_rows_past_a_poison_row(tmp_path) -> None:
+    spill = tmp_path / "spill.jsonl"
+    db = FlakyDatabase(bad_ids=("order-1",))
+    writer = WriteBehindWriter(db, spill_path=str(spill))
+    writer._spill([make_result(i) for i in range(1, 4)])
+
+    assert writer.replay_spill() == 2
+    assert writer.replay_spill() == 0
+
+    assert db.batches == [["order-2"], ["order-3"]]
+    assert not spill.exists()
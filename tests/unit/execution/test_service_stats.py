@@ -10,10 +10,27 @@ from services.execution import config, service
 from services.execution.models import ExecutionResult, OrderStatus
 
 
+class DummyPipeline:
+    def __init__(self, client: "DummyRedisClient") -> None:
+        self.client = client
+        self.commands: list = []
+
+    def publish(self, channel: str, payload: str) -> None:
+        self.commands.append(lambda: self.client.publish(channel, payload))
+
+    def xadd(self, stream: str, payload: dict, maxlen: int, approximate: bool) -> None:
+        self.commands.append(lambda: self.client.xadd(stream, payload, maxlen))
+
+    def execute(self) -> list:
+        self.client.round_trips += 1
+        return [command() for command in self.commands]
+
+
 class DummyRedisClient:
     def __init__(self) -> None:
         self.published: list[tuple[str, str]] = []
         self.streams: list[tuple[str, dict, int]] = []
+        self.round_trips = 0
 
     def publish(self, channel: str, payload: str) -> None:
         self.published.append((channel, payload))
@@ -21,6 +38,9 @@ class DummyRedisClient:
     def xadd(self, stream: str, payload: dict, maxlen: int) -> None:
         self.streams.append((stream, payload, maxlen))
 
+    def pipeline(self, transaction: bool = True) -> DummyPipeline:
+        return DummyPipeline(self)
+
 
 class DummyDatabase:
     def __init__(self) -> None:
@@ -72,6 +92,7 @@ def test_publish_result_updates_stats_and_history(monkeypatch: pytest.MonkeyPatc
         payload = json.loads(payload_text)
         assert payload["order_id"] == result.order_id
         assert dummy_redis.streams[0][0] == config.STREAM_ORDER_RESULTS
+        assert dummy_redis.round_trips == 1
         assert dummy_db.saved_orders
         assert dummy_db.saved_trades
         stats_snapshot = service.get_stats_copy()
@@ -79,3 +100,192 @@ def test_publish_result_updates_stats_and_history(monkeypatch: pytest.MonkeyPatc
     finally:
         service.stats.clear()
         service.stats.update(original)
+
+
+def test_process_order_rejects_below_lot_size_without_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from core.clients.exchange_info import ExchangeInfoCache
+
+    original = service.stats.copy()
+    cache = ExchangeInfoCache()
+    cache.load(
+        {"symbols": [{"symbol": "BTCUSDT", "status": "1", "baseSizePrecision": "0.0001"}]}
+    )
+
+    class FailingExecutor:
+        def execute_order(self, order):
+            raise AssertionError("Order darf nicht an die Börse gehen")
+
+    try:
+        monkeypatch.setattr(service, "redis_client", DummyRedisClient())
+        monkeypatch.setattr(service, "db", DummyDatabase())
+        monkeypatch.setattr(service, "executor", FailingExecutor())
+        monkeypatch.setattr(service, "exchange_info", cache)
+
+        result = service.process_order(
+            {"symbol": "BTCUSDT", "side": "BUY", "quantity": 0.00004}
+        )
+
+        assert result.status == OrderStatus.REJECTED.value
+        assert result.order_id.startswith("FILTER_")
+        assert "min quantity" in result.error_message
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
+
+
+def test_process_order_async_uses_async_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+
+    original = service.stats.copy()
+
+    class AsyncExecutor:
+        def execute_order(self, order):
+            raise AssertionError("Sync-Pfad darf nicht genutzt werden")
+
+        async def execute_order_async(self, order):
+            return ExecutionResult(
+                order_id="async-1",
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                filled_quantity=order.quantity,
+                status=OrderStatus.FILLED.value,
+                price=100.0,
+            )
+
+    try:
+        dummy_redis = DummyRedisClient()
+        monkeypatch.setattr(service, "redis_client", dummy_redis)
+        monkeypatch.setattr(service, "db", DummyDatabase())
+        monkeypatch.setattr(service, "executor", AsyncExecutor())
+        monkeypatch.setattr(service, "exchange_info", None)
+
+        result = asyncio.run(
+            service.process_order_async(
+                {"symbol": "ETHUSDT", "side": "SELL", "quantity": 1.0}
+            )
+        )
+
+        assert result.order_id == "async-1"
+        assert dummy_redis.published
+        assert service.get_stats_copy()["orders_filled"] == original["orders_filled"] + 1
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
+
+
+def test_process_order_async_serializes_sync_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import asyncio
+    import threading
+    import time
+
+    original = service.stats.copy()
+
+    class SyncExecutor:
+        def __init__(self) -> None:
+            self.active = 0
+            self.max_active = 0
+            self.lock = threading.Lock()
+
+        def execute_order(self, order):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            time.sleep(0.01)
+            with self.lock:
+                self.active -= 1
+            return ExecutionResult(
+                order_id=f"sync-{order.symbol}",
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                filled_quantity=order.quantity,
+                status=OrderStatus.FILLED.value,
+                price=100.0,
+            )
+
+    async def burst():
+        return await asyncio.gather(
+            *(
+                service.process_order_async(
+                    {"symbol": symbol, "side": "BUY", "quantity": 1.0}
+                )
+                for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT")
+            )
+        )
+
+    sync_executor = SyncExecutor()
+    try:
+        monkeypatch.setattr(service, "redis_client", DummyRedisClient())
+        monkeypatch.setattr(service, "db", DummyDatabase())
+        monkeypatch.setattr(service, "executor", sync_executor)
+        monkeypatch.setattr(service, "exchange_info", None)
+
+        results = asyncio.run(burst())
+
+        assert all(result is not None for result in results)
+        assert sync_executor.max_active == 1
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
+
+
+def test_account_update_push_replaces_status_polling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from services.execution.live_executor import LiveExecutor
+
+    original = service.stats.copy()
+
+    # Live-Pfad: LiveExecutor konsumiert den Push (begrenzter Cache)
+    executor = LiveExecutor(dry_run=True, order_cache_max=1)
+    try:
+        monkeypatch.setattr(service, "executor", executor)
+        monkeypatch.setattr(service, "open_orders", {"C02"})
+
+        service._handle_account_update(
+            {
+                "type": "order_update",
+                "order_id": "C01",
+                "symbol": "BTCUSDT",
+                "side": "BUY",
+                "status": "NEW",
+                "quantity": "0.5",
+            }
+        )
+        service._handle_account_update(
+            {
+                "type": "order_update",
+                "order_id": "C02",
+                "client_id": "cdb-7",
+                "symbol": "BTCUSDT",
+                "side": "BUY",
+                "status": "FILLED",
+                "price": "42000",
+                "avg_price": "41990.5",
+                "quantity": "0.5",
+                "cumulative_quantity": "0.5",
+            }
+        )
+        service._handle_account_update({"type": "fill", "order_id": "C02"})
+
+        assert executor.pushed_orders.order_ids() == ["C02"]
+        assert "C02" not in service.open_orders
+        snapshot = service.get_stats_copy()
+        assert snapshot["order_updates_pushed"] == original["order_updates_pushed"] + 2
+        assert snapshot["fills_pushed"] == original["fills_pushed"] + 1
+
+        pushed = executor.get_order_status("C02")
+        assert pushed.status == OrderStatus.FILLED.value
+        assert pushed.filled_quantity == 0.5
+        assert pushed.price == 41990.5
+        assert pushed.client_id == "cdb-7"
+    finally:
+        service.stats.clear()
+        service.stats.update(original)
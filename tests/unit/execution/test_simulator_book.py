@@ -0,0 +1,71 @@
+"""
+Unit tests for the L2 depth-walking fill model of ExecutionSimulator
+Tests VWAP, levels consumed, partial fills and the parametric fallback.
+"""
+
+import numpy as np
+import pytest
+
+from services.execution.simulator import ExecutionSimulator, OrderBookSnapshot
+
+
+@pytest.fixture
+def book():
+    return OrderBookSnapshot(
+        bids=[[99.0, 2.0], [100.0, 1.0], [98.0, 5.0]],  # unsorted on purpose
+        asks=[[101.0, 1.0], [102.0, 2.0], [103.0, 5.0]],
+    )
+
+
+@pytest.mark.unit
+def test_walk_buy_across_levels(book):
+    fill = book.walk("buy", 2.5)
+
+    assert fill.filled_size == 2.5
+    assert fill.levels_consumed == 2
+    assert fill.vwap == pytest.approx((101.0 * 1 + 102.0 * 1.5) / 2.5)
+    assert not fill.partial_fill
+
+
+@pytest.mark.unit
+def test_walk_sell_exact_level_and_partial(book):
+    exact = book.walk("sell", 3.0)
+    assert exact.levels_consumed == 2
+    assert exact.vwap == pytest.approx((100.0 + 2 * 99.0) / 3.0)
+
+    partial = book.walk("sell", 10.0)
+    assert partial.partial_fill
+    assert partial.filled_size == 8.0
+    assert partial.levels_consumed == 3
+
+
+@pytest.mark.unit
+def test_walk_vectorized_matches_scalar(book):
+    sizes = np.array([0.0, 0.5, 1.0, 2.5, 8.0, 9.0])
+
+    filled, vwap, notional, levels, partial = book.walk("buy", sizes)
+
+    for i, qty in enumerate(sizes):
+        scalar = book.walk("buy", qty)
+        assert filled[i] == scalar.filled_size
+        assert vwap[i] == pytest.approx(scalar.vwap)
+        assert levels[i] == scalar.levels_consumed
+        assert partial[i] == scalar.partial_fill
+
+
+@pytest.mark.unit
+def test_market_order_uses_book_and_falls_back():
+    sim = ExecutionSimulator()
+    book = OrderBookSnapshot(bids=[], asks=[[101.0, 1.0], [102.0, 2.0]])
+
+    walked = sim.simulate_market_order("buy", 2.0, 100.0, 1_000_000, 0.02, book=book)
+    assert walked.levels_consumed == 2
+    assert walked.avg_fill_price == pytest.approx(101.5)
+    assert walked.slippage_bps == pytest.approx(150.0)
+    assert walked.fees == pytest.approx(203.0 * sim.taker_fee)
+
+    # empty bid side -> parametric model
+    fallback = sim.simulate_market_order("sell", 2.0, 100.0, 1_000_000, 0.02, book=book)
+    parametric = sim.simulate_market_order("sell", 2.0, 100.0, 1_000_000, 0.02)
+    assert fallback == parametric
+    assert fallback.levels_consumed == 0
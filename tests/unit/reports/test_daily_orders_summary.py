@@ -0,0 +1,68 @@
+"""
+Unit-Tests für den Daily Orders Summary Report (liest die Rollup-Tabellen).
+"""
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from services.reports import daily_orders_summary as report  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query):
+        self.conn.queries.append(query)
+
+    def fetchone(self):
+        return (10, 7, 2, 1, 0, Decimal("1500.5"), 7, Decimal("1.25"))
+
+    def fetchall(self):
+        return [("risk_limit", Decimal("2"))]
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+        self.commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.commits += 1
+        return False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.mark.unit
+def test_fetch_summary_refreshes_and_reads_rollups():
+    conn = FakeConnection()
+
+    data = report.fetch_summary(conn, hours=24)
+
+    refresh, summary, rejections = conn.queries
+    assert "cdb_refresh_rollups" in refresh
+    assert conn.commits == 1
+    assert "FROM orders_hourly" in summary and "FROM trades_hourly" in summary
+    assert "FROM orders " not in summary + rejections
+    # 24 Stunden-Buckets inklusive der laufenden Stunde, nicht 25
+    window = "- INTERVAL '24 hours' + INTERVAL '1 hour'"
+    assert summary.count(window) == 2
+    assert window in rejections
+    assert data["total_orders"] == 10
+    assert data["notional"] == 1500.5
+    assert data["rejections"] == [("risk_limit", 2)]
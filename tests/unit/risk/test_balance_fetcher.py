@@ -0,0 +1,53 @@
+"""
+Unit-Tests für RealBalanceFetcher: Private-WS Balance-Pushes ersetzen Polling.
+"""
+
+import pytest
+
+from services.risk.balance_fetcher import RealBalanceFetcher
+
+BASE_URL = "https://balance.test"
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.setenv("MEXC_API_KEY", "key")
+    monkeypatch.setenv("MEXC_API_SECRET", "secret")
+    monkeypatch.setenv("MEXC_BASE_URL", BASE_URL)
+    return RealBalanceFetcher()
+
+
+@pytest.mark.unit
+def test_balance_push_updates_cache_without_rest_poll(fetcher, requests_mock):
+    account = requests_mock.get(
+        f"{BASE_URL}/api/v3/account",
+        json={
+            "balances": [
+                {"asset": "USDT", "free": "1000", "locked": "0"},
+                {"asset": "BTC", "free": "0.1", "locked": "0"},
+            ]
+        },
+    )
+    requests_mock.get(f"{BASE_URL}/api/v3/ticker/price", json={"price": "50000"})
+
+    baseline = fetcher.get_real_balance()
+    assert baseline["TOTAL_USDT"] == pytest.approx(6000.0)
+    assert account.call_count == 1
+
+    fetcher.apply_balance_update("USDT", free=400.0, locked=100.0)
+    balances = fetcher.get_real_balance()
+
+    assert account.call_count == 1
+    assert balances["USDT"] == 500.0
+    assert balances["TOTAL_USDT"] == pytest.approx(5500.0)
+
+    fetcher.apply_balance_update("BTC", free=0.0, locked=0.0)
+    assert "BTC" not in fetcher.get_real_balance()
+    assert fetcher.get_usdt_balance() == pytest.approx(500.0)
+
+
+@pytest.mark.unit
+def test_balance_push_without_baseline_keeps_polling(fetcher):
+    fetcher.apply_balance_update("USDT", free=10.0, locked=0.0)
+    assert fetcher._balance_cache is None
+    assert fetcher._pushed_at == 0
@@ -0,0 +1,133 @@
+"""
+Unit Tests für SignalIntake (Stale-Signal Shedding)
+
+Testet:
+- TTL-Shedding beim Enqueue und beim Dequeue
+- Reduce-Only Downgrade alternder Signale
+- Zusammenfassen überholter Signale je (strategy, symbol, side)
+- Bounded Queue (Overflow)
+"""
+
+import pytest
+
+from core.domain.models import Signal
+from services.risk.intake import SignalIntake, signal_age_seconds
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_signal(ts: float, symbol="BTCUSDT", side="BUY", strategy_id="paper", price=1.0):
+    return Signal(
+        strategy_id=strategy_id, symbol=symbol, side=side, timestamp=ts, price=price
+    )
+
+
+@pytest.mark.unit
+def test_signal_age_supports_seconds_and_millis():
+    assert signal_age_seconds(make_signal(990), 1000.0) == 10.0
+    assert signal_age_seconds(make_signal(1_700_000_000_000), 1_700_000_005.0) == 5.0
+    assert signal_age_seconds(make_signal(0), 1000.0) is None
+
+
+@pytest.mark.unit
+def test_stale_signal_shed_on_offer():
+    clock = FakeClock(1_700_000_100.0)
+    intake = SignalIntake(max_age_s=30, clock=clock)
+
+    assert intake.offer(make_signal(1_700_000_000)) is False
+    assert intake.shed_counts["stale"] == 1
+    assert intake.depth == 0
+
+
+@pytest.mark.unit
+def test_signal_going_stale_in_queue_is_shed_on_poll():
+    clock = FakeClock(1_700_000_000.0)
+    intake = SignalIntake(max_age_s=30, clock=clock)
+
+    assert intake.offer(make_signal(1_700_000_000, symbol="BTCUSDT"))
+    assert intake.offer(make_signal(1_700_000_040, symbol="ETHUSDT"))
+    clock.now = 1_700_000_045.0
+
+    item = intake.poll(timeout=0)
+    assert item is not None
+    assert item.signal.symbol == "ETHUSDT"
+    assert intake.shed_counts["stale"] == 1
+
+
+@pytest.mark.unit
+def test_aging_signal_is_degraded():
+    clock = FakeClock(1_700_000_015.0)
+    intake = SignalIntake(max_age_s=30, degrade_age_s=10, clock=clock)
+
+    intake.offer(make_signal(1_700_000_000))
+    item = intake.poll(timeout=0)
+
+    assert item.degraded is True
+    assert item.age_s == pytest.approx(15.0)
+
+
+@pytest.mark.unit
+def test_superseded_signal_collapsed_keeps_queue_slot():
+    clock = FakeClock(1_700_000_000.0)
+    intake = SignalIntake(max_age_s=30, clock=clock)
+
+    intake.offer(make_signal(1_700_000_000, symbol="BTCUSDT", price=100.0))
+    intake.offer(make_signal(1_700_000_000, symbol="ETHUSDT"))
+    intake.offer(make_signal(1_700_000_000, symbol="BTCUSDT", price=101.0))
+    intake.offer(make_signal(1_700_000_000, symbol="BTCUSDT", side="SELL"))
+
+    assert intake.depth == 3
+    assert intake.shed_counts["superseded"] == 1
+
+    first = intake.poll(timeout=0)
+    assert first.signal.symbol == "BTCUSDT"
+    assert first.signal.price == 101.0
+
+
+@pytest.mark.unit
+def test_overflow_sheds_oldest_pending():
+    clock = FakeClock(1_700_000_000.0)
+    intake = SignalIntake(max_age_s=30, max_queue=2, clock=clock)
+
+    for symbol in ("AAA", "BBB", "CCC"):
+        intake.offer(make_signal(1_700_000_000, symbol=symbol))
+
+    assert intake.depth == 2
+    assert intake.shed_counts["overflow"] == 1
+    assert intake.poll(timeout=0).signal.symbol == "BBB"
+
+
+@pytest.mark.unit
+def test_signal_without_timestamp_passes_through():
+    intake = SignalIntake(max_age_s=30, degrade_age_s=10, clock=FakeClock(1e9))
+
+    assert intake.offer(make_signal(0))
+    item = intake.poll(timeout=0)
+    assert item.age_s is None
+    assert item.degraded is False
+
+
+@pytest.mark.unit
+def test_poll_timeout_returns_none():
+    intake = SignalIntake()
+    assert intake.poll(timeout=0.01) is None
+
+
+@pytest.mark.unit
+def test_drain_returns_ready_items_without_blocking():
+    clock = FakeClock(1_000.0)
+    intake = SignalIntake(max_age_s=30, max_queue=10, clock=clock)
+    for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT"):
+        intake.offer(make_signal(symbol=symbol, ts=1_000))
+
+    items = intake.drain(2)
+    assert [item.signal.symbol for item in items] == ["BTCUSDT", "ETHUSDT"]
+    assert intake.depth == 1
+    assert intake.drain(5)[0].signal.symbol == "SOLUSDT"
+    assert intake.drain(5) == []
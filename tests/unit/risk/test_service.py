@@ -209,3 +209,186 @@ def test_exposure_limit_bypassed_for_reduce_only_sell(mock_redis, mock_postgres)
             risk_service.risk_state.last_prices = original_last_prices
             risk_service.risk_state.total_exposure = original_total_exposure
             risk_service.risk_off_active = original_risk_off
+
+
+@pytest.mark.unit
+def test_degraded_intake_signal_blocked_unless_reduce_only(mock_redis, mock_postgres):
+    """
+    Test: Gealterte Signale aus der Intake-Queue werden nur Reduce-Only ausgeführt.
+    """
+    test_config = RiskConfig(max_position_pct=0.10, max_total_exposure_pct=0.30)
+
+    with patch.object(risk_service, "config", test_config):
+        manager = RiskManager()
+        manager.process_signal = MagicMock(return_value=None)
+
+        original_positions = risk_service.risk_state.positions.copy()
+        try:
+            risk_service.risk_state.positions = {"BTCUSDT": 1.0}
+            item = risk_service.IntakeItem(
+                signal=Signal(strategy_id="paper", symbol="BTCUSDT", side="BUY"),
+                age_s=15.0,
+                degraded=True,
+            )
+            assert manager.handle_intake_item(item) is None
+            manager.process_signal.assert_not_called()
+            assert manager.intake.shed_counts["degraded"] == 1
+
+            item.signal = Signal(strategy_id="paper", symbol="BTCUSDT", side="SELL")
+            manager.handle_intake_item(item)
+            manager.process_signal.assert_called_once_with(item.signal)
+        finally:
+            risk_service.risk_state.positions = original_positions
+
+
+@pytest.mark.unit
+def test_batch_allocates_exposure_by_strength_and_uses_one_pipeline(
+    mock_redis, mock_postgres
+):
+    """
+    Test: Batch vergibt Rest-Exposure nach Strength und sendet via Pipeline.
+    """
+    test_config = RiskConfig(
+        max_position_pct=0.10,
+        max_total_exposure_pct=0.15,
+        max_daily_drawdown_pct=0.05,
+        test_balance=10_000.0,
+    )
+
+    with patch.object(risk_service, "config", test_config):
+        manager = RiskManager()
+        manager.redis_client = mock_redis
+        manager.allocation_state["paper"] = AllocationState(allocation_pct=1.0)
+        manager._get_current_balance = MagicMock(return_value=10_000.0)
+
+        original_exposure = risk_service.risk_state.total_exposure
+        original_positions = risk_service.risk_state.positions.copy()
+        try:
+            risk_service.risk_state.total_exposure = 0.0
+            risk_service.risk_state.positions = {}
+            signals = [
+                Signal(strategy_id="paper", symbol="ETHUSDT", side="BUY",
+                       price=100.0, strength=0.2, timestamp=1),
+                Signal(strategy_id="paper", symbol="SOLUSDT", side="BUY",
+                       price=10.0, strength=0.9, timestamp=2),
+                Signal(strategy_id="paper", symbol="XRPUSDT", side="BUY",
+                       price=1.0, strength=0.1, timestamp=3),
+            ]
+
+            orders = manager.process_signals_batch(signals)
+
+            assert [o.symbol for o in orders] == ["SOLUSDT", "ETHUSDT"]
+            assert orders[0].quantity == pytest.approx(100.0)  # 1000 USDT
+            assert orders[1].quantity == pytest.approx(5.0)  # Rest: 500 USDT
+            manager._get_current_balance.assert_called_once()
+            pipe = mock_redis.pipeline.return_value
+            assert pipe.publish.call_count == 2
+            assert pipe.xadd.call_count == 2
+            pipe.execute.assert_called_once()
+            # Einzelversand nur noch für den Alert der geblockten XRP-Order
+            channels = [c.args[0] for c in mock_redis.publish.call_args_list]
+            assert channels == [test_config.output_topic_alerts]
+        finally:
+            risk_service.risk_state.total_exposure = original_exposure
+            risk_service.risk_state.positions = original_positions
+
+
+@pytest.mark.unit
+def test_same_second_signals_of_two_strategies_both_execute(
+    mock_redis, mock_postgres, monkeypatch
+):
+    """
+    Test: client_id unterscheidet Strategien/Seiten derselben Sekunde, bleibt
+    für Redeliveries stabil, und die Execution führt beide Orders aus.
+    """
+    from services.execution import service as execution_service
+    from services.execution.idempotency import IdempotencyCache
+
+    test_config = RiskConfig(max_position_pct=0.10, max_total_exposure_pct=0.30)
+
+    with patch.object(risk_service, "config", test_config):
+        manager = RiskManager()
+        for strategy_id in ("momo", "meanrev"):
+            manager.allocation_state[strategy_id] = AllocationState(allocation_pct=0.5)
+        manager.check_drawdown_limit = MagicMock(return_value=(True, "Drawdown OK"))
+        manager.check_position_limit = MagicMock(return_value=(True, "Position OK"))
+        manager.check_exposure_limit = MagicMock(return_value=(True, "Exposure OK"))
+        manager.check_var_limit = MagicMock(return_value=(True, "VaR OK"))
+        manager.calculate_position_size = MagicMock(return_value=(0.1, None))
+
+        original_pending = risk_service.risk_state.pending_orders
+        try:
+            signals = [
+                Signal(strategy_id=strategy_id, symbol="BTCUSDT", side="BUY",
+                       price=50000.0, timestamp=1763840671)
+                for strategy_id in ("momo", "meanrev")
+            ]
+            orders = [manager.process_signal(signal) for signal in signals]
+            redelivered = manager.process_signal(signals[0])
+        finally:
+            risk_service.risk_state.pending_orders = original_pending
+
+    assert orders[0].client_id != orders[1].client_id
+    assert redelivered.client_id == orders[0].client_id
+    assert risk_service.order_client_id(
+        Signal(strategy_id="momo", symbol="BTCUSDT", side="SELL", timestamp=1763840671)
+    ) != orders[0].client_id
+
+    executed = []
+
+    class CountingExecutor:
+        def execute_order(self, order):
+            executed.append(order.client_id)
+            return execution_service.ExecutionResult(
+                order_id=f"ORD-{len(executed)}",
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                filled_quantity=order.quantity,
+                status="FILLED",
+                client_id=order.client_id,
+                price=50000.0,
+            )
+
+    original_stats = execution_service.stats.copy()
+    try:
+        monkeypatch.setattr(execution_service, "executor", CountingExecutor())
+        monkeypatch.setattr(execution_service, "exchange_info", None)
+        monkeypatch.setattr(execution_service, "idempotency", IdempotencyCache())
+        monkeypatch.setattr(execution_service, "_publish_result", lambda result: None)
+
+        for order in (*orders, redelivered):
+            execution_service.process_order(order.to_dict())
+    finally:
+        execution_service.stats.clear()
+        execution_service.stats.update(original_stats)
+
+    assert executed == [orders[0].client_id, orders[1].client_id]
+
+
+@pytest.mark.unit
+def test_batch_sends_approved_orders_when_a_signal_fails(mock_redis, mock_postgres):
+    """
+    Test: Exception bei einem Signal überspringt nur dieses Signal; bereits
+    freigegebene Orders werden trotzdem versendet.
+    """
+    test_config = RiskConfig(max_position_pct=0.10, max_total_exposure_pct=0.30)
+
+    with patch.object(risk_service, "config", test_config):
+        manager = RiskManager()
+        manager._get_current_balance = MagicMock(return_value=10_000.0)
+        approved = MagicMock(symbol="ETHUSDT", quantity=1.0, price=100.0)
+        manager.process_signal = MagicMock(
+            side_effect=[approved, RuntimeError("boom"), None]
+        )
+        manager.send_orders = MagicMock()
+
+        signals = [
+            Signal(strategy_id="paper", symbol=symbol, side="BUY", strength=strength)
+            for symbol, strength in (("ETHUSDT", 0.9), ("SOLUSDT", 0.5), ("XRPUSDT", 0.1))
+        ]
+        orders = manager.process_signals_batch(signals)
+
+    assert orders == [approved]
+    manager.send_orders.assert_called_once_with([approved])
+    assert manager.process_signal.call_count == 3
@@ -0,0 +1,162 @@
+"""
+Unit Tests für StreamingRiskEngine (Portfolio VaR/ES)
+
+Testet:
+- Inkrementelle EW-Kovarianz == Batch-Berechnung
+- Parametrischer und historischer VaR/ES
+- Candle-Alignment (fehlende Symbole, späte Candles)
+- Kapazitätswachstum über die initiale Symbolanzahl hinaus
+"""
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from services.risk.metrics import RiskMetrics
+from services.risk.var_engine import StreamingRiskEngine
+
+
+def feed_prices(engine, prices: np.ndarray, symbols: list[str], start_ts: int = 0):
+    for t in range(prices.shape[0]):
+        for j, symbol in enumerate(symbols):
+            engine.update_candle(symbol, start_ts + 60 * t, float(prices[t, j]))
+    engine.flush()
+
+
+def make_prices(n_steps: int, n_symbols: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    returns = rng.normal(0.0, 0.002, size=(n_steps, n_symbols))
+    returns[:, 1:] += 0.5 * returns[:, :1]  # correlated with first symbol
+    return 100.0 * np.exp(np.cumsum(returns, axis=0))
+
+
+@pytest.mark.unit
+def test_incremental_covariance_matches_batch():
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    prices = make_prices(200, 3)
+    engine = StreamingRiskEngine(window=500, ewma_lambda=0.94)
+    feed_prices(engine, prices, symbols)
+
+    returns = np.diff(np.log(prices), axis=0)
+    expected = np.outer(returns[0], returns[0])
+    for r in returns[1:]:
+        expected = 0.94 * expected + 0.06 * np.outer(r, r)
+
+    np.testing.assert_allclose(engine.covariance(symbols), expected, rtol=1e-10)
+    assert engine.observations == 199
+
+
+@pytest.mark.unit
+def test_parametric_var_matches_closed_form():
+    symbols = ["BTCUSDT", "ETHUSDT"]
+    engine = StreamingRiskEngine(window=500)
+    feed_prices(engine, make_prices(300, 2), symbols)
+
+    exposures = {"BTCUSDT": 10_000.0, "ETHUSDT": -4_000.0}
+    result = engine.portfolio_var(exposures, confidence=0.99, horizon_minutes=4)
+
+    w = np.array([10_000.0, -4_000.0])
+    sigma = math.sqrt(w @ engine.covariance(symbols) @ w) * 2.0
+    z = NormalDist().inv_cdf(0.99)
+    assert result.parametric_var == pytest.approx(z * sigma)
+    assert result.parametric_es > result.parametric_var
+    assert result.gross_exposure == 14_000.0
+
+
+@pytest.mark.unit
+def test_historical_var_and_es():
+    symbols = ["BTCUSDT"]
+    engine = StreamingRiskEngine(window=100)
+    prices = make_prices(101, 1)
+    feed_prices(engine, prices, symbols)
+
+    result = engine.portfolio_var({"BTCUSDT": 1_000.0}, confidence=0.95)
+    pnl = np.diff(np.log(prices[:, 0])) * 1_000.0
+    cutoff = np.quantile(pnl, 0.05)
+
+    assert result.historical_var == pytest.approx(-cutoff)
+    assert result.historical_es == pytest.approx(-pnl[pnl <= cutoff].mean())
+    assert result.historical_es >= result.historical_var
+
+
+@pytest.mark.unit
+def test_ring_window_keeps_latest_rows_only():
+    engine = StreamingRiskEngine(window=10)
+    feed_prices(engine, make_prices(50, 1), ["BTCUSDT"])
+    assert engine.observations == 10
+
+
+@pytest.mark.unit
+def test_missing_symbol_contributes_zero_return_and_late_candle_ignored():
+    engine = StreamingRiskEngine(window=10)
+    engine.update_candle("BTCUSDT", 0, 100.0)
+    engine.update_candle("ETHUSDT", 0, 10.0)
+    engine.update_candle("BTCUSDT", 60, 101.0)
+    engine.update_candle("ETHUSDT", 0, 11.0)  # late candle: price only
+    engine.update_candle("BTCUSDT", 120, 101.0)
+    engine.flush()
+
+    cov = engine.covariance(["BTCUSDT", "ETHUSDT"])
+    assert cov[1, 1] == 0.0
+    assert cov[0, 0] > 0.0
+
+
+@pytest.mark.unit
+def test_out_of_order_candle_does_not_shift_next_return():
+    prices = make_prices(20, 1)[:, 0]
+    in_order = StreamingRiskEngine(window=50)
+    with_late = StreamingRiskEngine(window=50)
+    for t, price in enumerate(prices):
+        in_order.update_candle("BTCUSDT", 60 * t, float(price))
+        with_late.update_candle("BTCUSDT", 60 * t, float(price))
+        if t == 10:
+            # late candle with a far-off close
+            with_late.update_candle("BTCUSDT", 60 * (t - 5), 2 * float(price))
+    in_order.flush()
+    with_late.flush()
+
+    np.testing.assert_allclose(
+        with_late.covariance(["BTCUSDT"]), in_order.covariance(["BTCUSDT"])
+    )
+
+
+@pytest.mark.unit
+def test_capacity_grows_beyond_initial_slots():
+    symbols = [f"SYM{i}USDT" for i in range(12)]
+    engine = StreamingRiskEngine(window=50, capacity=4)
+    feed_prices(engine, make_prices(30, 12), symbols)
+
+    corr = engine.correlation(symbols)
+    assert corr.shape == (12, 12)
+    np.testing.assert_allclose(np.diag(corr), 1.0)
+    assert corr[0, 5] > 0.2
+
+
+@pytest.mark.unit
+def test_empty_engine_returns_zero_var():
+    result = StreamingRiskEngine().portfolio_var({"BTCUSDT": 1_000.0})
+    assert result.parametric_var == 0.0
+    assert result.historical_var == 0.0
+    assert result.observations == 0
+
+
+@pytest.mark.unit
+def test_risk_metrics_portfolio_risk_uses_engine():
+    symbols = ["BTCUSDT", "ETHUSDT"]
+    engine = StreamingRiskEngine(window=200)
+    feed_prices(engine, make_prices(150, 2), symbols)
+    metrics = RiskMetrics(risk_engine=engine)
+
+    risk = metrics.calculate_portfolio_risk(
+        [
+            {"symbol": "BTCUSDT", "quantity": 1.0, "current_price": 3_000.0},
+            {"symbol": "ETHUSDT", "quantity": 10.0, "current_price": 100.0},
+        ]
+    )
+
+    assert risk["total_exposure"] == 4_000.0
+    assert risk["concentration_risk"] == pytest.approx(0.75)
+    assert risk["portfolio_var"] > 0.0
+    assert risk["beta"] > 0.0
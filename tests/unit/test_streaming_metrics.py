@@ -0,0 +1,110 @@
+"""Unit tests for core.utils.streaming_metrics module."""
+
+import json
+import math
+
+import numpy as np
+import pytest
+
+from core.utils.streaming_metrics import (
+    P2Quantile,
+    RunningStats,
+    StreamingPerformanceMetrics,
+)
+from services.risk.metrics import RiskMetrics
+
+
+@pytest.mark.unit
+def test_running_stats_matches_batch():
+    values = np.random.default_rng(1).normal(0.001, 0.01, 1000)
+    stats = RunningStats()
+    for v in values:
+        stats.update(float(v))
+
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.variance == pytest.approx(values.var())
+    downside = np.sqrt(np.mean(np.minimum(values, 0.0) ** 2))
+    assert stats.downside_deviation == pytest.approx(downside)
+
+
+@pytest.mark.unit
+def test_p2_quantile_converges():
+    values = np.random.default_rng(2).normal(0.0, 1.0, 20000)
+    estimator = P2Quantile(0.05)
+    for v in values:
+        estimator.update(float(v))
+
+    assert estimator.value() == pytest.approx(np.quantile(values, 0.05), abs=0.05)
+
+
+@pytest.mark.unit
+def test_p2_quantile_exact_for_small_samples():
+    estimator = P2Quantile(0.5)
+    assert estimator.value() is None
+    for v in (5.0, 1.0, 3.0):
+        estimator.update(v)
+    assert estimator.value() == 3.0
+
+
+@pytest.mark.unit
+def test_drawdown_and_trade_aggregates():
+    metrics = StreamingPerformanceMetrics()
+    for equity in (100.0, 120.0, 90.0, 110.0, 130.0, 117.0):
+        metrics.record_equity(equity)
+    for pnl in (10.0, -5.0, 20.0, -15.0, 0.0):
+        metrics.record_trade(pnl)
+
+    assert metrics.max_drawdown == pytest.approx(0.25)
+    assert metrics.current_drawdown == pytest.approx(0.1)
+    assert metrics.total_trades == 5
+    assert metrics.win_rate == pytest.approx(0.4)
+    assert metrics.profit_factor == pytest.approx(30.0 / 20.0)
+    snap = metrics.snapshot()
+    assert snap.largest_win == 20.0
+    assert snap.largest_loss == -15.0
+    assert snap.avg_losing_trade == pytest.approx(-10.0)
+
+
+@pytest.mark.unit
+def test_profit_factor_without_losses_is_json_safe():
+    metrics = StreamingPerformanceMetrics()
+    metrics.record_trade(10.0)
+
+    assert metrics.profit_factor == 0.0
+    assert json.dumps(metrics.snapshot().__dict__)
+
+
+@pytest.mark.unit
+def test_sharpe_matches_legacy_formula():
+    equities = [100.0, 101.0, 100.5, 102.0, 101.0, 103.0]
+    metrics = StreamingPerformanceMetrics(annualization=365)
+    for equity in equities:
+        metrics.record_equity(equity)
+
+    returns = [(b - a) / a for a, b in zip(equities, equities[1:])]
+    mean = sum(returns) / len(returns)
+    std = math.sqrt(sum((r - mean) ** 2 for r in returns) / len(returns))
+    expected = (mean * 365) / (std * math.sqrt(365))
+
+    assert metrics.sharpe_ratio == pytest.approx(expected)
+    assert metrics.sortino_ratio > metrics.sharpe_ratio
+
+
+@pytest.mark.unit
+def test_risk_metrics_reports_streaming_values():
+    risk_metrics = RiskMetrics()
+    risk_metrics.initialize_tracking(10_000.0)
+    risk_metrics.update_equity(10_500.0)
+    risk_metrics.update_equity(9_975.0)
+    risk_metrics.record_trade({"pnl": 500.0, "holding_seconds": 60})
+    risk_metrics.record_trade({"pnl": -525.0, "holding_seconds": 120})
+
+    result = risk_metrics.calculate_comprehensive_metrics()
+
+    assert result.total_trades == 2
+    assert result.win_rate == pytest.approx(0.5)
+    assert result.max_drawdown == pytest.approx(0.05)
+    assert result.total_pnl == pytest.approx(-25.0)
+    assert result.realized_pnl == pytest.approx(-25.0)
+    assert result.holding_period_avg == pytest.approx(90.0)
+    assert result.var_95 > 0.0
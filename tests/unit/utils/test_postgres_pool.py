@@ -0,0 +1,130 @@
+"""Unit tests for core.utils.postgres_client connection pool."""
+
+import threading
+
+import psycopg2
+import pytest
+
+from core.utils.postgres_client import PoolExhaustedError, PostgresConnectionPool
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.executed.append(sql)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeConnector:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self):
+        conn = FakeConnection()
+        self.created.append(conn)
+        return conn
+
+
+@pytest.mark.unit
+def test_connections_are_reused_and_committed():
+    connect = FakeConnector()
+    pool = PostgresConnectionPool(connect, minconn=1, maxconn=3)
+
+    for _ in range(5):
+        with pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("INSERT 1")
+
+    assert len(connect.created) == 1
+    assert connect.created[0].commits == 5
+    assert pool.size == 1 and pool.idle == 1
+
+
+@pytest.mark.unit
+def test_checkout_blocks_until_timeout_when_exhausted():
+    pool = PostgresConnectionPool(FakeConnector(), minconn=0, maxconn=1)
+    held = pool.getconn()
+
+    with pytest.raises(PoolExhaustedError):
+        pool.getconn(timeout=0.05)
+
+    threading.Timer(0.05, pool.putconn, args=(held,)).start()
+    assert pool.getconn(timeout=2.0) is held
+    assert pool.stats["checkout_waits"] >= 1
+
+
+@pytest.mark.unit
+def test_unhealthy_idle_connection_is_replaced_on_checkout():
+    connect = FakeConnector()
+    pool = PostgresConnectionPool(
+        connect, minconn=1, maxconn=2, health_check_after_s=0.0
+    )
+    connect.created[0].broken = True
+
+    conn = pool.getconn()
+
+    assert conn is connect.created[1]
+    assert connect.created[0].closed
+    assert pool.size == 1
+
+
+@pytest.mark.unit
+def test_operational_error_discards_connection():
+    connect = FakeConnector()
+    pool = PostgresConnectionPool(connect, minconn=1, maxconn=2)
+
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            conn.broken = True
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+
+    assert connect.created[0].closed
+    assert pool.size == 0
+    with pool.connection() as conn:
+        assert conn is connect.created[1]
+
+
+@pytest.mark.unit
+def test_application_error_rolls_back_and_keeps_connection():
+    connect = FakeConnector()
+    pool = PostgresConnectionPool(connect, minconn=1, maxconn=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("bad row")
+
+    conn = connect.created[0]
+    assert conn.rollbacks >= 1 and conn.commits == 0
+    assert not conn.closed
+    assert pool.idle == 1
@@ -0,0 +1,167 @@
+"""Unit tests for core.utils.postgres_client.PreparedStatements."""
+
+import psycopg2.errors
+import psycopg2.extras
+import pytest
+
+from core.utils.postgres_client import PreparedStatements
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.connection = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def mogrify(self, sql, params=None):
+        return (sql % tuple(repr(p) for p in params)).encode()
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        elif sql.startswith("EXECUTE"):
+            sql = self.mogrify(sql, params).decode()
+        if self.connection.fail_next is not None:
+            error, self.connection.fail_next = self.connection.fail_next, None
+            raise error
+        self.connection.executed.append(sql)
+        if "pg_prepared_statements" in sql:
+            self._rows = list(self.connection.server_prepared.items())
+        elif "information_schema.columns" in sql:
+            self._rows = [(name,) for name in self.connection.columns[params[0]]]
+        elif sql.startswith("PREPARE "):
+            name = sql.split()[1]
+            self.connection.server_prepared[name] = sql
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, server_prepared=None):
+        self.executed = []
+        self.server_prepared = dict(server_prepared or {})
+        self.columns = {"orders": ["id", "order_id", "symbol"]}
+        self.fail_next = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture
+def statements():
+    registry = PreparedStatements(prefix="t")
+    registry.define(
+        "by_id", "SELECT * FROM orders WHERE order_id = %s AND note LIKE 'a%%'"
+    )
+    registry.define_insert(
+        "order", "orders", "symbol, price, created_at", "(%s, %s, to_timestamp(%s))"
+    )
+    return registry
+
+
+@pytest.mark.unit
+def test_prepares_once_per_connection_with_numbered_placeholders(statements):
+    conn = FakeConnection()
+
+    for _ in range(3):
+        statements.execute(conn.cursor(), "by_id", ("abc",))
+
+    prepares = [sql for sql in conn.executed if sql.startswith("PREPARE")]
+    assert prepares == [
+        "PREPARE t_by_id AS SELECT * FROM orders WHERE order_id = $1 AND note LIKE 'a%'"
+    ]
+    assert conn.executed.count("EXECUTE t_by_id ('abc')") == 3
+    assert statements.prepared(conn) == {"by_id"}
+
+    other = FakeConnection()
+    statements.execute(other.cursor(), "by_id", ("abc",))
+    assert statements.stats["prepares"] == 2
+
+
+@pytest.mark.unit
+def test_reuses_or_replaces_statements_already_on_the_server(statements):
+    conn = FakeConnection(
+        {
+            "t_by_id": statements._statement("by_id").prepare_sql,
+            "t_order": "PREPARE t_order AS INSERT INTO orders (symbol) VALUES ($1)",
+        }
+    )
+
+    statements.execute(conn.cursor(), "by_id", ("abc",))
+    statements.execute_many(conn.cursor(), "order", [("BTCUSDT", 1, 0)])
+
+    assert "DEALLOCATE t_order" in conn.executed
+    assert [sql for sql in conn.executed if sql.startswith("PREPARE")] == [
+        statements._statement("order").prepare_sql
+    ]
+
+
+@pytest.mark.unit
+def test_small_batches_execute_prepared_large_batches_use_multi_row_insert(
+    statements, monkeypatch
+):
+    calls = []
+    monkeypatch.setattr(
+        psycopg2.extras,
+        "execute_values",
+        lambda cur, sql, rows, template=None, page_size=100: calls.append(
+            (sql, template, len(rows))
+        ),
+    )
+    conn = FakeConnection()
+    rows = [("BTCUSDT", i, 0) for i in range(10)]
+
+    statements.execute_many(conn.cursor(), "order", rows[:2])
+    statements.execute_many(conn.cursor(), "order", rows)
+
+    assert conn.executed[-1].count("EXECUTE t_order") == 2
+    assert calls == [
+        (
+            "INSERT INTO orders (symbol, price, created_at) VALUES %s",
+            "(%s, %s, to_timestamp(%s))",
+            10,
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_dropped_statement_is_prepared_again(statements):
+    conn = FakeConnection()
+    statements.execute(conn.cursor(), "by_id", ("abc",))
+    conn.server_prepared.clear()  # DISCARD ALL
+    conn.fail_next = psycopg2.errors.InvalidSqlStatementName("does not exist")
+
+    with pytest.raises(psycopg2.errors.InvalidSqlStatementName):
+        statements.execute(conn.cursor(), "by_id", ("abc",))
+    statements.execute(conn.cursor(), "by_id", ("abc",))
+
+    assert statements.stats["prepares"] == 2
+
+
+@pytest.mark.unit
+def test_column_capabilities_are_cached_per_connection(statements):
+    conn = FakeConnection()
+
+    assert statements.has_column(conn.cursor(), "orders", "order_id")
+    assert not statements.has_column(conn.cursor(), "orders", "strategy_id")
+    assert statements.stats["capability_checks"] == 1
+
+    migrated = FakeConnection()
+    migrated.columns["orders"].append("strategy_id")
+    assert statements.has_column(migrated.cursor(), "orders", "strategy_id")
+
+
+@pytest.mark.unit
+def test_conflicting_definition_is_rejected(statements):
+    statements.define("by_id", statements.sql("by_id"))  # idempotent
+
+    with pytest.raises(ValueError):
+        statements.define("by_id", "SELECT 1")
+    with pytest.raises(ValueError):
+        statements.define("bad-name", "SELECT 1")
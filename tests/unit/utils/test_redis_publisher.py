@@ -0,0 +1,65 @@
+"""Unit tests for core.utils.redis_publisher module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.utils.redis_publisher import Event, EventPublisher
+
+
+@pytest.mark.unit
+def test_publish_groups_channel_and_streams_in_one_pipeline():
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+
+    EventPublisher(client, maxlen=500).publish(
+        "order_results",
+        '{"order_id": "1"}',
+        streams=["stream.fills", "stream.order_results", "stream.fills", ""],
+        fields={"order_id": "1"},
+    )
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    pipe.publish.assert_called_once_with("order_results", '{"order_id": "1"}')
+    assert [c.args[0] for c in pipe.xadd.call_args_list] == [
+        "stream.fills",
+        "stream.order_results",
+    ]
+    assert all(
+        c.kwargs == {"maxlen": 500, "approximate": True}
+        for c in pipe.xadd.call_args_list
+    )
+    pipe.execute.assert_called_once()
+    client.publish.assert_not_called()
+
+
+@pytest.mark.unit
+def test_publish_many_uses_single_round_trip():
+    client = MagicMock()
+    events = [
+        Event("orders", f'{{"n": {i}}}', ("stream.orders",), {"n": i})
+        for i in range(3)
+    ]
+
+    EventPublisher(client).publish_many(events)
+
+    pipe = client.pipeline.return_value
+    assert pipe.publish.call_count == 3
+    assert pipe.xadd.call_count == 3
+    pipe.execute.assert_called_once()
+
+
+@pytest.mark.unit
+def test_atomic_mode_runs_lua_script_per_event():
+    client = MagicMock()
+    script = client.register_script.return_value
+
+    EventPublisher(client, maxlen=100, atomic=True).publish(
+        "signals", "{}", streams=["stream.signals"], fields={"symbol": "BTCUSDT"}
+    )
+
+    script.assert_called_once()
+    kwargs = script.call_args.kwargs
+    assert kwargs["keys"] == ["stream.signals"]
+    assert kwargs["args"] == ["signals", "{}", 100, "symbol", "BTCUSDT"]
+    assert kwargs["client"] is client.pipeline.return_value
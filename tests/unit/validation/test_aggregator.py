@@ -61,3 +61,16 @@ def test_aggregate_orders_partial_fills() -> None:
     assert summary["orders_total"] == 2
     assert summary["filled_total"] == 1
     assert summary["not_filled_total"] == 1
+
+
+@pytest.mark.unit
+def test_aggregate_orders_consumes_generator() -> None:
+    orders = (
+        {"status": "FILLED", "symbol": "BTCUSDT", "qty": 1.0, "price": 100.0}
+        for _ in range(3)
+    )
+    summary = aggregate_orders(orders)
+
+    assert summary["orders_total"] == 3
+    assert summary["filled_total"] == 3
+    assert summary["avg_price"] == pytest.approx(100.0)
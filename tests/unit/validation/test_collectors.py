@@ -14,6 +14,8 @@ class DummyCursor:
     def __init__(self, rows: list[dict]) -> None:
         self.rows = rows
         self.executed: list[tuple[str, tuple[Any, Any]]] = []
+        self.fetches: list[int] = []
+        self.description = None
 
     def execute(self, query: str, params: tuple[Any, Any]) -> None:
         self.executed.append((query, params))
@@ -21,6 +23,11 @@ class DummyCursor:
     def fetchall(self) -> list[dict]:
         return self.rows
 
+    def fetchmany(self, size: int) -> list[dict]:
+        self.fetches.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
     def __enter__(self) -> "DummyCursor":
         return self
 
@@ -31,9 +38,12 @@ class DummyCursor:
 class DummyConnection:
     def __init__(self, rows: list[dict]) -> None:
         self.cursor_instance = DummyCursor(rows)
+        self.cursor_kwargs: dict = {}
         self.closed = False
+        self.autocommit = False
 
-    def cursor(self, cursor_factory=None):
+    def cursor(self, name=None, cursor_factory=None, withhold=False):
+        self.cursor_kwargs = {"name": name, "withhold": withhold}
         return self.cursor_instance
 
     def close(self):
@@ -77,3 +87,69 @@ def test_collect_execution_orders_normalizes_sql_results() -> None:
             "status": "FILLED",
         }
     ]
+
+
+@pytest.mark.unit
+def test_iter_execution_orders_uses_named_cursor_with_itersize() -> None:
+    now = datetime.datetime(2026, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    rows = [
+        {
+            "id": i,
+            "symbol": "BTCUSDT",
+            "side": "sell",
+            "size": 1,
+            "effective_price": None,
+            "price": None,
+            "submitted_at": now,
+            "status": "rejected",
+        }
+        for i in range(3)
+    ]
+    conn = DummyConnection(rows)
+    conn.autocommit = True
+    config = ExecutionCollectorConfig(db_client=conn, redis_client=None, itersize=2)
+    collector = ExecutionCollector(config=config)
+
+    orders = collector.iter_execution_orders("2026-01-01", "2026-01-02")
+
+    assert not conn.cursor_instance.executed  # Generator: Query erst beim Iterieren
+    assert [order["id"] for order in orders] == [0, 1, 2]
+    assert conn.cursor_kwargs == {"name": "validation_orders", "withhold": True}
+    assert conn.cursor_instance.itersize == 2
+    assert conn.cursor_instance.fetches == [2, 2, 2]
+
+
+class PagedRedis:
+    def __init__(self, total: int) -> None:
+        self.entries = [(f"1000-{i}", {"n": str(i)}) for i in range(total)]
+        self.calls: list[tuple[str, int]] = []
+
+    def xrange(self, name, min, max, count):
+        self.calls.append((min, count))
+        ms, _, seq = min.partition("-")
+        start = 0 if min == "-" else int(seq or 0)
+        return self.entries[start : start + count]
+
+
+@pytest.mark.unit
+def test_iter_redis_events_paginates_xrange() -> None:
+    redis_client = PagedRedis(5)
+    config = ExecutionCollectorConfig(db_client=None, redis_client=redis_client, page_size=2)
+    collector = ExecutionCollector(config=config)
+
+    events = list(collector.iter_redis_events("stream.orders", "-", "+"))
+
+    assert [event["id"] for event in events] == [f"1000-{i}" for i in range(5)]
+    assert redis_client.calls == [("-", 2), ("1000-2", 2), ("1000-4", 2)]
+
+
+@pytest.mark.unit
+def test_collect_redis_events_respects_limit_across_pages() -> None:
+    redis_client = PagedRedis(10)
+    config = ExecutionCollectorConfig(db_client=None, redis_client=redis_client, page_size=3)
+    collector = ExecutionCollector(config=config)
+
+    events = collector.collect_redis_events("stream.orders", "-", "+", limit=4)
+
+    assert [event["n"] for event in events] == ["0", "1", "2", "3"]
+    assert redis_client.calls == [("-", 3), ("1000-3", 1)]
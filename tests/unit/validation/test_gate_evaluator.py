@@ -66,3 +66,20 @@ def test_gate_thresholds_invalid_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("VALIDATION_MIN_ORDERS", "nope")
     with pytest.raises(ThresholdConfigError):
         GateThresholds.from_env()
+
+
+@pytest.mark.unit
+def test_gate_evaluator_consumes_order_stream() -> None:
+    evaluator = GateEvaluator(
+        thresholds=GateThresholds(min_orders=2, min_fill_rate=0.5, min_qty_sum=0.0)
+    )
+    orders = (
+        {"status": status, "symbol": "BTCUSDT", "qty": 0.5, "price": 100.0}
+        for status in ("FILLED", "FILLED", "REJECTED")
+    )
+
+    result = evaluator.evaluate_orders(orders)
+
+    assert result["overall_pass"] is True
+    assert result["summary"]["orders_total"] == 3
+    assert result["criteria_results"]["min_fill_rate"]["actual"] == pytest.approx(2 / 3)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sqlite3
 
+import psycopg2
 import pytest
 
 from services.validation import runner
@@ -59,20 +60,11 @@ def test_runner_sqlite_locked(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None
     def dummy_connect(*args, **kwargs):
         return DummyConn()
 
-    def fake_window(*args, **kwargs):
-        return {
-            "summary": {
-                "orders_total": 1,
-                "filled_total": 1,
-                "not_filled_total": 0,
-                "symbols": 1,
-                "qty_sum": 1.0,
-                "avg_price": 100.0,
-            }
-        }
+    def fake_collect(*args, **kwargs):
+        yield {"status": "FILLED", "symbol": "BTCUSDT", "qty": 1.0, "price": 100.0}
 
     monkeypatch.setattr(runner, "_connect_with_retries", dummy_connect)
-    monkeypatch.setattr(runner, "run_validation_window", fake_window)
+    monkeypatch.setattr(runner, "collect_execution_orders", fake_collect)
     monkeypatch.setattr(runner, "RealValidationFetcher", LockedFetcher)
     monkeypatch.setenv("VALIDATION_EVIDENCE_DIR", str(tmp_path))
 
@@ -81,3 +73,63 @@ def test_runner_sqlite_locked(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None
     assert report["pass"] is False
     assert "sqlite_locked" in report["reasons"]
     assert (tmp_path / "1" / "report.json").exists()
+
+
+@pytest.mark.unit
+def test_runner_evaluates_streamed_orders(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    def fake_collect(*args, **kwargs):
+        for status in ("FILLED", "FILLED", "REJECTED"):
+            yield {"status": status, "symbol": "BTCUSDT", "qty": 1.0, "price": 100.0}
+
+    monkeypatch.setattr(runner, "_connect_with_retries", lambda **kwargs: DummyConn())
+    monkeypatch.setattr(runner, "collect_execution_orders", fake_collect)
+    monkeypatch.setattr(runner, "RealValidationFetcher", DummyFetcher)
+    monkeypatch.setenv("VALIDATION_EVIDENCE_DIR", str(tmp_path))
+
+    report = runner.run("2026-01-01T00:00:00Z", "2026-01-01T01:00:00Z")
+
+    assert report["pass"] is True
+    assert report["orders_total"] == 3
+    assert report["filled_total"] == 2
+    assert "summary" not in report["evaluation"]
+    assert report["evaluation"]["criteria_results"]["min_orders"]["actual"] == 3
+
+
+@pytest.mark.unit
+def test_runner_db_error_while_streaming_is_db_unreachable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    def failing_collect(*args, **kwargs):
+        yield {"status": "FILLED", "symbol": "BTCUSDT", "qty": 1.0, "price": 100.0}
+        raise psycopg2.OperationalError("server closed the connection")
+
+    monkeypatch.setattr(runner, "_connect_with_retries", lambda **kwargs: DummyConn())
+    monkeypatch.setattr(runner, "collect_execution_orders", failing_collect)
+    monkeypatch.setattr(runner, "RealValidationFetcher", DummyFetcher)
+    monkeypatch.setenv("VALIDATION_EVIDENCE_DIR", str(tmp_path))
+
+    report = runner.run("2026-01-01T00:00:00Z", "2026-01-01T01:00:00Z")
+
+    assert report["pass"] is False
+    assert "db_unreachable: OperationalError" in report["reasons"]
+
+
+@pytest.mark.unit
+def test_runner_gate_error_is_not_reported_as_db_unreachable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    def broken_gate(self, orders):
+        raise KeyError("criteria")
+
+    monkeypatch.setattr(runner, "_connect_with_retries", lambda **kwargs: DummyConn())
+    monkeypatch.setattr(runner, "collect_execution_orders", lambda *a, **kw: iter(()))
+    monkeypatch.setattr(runner.GateEvaluator, "evaluate_orders", broken_gate)
+    monkeypatch.setattr(runner, "RealValidationFetcher", DummyFetcher)
+    monkeypatch.setenv("VALIDATION_EVIDENCE_DIR", str(tmp_path))
+
+    report = runner.run("2026-01-01T00:00:00Z", "2026-01-01T01:00:00Z")
+
+    assert report["pass"] is False
+    assert report["reasons"] == ["gate_error: KeyError"]
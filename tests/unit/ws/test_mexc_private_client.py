@@ -0,0 +1,107 @@
+"""
+Unit-Tests für den MEXC Private User-Data Client (Listen-Key + Protobuf-Pushes).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+pytest.importorskip("google.protobuf")
+
+from services.ws import mexc_private_client as private  # noqa: E402
+
+PrivateOrdersV3Api_pb2 = pytest.importorskip("PrivateOrdersV3Api_pb2")
+PrivateAccountV3Api_pb2 = pytest.importorskip("PrivateAccountV3Api_pb2")
+
+
+def _order_push() -> bytes:
+    wrapper = private.wrapper_pb2.PushDataV3ApiWrapper(
+        channel="spot@private.orders.v3.api.pb", symbol="BTCUSDT", sendTime=1700
+    )
+    wrapper.privateOrders.CopyFrom(
+        PrivateOrdersV3Api_pb2.PrivateOrdersV3Api(
+            id="C02",
+            clientId="cdb-7",
+            price="42000",
+            quantity="0.5",
+            avgPrice="41990.5",
+            tradeType=1,
+            status=2,
+            cumulativeQuantity="0.5",
+        )
+    )
+    return wrapper.SerializeToString()
+
+
+class StubListenKeys:
+    def __init__(self):
+        self.calls = []
+
+    def create(self):
+        self.calls.append("create")
+        return "lk-1"
+
+    def keepalive(self, listen_key):
+        self.calls.append(("keepalive", listen_key))
+
+    def close(self, listen_key):
+        self.calls.append(("close", listen_key))
+
+
+@pytest.mark.unit
+def test_decode_private_account_push():
+    wrapper = private.wrapper_pb2.PushDataV3ApiWrapper(
+        channel="spot@private.account.v3.api.pb", sendTime=1700
+    )
+    wrapper.privateAccount.CopyFrom(
+        PrivateAccountV3Api_pb2.PrivateAccountV3Api(
+            vcoinName="USDT", balanceAmount="400", frozenAmount="100"
+        )
+    )
+
+    event = private.decode_private_message(wrapper.SerializeToString())
+
+    assert event["type"] == "balance"
+    assert (event["asset"], event["free"], event["locked"]) == ("USDT", "400", "100")
+    assert event["ts_ms"] == 1700
+
+
+@pytest.mark.unit
+def test_private_client_subscribes_with_listen_key_and_emits_events():
+    listen_keys = StubListenKeys()
+    received = {}
+    events = []
+
+    async def handler(ws, *args):
+        request = getattr(ws, "request", None)
+        received["path"] = request.path if request is not None else ws.path
+        received["subscribe"] = json.loads(await ws.recv())
+        await ws.send(_order_push())
+        await ws.close()
+
+    async def scenario():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = private.MexcPrivateClient(
+                listen_keys=listen_keys,
+                on_event=lambda event: (events.append(event), client.stop()),
+                ws_url=f"ws://127.0.0.1:{port}/ws",
+                ping_interval=60,
+            )
+            await asyncio.wait_for(client.run(), timeout=5)
+            return client
+
+    client = asyncio.run(scenario())
+
+    assert received["path"] == "/ws?listenKey=lk-1"
+    assert received["subscribe"] == {
+        "method": "SUBSCRIPTION",
+        "params": list(private.PRIVATE_CHANNELS),
+    }
+    assert listen_keys.calls == ["create", ("close", "lk-1")]
+    assert events[0]["type"] == "order_update"
+    assert events[0]["status"] == "FILLED"
+    assert events[0]["client_id"] == "cdb-7"
+    assert client.get_metrics()["private_events_total"] == 1